@@ -1,6 +1,9 @@
+import base64
+import binascii
 from enum import Enum
 from typing import (
     Annotated,
+    Any,
     List,
     Optional,
 )
@@ -9,7 +12,9 @@ from pydantic import (
     BaseModel,
     Field,
     StringConstraints,
+    field_validator,
 )
+from pydantic_core import PydanticCustomError
 
 
 class CommandRequest(BaseModel):
@@ -19,10 +24,21 @@ class CommandRequest(BaseModel):
 
 class TextCompatibleCommandWrapper(CommandRequest):
     text: str = Field(default="")
+    image: Optional[bytes] = Field(default=None)
 
-    def __init__(self, command_name: str, args: List[str], json: bool):
+    def __init__(self, command_name: str, args: List[str], json: bool, image: Optional[str] = None):
         text = f"{command_name} {' '.join(args)}".strip()
-        super().__init__(args=args, text=text, reply_json=json)
+        super().__init__(args=args, text=text, reply_json=json, image=image)
+
+    @field_validator("image", mode="before")
+    @classmethod
+    def decode_image(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        try:
+            return base64.b64decode(value, validate=True)
+        except binascii.Error as e:
+            raise PydanticCustomError("invalid_image", "Invalid image: must be a base64-encoded string.") from e
 
     def __str__(self):
         return self.text
@@ -1,4 +1,5 @@
 import json
+from typing import Optional
 
 from bot.adapters.rest.models import TextCompatibleCommandWrapper
 from bot.interfaces.message import AbstractMessage
@@ -29,3 +30,6 @@ class RestMessage(AbstractMessage):
 
     def should_reply_json(self) -> bool:
         return self.__payload.reply_json
+
+    async def get_image(self) -> Optional[bytes]:
+        return self.__payload.image or None
@@ -61,6 +61,7 @@ class RestResponder(AbstractResponder):
         height: Optional[int] = None,
         duration: Optional[float] = None,
         suggestions: Optional[List[str]] = None,
+        clip_key: Optional[str] = None,
     ) -> None:
         if self.__prefer_json:
             payload: Dict[str, object] = {
@@ -91,6 +92,9 @@ class RestResponder(AbstractResponder):
             ),
         )
 
+    async def send_cached_video(self, clip_key: str) -> bool:
+        return False
+
     async def send_document(
         self,
         file_path: Path,
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from aiogram.types import InlineQuery
 
 from bot.interfaces.message import AbstractMessage
@@ -27,3 +29,6 @@ class TelegramInlineQuery(AbstractMessage):
 
     def should_reply_json(self) -> bool:
         return False
+
+    async def get_image(self) -> Optional[bytes]:
+        return None
@@ -32,9 +32,13 @@ class TelegramInlineResponder(AbstractResponder):
         height: Optional[int] = None,
         duration: Optional[float] = None,
         suggestions: Optional[List[str]] = None,
+        clip_key: Optional[str] = None,
     ) -> None:
         raise NotImplementedError("send_video not supported for inline queries")
 
+    async def send_cached_video(self, clip_key: str) -> bool:
+        return False
+
     async def send_document(self, file_path: Path, caption: str, delete_after_send: bool = True, cleanup_dir: Optional[Path] = None) -> None:
         raise NotImplementedError("send_document not supported for inline queries")
 
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from aiogram.types import Message
 
 from bot.interfaces.message import AbstractMessage
@@ -14,7 +16,7 @@ class TelegramMessage(AbstractMessage):
         return self._message.from_user.username or "unknown"
 
     def get_text(self) -> str:
-        return self._message.text or ""
+        return self._message.text or self._message.caption or ""
 
     def get_chat_id(self) -> int:
         return self._message.chat.id
@@ -27,3 +29,17 @@ class TelegramMessage(AbstractMessage):
 
     def should_reply_json(self) -> bool:
         return False
+
+    async def get_image(self) -> Optional[bytes]:
+        for message in (self._message, self._message.reply_to_message):
+            if message is None:
+                continue
+            if message.photo:
+                file_id = message.photo[-1].file_id
+            elif message.document and (message.document.mime_type or "").startswith("image/"):
+                file_id = message.document.file_id
+            else:
+                continue
+            downloaded = await self._message.bot.download(file_id)
+            return downloaded.read()
+        return None
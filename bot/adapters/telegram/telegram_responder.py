@@ -6,7 +6,10 @@ from typing import (
     Optional,
 )
 
-from aiogram.exceptions import TelegramEntityTooLarge
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramEntityTooLarge,
+)
 from aiogram.types import (
     BufferedInputFile,
     FSInputFile,
@@ -15,6 +18,7 @@ from aiogram.types import (
 
 from bot.exceptions import VideoTooLargeException
 from bot.interfaces.responder import AbstractResponder
+from bot.services.telegram_file_cache.telegram_file_cache import TelegramFileCache
 from bot.settings import settings
 from bot.utils.functions import RESOLUTIONS
 
@@ -58,6 +62,7 @@ class TelegramResponder(AbstractResponder):
         height: Optional[int] = None,
         duration: Optional[float] = None,
         suggestions: Optional[List[str]] = None,
+        clip_key: Optional[str] = None,
     ) -> None:
         try:
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
@@ -70,7 +75,7 @@ class TelegramResponder(AbstractResponder):
                 width = resolution.width
                 height = resolution.height
 
-            await self._message.answer_video(
+            sent_message = await self._message.answer_video(
                 video=FSInputFile(file_path),
                 width=width,
                 height=height,
@@ -78,12 +83,34 @@ class TelegramResponder(AbstractResponder):
                 reply_to_message_id=self._message.message_id,
                 disable_notification=True,
             )
+            if clip_key and sent_message.video:
+                await TelegramFileCache.put(clip_key, sent_message.video.file_id)
         except TelegramEntityTooLarge as exc:
             raise VideoTooLargeException(duration=duration, suggestions=suggestions) from exc
         finally:
             if delete_after_send:
                 file_path.unlink()
 
+    async def send_cached_video(self, clip_key: str) -> bool:
+        file_id = await TelegramFileCache.get(clip_key)
+        if file_id is None:
+            return False
+
+        resolution = RESOLUTIONS[settings.DEFAULT_RESOLUTION_KEY]
+        try:
+            await self._message.answer_video(
+                video=file_id,
+                width=resolution.width,
+                height=resolution.height,
+                supports_streaming=True,
+                reply_to_message_id=self._message.message_id,
+                disable_notification=True,
+            )
+            return True
+        except TelegramBadRequest:
+            await TelegramFileCache.invalidate(clip_key)
+            return False
+
     async def send_document(self, file_path: Path, caption: str, delete_after_send: bool = True, cleanup_dir: Optional[Path] = None) -> None:
         await self._message.answer_document(
             document=FSInputFile(file_path),
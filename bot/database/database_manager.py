@@ -8,9 +8,11 @@ import logging
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -19,6 +21,7 @@ import asyncpg
 import bcrypt
 
 from bot.database.models import (
+    BlobRef,
     ClipType,
     LastClip,
     RefreshToken,
@@ -26,6 +29,7 @@ from bot.database.models import (
     Series,
     SubscriptionKey,
     UserCredentials,
+    UserPrincipal,
     UserProfile,
     VideoClip,
 )
@@ -39,6 +43,7 @@ db_manager_logger = logging.getLogger(__name__)
 class DatabaseManager: # pylint: disable=too-many-public-methods
     pool: asyncpg.Pool = None
     _db_fully_initialized: bool = False
+    __series_ids: Dict[str, int] = {}
 
     @staticmethod
     async def init_pool(
@@ -121,6 +126,10 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
 
     @staticmethod
     async def get_or_create_series(series_name: str) -> int:
+        cached_id = DatabaseManager.__series_ids.get(series_name)
+        if cached_id is not None:
+            return cached_id
+
         async with DatabaseManager.__get_db_connection() as conn:
             series_id = await conn.fetchval(
                 "SELECT id FROM series WHERE series_name = $1",
@@ -131,7 +140,8 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
                     "INSERT INTO series (series_name) VALUES ($1) RETURNING id",
                     series_name,
                 )
-            return series_id
+        DatabaseManager.__series_ids[series_name] = series_id
+        return series_id
 
     @staticmethod
     async def get_series_by_id(series_id: int) -> Optional[str]:
@@ -175,6 +185,24 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
                     log_level, log_message,
                 )
 
+    @staticmethod
+    async def log_user_activities_batch(records: List[Tuple[int, str, Optional[int]]]) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.copy_records_to_table(
+                "user_logs",
+                records=records,
+                columns=["user_id", "command", "series_id"],
+            )
+
+    @staticmethod
+    async def log_system_messages_batch(records: List[Tuple[str, str]]) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.copy_records_to_table(
+                "system_logs",
+                records=records,
+                columns=["log_level", "log_message"],
+            )
+
     @staticmethod
     async def add_user(
             user_id: int, username: Optional[str] = None, full_name: Optional[str] = None,
@@ -306,6 +334,44 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
                 return True
         return False
 
+    @staticmethod
+    async def get_user_principal(user_id: int) -> UserPrincipal:
+        async with DatabaseManager.__get_db_connection() as conn:
+            row = await conn.fetchrow(
+                "SELECT up.user_id IS NOT NULL AS in_db, ur.is_admin, ur.is_moderator, up.subscription_end, usc.active_series "
+                "FROM (SELECT $1::BIGINT AS user_id) AS u "
+                "LEFT JOIN user_profiles up ON up.user_id = u.user_id "
+                "LEFT JOIN user_roles ur ON ur.user_id = u.user_id "
+                "LEFT JOIN user_series_context usc ON usc.user_id = u.user_id",
+                user_id,
+            )
+        active_series = row["active_series"]
+        return UserPrincipal(
+            user_id=user_id,
+            in_db=row["in_db"],
+            is_admin=bool(row[DatabaseKeys.IS_ADMIN]),
+            is_moderator=bool(row[DatabaseKeys.IS_MODERATOR]),
+            subscription_end=row[DatabaseKeys.SUBSCRIPTION_END],
+            active_series=tuple(json.loads(active_series)) if active_series is not None else (),
+        )
+
+    @staticmethod
+    async def listen(
+        channel: str,
+        callback: Callable[[str], None],
+        on_terminated: Optional[Callable[[asyncpg.Connection], None]] = None,
+    ) -> asyncpg.Connection:
+        conn = await DatabaseManager.__get_db_connection()
+        if on_terminated is not None:
+            conn.add_termination_listener(on_terminated)
+        await conn.add_listener(channel, lambda _conn, _pid, _channel, payload: callback(payload))
+        return conn
+
+    @staticmethod
+    async def unlisten(conn: asyncpg.Connection) -> None:
+        # Releasing resets the connection, which drops its LISTEN registrations and callbacks.
+        await DatabaseManager.pool.release(conn)
+
     @staticmethod
     async def is_user_admin(user_id: int) -> Optional[bool]:
         async with DatabaseManager.__get_db_connection() as conn:
@@ -362,7 +428,8 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
             chat_id=row["chat_id"],
             user_id=row[DatabaseKeys.USER_ID],
             name=row[DatabaseKeys.CLIP_NAME],
-            video_data=row[DatabaseKeys.VIDEO_DATA],
+            video_hash=row[DatabaseKeys.VIDEO_HASH],
+            video_size=row[DatabaseKeys.VIDEO_SIZE],
             start_time=row[DatabaseKeys.START_TIME],
             end_time=row[DatabaseKeys.END_TIME],
             duration=row[DatabaseKeys.DURATION],
@@ -370,6 +437,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
             episode_number=row[DatabaseKeys.EPISODE_NUMBER],
             is_compilation=row[DatabaseKeys.IS_COMPILATION],
             series_id=row.get(DatabaseKeys.SERIES_ID),
+            thumbnail_hash=row.get(DatabaseKeys.THUMBNAIL_HASH),
         )
 
     @staticmethod
@@ -379,14 +447,16 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
         async with DatabaseManager.__get_db_connection() as conn:
             if resolved_series_id:
                 rows = await conn.fetch(
-                    "SELECT id, chat_id, user_id, clip_name, video_data, start_time, end_time, duration, season, episode_number, is_compilation, series_id "
+                    "SELECT id, chat_id, user_id, clip_name, video_hash, video_size, start_time, end_time, duration, "
+                    "season, episode_number, is_compilation, series_id, thumbnail_hash "
                     "FROM video_clips "
                     "WHERE user_id = $1 AND series_id = $2",
                     user_id, resolved_series_id,
                 )
             else:
                 rows = await conn.fetch(
-                    "SELECT id, chat_id, user_id, clip_name, video_data, start_time, end_time, duration, season, episode_number, is_compilation, series_id "
+                    "SELECT id, chat_id, user_id, clip_name, video_hash, video_size, start_time, end_time, duration, "
+                    "season, episode_number, is_compilation, series_id, thumbnail_hash "
                     "FROM video_clips "
                     "WHERE user_id = $1",
                     user_id,
@@ -396,28 +466,30 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
 
     @staticmethod
     async def save_clip(  # pylint: disable=too-many-arguments
-            chat_id: int, user_id: int, clip_name: str, video_data: bytes, start_time: float,
+            chat_id: int, user_id: int, clip_name: str, video: BlobRef, start_time: float,
             end_time: float, duration: float, is_compilation: bool,
             season: Optional[int] = None, episode_number: Optional[int] = None, series_id: Optional[int] = None,
-            thumbnail_data: Optional[bytes] = None,
+            thumbnail: Optional[BlobRef] = None,
     ) -> None:
         resolved_series_id = await DatabaseManager.__resolve_series_id(user_id, series_id)
 
         async with DatabaseManager.__get_db_connection() as conn:
             async with conn.transaction():
                 await conn.execute(
-                    "INSERT INTO video_clips (chat_id, user_id, clip_name, video_data, start_time, "
-                    "end_time, duration, season, episode_number, is_compilation, series_id, thumbnail_data) "
-                    "VALUES ($1, $2, $3, $4::bytea, $5, $6, $7, $8, $9, $10, $11, $12::bytea)",
-                    chat_id, user_id, clip_name, video_data, start_time, end_time, duration,
-                    season, episode_number, is_compilation, resolved_series_id, thumbnail_data,
+                    "INSERT INTO video_clips (chat_id, user_id, clip_name, video_hash, video_size, start_time, "
+                    "end_time, duration, season, episode_number, is_compilation, series_id, thumbnail_hash) "
+                    "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)",
+                    chat_id, user_id, clip_name, video.blob_hash, video.size, start_time, end_time, duration,
+                    season, episode_number, is_compilation, resolved_series_id,
+                    thumbnail.blob_hash if thumbnail else None,
                 )
 
     @staticmethod
     async def get_clip_by_name(user_id: int, clip_name: str) -> Optional[VideoClip]:
         async with DatabaseManager.__get_db_connection() as conn:
             row = await conn.fetchrow(
-                "SELECT id, chat_id, user_id, clip_name, video_data, start_time, end_time, duration, season, episode_number, is_compilation, series_id "
+                "SELECT id, chat_id, user_id, clip_name, video_hash, video_size, start_time, end_time, duration, "
+                "season, episode_number, is_compilation, series_id, thumbnail_hash "
                 "FROM video_clips "
                 "WHERE user_id = $1 AND clip_name = $2",
                 user_id, clip_name,
@@ -431,7 +503,8 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
     async def get_clip_by_index(user_id: int, index: int) -> Optional[VideoClip]:
         async with DatabaseManager.__get_db_connection() as conn:
             row = await conn.fetchrow(
-                "SELECT id, chat_id, user_id, clip_name, video_data, start_time, end_time, duration, season, episode_number, is_compilation, series_id "
+                "SELECT id, chat_id, user_id, clip_name, video_hash, video_size, start_time, end_time, duration, "
+                "season, episode_number, is_compilation, series_id, thumbnail_hash "
                 "FROM video_clips "
                 "WHERE user_id = $1 "
                 "ORDER BY id "
@@ -444,22 +517,108 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
         return None
 
     @staticmethod
-    async def get_video_data_by_name(user_id: int, clip_name: str) -> Optional[bytes]:
+    async def get_legacy_video_data(clip_id: int) -> Optional[bytes]:
         async with DatabaseManager.__get_db_connection() as conn:
-            result = await conn.fetchval(
-                "SELECT video_data FROM video_clips WHERE user_id = $1 AND clip_name = $2",
-                user_id, clip_name,
+            return await conn.fetchval(
+                "SELECT video_data FROM video_clips WHERE id = $1",
+                clip_id,
             )
-        return result
 
     @staticmethod
-    async def get_thumbnail_by_name(user_id: int, clip_name: str) -> Optional[bytes]:
+    async def get_legacy_thumbnail_data(clip_id: int) -> Optional[bytes]:
         async with DatabaseManager.__get_db_connection() as conn:
-            result = await conn.fetchval(
-                "SELECT thumbnail_data FROM video_clips WHERE user_id = $1 AND clip_name = $2",
-                user_id, clip_name,
+            return await conn.fetchval(
+                "SELECT thumbnail_data FROM video_clips WHERE id = $1",
+                clip_id,
             )
-        return result
+
+    @staticmethod
+    async def get_legacy_compiled_clip(last_clip_id: int) -> Optional[bytes]:
+        async with DatabaseManager.__get_db_connection() as conn:
+            return await conn.fetchval(
+                "SELECT compiled_clip FROM last_clips WHERE id = $1",
+                last_clip_id,
+            )
+
+    @staticmethod
+    async def get_unmigrated_video_clip_ids(limit: int) -> List[int]:
+        async with DatabaseManager.__get_db_connection() as conn:
+            rows = await conn.fetch(
+                "SELECT id FROM video_clips "
+                "WHERE video_data IS NOT NULL OR thumbnail_data IS NOT NULL "
+                "ORDER BY id LIMIT $1",
+                limit,
+            )
+        return [row[DatabaseKeys.ID] for row in rows]
+
+    @staticmethod
+    async def get_unmigrated_last_clip_ids(limit: int) -> List[int]:
+        async with DatabaseManager.__get_db_connection() as conn:
+            rows = await conn.fetch(
+                "SELECT id FROM last_clips WHERE compiled_clip IS NOT NULL ORDER BY id LIMIT $1",
+                limit,
+            )
+        return [row[DatabaseKeys.ID] for row in rows]
+
+    @staticmethod
+    async def set_video_clip_blobs(clip_id: int, video: Optional[BlobRef], thumbnail: Optional[BlobRef]) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.execute(
+                "UPDATE video_clips "
+                "SET video_hash = COALESCE($2, video_hash), video_size = COALESCE($3, video_size), "
+                "thumbnail_hash = COALESCE($4, thumbnail_hash), video_data = NULL, thumbnail_data = NULL "
+                "WHERE id = $1",
+                clip_id,
+                video.blob_hash if video else None,
+                video.size if video else None,
+                thumbnail.blob_hash if thumbnail else None,
+            )
+
+    @staticmethod
+    async def set_last_clip_blob(last_clip_id: int, compiled_clip: BlobRef) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.execute(
+                "UPDATE last_clips "
+                "SET compiled_clip_hash = $2, compiled_clip_size = $3, compiled_clip = NULL "
+                "WHERE id = $1",
+                last_clip_id, compiled_clip.blob_hash, compiled_clip.size,
+            )
+
+    @staticmethod
+    async def get_referenced_blob_hashes() -> Set[str]:
+        async with DatabaseManager.__get_db_connection() as conn:
+            rows = await conn.fetch(
+                "SELECT video_hash AS blob_hash FROM video_clips WHERE video_hash IS NOT NULL "
+                "UNION SELECT thumbnail_hash FROM video_clips WHERE thumbnail_hash IS NOT NULL "
+                "UNION SELECT compiled_clip_hash FROM last_clips WHERE compiled_clip_hash IS NOT NULL",
+            )
+        return {row["blob_hash"] for row in rows}
+
+    @staticmethod
+    async def get_telegram_file_id(clip_key: str) -> Optional[str]:
+        async with DatabaseManager.__get_db_connection() as conn:
+            return await conn.fetchval(
+                "UPDATE telegram_file_ids SET last_used_at = CURRENT_TIMESTAMP WHERE clip_key = $1 RETURNING file_id",
+                clip_key,
+            )
+
+    @staticmethod
+    async def upsert_telegram_file_id(clip_key: str, file_id: str) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.execute(
+                """
+                INSERT INTO telegram_file_ids (clip_key, file_id)
+                VALUES ($1, $2)
+                ON CONFLICT (clip_key) DO UPDATE
+                SET file_id = EXCLUDED.file_id, last_used_at = CURRENT_TIMESTAMP
+                """,
+                clip_key, file_id,
+            )
+
+    @staticmethod
+    async def delete_telegram_file_id(clip_key: str) -> None:
+        async with DatabaseManager.__get_db_connection() as conn:
+            await conn.execute("DELETE FROM telegram_file_ids WHERE clip_key = $1", clip_key)
 
     @staticmethod
     async def add_subscription(user_id: int, days: int) -> Optional[date]:
@@ -603,7 +762,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
     async def insert_last_clip(
             chat_id: int,
             segment: json,
-            compiled_clip: Optional[bytes],
+            compiled_clip: Optional[BlobRef],
             clip_type: ClipType,
             adjusted_start_time: Optional[float],
             adjusted_end_time: Optional[float],
@@ -615,9 +774,13 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
         async with DatabaseManager.__get_db_connection() as conn:
             segment_json = json.dumps(segment)
             await conn.execute(
-                "INSERT INTO last_clips (chat_id, segment, compiled_clip, type, adjusted_start_time, adjusted_end_time, is_adjusted, series_id) "
-                "VALUES ($1, $2::jsonb, $3::bytea, $4, $5, $6, $7, $8)",
-                chat_id, segment_json, compiled_clip, clip_type.value, adjusted_start_time, adjusted_end_time, is_adjusted, resolved_series_id,
+                "INSERT INTO last_clips (chat_id, segment, compiled_clip_hash, compiled_clip_size, type, "
+                "adjusted_start_time, adjusted_end_time, is_adjusted, series_id) "
+                "VALUES ($1, $2::jsonb, $3, $4, $5, $6, $7, $8, $9)",
+                chat_id, segment_json,
+                compiled_clip.blob_hash if compiled_clip else None,
+                compiled_clip.size if compiled_clip else None,
+                clip_type.value, adjusted_start_time, adjusted_end_time, is_adjusted, resolved_series_id,
             )
 
     @staticmethod
@@ -627,7 +790,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
         async with DatabaseManager.__get_db_connection() as conn:
             if resolved_series_id:
                 row = await conn.fetchrow(
-                    "SELECT id, chat_id, segment, compiled_clip, type AS clip_type, "
+                    "SELECT id, chat_id, segment, compiled_clip_hash, type AS clip_type, "
                     "adjusted_start_time, adjusted_end_time, is_adjusted, timestamp, series_id "
                     "FROM last_clips "
                     "WHERE chat_id = $1 AND series_id = $2 "
@@ -637,7 +800,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
                 )
             else:
                 row = await conn.fetchrow(
-                    "SELECT id, chat_id, segment, compiled_clip, type AS clip_type, "
+                    "SELECT id, chat_id, segment, compiled_clip_hash, type AS clip_type, "
                     "adjusted_start_time, adjusted_end_time, is_adjusted, timestamp, series_id "
                     "FROM last_clips "
                     "WHERE chat_id = $1 "
@@ -651,7 +814,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
                 id=row[DatabaseKeys.ID],
                 chat_id=row["chat_id"],
                 segment=row[DatabaseKeys.SEGMENT],
-                compiled_clip=row[DatabaseKeys.COMPILED_CLIP],
+                compiled_clip_hash=row[DatabaseKeys.COMPILED_CLIP_HASH],
                 clip_type=ClipType(row[DatabaseKeys.CLIP_TYPE]),
                 adjusted_start_time=row[DatabaseKeys.ADJUSTED_START_TIME],
                 adjusted_end_time=row[DatabaseKeys.ADJUSTED_END_TIME],
@@ -663,7 +826,7 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
 
     @staticmethod
     async def update_last_clip(
-            clip_id: int, new_segment: Optional[str] = None, new_compiled_clip: Optional[bytes] = None,
+            clip_id: int, new_segment: Optional[str] = None, new_compiled_clip: Optional[BlobRef] = None,
             new_type: Optional[str] = None,
     ) -> None:
         async with DatabaseManager.__get_db_connection() as conn:
@@ -677,9 +840,9 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
             if new_compiled_clip:
                 await conn.execute(
                     "UPDATE last_clips "
-                    "SET compiled_clip = $1::bytea "
-                    "WHERE id = $2",
-                    new_compiled_clip, clip_id,
+                    "SET compiled_clip_hash = $1, compiled_clip_size = $2, compiled_clip = NULL "
+                    "WHERE id = $3",
+                    new_compiled_clip.blob_hash, new_compiled_clip.size, clip_id,
                 )
             if new_type:
                 await conn.execute(
@@ -714,27 +877,20 @@ class DatabaseManager: # pylint: disable=too-many-public-methods
             )
 
     @staticmethod
-    async def log_command_usage(user_id: int) -> None:
+    async def compact_command_usage(retention_seconds: int, batch_size: int) -> int:
+        threshold = datetime.now() - timedelta(seconds=retention_seconds)
+        deleted = 0
         async with DatabaseManager.__get_db_connection() as conn:
-            await conn.execute(
-                "INSERT INTO user_command_limits (user_id, timestamp) VALUES ($1, NOW())",
-                user_id,
-            )
-
-    @staticmethod
-    async def is_command_limited(user_id: int, limit: int, duration_seconds: int) -> bool:
-        usage_count = await DatabaseManager.get_command_usage_count(user_id, duration_seconds)
-        return usage_count >= limit
-
-    @staticmethod
-    async def get_command_usage_count(user_id: int, duration_seconds: int) -> int:
-        async with DatabaseManager.__get_db_connection() as conn:
-            time_threshold = datetime.now() - timedelta(seconds=duration_seconds)
-            count = await conn.fetchval(
-                "SELECT COUNT(*) FROM user_command_limits WHERE user_id = $1 AND timestamp >= $2",
-                user_id, time_threshold,
-            )
-        return count
+            while True:
+                result = await conn.execute(
+                    "DELETE FROM user_command_limits WHERE id IN ("
+                    "SELECT id FROM user_command_limits WHERE timestamp < $1 LIMIT $2)",
+                    threshold, batch_size,
+                )
+                batch_deleted = int(result.split()[-1])
+                deleted += batch_deleted
+                if batch_deleted < batch_size:
+                    return deleted
 
     @staticmethod
     async def is_admin_or_moderator(user_id: int) -> bool:
@@ -140,14 +140,17 @@ CREATE TABLE IF NOT EXISTS video_clips (
     chat_id        BIGINT NOT NULL,
     user_id        BIGINT NOT NULL,
     clip_name      TEXT NOT NULL,
-    video_data     BYTEA NOT NULL,
+    video_data     BYTEA NULL,
+    video_hash     TEXT NULL,
+    video_size     BIGINT NULL,
     start_time     FLOAT,
     end_time       FLOAT,
     duration       FLOAT,
     season         INT,
     episode_number INT,
     is_compilation BOOLEAN NOT NULL DEFAULT FALSE,
-    thumbnail_data BYTEA NULL
+    thumbnail_data BYTEA NULL,
+    thumbnail_hash TEXT NULL
 );
 
 CREATE INDEX IF NOT EXISTS idx_video_clips_user_id   ON video_clips(user_id);
@@ -156,6 +159,12 @@ CREATE INDEX IF NOT EXISTS idx_video_clips_clip_name ON video_clips(clip_name);
 -- Safety migration for instances created before thumbnail_data was part of the schema.
 ALTER TABLE video_clips ADD COLUMN IF NOT EXISTS thumbnail_data BYTEA NULL;
 
+-- Clip bytes live in the blob store; the bytea columns are only read for rows not yet migrated.
+ALTER TABLE video_clips ADD COLUMN IF NOT EXISTS video_hash     TEXT NULL;
+ALTER TABLE video_clips ADD COLUMN IF NOT EXISTS video_size     BIGINT NULL;
+ALTER TABLE video_clips ADD COLUMN IF NOT EXISTS thumbnail_hash TEXT NULL;
+ALTER TABLE video_clips ALTER COLUMN video_data DROP NOT NULL;
+
 
 CREATE TABLE IF NOT EXISTS search_history (
     id        SERIAL PRIMARY KEY,
@@ -173,6 +182,8 @@ CREATE TABLE IF NOT EXISTS last_clips (
     chat_id             BIGINT NOT NULL,
     segment             JSONB,
     compiled_clip       BYTEA,
+    compiled_clip_hash  TEXT NULL,
+    compiled_clip_size  BIGINT NULL,
     type                TEXT,
     adjusted_start_time FLOAT NULL,
     adjusted_end_time   FLOAT NULL,
@@ -184,6 +195,9 @@ CREATE INDEX IF NOT EXISTS idx_last_clips_timestamp ON last_clips(timestamp);
 CREATE INDEX IF NOT EXISTS idx_last_clips_id        ON last_clips(id);
 CREATE INDEX IF NOT EXISTS idx_last_clips_chat_id   ON last_clips(chat_id);
 
+ALTER TABLE last_clips ADD COLUMN IF NOT EXISTS compiled_clip_hash TEXT NULL;
+ALTER TABLE last_clips ADD COLUMN IF NOT EXISTS compiled_clip_size BIGINT NULL;
+
 
 CREATE TABLE IF NOT EXISTS user_search_filters (
     id           SERIAL PRIMARY KEY,
@@ -195,6 +209,16 @@ CREATE TABLE IF NOT EXISTS user_search_filters (
 CREATE INDEX IF NOT EXISTS idx_user_search_filters_chat_id ON user_search_filters(chat_id);
 
 
+CREATE TABLE IF NOT EXISTS telegram_file_ids (
+    clip_key     TEXT PRIMARY KEY,
+    file_id      TEXT NOT NULL,
+    created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_telegram_file_ids_last_used_at ON telegram_file_ids(last_used_at);
+
+
 -- ============================================================================
 -- Logging: user_logs (partitioned), system_logs, user_command_limits
 -- ============================================================================
@@ -349,6 +373,26 @@ BEGIN
 END $$;
 
 
+-- telegram_file_ids
+CREATE OR REPLACE FUNCTION clean_old_telegram_file_ids() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM telegram_file_ids WHERE last_used_at < NOW() - INTERVAL '30 days';
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_clean_telegram_file_ids'
+    ) THEN
+        CREATE TRIGGER trigger_clean_telegram_file_ids
+        AFTER INSERT ON telegram_file_ids
+        FOR EACH ROW EXECUTE FUNCTION clean_old_telegram_file_ids();
+    END IF;
+END $$;
+
+
 -- Drop deprecated cleanup triggers (system_logs and user_logs are kept long-term).
 DROP TRIGGER  IF EXISTS trigger_clean_system_logs ON system_logs;
 DROP FUNCTION IF EXISTS clean_old_system_logs() CASCADE;
@@ -411,3 +455,41 @@ INSERT INTO user_series_context (user_id)
 SELECT user_id
 FROM user_profiles
 ON CONFLICT (user_id) DO NOTHING;
+
+
+-- ============================================================================
+-- Principal cache invalidation
+-- ============================================================================
+
+-- Notify every bot process that a user's roles, subscription or active series changed.
+CREATE OR REPLACE FUNCTION notify_principal_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('principal_changed', OLD.user_id::TEXT);
+    ELSE
+        PERFORM pg_notify('principal_changed', NEW.user_id::TEXT);
+        IF TG_OP = 'UPDATE' AND OLD.user_id IS DISTINCT FROM NEW.user_id THEN
+            PERFORM pg_notify('principal_changed', OLD.user_id::TEXT);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    table_name TEXT;
+BEGIN
+    FOREACH table_name IN ARRAY ARRAY['user_profiles', 'user_roles', 'user_series_context'] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = 'trigger_notify_principal_changed_' || table_name
+        ) THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE ON %I '
+                'FOR EACH ROW EXECUTE FUNCTION notify_principal_changed()',
+                'trigger_notify_principal_changed_' || table_name, table_name
+            );
+        END IF;
+    END LOOP;
+END $$;
@@ -5,7 +5,10 @@ from datetime import (
 )
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Optional,
+    Tuple,
+)
 
 from bot.database.serializable import Serializable
 
@@ -45,13 +48,20 @@ class Series(Serializable):
     series_name: str
 
 
+@dataclass(frozen=True)
+class BlobRef:
+    blob_hash: str
+    size: int
+
+
 @dataclass
 class VideoClip(Serializable):
     id: int
     chat_id: int
     user_id: int
     name: str
-    video_data: bytes
+    video_hash: Optional[str]
+    video_size: Optional[int]
     start_time: float
     end_time: float
     duration: Optional[float]
@@ -59,6 +69,7 @@ class VideoClip(Serializable):
     episode_number: Optional[int]
     is_compilation: bool
     series_id: Optional[int] = None
+    thumbnail_hash: Optional[str] = None
 
 
 class ClipType(Enum):
@@ -74,7 +85,7 @@ class LastClip(Serializable):
     id: int
     chat_id: int
     segment: str
-    compiled_clip: Optional[bytes]
+    compiled_clip_hash: Optional[str]
     clip_type: Optional[ClipType]
     adjusted_start_time: Optional[float]
     adjusted_end_time: Optional[float]
@@ -115,6 +126,15 @@ class ClipInfo(Serializable):
     season: Optional[int]
     episode_number: Optional[int]
 
+@dataclass(frozen=True)
+class UserPrincipal:
+    user_id: int
+    in_db: bool
+    is_admin: bool
+    is_moderator: bool
+    subscription_end: Optional[date]
+    active_series: Tuple[str, ...]
+
 @dataclass
 class SeriesContext(Serializable):
     user_id: int
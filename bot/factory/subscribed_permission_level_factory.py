@@ -35,6 +35,7 @@ from bot.handlers import (
     SaveClipByIndexHandler,
     SaveClipHandler,
     SavedClipThumbnailHandler,
+    ScreenshotSearchHandler,
     SearchFilterHandler,
     SearchHandler,
     SearchListHandler,
@@ -80,6 +81,7 @@ class SubscribedPermissionLevelFactory(PermissionLevelFactory):
             SaveClipByIndexHandler,
             SaveClipHandler,
             SavedClipThumbnailHandler,
+            ScreenshotSearchHandler,
             SearchFilterHandler,
             SearchHandler,
             SemanticClipHandler,
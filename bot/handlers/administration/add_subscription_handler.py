@@ -14,6 +14,7 @@ from bot.responses.administration.add_subscription_handler_responses import (
     get_subscription_extended_message,
     get_subscription_log_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class AddSubscriptionHandler(BotMessageHandler):
@@ -48,6 +49,7 @@ class AddSubscriptionHandler(BotMessageHandler):
         days = int(content[2])
 
         new_end_date = await DatabaseManager.add_subscription(user_id, days)
+        PrincipalCache.invalidate(user_id)
         if new_end_date is None:
             await self.__reply_subscription_error()
             return
@@ -11,6 +11,7 @@ from bot.responses.administration.add_whitelist_handler_responses import (
     get_log_user_added_message,
     get_user_added_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class AddWhitelistHandler(BotMessageHandler):
@@ -39,6 +40,7 @@ class AddWhitelistHandler(BotMessageHandler):
             full_name="",
             note=None,
         )
+        PrincipalCache.invalidate(int(user_input))
         await self.__reply_user_added(user_input)
 
     async def __reply_user_added(self, user_input: str) -> None:
@@ -12,6 +12,7 @@ from bot.responses.administration.link_account_handler_responses import (
     get_invalid_code_message,
     get_link_success_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class LinkAccountHandler(BotMessageHandler):
@@ -59,6 +60,8 @@ class LinkAccountHandler(BotMessageHandler):
             telegram_username=self._message.get_username(),
             telegram_full_name=self._message.get_full_name(),
         )
+        PrincipalCache.invalidate(telegram_user_id)
+        PrincipalCache.invalidate(rest_user_id)
 
         await self._reply(
             get_link_success_message(rest_profile.username or ""),
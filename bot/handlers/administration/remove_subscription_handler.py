@@ -11,6 +11,7 @@ from bot.responses.administration.remove_subscription_handler_responses import (
     get_log_subscription_removed_message,
     get_subscription_removed_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class RemoveSubscriptionHandler(BotMessageHandler):
@@ -34,6 +35,7 @@ class RemoveSubscriptionHandler(BotMessageHandler):
         user_id = int(self._message.get_text().split()[1])
 
         await DatabaseManager.remove_subscription(user_id)
+        PrincipalCache.invalidate(user_id)
 
         await self._reply(
             get_subscription_removed_message(str(user_id)),
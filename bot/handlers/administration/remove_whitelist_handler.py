@@ -13,6 +13,7 @@ from bot.responses.administration.remove_whitelist_handler_responses import (
     get_user_not_in_whitelist_message,
     get_user_removed_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class RemoveWhitelistHandler(BotMessageHandler):
@@ -52,6 +53,7 @@ class RemoveWhitelistHandler(BotMessageHandler):
         user_id = int(self._message.get_text().split()[1])
 
         await DatabaseManager.remove_user(user_id)
+        PrincipalCache.invalidate(user_id)
         await self.__reply_user_removed(user_id)
 
     async def __reply_user_removed(self, user_id: int) -> None:
@@ -12,6 +12,7 @@ from bot.responses.administration.use_key_handler_responses import (
     get_no_message_provided_message,
     get_subscription_redeemed_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class SaveUserKeyHandler(BotMessageHandler):
@@ -38,6 +39,7 @@ class SaveUserKeyHandler(BotMessageHandler):
         if subscription_days:
             await DatabaseManager.add_user(user_id, username, full_name, None)
             await DatabaseManager.add_subscription(user_id, subscription_days)
+            PrincipalCache.invalidate(user_id)
             await DatabaseManager.remove_subscription_key(key)
 
             await self._reply(get_subscription_redeemed_message(subscription_days), data={"days": subscription_days})
@@ -44,8 +44,11 @@ from bot.responses.bot_response import BotResponse
 from bot.responses.sending_videos.manual_clip_handler_responses import get_limit_exceeded_clip_duration_message
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
 from bot.search.scenes_finder import ScenesFinder
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.services.rate_limiter.command_rate_limiter import CommandRateLimiter
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.services.serial_context.serial_context_manager import SerialContextManager
+from bot.services.telegram_file_cache.telegram_file_cache import TelegramFileCache
 from bot.settings import settings
 from bot.types import (
     ClipSegment,
@@ -103,7 +106,7 @@ class BotMessageHandler(ABC):
                 f"{type(e)} Error in {self.__get_action_name()} for user '{self._message.get_user_id()}': {e}",
             )
 
-        await DatabaseManager.log_command_usage(self._message.get_user_id())
+        await CommandRateLimiter.record_usage(self._message.get_user_id())
 
     async def _log_system_message(self, level: int, message: str) -> None:
         await log_system_message(level, message, self._logger)
@@ -213,7 +216,7 @@ class BotMessageHandler(ABC):
         end_time: float,
         segment_id: Any,
     ) -> Tuple[float, float, float]:
-        is_admin = await DatabaseManager.is_admin_or_moderator(self._message.get_user_id())
+        is_admin = await PrincipalCache.is_admin_or_moderator(self._message.get_user_id())
         max_duration = settings.MAX_CLIP_DURATION_HARD_LIMIT if is_admin else settings.MAX_CLIP_DURATION
         clip_duration = end_time - start_time
         if clip_duration > max_duration:
@@ -226,6 +229,33 @@ class BotMessageHandler(ABC):
             clip_duration = max_duration
         return start_time, end_time, clip_duration
 
+    async def _send_single_clip(
+        self,
+        *,
+        chat_id: int,
+        segment: Dict[str, Any],
+        start_time: float,
+        end_time: float,
+    ) -> None:
+        segment_id = segment.get(SegmentKeys.SEGMENT_ID, segment.get(SegmentKeys.ID))
+        start_time, end_time, _ = await self._trim_clip_if_needed(
+            start_time=start_time,
+            end_time=end_time,
+            segment_id=segment_id,
+        )
+
+        await self._send_segment_clip(
+            segment[SegmentKeys.VIDEO_PATH], start_time, end_time,
+            suggestions=["Uzyj /w N aby wybrac inny wynik"],
+        )
+
+        await self._insert_last_single_clip(
+            chat_id=chat_id,
+            segment=segment,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     async def _insert_last_single_clip(
         self,
         *,
@@ -249,7 +279,7 @@ class BotMessageHandler(ABC):
         return []
 
     async def _check_clip_limit_not_exceeded(self) -> bool:
-        is_admin_or_moderator = await DatabaseManager.is_admin_or_moderator(self._message.get_user_id())
+        is_admin_or_moderator = await PrincipalCache.is_admin_or_moderator(self._message.get_user_id())
         user_clip_count = await DatabaseManager.get_user_clip_count(self._message.get_chat_id())
         if is_admin_or_moderator or user_clip_count < settings.MAX_CLIPS_PER_USER:
             return True
@@ -259,7 +289,7 @@ class BotMessageHandler(ABC):
     async def _handle_clip_duration_limit_exceeded(self, clip_duration: Optional[float]) -> bool:
         if clip_duration is None:
             return False
-        if not await DatabaseManager.is_admin_or_moderator(self._message.get_user_id()) and clip_duration > settings.MAX_CLIP_DURATION:
+        if not await PrincipalCache.is_admin_or_moderator(self._message.get_user_id()) and clip_duration > settings.MAX_CLIP_DURATION:
             await self._responder.send_markdown(get_limit_exceeded_clip_duration_message())
             await self._log_system_message(logging.INFO, get_log_clip_duration_exceeded_message(self._message.get_user_id()))
             return True
@@ -376,6 +406,25 @@ class BotMessageHandler(ABC):
         output = await ClipsExtractor.extract_clip(video_path, new_start, new_end, self._logger)
         return output, new_start, new_end
 
+    async def _send_segment_clip(
+        self,
+        video_path: Union[str, Path],
+        start_time: float,
+        end_time: float,
+        suggestions: Optional[List[str]] = None,
+    ) -> None:
+        clip_key = await TelegramFileCache.segment_key(video_path, start_time, end_time)
+        if await self._responder.send_cached_video(clip_key):
+            return
+
+        output_filename = await ClipsExtractor.extract_clip(video_path, start_time, end_time, self._logger)
+        await self._responder.send_video(
+            output_filename,
+            duration=end_time - start_time,
+            suggestions=suggestions,
+            clip_key=clip_key,
+        )
+
     async def _send_top_segment_as_clip(
         self,
         top_segment: Dict[str, Any],
@@ -396,15 +445,19 @@ class BotMessageHandler(ABC):
         if await self._handle_clip_duration_limit_exceeded(clip_duration):
             return True
 
-        output_filename, start_time, end_time = await self.__extract_clip_with_size_guard(
-            Path(top_segment[SegmentKeys.VIDEO_PATH]), start_time, end_time, top_segment,
-        )
+        # Keyed by the requested range: the size guard may shrink the clip, and the next request must still hit.
+        clip_key = await TelegramFileCache.segment_key(top_segment[SegmentKeys.VIDEO_PATH], start_time, end_time)
+        if not await self._responder.send_cached_video(clip_key):
+            output_filename, start_time, end_time = await self.__extract_clip_with_size_guard(
+                Path(top_segment[SegmentKeys.VIDEO_PATH]), start_time, end_time, top_segment,
+            )
 
-        await self._responder.send_video(
-            output_filename,
-            duration=end_time - start_time,
-            suggestions=["Uzyj /w N aby wybrac inny wynik"],
-        )
+            await self._responder.send_video(
+                output_filename,
+                duration=end_time - start_time,
+                suggestions=["Uzyj /w N aby wybrac inny wynik"],
+                clip_key=clip_key,
+            )
 
         await DatabaseManager.insert_last_clip(
             chat_id=self._message.get_chat_id(),
@@ -424,8 +477,11 @@ class BotMessageHandler(ABC):
         total_duration: float,
         clip_type: ClipType,
         series_name: Optional[str] = None,
+        use_clip_cache: bool = True,
     ) -> None:
-        compiled_output = await ClipsCompiler.compile(self._message, selected_segments, self._logger, series_name)
+        compiled_output = await ClipsCompiler.compile(
+            self._message, selected_segments, self._logger, series_name, use_clip_cache=use_clip_cache,
+        )
         await process_compiled_clip(self._message, compiled_output, clip_type)
 
         try:
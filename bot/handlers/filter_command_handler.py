@@ -18,6 +18,7 @@ from bot.responses.filter_command_messages import (
     get_no_filter_set_message,
     get_no_segments_match_active_filter_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.services.search_filter.active_filter_scene_segments import (
     ActiveFilterSceneSegmentsStatus,
     load_active_filter_scene_segments,
@@ -47,7 +48,7 @@ class FilterCommandHandler(BotMessageHandler):
         parts = msg.get_text().split()
         if len(parts) <= 1:
             return True
-        if not await DatabaseManager.is_admin_or_moderator(msg.get_user_id()) and len(
+        if not await PrincipalCache.is_admin_or_moderator(msg.get_user_id()) and len(
                 msg.get_text(),
         ) > settings.MAX_SEARCH_QUERY_LENGTH:
             await self._reply_error(get_message_too_long_message())
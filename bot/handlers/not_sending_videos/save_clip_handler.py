@@ -31,6 +31,7 @@ from bot.responses.not_sending_videos.save_clip_handler_responses import (
     get_log_no_segment_selected_message,
     get_no_segment_selected_message,
 )
+from bot.services.blob_store.clip_storage import ClipStorage
 from bot.settings import settings
 from bot.types import ElasticsearchSegment
 from bot.utils.constants import (
@@ -106,24 +107,24 @@ class SaveClipHandler(BotMessageHandler):
 
         clip_info = await self.__prepare_clip(last_clip)
 
-        with clip_info.output_filename.open("rb") as f:
-            video_data = f.read()
+        video = await ClipStorage.store_file(clip_info.output_filename)
 
         duration = await get_video_duration(clip_info.output_filename)
         thumbnail_data = await KeyframeExtractor.extract_thumbnail_bytes(clip_info.output_filename, clip_info.start_time, duration)
+        thumbnail = await ClipStorage.store(thumbnail_data) if thumbnail_data else None
 
         await DatabaseManager.save_clip(
             chat_id=self._message.get_chat_id(),
             user_id=self._message.get_user_id(),
             clip_name=clip_name,
-            video_data=video_data,
+            video=video,
             start_time=clip_info.start_time,
             end_time=clip_info.end_time,
             duration=duration,
             is_compilation=clip_info.is_compilation,
             season=clip_info.season,
             episode_number=clip_info.episode_number,
-            thumbnail_data=thumbnail_data,
+            thumbnail=thumbnail,
         )
 
         await self.__reply_clip_saved_successfully(clip_name, duration)
@@ -152,7 +153,7 @@ class SaveClipHandler(BotMessageHandler):
         return await clip_handlers[last_clip.clip_type]()
 
     async def __handle_compiled_clip(self, last_clip: LastClip) -> ClipInfo:
-        output_filename = self.__bytes_to_filepath(last_clip.compiled_clip)
+        output_filename = self.__bytes_to_filepath(await ClipStorage.load_compiled_clip(last_clip))
         return ClipInfo(
             output_filename=output_filename,
             start_time=0.0,
@@ -0,0 +1,93 @@
+import json
+import logging
+import re
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from bot.database.database_manager import DatabaseManager
+from bot.handlers.bot_message_handler import (
+    BotMessageHandler,
+    ValidatorFunctions,
+)
+from bot.responses.not_sending_videos.screenshot_search_handler_responses import (
+    format_screenshot_search_response,
+    get_frame_hashes_not_indexed_message,
+    get_invalid_distance_message,
+    get_log_no_similar_frames_message,
+    get_log_screenshot_search_results_sent_message,
+    get_no_image_provided_message,
+    get_no_similar_frames_message,
+)
+from bot.search.video_frames.frame_hash_finder import FrameHashFinder
+from bot.settings import settings
+from bot.video.frame_hasher import FrameHasher
+
+
+class ScreenshotSearchHandler(BotMessageHandler):
+    __HASH_PATTERN = re.compile(r"^[0-9a-fA-F]{16}$")
+    __MAX_DISTANCE = 32
+
+    @classmethod
+    def get_commands(cls) -> List[str]:
+        return ["zrzut", "screenshot", "zr"]
+
+    async def _get_validator_functions(self) -> ValidatorFunctions:
+        return [self.__check_argument_count]
+
+    def _get_usage_message(self) -> str:
+        return get_no_image_provided_message()
+
+    async def __check_argument_count(self) -> bool:
+        return await self._validate_argument_count(self._message, 0, 2)
+
+    async def _do_handle(self) -> None:
+        phash, max_distance = self.__parse_arguments(self._get_message_content()[1:])
+        if max_distance is None:
+            return await self._reply_error(get_invalid_distance_message())
+
+        if phash is None:
+            image = await self._message.get_image()
+            if not image:
+                return await self._reply_invalid_args_count(get_no_image_provided_message())
+            phash = await FrameHasher.compute_phash(image)
+
+        active_series = await self._get_user_active_series(self._message.get_user_id())
+        frames = await FrameHashFinder.find_similar(phash, active_series, self._logger, max_distance)
+
+        if frames is None:
+            await self._reply_error(get_frame_hashes_not_indexed_message(active_series))
+            return await self._log_system_message(logging.INFO, get_log_no_similar_frames_message(phash))
+        if not frames:
+            await self._reply_error(get_no_similar_frames_message(phash))
+            return await self._log_system_message(logging.INFO, get_log_no_similar_frames_message(phash))
+
+        await DatabaseManager.insert_last_search(
+            chat_id=self._message.get_chat_id(),
+            quote=f"{phash:016x}",
+            segments=json.dumps(frames),
+        )
+
+        await self._reply(
+            format_screenshot_search_response(frames, phash),
+            data={"hash": f"{phash:016x}", "max_distance": max_distance, "results": frames},
+        )
+        return await self._log_system_message(
+            logging.INFO,
+            get_log_screenshot_search_results_sent_message(phash, len(frames), self._message.get_username()),
+        )
+
+    @staticmethod
+    def __parse_arguments(args: List[str]) -> Tuple[Optional[int], Optional[int]]:
+        phash = None
+        max_distance: Optional[int] = settings.FRAME_HASH_MAX_DISTANCE
+        for arg in args:
+            if ScreenshotSearchHandler.__HASH_PATTERN.match(arg):
+                phash = int(arg, 16)
+            elif arg.isdigit() and int(arg) <= ScreenshotSearchHandler.__MAX_DISTANCE:
+                max_distance = int(arg)
+            else:
+                return phash, None
+        return phash, max_distance
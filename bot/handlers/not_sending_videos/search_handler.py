@@ -2,7 +2,6 @@ import logging
 import math
 from typing import List
 
-from bot.database.database_manager import DatabaseManager
 from bot.handlers.bot_message_handler import (
     BotMessageHandler,
     ValidatorFunctions,
@@ -17,6 +16,7 @@ from bot.responses.not_sending_videos.search_handler_responses import (
     get_log_search_results_sent_message,
     get_no_quote_provided_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.settings import settings
 
 
@@ -39,7 +39,7 @@ class SearchHandler(BotMessageHandler):
 
     async def __check_quote_length(self) -> bool:
         quote = self._get_quote()
-        if not await DatabaseManager.is_admin_or_moderator(self._message.get_user_id()) and len(
+        if not await PrincipalCache.is_admin_or_moderator(self._message.get_user_id()) and len(
                 quote,
         ) > settings.MAX_SEARCH_QUERY_LENGTH:
             await self._reply_error(get_message_too_long_message())
@@ -8,7 +8,6 @@ from typing import (
     Tuple,
 )
 
-from bot.database.database_manager import DatabaseManager
 from bot.exceptions.vllm_exceptions import (
     VllmConnectionError,
     VllmTimeoutError,
@@ -23,6 +22,7 @@ from bot.search.semantic_segments_finder import (
     SemanticSearchMode,
     SemanticSegmentsFinder,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.settings import settings
 
 
@@ -38,7 +38,7 @@ class SemanticBotHandler(BotMessageHandler):
 
     async def __check_semantic_query_length(self) -> bool:
         _, query = self._parse_semantic_mode_and_query()
-        if not await DatabaseManager.is_admin_or_moderator(
+        if not await PrincipalCache.is_admin_or_moderator(
             self._message.get_user_id(),
         ) and len(query) > settings.MAX_SEARCH_QUERY_LENGTH:
             await self._reply_error(get_message_too_long_message())
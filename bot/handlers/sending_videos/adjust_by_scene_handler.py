@@ -35,7 +35,6 @@ from bot.utils.constants import (
     EpisodeMetadataKeys,
     SegmentKeys,
 )
-from bot.video.clips_extractor import ClipsExtractor
 from bot.video.utils import get_video_duration
 
 
@@ -92,12 +91,8 @@ class AdjustBySceneHandler(BotMessageHandler):
         if await self._handle_clip_duration_limit_exceeded(new_end - new_start):
             return None
 
-        output_filename = await ClipsExtractor.extract_clip(
-            segment_info.get(SegmentKeys.VIDEO_PATH), new_start, new_end, self._logger,
-        )
-        await self._responder.send_video(
-            output_filename,
-            duration=new_end - new_start,
+        await self._send_segment_clip(
+            segment_info.get(SegmentKeys.VIDEO_PATH), new_start, new_end,
             suggestions=["Zmniejszyć liczbę cięć", "Wybrać krótszy fragment"],
         )
         await DatabaseManager.insert_last_clip(
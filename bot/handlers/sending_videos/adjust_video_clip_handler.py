@@ -29,9 +29,9 @@ from bot.responses.sending_videos.adjust_video_clip_handler_responses import (
     get_successful_adjustment_message,
     get_updated_segment_info_log,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.settings import settings
 from bot.types import SegmentWithTimes
-from bot.video.clips_extractor import ClipsExtractor
 from bot.video.utils import get_video_duration
 
 
@@ -100,12 +100,8 @@ class AdjustVideoClipHandler(BotMessageHandler):
         if await self._handle_clip_duration_limit_exceeded(end_time - start_time):
             return None
 
-        output_filename = await ClipsExtractor.extract_clip(segment_info.get("video_path"), start_time, end_time, self._logger)
-
-        clip_duration = end_time - start_time
-        await self._responder.send_video(
-            output_filename,
-            duration=clip_duration,
+        await self._send_segment_clip(
+            segment_info.get("video_path"), start_time, end_time,
             suggestions=["Zmniejszyć rozszerzenie czasowe", "Wybrać krótszy fragment"],
         )
 
@@ -136,7 +132,7 @@ class AdjustVideoClipHandler(BotMessageHandler):
 
     async def __is_adjustment_exceeding_limits(self, additional_start_offset: float, additional_end_offset: float) -> bool:
         return (
-            not await DatabaseManager.is_admin_or_moderator(self._message.get_user_id()) and
+            not await PrincipalCache.is_admin_or_moderator(self._message.get_user_id()) and
             abs(additional_start_offset) + abs(additional_end_offset) > settings.MAX_ADJUSTMENT_DURATION
         )
 
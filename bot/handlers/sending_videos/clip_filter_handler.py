@@ -23,7 +23,6 @@ from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.services.search_filter.active_filter_text_segments import ActiveFilterTextSegmentsOutcome
 from bot.settings import settings
 from bot.utils.constants import SegmentKeys
-from bot.video.clips_extractor import ClipsExtractor
 
 
 class ClipFilterHandler(FilterCommandHandler):
@@ -65,24 +64,7 @@ class ClipFilterHandler(FilterCommandHandler):
             series_names[0] if series_names else "", segment, start_time, end_time, self._logger,
         )
 
-        segment_id = segment.get(SegmentKeys.SEGMENT_ID, segment.get(SegmentKeys.ID))
-        start_time, end_time, clip_duration = await self._trim_clip_if_needed(
-            start_time=start_time,
-            end_time=end_time,
-            segment_id=segment_id,
-        )
-
-        output_filename = await ClipsExtractor.extract_clip(
-            segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger,
-        )
-
-        await self._responder.send_video(
-            output_filename,
-            duration=clip_duration,
-            suggestions=["Uzyj /w N aby wybrac inny wynik"],
-        )
-
-        await self._insert_last_single_clip(
+        await self._send_single_clip(
             chat_id=chat_id,
             segment=segment,
             start_time=start_time,
@@ -16,10 +16,10 @@ from bot.responses.sending_videos.clip_handler_responses import (
     get_no_quote_provided_message,
     get_no_segments_found_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.settings import settings
 from bot.utils.constants import SegmentKeys
-from bot.video.clips_extractor import ClipsExtractor
 
 
 class ClipHandler(BotMessageHandler):
@@ -41,7 +41,7 @@ class ClipHandler(BotMessageHandler):
 
     async def __validate_length(self) -> bool:
         msg = self._message
-        if not await DatabaseManager.is_admin_or_moderator(msg.get_user_id()) \
+        if not await PrincipalCache.is_admin_or_moderator(msg.get_user_id()) \
                 and len(msg.get_text()) > settings.MAX_SEARCH_QUERY_LENGTH:
             await self._reply_error(get_message_too_long_message())
             return False
@@ -71,22 +71,7 @@ class ClipHandler(BotMessageHandler):
             active_series, segment, start_time, end_time, self._logger,
         )
 
-        segment_id = segment.get(SegmentKeys.SEGMENT_ID, segment.get(SegmentKeys.ID))
-        start_time, end_time, clip_duration = await self._trim_clip_if_needed(
-            start_time=start_time,
-            end_time=end_time,
-            segment_id=segment_id,
-        )
-
-        output_filename = await ClipsExtractor.extract_clip(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger)
-
-        await self._responder.send_video(
-            output_filename,
-            duration=clip_duration,
-            suggestions=["Uzyj /w N aby wybrac inny wynik"],
-        )
-
-        await self._insert_last_single_clip(
+        await self._send_single_clip(
             chat_id=msg.get_chat_id(),
             segment=segment,
             start_time=start_time,
@@ -25,6 +25,7 @@ from bot.responses.sending_videos.compile_clips_handler_responses import (
     get_no_previous_search_results_message,
     get_selected_clip_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.settings import settings
 from bot.types import ClipSegment
 from bot.utils.constants import (
@@ -85,7 +86,7 @@ class CompileClipsHandler(BotMessageHandler):
             return await self.__reply_no_matching_segments_found()
 
         if (
-            not await DatabaseManager.is_admin_or_moderator(user_id)
+            not await PrincipalCache.is_admin_or_moderator(user_id)
             and len(selected_segments) > settings.MAX_CLIPS_PER_COMPILATION
         ):
             return await self.__reply_max_clips_exceeded()
@@ -146,7 +147,7 @@ class CompileClipsHandler(BotMessageHandler):
             raise self.InvalidRangeException(get_invalid_range_message(index))
 
         num_of_clips = end - start + 1
-        if not await DatabaseManager.is_admin_or_moderator(user_id) and num_of_clips > settings.MAX_CLIPS_PER_COMPILATION:
+        if not await PrincipalCache.is_admin_or_moderator(user_id) and num_of_clips > settings.MAX_CLIPS_PER_COMPILATION:
             raise self.MaxClipsExceededException()
 
         collected = []
@@ -185,7 +186,7 @@ class CompileClipsHandler(BotMessageHandler):
 
     @staticmethod
     async def __check_clip_duration_limit(user_id: int, total_duration: float) -> bool:
-        if await DatabaseManager.is_admin_or_moderator(user_id):
+        if await PrincipalCache.is_admin_or_moderator(user_id):
             return False
         return total_duration > settings.LIMIT_DURATION
 
@@ -1,5 +1,6 @@
 import logging
 import math
+from pathlib import Path
 import tempfile
 from typing import List
 
@@ -15,6 +16,7 @@ from bot.responses.sending_videos.compile_selected_clips_handler_responses impor
     get_no_clip_numbers_provided_message,
     get_no_matching_clips_found_message,
 )
+from bot.services.blob_store.clip_storage import ClipStorage
 
 
 class CompileSelectedClipsHandler(BotMessageHandler):
@@ -68,23 +70,28 @@ class CompileSelectedClipsHandler(BotMessageHandler):
         if not selected_clips:
             return await self.__reply_no_matching_clips_found()
 
-        selected_segments = []
-        for clip in selected_clips:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, delete_on_close=False, suffix=".mp4")
-            temp_file.write(clip.video_data)
-            temp_file.close()
-            selected_segments.append({
-                "video_path": temp_file.name,
-                "start": 0,
-                "end": clip.duration or 0.0,
-            })
-
         total_duration = sum(clip.duration or 0.0 for clip in selected_clips)
 
         if await self._handle_clip_duration_limit_exceeded(total_duration):
             return None
 
-        await self._compile_and_send_video(selected_segments, total_duration, ClipType.COMPILED)
+        selected_segments = []
+        try:
+            for clip in selected_clips:
+                temp_file = tempfile.NamedTemporaryFile(delete=False, delete_on_close=False, suffix=".mp4")
+                temp_file.write(await ClipStorage.load_video(clip))
+                temp_file.close()
+                selected_segments.append({
+                    "video_path": temp_file.name,
+                    "start": 0,
+                    "end": clip.duration or 0.0,
+                })
+
+            # Cutting one-off temp copies would only fill the clip cache with keys that never repeat.
+            await self._compile_and_send_video(selected_segments, total_duration, ClipType.COMPILED, use_clip_cache=False)
+        finally:
+            for segment in selected_segments:
+                Path(segment["video_path"]).unlink(missing_ok=True)
 
         return await self._log_system_message(
             logging.INFO,
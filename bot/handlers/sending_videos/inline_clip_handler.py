@@ -30,7 +30,11 @@ from bot.handlers.bot_message_handler import (
 )
 from bot.responses.sending_videos.inline_clip_handler_responses import get_no_query_provided_message
 from bot.search.text_segments_finder import TextSegmentsFinder
+from bot.services.blob_store.clip_storage import ClipStorage
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.services.rate_limiter.command_rate_limiter import CommandRateLimiter
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
+from bot.services.telegram_file_cache.telegram_file_cache import TelegramFileCache
 from bot.settings import settings
 from bot.types import ElasticsearchSegment
 from bot.utils.constants import SegmentKeys
@@ -108,7 +112,7 @@ class InlineClipHandler(BotMessageHandler):
             await log_system_message(logging.ERROR, f"Failed to generate any results for: '{query}'", self._logger)
             return [generate_error_result(f'Nie znaleziono klipu dla: "{query}"')]
 
-        await DatabaseManager.log_command_usage(user_id)
+        await CommandRateLimiter.record_usage(user_id)
         return results
 
     async def __fetch_data(self, user_id: int, query: str) -> Tuple[Optional[VideoClip], List[ElasticsearchSegment], Optional[Dict[str, Any]], bool, str]:
@@ -117,7 +121,7 @@ class InlineClipHandler(BotMessageHandler):
             DatabaseManager.get_clip_by_name(user_id, query),
             self._search_segments(query, [active_series], 5),
             TextSegmentsFinder.get_season_details_from_elastic(logger=self._logger, series_name=active_series),
-            DatabaseManager.is_admin_or_moderator(user_id),
+            PrincipalCache.is_admin_or_moderator(user_id),
             return_exceptions=True,
         )
 
@@ -141,7 +145,7 @@ class InlineClipHandler(BotMessageHandler):
 
         if saved_clip:
             saved_file = temp_dir / f"1_saved_{saved_clip.name}.mp4"
-            saved_file.write_bytes(saved_clip.video_data)
+            saved_file.write_bytes(await ClipStorage.load_video(saved_clip))
             video_files.append(saved_file)
 
         for idx, segment in enumerate(segments, start=2 if saved_clip else 1):
@@ -160,7 +164,7 @@ class InlineClipHandler(BotMessageHandler):
                 episode_code = segment_info.episode_formatted if segment_info else str(idx)
                 output_path = await ClipsExtractor.extract_clip(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger)
                 final_path = temp_dir / f"{idx}_search_{episode_code}.mp4"
-                output_path.rename(final_path)
+                shutil.move(output_path, final_path)
                 video_files.append(final_path)
             except FFMpegException as e:
                 await log_system_message(logging.ERROR, f"FFmpeg error for segment {segment.get('id', 'unknown')}: {e}", self._logger)
@@ -188,10 +192,11 @@ class InlineClipHandler(BotMessageHandler):
 
             results.append(
                 await self.__upload_clip_with_cleanup(
-                    saved_clip.video_data,
+                    saved_clip,
                     f"💾 Zapisany klip: {saved_clip.name}",
                     description,
                     bot,
+                    TelegramFileCache.saved_clip_key(saved_clip.id),
                 ),
             )
 
@@ -216,28 +221,42 @@ class InlineClipHandler(BotMessageHandler):
         if not is_admin and (end_time - start_time) > settings.MAX_CLIP_DURATION:
             return None
 
+        segment_info = format_segment(segment)
+        title = f"{convert_number_to_emoji(index)} {segment_info.episode_formatted} | {segment_info.time_formatted}"
+        description = f"👉🏻 {segment_info.episode_title}"
+        clip_key = await TelegramFileCache.segment_key(segment[SegmentKeys.VIDEO_PATH], start_time, end_time)
+
+        file_id = await TelegramFileCache.get(clip_key)
+        if file_id is not None:
+            return self.__build_cached_result(title, description, file_id)
+
         video_path = await ClipsExtractor.extract_clip(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger)
         try:
-            segment_info = format_segment(segment)
-            return await self.__cache_video(
-                f"{convert_number_to_emoji(index)} {segment_info.episode_formatted} | {segment_info.time_formatted}",
-                f"👉🏻 {segment_info.episode_title}",
-                video_path,
-                bot,
-            )
+            return await self.__cache_video(title, description, video_path, bot, clip_key)
         finally:
             video_path.unlink(missing_ok=True)
 
-    async def __upload_clip_with_cleanup(self, video_data: bytes, title: str, description: str, bot: Bot) -> InlineQueryResultCachedVideo:
+    async def __upload_clip_with_cleanup(
+        self, clip: VideoClip, title: str, description: str, bot: Bot, clip_key: str,
+    ) -> InlineQueryResultCachedVideo:
+        file_id = await TelegramFileCache.get(clip_key)
+        if file_id is not None:
+            return self.__build_cached_result(title, description, file_id)
+
         with tempfile.NamedTemporaryFile(suffix=".mp4", delete=True) as tmp:
-            tmp.write(video_data)
+            tmp.write(await ClipStorage.load_video(clip))
             tmp.flush()
-            return await self.__cache_video(title, description, Path(tmp.name), bot)
+            return await self.__cache_video(title, description, Path(tmp.name), bot, clip_key)
+
+    @staticmethod
+    def __build_cached_result(title: str, description: str, file_id: str) -> InlineQueryResultCachedVideo:
+        return InlineQueryResultCachedVideo(id=str(uuid4()), video_file_id=file_id, title=title, description=description)
 
     @staticmethod
-    async def __cache_video(title: str, description: str, video_path: Path, bot: Bot) -> InlineQueryResultCachedVideo:
+    async def __cache_video(title: str, description: str, video_path: Path, bot: Bot, clip_key: str) -> InlineQueryResultCachedVideo:
         sent_message = await bot.send_video(chat_id=settings.INLINE_CACHE_CHANNEL_ID, video=FSInputFile(video_path))
-        return InlineQueryResultCachedVideo(id=str(uuid4()), video_file_id=sent_message.video.file_id, title=title, description=description)
+        await TelegramFileCache.put(clip_key, sent_message.video.file_id)
+        return InlineClipHandler.__build_cached_result(title, description, sent_message.video.file_id)
 
     @staticmethod
     async def __create_zip(video_files: List[Path], temp_dir: Path, query: str) -> Path:
@@ -29,7 +29,6 @@ from bot.utils.functions import (
     InvalidTimeStringException,
     minutes_str_to_seconds,
 )
-from bot.video.clips_extractor import ClipsExtractor
 from bot.video.episode import (
     Episode,
     InvalidSeasonEpisodeStringException,
@@ -94,13 +93,7 @@ class ManualClipHandler(BotMessageHandler):
         if not video_path.exists():
             return await self.__reply_video_file_not_exist(video_path)
 
-        output_filename = await ClipsExtractor.extract_clip(video_path, start_seconds, end_seconds, self._logger)
-
-        await self._responder.send_video(
-            output_filename,
-            duration=clip_duration,
-            suggestions=["Wybrać krótszy fragment"],
-        )
+        await self._send_segment_clip(video_path, start_seconds, end_seconds, suggestions=["Wybrać krótszy fragment"])
 
         await self._log_system_message(
             logging.INFO,
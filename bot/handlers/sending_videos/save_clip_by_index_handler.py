@@ -27,6 +27,7 @@ from bot.responses.sending_videos.save_clip_by_index_handler_responses import (
     get_no_previous_search_message,
     get_usage_message,
 )
+from bot.services.blob_store.clip_storage import ClipStorage
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.settings import settings
 from bot.utils.constants import (
@@ -185,11 +186,11 @@ class SaveClipByIndexHandler(BotMessageHandler):
             segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger,
         )
 
-        with output_filename.open("rb") as f:
-            video_data = f.read()
+        video = await ClipStorage.store_file(output_filename)
 
         duration = await get_video_duration(output_filename)
         thumbnail_data = await KeyframeExtractor.extract_thumbnail_bytes(output_filename, start_time, duration)
+        thumbnail = await ClipStorage.store(thumbnail_data) if thumbnail_data else None
 
         episode_info = segment.get(
             EpisodeMetadataKeys.EPISODE_METADATA,
@@ -202,14 +203,14 @@ class SaveClipByIndexHandler(BotMessageHandler):
             chat_id=self._message.get_chat_id(),
             user_id=self._message.get_user_id(),
             clip_name=clip_name,
-            video_data=video_data,
+            video=video,
             start_time=start_time,
             end_time=end_time,
             duration=duration,
             is_compilation=False,
             season=season,
             episode_number=episode_number,
-            thumbnail_data=thumbnail_data,
+            thumbnail=thumbnail,
         )
 
         await self._reply(
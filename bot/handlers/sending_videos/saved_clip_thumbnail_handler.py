@@ -19,6 +19,7 @@ from bot.responses.sending_videos.saved_clip_thumbnail_handler_responses import
     get_log_keyframe_sent_message,
     get_no_clip_identifier_provided_message,
 )
+from bot.services.blob_store.clip_storage import ClipStorage
 from bot.utils.functions import parse_frame_selector
 from bot.video.keyframe_extractor import KeyframeExtractor
 
@@ -67,7 +68,7 @@ class SavedClipThumbnailHandler(BotMessageHandler):
         os.close(fd)
         video_path = Path(tmp_path)
         try:
-            video_path.write_bytes(clip.video_data)
+            video_path.write_bytes(await ClipStorage.load_video(clip))
 
             duration = clip.duration or 0.0
             if duration > 0:
@@ -1,7 +1,5 @@
 import json
 import logging
-from pathlib import Path
-import tempfile
 from typing import List
 
 from bot.database.database_manager import DatabaseManager
@@ -20,10 +18,10 @@ from bot.responses.sending_videos.select_clip_handler_responses import (
     get_no_clip_number_provided_message,
     get_no_previous_search_message,
 )
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.settings import settings
 from bot.utils.constants import SegmentKeys
-from bot.video.clips_extractor import ClipsExtractor
 
 
 class SelectClipHandler(BotMessageHandler):
@@ -67,7 +65,7 @@ class SelectClipHandler(BotMessageHandler):
         )
 
         segment_id = segment.get(SegmentKeys.SEGMENT_ID, segment.get(SegmentKeys.ID))
-        is_admin = await DatabaseManager.is_admin_or_moderator(self._message.get_user_id())
+        is_admin = await PrincipalCache.is_admin_or_moderator(self._message.get_user_id())
         max_duration = settings.MAX_CLIP_DURATION_HARD_LIMIT if is_admin else settings.MAX_CLIP_DURATION
         clip_duration = end_time - start_time
         if clip_duration > max_duration:
@@ -75,14 +73,8 @@ class SelectClipHandler(BotMessageHandler):
             await self._responder.send_markdown(get_clip_trimmed_message(max_duration))
             await self._log_system_message(logging.INFO, get_log_clip_trimmed_message(segment_id, clip_duration, max_duration))
 
-        output_filename = await ClipsExtractor.extract_clip(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, self._logger)
-        temp_file_path = Path(tempfile.gettempdir()) / f"selected_clip_{segment_id}.mp4"
-        output_filename.replace(temp_file_path)
-
-        clip_duration = end_time - start_time
-        await self._responder.send_video(
-            temp_file_path,
-            duration=clip_duration,
+        await self._send_segment_clip(
+            segment[SegmentKeys.VIDEO_PATH], start_time, end_time,
             suggestions=["Wybrać krótszy fragment"],
         )
 
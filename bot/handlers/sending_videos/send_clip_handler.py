@@ -22,6 +22,8 @@ from bot.responses.sending_videos.send_clip_handler_responses import (
     get_log_empty_file_error_message,
     get_no_clip_number_provided_message,
 )
+from bot.services.blob_store.clip_storage import ClipStorage
+from bot.services.telegram_file_cache.telegram_file_cache import TelegramFileCache
 
 
 class SendClipHandler(BotMessageHandler):
@@ -76,22 +78,25 @@ class SendClipHandler(BotMessageHandler):
         if await self._handle_clip_duration_limit_exceeded(clip.duration):
             return None
 
-        video_data = clip.video_data
-        if not video_data:
-            return await self.__reply_empty_clip_file(clip.name)
-
-        temp_file_path = Path(tempfile.gettempdir()) / f"{clip.name}.mp4"
-        with temp_file_path.open("wb") as temp_file:
-            temp_file.write(video_data)
-
-        if temp_file_path.stat().st_size == 0:
-            return await self.__reply_empty_file_error(clip.name)
-
-        await self._responder.send_video(
-            temp_file_path,
-            duration=clip.duration,
-            suggestions=["Wybrać krótszy fragment"],
-        )
+        clip_key = TelegramFileCache.saved_clip_key(clip.id)
+        if not await self._responder.send_cached_video(clip_key):
+            video_data = await ClipStorage.load_video(clip)
+            if not video_data:
+                return await self.__reply_empty_clip_file(clip.name)
+
+            temp_file_path = Path(tempfile.gettempdir()) / f"{clip.name}.mp4"
+            with temp_file_path.open("wb") as temp_file:
+                temp_file.write(video_data)
+
+            if temp_file_path.stat().st_size == 0:
+                return await self.__reply_empty_file_error(clip.name)
+
+            await self._responder.send_video(
+                temp_file_path,
+                duration=clip.duration,
+                suggestions=["Wybrać krótszy fragment"],
+                clip_key=clip_key,
+            )
 
         return await self._log_system_message(
             logging.INFO,
@@ -19,7 +19,6 @@ from bot.utils.constants import (
     EpisodeMetadataKeys,
     SegmentKeys,
 )
-from bot.video.clips_extractor import ClipsExtractor
 
 
 class SnapClipHandler(BotMessageHandler):
@@ -69,11 +68,7 @@ class SnapClipHandler(BotMessageHandler):
         if await self._handle_clip_duration_limit_exceeded(clip_duration):
             return None
 
-        output_filename = await ClipsExtractor.extract_clip(
-            Path(segment[SegmentKeys.VIDEO_PATH]), snapped_start, snapped_end, self._logger,
-        )
-
-        await self._responder.send_video(output_filename, duration=clip_duration)
+        await self._send_segment_clip(Path(segment[SegmentKeys.VIDEO_PATH]), snapped_start, snapped_end)
 
         await DatabaseManager.insert_last_clip(
             chat_id=chat_id,
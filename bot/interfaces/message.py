@@ -2,6 +2,7 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from typing import Optional
 
 
 class AbstractMessage(ABC):
@@ -25,3 +26,6 @@ class AbstractMessage(ABC):
 
     @abstractmethod
     def should_reply_json(self) -> bool: ...
+
+    @abstractmethod
+    async def get_image(self) -> Optional[bytes]: ...
@@ -39,8 +39,11 @@ class AbstractResponder(ABC):
         height: Optional[int] = None,
         duration: Optional[float] = None,
         suggestions: Optional[List[str]] = None,
+        clip_key: Optional[str] = None,
     ) -> None: ...
     @abstractmethod
+    async def send_cached_video(self, clip_key: str) -> bool: ...
+    @abstractmethod
     async def send_document(self, file_path: Path, caption: str, delete_after_send: bool = True, cleanup_dir: Optional[Path] = None) -> None: ...
     @abstractmethod
     async def send_json(self, data: json) -> None: ...
@@ -17,8 +17,16 @@ from bot.database.database_manager import DatabaseManager
 from bot.platforms.rest_runner import run_rest_api
 from bot.platforms.telegram_runner import run_telegram_bot
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.search.infra.vllm_client import VllmClient
+from bot.services.blob_store.blob_garbage_collector import BlobGarbageCollector
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.services.rate_limiter.command_rate_limiter import CommandRateLimiter
 from bot.settings import settings as s
 from bot.utils.log import get_log_level
+from bot.utils.log_sink import (
+    LogSink,
+    log_sink_logger,
+)
 
 
 @dataclass(frozen=True)
@@ -34,7 +42,11 @@ class DBLogHandler(logging.Handler):
         self.loop: Optional[asyncio.AbstractEventLoop] = None
 
     def emit(self, record: LogRecord) -> None:
-        if self.loop is not None:
+        if record.name == log_sink_logger.name:
+            return
+        if LogSink.is_running():
+            LogSink.offer_system_message(record.levelname, self.format(record))
+        elif self.loop is not None:
             self.loop.create_task(self.log_to_db(record))
 
     async def log_to_db(self, record: LogRecord) -> None:
@@ -114,9 +126,24 @@ PLATFORM_REGISTRY: Tuple[PlatformConfig, ...] = (
 )
 
 
+async def start_background_services() -> None:
+    LogSink.start()
+    CommandRateLimiter.start()
+    BlobGarbageCollector.start()
+    await PrincipalCache.start()
+
+
+async def stop_background_services() -> None:
+    await PrincipalCache.stop()
+    await BlobGarbageCollector.stop()
+    await CommandRateLimiter.stop()
+    await LogSink.stop()
+
+
 async def main():
     try:
         await initialize_common_and_set_admin()
+        await start_background_services()
 
         enabled_platforms = [p for p in PLATFORM_REGISTRY if p.enabled()]
         disabled_platforms = [p for p in PLATFORM_REGISTRY if not p.enabled()]
@@ -134,7 +161,9 @@ async def main():
         logger.info(f"Running {len(enabled_platforms)} platform(s)")
         await asyncio.gather(*[p.runner() for p in enabled_platforms])
     finally:
+        await stop_background_services()
         await ElasticSearchManager.close_shared_elasticsearch(logger)
+        await VllmClient.close_session()
 
 
 if __name__ == "__main__":
@@ -9,10 +9,11 @@ from typing import (
     List,
 )
 
-from bot.database.database_manager import DatabaseManager
 from bot.interfaces.message import AbstractMessage
 from bot.interfaces.responder import AbstractResponder
 from bot.responses.bot_message_handler_responses import get_limit_exceeded_message
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.services.rate_limiter.command_rate_limiter import CommandRateLimiter
 from bot.settings import settings
 
 
@@ -29,14 +30,15 @@ class BotMiddleware(ABC):
         handler: Callable[[], Awaitable[None]],
     ) -> None:
         command = message.get_text().split()[0].lstrip('/')
-        if command in self._supported_commands:
-            if await self.check_command_limits_and_privileges(message, responder) and await self.check(message):
-                await handler()
+        with PrincipalCache.request_scope():
+            if command in self._supported_commands:
+                if await self.check_command_limits_and_privileges(message, responder) and await self.check(message):
+                    await handler()
+                else:
+                    await responder.send_text("❌ Brak uprawnień. ❌")
+                    self._logger.warning(f"[{self.__class__.__name__}] Unauthorized user: {message.get_user_id()} | Command: {command}")
             else:
-                await responder.send_text("❌ Brak uprawnień. ❌")
-                self._logger.warning(f"[{self.__class__.__name__}] Unauthorized user: {message.get_user_id()} | Command: {command}")
-        else:
-            await handler()
+                await handler()
 
     @abstractmethod
     async def check(self, message: AbstractMessage) -> bool:
@@ -48,20 +50,16 @@ class BotMiddleware(ABC):
             return True
 
         user_id = message.get_user_id()
-        is_admin_or_moderator = await DatabaseManager.is_admin_or_moderator(user_id)
-
-        if not is_admin_or_moderator:
-            limited = await DatabaseManager.is_command_limited(user_id, settings.MESSAGE_LIMIT, settings.LIMIT_DURATION)
-            if limited:
-                await responder.send_text(get_limit_exceeded_message())
-                return False
+        if await CommandRateLimiter.is_limited(user_id) and not await PrincipalCache.is_admin_or_moderator(user_id):
+            await responder.send_text(get_limit_exceeded_message())
+            return False
 
         return True
 
     @staticmethod
     async def _does_user_have_moderator_privileges(user_id: int) -> bool:
-        return await DatabaseManager.is_user_moderator(user_id) or await DatabaseManager.is_user_admin(user_id)
+        return await PrincipalCache.is_admin_or_moderator(user_id)
 
     @staticmethod
     async def _does_user_have_admin_privileges(user_id: int) -> bool:
-        return await DatabaseManager.is_user_admin(user_id)
+        return await PrincipalCache.is_admin(user_id)
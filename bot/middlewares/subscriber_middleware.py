@@ -1,8 +1,8 @@
-from bot.database.database_manager import DatabaseManager
 from bot.interfaces.message import AbstractMessage
 from bot.middlewares.bot_middleware import BotMiddleware
+from bot.services.principal_cache.principal_cache import PrincipalCache
 
 
 class SubscriberMiddleware(BotMiddleware):
     async def check(self, message: AbstractMessage) -> bool:
-        return await DatabaseManager.is_user_subscribed(message.get_user_id())
+        return await PrincipalCache.is_subscribed(message.get_user_id())
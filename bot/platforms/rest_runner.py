@@ -30,6 +30,7 @@ from jose import (
 from pydantic import (
     BaseModel,
     StringConstraints,
+    ValidationError,
 )
 from slowapi import (
     Limiter,
@@ -66,6 +67,10 @@ from bot.database.database_manager import DatabaseManager
 from bot.factory import create_all_factories
 from bot.platforms.rest_registrar import RestRegistrar
 from bot.responses.bot_response import BotResponse
+from bot.search.infra.vllm_client import VllmClient
+from bot.services.blob_store.blob_garbage_collector import BlobGarbageCollector
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.services.rate_limiter.command_rate_limiter import CommandRateLimiter
 from bot.settings import settings as s
 from bot.utils.constants import (
     AuthKeys,
@@ -73,6 +78,7 @@ from bot.utils.constants import (
     JwtPayloadKeys,
 )
 from bot.utils.log import get_log_level
+from bot.utils.log_sink import LogSink
 
 logging.basicConfig(level=get_log_level())
 logger = logging.getLogger(__name__)
@@ -490,11 +496,20 @@ async def universal_handler(
         if not isinstance(reply_json, bool):
             raise ValueError("Invalid reply_json flag: must be boolean.")
 
+        image = request_json.get("image")
+        if image is not None and not isinstance(image, str):
+            raise ValueError("Invalid image: must be a base64-encoded string.")
+        if image is not None and len(image) > s.FRAME_HASH_MAX_IMAGE_MB * 1024 * 1024 * 4 // 3:
+            raise ValueError(f"Image too large: limit is {s.FRAME_HASH_MAX_IMAGE_MB} MB.")
+
         command_request_obj = TextCompatibleCommandWrapper(
             command_name=command_name,
             args=args,
             json=reply_json,
+            image=image,
         )
+    except ValidationError as ve:
+        raise HTTPException(status_code=400, detail=ve.errors()[0]["msg"]) from ve
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve)) from ve
     except Exception as exc:
@@ -526,6 +541,10 @@ async def lifespan(app_instance: FastAPI):
 
     await DatabaseManager.ensure_db_initialized()
     logger.info("DB initialization process ensured by REST runner lifespan.")
+    owns_log_sink = LogSink.start()
+    owns_rate_limiter = CommandRateLimiter.start()
+    owns_blob_gc = BlobGarbageCollector.start()
+    owns_principal_listener = await PrincipalCache.start()
 
     registrar = RestRegistrar(create_all_factories(logger))
     command_handlers.update(registrar.get_command_handlers())
@@ -537,6 +556,15 @@ async def lifespan(app_instance: FastAPI):
     yield
 
     logger.info("🛑 API Shutdown logic initiated by REST runner lifespan...")
+    if owns_principal_listener:
+        await PrincipalCache.stop()
+    if owns_blob_gc:
+        await BlobGarbageCollector.stop()
+    if owns_rate_limiter:
+        await CommandRateLimiter.stop()
+    await VllmClient.close_session()
+    if owns_log_sink:
+        await LogSink.stop()
     logger.info("🛑 API Shutdown complete for REST runner.")
 
 app = FastAPI(
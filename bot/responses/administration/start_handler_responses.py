@@ -57,6 +57,7 @@ def get_all_message() -> str:
 🧠 /sensklatki <zapytanie> - Wyszukiwanie semantyczne po klatkach. Przykład: /sensklatki biesiada.
 🧠 /sensodcinek <zapytanie> - Wyszukiwanie semantyczne po odcinkach. Przykład: /sensodcinek ślub.
 🎬 /klipsens <zapytanie> - Wyszukuje semantycznie i wysyła klip. Przykład: /klipsens ucieczka.
+🖼️ /zrzut [hash] [odległość] - Szuka klatek podobnych do załączonego zrzutu ekranu. Przykład: zdjęcie z podpisem /zrzut.
 👤 /postacie [postac] [emocja] - Przegladanie postaci i ich scen. Przyklad: /postacie Wilkowyska.
 👤 /szukajpostac <postac> [emocja] - Lista scen z daną postacią (bez wysyłania klipu). Przykład: /szp Wilkowyska.
 🎭 /klippostac <postac> [emocja] - Klip z daną postacią. Przykład: /klippostac Wilkowyska.
@@ -134,6 +135,7 @@ def get_search_message() -> str:
 🧠 /sensklatki <zapytanie> - Wyszukiwanie semantyczne po klatkach. Przykład: /sensklatki biesiada.\n
 🧠 /sensodcinek <zapytanie> - Wyszukiwanie semantyczne po odcinkach. Przykład: /sensodcinek ślub.\n
 🎬 /klipsens <zapytanie> - Wyszukuje semantycznie i wysyła klip. Przykład: /klipsens ucieczka.\n
+🖼️ /zrzut [hash] [odległość] - Szuka klatek podobnych do załączonego zrzutu ekranu. Przykład: zdjęcie z podpisem /zrzut.\n
 👤 /postacie [postac] [emocja] - Przegladanie postaci i ich scen. Przyklad: /postacie Wilkowyska.\n
 👤 /szukajpostac <postac> [emocja] - Lista scen z daną postacią (bez wysyłania klipu). Przykład: /szp Wilkowyska.\n
 🎭 /klippostac <postac> [emocja] - Klip z daną postacią. Przykład: /klippostac Wilkowyska.\n
@@ -251,6 +253,7 @@ def get_shortcuts_message() -> str:
 🔎 /f, /filtr - Ustawia filtry wyszukiwania.\n
 🎬 /kf, /klipfiltr - Klip na podstawie aktywnego filtra.\n
 🔎 /szf, /szukajfiltr - Lista scen na podstawie aktywnego filtra.\n
+🖼️ /zr, /zrzut - Wyszukiwanie klatek po zrzucie ekranu.\n
 🖼️ /kl, /klatka - Klatka kluczowa z ostatniego klipu.\n
 🖼️ /kk, /klatkaklipu - Klatka kluczowa z zapisanego klipu.\n
 🔗 /link - Powiązuje konto Telegram z kontem REST.\n
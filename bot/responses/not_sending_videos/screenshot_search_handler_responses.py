@@ -0,0 +1,69 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from bot.responses.bot_response import BotResponse
+from bot.search.video_frames.frame_hash_finder import HASH_DISTANCE_KEY
+from bot.utils.functions import (
+    convert_number_to_emoji,
+    format_segment,
+)
+
+
+def format_screenshot_search_response(frames: List[Dict[str, Any]], phash: int) -> str:
+    emoji_count = convert_number_to_emoji(len(frames))
+    response = (
+        f"🖼️ *Wyniki wyszukiwania po zrzucie ekranu* 🖼️\n"
+        f"👁️ *Znaleziono:* {emoji_count} podobnych klatek 👁️\n\n"
+    )
+    frame_lines = []
+
+    for i, frame in enumerate(frames[:5], start=1):
+        segment_info = format_segment(frame)
+        line = (
+            f"{convert_number_to_emoji(i)}  | 📺 {segment_info.episode_formatted} | 🕒 {segment_info.time_formatted}"
+            f" | Δ {frame[HASH_DISTANCE_KEY]}\n"
+            f"   👉  {segment_info.episode_title}"
+        )
+        frame_lines.append(line)
+
+    response += f"```Hash: {phash:016x} \n".replace(" ", "\u00A0") + "\n\n".join(frame_lines) + "\n```"
+    return response
+
+
+def get_no_image_provided_message() -> str:
+    return BotResponse.usage(
+        command="zrzut",
+        error_title="BRAK OBRAZU",
+        usage_syntax="[hash] [odległość]",
+        params=[
+            ("[hash]", "opcjonalnie: 16-znakowy hash klatki zamiast załączonego obrazu"),
+            ("[odległość]", "maksymalna liczba różniących się bitów hasha (domyślnie 10)"),
+        ],
+        example="wyślij zdjęcie z podpisem /zrzut | /zrzut 3 | /zrzut c3a1f0e2d4b59687",
+    )
+
+
+def get_invalid_distance_message() -> str:
+    return BotResponse.error("NIEPRAWIDŁOWA ODLEGŁOŚĆ", "Odległość musi być liczbą od 0 do 32")
+
+
+def get_no_similar_frames_message(phash: int) -> str:
+    return BotResponse.error("BRAK WYNIKÓW", f"Nie znaleziono klatek podobnych do obrazu (hash {phash:016x})")
+
+
+def get_frame_hashes_not_indexed_message(series_name: str) -> str:
+    return BotResponse.warning(
+        "BRAK HASHY KLATEK",
+        f"Klatki serialu '{series_name}' nie zostały jeszcze zaindeksowane.",
+    )
+
+
+def get_log_screenshot_search_results_sent_message(phash: int, count: int, username: str) -> str:
+    return f"Screenshot search results for hash {phash:016x} ({count} frames) sent to '{username}'."
+
+
+def get_log_no_similar_frames_message(phash: int) -> str:
+    return f"No frames found for hash {phash:016x}."
@@ -1,7 +1,5 @@
 import asyncio
-import bisect
 import logging
-import math
 from typing import (
     Any,
     Dict,
@@ -16,6 +14,7 @@ from typing import (
 from elasticsearch import RequestError
 
 from bot.responses.not_sending_videos.emotions_handler_responses import map_emotion_to_en
+from bot.search.frame_interval_index import FrameIntervalIndex
 from bot.search.infra.elastic_search_manager import (
     ElasticSearchManager,
     build_episode_restriction_filter,
@@ -319,9 +318,10 @@ class FilterApplicator:
         }
         all_timestamps = await FilterApplicator._get_all_frame_timestamps(hit_episode_keys, series_name, logger)
 
+        indexes = [FrameIntervalIndex(frame_keys, all_timestamps) for frame_keys in frame_key_sets]
         filtered = [
             seg for seg in segments
-            if FilterApplicator._segment_passes_all(seg, frame_key_sets, all_timestamps)
+            if FilterApplicator._segment_passes_all(seg, indexes)
         ]
         await log_system_message(
             logging.INFO,
@@ -335,29 +335,17 @@ class FilterApplicator:
         return filtered
 
     @staticmethod
-    def _segment_passes_all(
-        segment: SegmentWithScore,
-        frame_key_sets: List[Set[Tuple[Optional[int], Optional[int], float]]],
-        all_timestamps: Dict[Tuple[Optional[int], Optional[int]], List[float]],
-    ) -> bool:
+    def __segment_window(segment: SegmentWithScore) -> Tuple[Tuple[Optional[int], Optional[int]], float, float]:
         meta = cast(Dict[str, Any], segment.get(EpisodeMetadataKeys.EPISODE_METADATA, {}))
-        season = meta.get(EpisodeMetadataKeys.SEASON)
-        episode = meta.get(EpisodeMetadataKeys.EPISODE_NUMBER)
+        key = (meta.get(EpisodeMetadataKeys.SEASON), meta.get(EpisodeMetadataKeys.EPISODE_NUMBER))
         start = float(segment.get(SegmentKeys.START_TIME, 0.0))
         end = float(segment.get(SegmentKeys.END_TIME, 0.0))
-        ep_timestamps = all_timestamps.get((season, episode), [])
+        return key, start, end
 
-        def __scene_overlaps(frame_keys: Set[Tuple[Optional[int], Optional[int], float]]) -> bool:
-            for fk_season, fk_episode, ts in frame_keys:
-                if fk_season != season or fk_episode != episode:
-                    continue
-                idx = bisect.bisect_right(ep_timestamps, ts)
-                next_ts = ep_timestamps[idx] if idx < len(ep_timestamps) else math.inf
-                if ts <= end and next_ts >= start:
-                    return True
-            return False
-
-        return all(__scene_overlaps(fk) for fk in frame_key_sets)
+    @staticmethod
+    def _segment_passes_all(segment: SegmentWithScore, indexes: List[FrameIntervalIndex]) -> bool:
+        key, start, end = FilterApplicator.__segment_window(segment)
+        return all(index.overlaps(key, start, end) for index in indexes)
 
     @staticmethod
     async def _get_character_frame_keys(
@@ -642,22 +630,10 @@ class FilterApplicator:
         confidence_map: Dict[Tuple[Optional[int], Optional[int], float], float],
         all_timestamps: Dict[Tuple[Optional[int], Optional[int]], List[float]],
     ) -> List[SegmentWithScore]:
+        index = FrameIntervalIndex(confidence_map.keys(), all_timestamps, confidence_map)
+
         def __best_confidence(segment: SegmentWithScore) -> float:
-            meta = cast(Dict[str, Any], segment.get(EpisodeMetadataKeys.EPISODE_METADATA, {}))
-            season = meta.get(EpisodeMetadataKeys.SEASON)
-            episode = meta.get(EpisodeMetadataKeys.EPISODE_NUMBER)
-            start = float(segment.get(SegmentKeys.START_TIME, 0.0))
-            end = float(segment.get(SegmentKeys.END_TIME, 0.0))
-            ep_timestamps = all_timestamps.get((season, episode), [])
-            best = 0.0
-            for (fk_season, fk_episode, ts), conf in confidence_map.items():
-                if fk_season != season or fk_episode != episode:
-                    continue
-                idx = bisect.bisect_right(ep_timestamps, ts)
-                next_ts = ep_timestamps[idx] if idx < len(ep_timestamps) else math.inf
-                if ts <= end and next_ts >= start:
-                    best = max(best, conf)
-            return best
+            return index.best_confidence(*FilterApplicator.__segment_window(segment))
 
         return sorted(segments, key=__best_confidence, reverse=True)
 
@@ -0,0 +1,62 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+EpisodeKey = Tuple[Optional[int], Optional[int]]
+FrameKey = Tuple[Optional[int], Optional[int], float]
+
+
+class FrameIntervalIndex:
+    def __init__(
+        self,
+        frame_keys: Iterable[FrameKey],
+        all_timestamps: Mapping[EpisodeKey, List[float]],
+        confidences: Optional[Mapping[FrameKey, float]] = None,
+    ) -> None:
+        grouped: Dict[EpisodeKey, List[float]] = {}
+        for season, episode, timestamp in frame_keys:
+            grouped.setdefault((season, episode), []).append(timestamp)
+
+        self.__starts: Dict[EpisodeKey, np.ndarray] = {}
+        self.__ends: Dict[EpisodeKey, np.ndarray] = {}
+        self.__confidences: Dict[EpisodeKey, np.ndarray] = {}
+
+        for key, timestamps in grouped.items():
+            starts = np.unique(np.asarray(timestamps, dtype=np.float64))
+            cuts = np.asarray(all_timestamps.get(key, ()), dtype=np.float64)
+            next_cut = np.searchsorted(cuts, starts, side="right")
+            self.__starts[key] = starts
+            self.__ends[key] = np.append(cuts, np.inf)[next_cut]
+            if confidences is not None:
+                season, episode = key
+                self.__confidences[key] = np.fromiter(
+                    (confidences.get((season, episode, float(ts)), 0.0) for ts in starts),
+                    dtype=np.float64,
+                    count=len(starts),
+                )
+
+    def __window(self, key: EpisodeKey, start: float, end: float) -> Tuple[int, int]:
+        starts = self.__starts.get(key)
+        if starts is None:
+            return 0, 0
+        lo = int(np.searchsorted(self.__ends[key], start, side="left"))
+        hi = int(np.searchsorted(starts, end, side="right"))
+        return lo, hi
+
+    def overlaps(self, key: EpisodeKey, start: float, end: float) -> bool:
+        lo, hi = self.__window(key, start, end)
+        return lo < hi
+
+    def best_confidence(self, key: EpisodeKey, start: float, end: float) -> float:
+        lo, hi = self.__window(key, start, end)
+        confidences = self.__confidences.get(key)
+        if lo >= hi or confidences is None:
+            return 0.0
+        return float(confidences[lo:hi].max())
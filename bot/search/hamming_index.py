@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+_SEGMENTS = 4
+_SEGMENT_BITS = 16
+_SEGMENT_MASK = np.uint64((1 << _SEGMENT_BITS) - 1)
+
+
+@lru_cache(maxsize=None)
+def _flip_masks(radius: int) -> np.ndarray:
+    masks = np.arange(1 << _SEGMENT_BITS, dtype=np.uint16)
+    return masks[np.bitwise_count(masks) <= radius]
+
+
+class HammingIndex:
+    def __init__(self, hashes: np.ndarray, orders: Optional[List[np.ndarray]] = None) -> None:
+        self.__hashes = np.ascontiguousarray(hashes, dtype=np.uint64)
+        self.__orders: List[np.ndarray] = []
+        self.__keys: List[np.ndarray] = []
+
+        for segment in range(_SEGMENTS):
+            keys = self.__segment_keys(self.__hashes, segment)
+            order = orders[segment] if orders is not None else np.argsort(keys, kind="stable")
+            self.__orders.append(order)
+            self.__keys.append(keys[order])
+
+    def __len__(self) -> int:
+        return len(self.__hashes)
+
+    def search(self, query: int, max_distance: int) -> Tuple[np.ndarray, np.ndarray]:
+        query_hash = np.uint64(query)
+        flips = _flip_masks(max(0, max_distance) // _SEGMENTS)
+
+        candidates = []
+        for segment in range(_SEGMENTS):
+            variants = self.__segment_keys(query_hash, segment) ^ flips
+            lo = np.searchsorted(self.__keys[segment], variants, side="left")
+            counts = np.searchsorted(self.__keys[segment], variants, side="right") - lo
+            offsets = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            candidates.append(self.__orders[segment][offsets + np.arange(len(offsets))])
+
+        rows = np.concatenate(candidates)
+        distances = np.bitwise_count(self.__hashes[rows] ^ query_hash).astype(np.int64)
+        keep = distances <= max_distance
+        rows, first = np.unique(rows[keep], return_index=True)
+        distances = distances[keep][first]
+        ranking = np.lexsort((rows, distances))
+        return rows[ranking], distances[ranking]
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {"hashes": self.__hashes}
+        for segment, order in enumerate(self.__orders):
+            arrays[f"order_{segment}"] = order
+        return arrays
+
+    @staticmethod
+    def from_arrays(arrays: Dict[str, np.ndarray]) -> "HammingIndex":
+        orders = [arrays[f"order_{segment}"] for segment in range(_SEGMENTS)]
+        return HammingIndex(arrays["hashes"], orders)
+
+    @staticmethod
+    def __segment_keys(hashes, segment: int):
+        return ((hashes >> np.uint64(segment * _SEGMENT_BITS)) & _SEGMENT_MASK).astype(np.uint16)
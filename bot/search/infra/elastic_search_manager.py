@@ -23,6 +23,7 @@ from elasticsearch.helpers import (
 import urllib3
 
 from bot.database.database_manager import DatabaseManager
+from bot.search.infra.vector_profile import VECTOR_PROFILE
 from bot.settings import settings as s
 from bot.utils.constants import (
     ElasticsearchKeys,
@@ -175,12 +176,7 @@ class ElasticSearchManager:
                 "start_time": {"type": "float"},
                 "end_time": {"type": "float"},
                 "video_path": {"type": "keyword"},
-                EmbeddingKeys.TEXT_EMBEDDING: {
-                    "type": "dense_vector",
-                    "dims": 4096,
-                    "index": True,
-                    "similarity": "cosine",
-                },
+                **VECTOR_PROFILE.mapping_properties(EmbeddingKeys.TEXT_EMBEDDING),
             },
         },
     }
@@ -197,12 +193,7 @@ class ElasticSearchManager:
                 "video_path": {"type": "keyword"},
                 "perceptual_hash": {"type": "keyword"},
                 "perceptual_hash_int": {"type": "unsigned_long"},
-                EmbeddingKeys.VIDEO_EMBEDDING: {
-                    "type": "dense_vector",
-                    "dims": 4096,
-                    "index": True,
-                    "similarity": "cosine",
-                },
+                **VECTOR_PROFILE.mapping_properties(EmbeddingKeys.VIDEO_EMBEDDING),
                 "character_appearances": {
                     "type": "nested",
                     "properties": {
@@ -257,12 +248,7 @@ class ElasticSearchManager:
                 EmbeddingKeys.EPISODE_ID: {"type": "keyword"},
                 "episode_metadata": {"properties": EPISODE_METADATA_PROPERTIES},
                 EmbeddingKeys.FULL_TRANSCRIPT: {"type": "text"},
-                EmbeddingKeys.FULL_EPISODE_EMBEDDING: {
-                    "type": "dense_vector",
-                    "dims": 4096,
-                    "index": True,
-                    "similarity": "cosine",
-                },
+                **VECTOR_PROFILE.mapping_properties(EmbeddingKeys.FULL_EPISODE_EMBEDDING),
             },
         },
     }
@@ -318,20 +304,9 @@ class ElasticSearchManager:
                 "scene_info": {"type": "object"},
                 "frames": {
                     "type": "nested",
+                    "dynamic": False,
                     "properties": {
                         "frame_number": {"type": "integer"},
-                        "timestamp": {"type": "float"},
-                        "frame_type": {"type": "keyword"},
-                        "scene_number": {"type": "integer"},
-                        "scene_info": {"type": "object"},
-                        "perceptual_hash": {"type": "keyword"},
-                        "perceptual_hash_int": {"type": "unsigned_long"},
-                        "video_embedding": {
-                            "type": "dense_vector",
-                            "dims": 4096,
-                            "index": True,
-                            "similarity": "cosine",
-                        },
                         "character_appearances": {
                             "type": "nested",
                             "properties": {
@@ -0,0 +1,9 @@
+from bot.search.vector_profile import VectorProfile
+from bot.settings import settings
+
+VECTOR_PROFILE = VectorProfile(
+    quantization=settings.ES_VECTOR_QUANTIZATION,
+    dims=settings.ES_VECTOR_DIMS,
+    rescore_oversample=settings.ES_VECTOR_RESCORE_OVERSAMPLE,
+    stores_vectors=settings.SEMANTIC_SEARCH_BACKEND != "local",
+)
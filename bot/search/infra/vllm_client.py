@@ -1,5 +1,14 @@
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
 import logging
-from typing import List
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import aiohttp
 
@@ -12,10 +21,24 @@ from bot.settings import settings
 
 
 class VllmClient:
+    __sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+    __pending: List[Tuple[str, asyncio.Future]] = []
+    __flush_handle: Optional[asyncio.TimerHandle] = None
+    __flush_logger: Optional[logging.Logger] = None
+    __cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+    __inflight: Set[asyncio.Task] = set()
+
     @staticmethod
     async def get_text_embedding(text: str, logger: logging.Logger) -> List[float]:
-        embeddings = await VllmClient.get_text_embeddings_batch([text], logger)
-        return embeddings[0]
+        cached = VllmClient.__cache.get(text)
+        if cached is not None:
+            VllmClient.__cache.move_to_end(text)
+            return list(cached)
+
+        future = asyncio.get_running_loop().create_future()
+        VllmClient.__pending.append((text, future))
+        VllmClient.__schedule_flush(logger)
+        return await future
 
     @staticmethod
     async def get_text_embeddings_batch(
@@ -24,25 +47,112 @@ class VllmClient:
     ) -> List[List[float]]:
         url = f"{settings.VLLM_HOST}/v1/embeddings"
         payload = {"input": texts, "model": settings.VLLM_EMBEDDINGS_MODEL}
-        timeout = aiohttp.ClientTimeout(total=settings.VLLM_TIMEOUT_SECONDS)
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload) as resp:
-                    if resp.status != 200:
-                        body = await resp.text()
-                        logger.error("vLLM proxy returned %d: %s", resp.status, body)
-                        raise VllmRequestError(f"vLLM proxy returned {resp.status}: {body}")
-                    data = await resp.json()
-        except aiohttp.ServerConnectionError as exc:
-            logger.error("Cannot connect to vLLM proxy at %s: %s", url, exc)
-            raise VllmConnectionError(f"Cannot connect to vLLM proxy at {url}") from exc
-        except aiohttp.ClientConnectorError as exc:
-            logger.error("Cannot connect to vLLM proxy at %s: %s", url, exc)
-            raise VllmConnectionError(f"Cannot connect to vLLM proxy at {url}") from exc
-        except aiohttp.ServerTimeoutError as exc:
+            session = await VllmClient.__get_session()
+            async with session.post(url, json=payload) as resp:
+                if resp.status != 200:
+                    body = await resp.text()
+                    logger.error("vLLM proxy returned %d: %s", resp.status, body)
+                    raise VllmRequestError(f"vLLM proxy returned {resp.status}: {body}")
+                data = await resp.json()
+        except asyncio.TimeoutError as exc:
             logger.error("vLLM proxy timed out after %ds", settings.VLLM_TIMEOUT_SECONDS)
             raise VllmTimeoutError("vLLM proxy request timed out") from exc
+        except (aiohttp.ServerConnectionError, aiohttp.ClientConnectorError) as exc:
+            logger.error("Cannot connect to vLLM proxy at %s: %s", url, exc)
+            raise VllmConnectionError(f"Cannot connect to vLLM proxy at {url}") from exc
+
+        embeddings = {item["index"]: item["embedding"] for item in data["data"]}
+        if embeddings.keys() != set(range(len(texts))):
+            logger.error("vLLM proxy returned %d embeddings for %d inputs", len(embeddings), len(texts))
+            raise VllmRequestError(f"vLLM proxy returned {len(embeddings)} embeddings for {len(texts)} inputs")
+        return [embeddings[index] for index in range(len(texts))]
 
-        items = sorted(data["data"], key=lambda x: x["index"])
-        return [item["embedding"] for item in items]
+    @staticmethod
+    async def close_session() -> None:
+        session = VllmClient.__sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    @staticmethod
+    async def __get_session() -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        await VllmClient.__close_orphaned_sessions()
+        session = VllmClient.__sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.VLLM_CONNECTION_POOL_SIZE,
+                    keepalive_timeout=settings.VLLM_KEEPALIVE_SECONDS,
+                ),
+                timeout=aiohttp.ClientTimeout(total=settings.VLLM_TIMEOUT_SECONDS),
+            )
+            VllmClient.__sessions[loop] = session
+        return session
+
+    @staticmethod
+    async def __close_orphaned_sessions() -> None:
+        for owner_loop in [owner for owner in VllmClient.__sessions if owner.is_closed()]:
+            session = VllmClient.__sessions.pop(owner_loop)
+            # The owning loop is gone; closing still releases the connector and its pooled sockets.
+            with suppress(RuntimeError):
+                await session.close()
+
+    @staticmethod
+    def __schedule_flush(logger: logging.Logger) -> None:
+        if len(VllmClient.__pending) >= settings.VLLM_MAX_BATCH_SIZE:
+            VllmClient.__flush_now()
+            return
+        if VllmClient.__flush_handle is None:
+            VllmClient.__flush_logger = logger
+            VllmClient.__flush_handle = asyncio.get_running_loop().call_later(
+                settings.VLLM_BATCH_WINDOW_MS / 1000,
+                VllmClient.__flush_now,
+            )
+        elif VllmClient.__flush_logger is None:
+            VllmClient.__flush_logger = logger
+
+    @staticmethod
+    def __flush_now() -> None:
+        if VllmClient.__flush_handle is not None:
+            VllmClient.__flush_handle.cancel()
+            VllmClient.__flush_handle = None
+        batch, VllmClient.__pending = VllmClient.__pending, []
+        logger, VllmClient.__flush_logger = VllmClient.__flush_logger, None
+        if batch:
+            task = asyncio.get_running_loop().create_task(VllmClient.__send_batch(batch, logger or logging.getLogger(__name__)))
+            VllmClient.__inflight.add(task)
+            task.add_done_callback(VllmClient.__inflight.discard)
+
+    @staticmethod
+    async def __send_batch(batch: List[Tuple[str, asyncio.Future]], logger: logging.Logger) -> None:
+        waiters: Dict[str, List[asyncio.Future]] = {}
+        for text, future in batch:
+            waiters.setdefault(text, []).append(future)
+        texts = list(waiters)
+
+        error: BaseException = VllmRequestError("vLLM embedding batch finished without a result for this text")
+        try:
+            embeddings = await VllmClient.get_text_embeddings_batch(texts, logger)
+            for text, embedding in zip(texts, embeddings):
+                VllmClient.__remember(text, embedding)
+                for future in waiters[text]:
+                    if not future.done():
+                        future.set_result(list(embedding))
+        except Exception as exc:
+            error = exc
+        finally:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+
+    @staticmethod
+    def __remember(text: str, embedding: List[float]) -> None:
+        if settings.VLLM_EMBEDDING_CACHE_SIZE <= 0:
+            return
+        VllmClient.__cache[text] = tuple(embedding)
+        VllmClient.__cache.move_to_end(text)
+        while len(VllmClient.__cache) > settings.VLLM_EMBEDDING_CACHE_SIZE:
+            VllmClient.__cache.popitem(last=False)
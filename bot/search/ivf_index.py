@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+VECTORS_FILE = "vectors.npy"
+CENTROIDS_FILE = "centroids.npy"
+OFFSETS_FILE = "offsets.npy"
+EPISODE_IDS_FILE = "episode_ids.npy"
+KEYS_FILE = "keys.npy"
+META_FILE = "meta.json"
+
+
+class IvfIndex:
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        episode_ids: np.ndarray,
+        keys: np.ndarray,
+        meta: Dict[str, Any],
+    ) -> None:
+        self.__vectors = vectors
+        self.__centroids = centroids
+        self.__offsets = offsets
+        self.__sizes = np.diff(offsets)
+        self.episode_ids = episode_ids
+        self.keys = keys
+        self.meta = meta
+
+    def __len__(self) -> int:
+        return len(self.__vectors)
+
+    @property
+    def dims(self) -> int:
+        return self.__vectors.shape[1]
+
+    @property
+    def key_field(self) -> Optional[str]:
+        return self.meta.get("key_field")
+
+    @staticmethod
+    def load(path: Path) -> "IvfIndex":
+        # Writers publish by flipping a symlink; resolve it once so every file comes from the same version.
+        path = path.resolve()
+        with open(path / META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return IvfIndex(
+            vectors=np.load(path / VECTORS_FILE, mmap_mode="r"),
+            centroids=np.load(path / CENTROIDS_FILE),
+            offsets=np.load(path / OFFSETS_FILE),
+            episode_ids=np.load(path / EPISODE_IDS_FILE),
+            keys=np.load(path / KEYS_FILE),
+            meta=meta,
+        )
+
+    def search(self, query: np.ndarray, k: int, nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        query = np.asarray(query, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        ranked_lists = np.argsort(-(self.__centroids @ query))
+        covered = np.cumsum(self.__sizes[ranked_lists])
+        probe_count = max(min(nprobe, len(ranked_lists)), int(np.searchsorted(covered, k)) + 1)
+        probed = ranked_lists[:probe_count]
+
+        rows = []
+        scores = []
+        for list_id in probed:
+            start, end = self.__offsets[list_id], self.__offsets[list_id + 1]
+            if start == end:
+                continue
+            rows.append(np.arange(start, end))
+            scores.append(np.asarray(self.__vectors[start:end], dtype=np.float32) @ query)
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        rows_array = np.concatenate(rows)
+        scores_array = np.concatenate(scores)
+        if len(scores_array) > k:
+            top = np.argpartition(-scores_array, k - 1)[:k]
+            rows_array, scores_array = rows_array[top], scores_array[top]
+        ranking = np.argsort(-scores_array, kind="stable")
+        return rows_array[ranking], scores_array[ranking]
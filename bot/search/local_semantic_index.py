@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from bot.search.ivf_index import (
+    META_FILE,
+    IvfIndex,
+)
+from bot.settings import settings
+from bot.utils.log import log_system_message
+
+LocalHit = Tuple[str, int, float]
+
+
+class LocalSemanticIndex:
+    __INDEX_SUFFIXES = (
+        settings.ES_TEXT_EMBEDDINGS_INDEX_SUFFIX,
+        settings.ES_VIDEO_EMBEDDINGS_INDEX_SUFFIX,
+        settings.ES_FULL_EPISODE_EMBEDDINGS_INDEX_SUFFIX,
+    )
+
+    __indexes: Dict[str, Dict[str, IvfIndex]] = {}
+    __locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.SEMANTIC_SEARCH_BACKEND == "local"
+
+    @staticmethod
+    async def search(
+        series_name: str,
+        index_suffix: str,
+        embedding: List[float],
+        size: int,
+        logger: logging.Logger,
+    ) -> Optional[Tuple[Optional[str], List[LocalHit]]]:
+        indexes = await LocalSemanticIndex.__get_series(series_name, logger)
+        index = indexes.get(index_suffix)
+        if index is None:
+            return None
+
+        query = np.asarray(embedding[:index.dims], dtype=np.float32)
+        rows, scores = await asyncio.to_thread(index.search, query, size, settings.SEMANTIC_INDEX_NPROBE)
+        hits = [
+            (str(index.episode_ids[row]), int(index.keys[row]), (float(score) + 1.0) / 2.0)
+            for row, score in zip(rows, scores)
+        ]
+        return index.key_field, hits
+
+    @staticmethod
+    async def reload(series_name: str, logger: logging.Logger) -> None:
+        lock = LocalSemanticIndex.__locks.setdefault(series_name, asyncio.Lock())
+        async with lock:
+            indexes = await asyncio.to_thread(LocalSemanticIndex.__load_series, series_name)
+            LocalSemanticIndex.__indexes[series_name] = indexes
+        await LocalSemanticIndex.__log_loaded(series_name, indexes, logger)
+
+    @staticmethod
+    def invalidate(series_name: str) -> None:
+        LocalSemanticIndex.__indexes.pop(series_name, None)
+
+    @staticmethod
+    async def __get_series(series_name: str, logger: logging.Logger) -> Dict[str, IvfIndex]:
+        indexes = LocalSemanticIndex.__indexes.get(series_name)
+        if indexes is not None:
+            return indexes
+
+        lock = LocalSemanticIndex.__locks.setdefault(series_name, asyncio.Lock())
+        async with lock:
+            indexes = LocalSemanticIndex.__indexes.get(series_name)
+            if indexes is not None:
+                return indexes
+            indexes = await asyncio.to_thread(LocalSemanticIndex.__load_series, series_name)
+            LocalSemanticIndex.__indexes[series_name] = indexes
+        await LocalSemanticIndex.__log_loaded(series_name, indexes, logger)
+        return indexes
+
+    @staticmethod
+    def __load_series(series_name: str) -> Dict[str, IvfIndex]:
+        root = Path(settings.VIDEO_DATA_DIR) / series_name / settings.SEMANTIC_INDEX_DIRNAME
+        return {
+            index_suffix: IvfIndex.load(root / index_suffix)
+            for index_suffix in LocalSemanticIndex.__INDEX_SUFFIXES
+            if (root / index_suffix / META_FILE).exists()
+        }
+
+    @staticmethod
+    async def __log_loaded(series_name: str, indexes: Dict[str, IvfIndex], logger: logging.Logger) -> None:
+        if not indexes:
+            await log_system_message(logging.WARNING, f"No local semantic index found for '{series_name}'.", logger)
+            return
+        summary = ", ".join(f"{suffix}: {len(index)}" for suffix, index in indexes.items())
+        await log_system_message(logging.INFO, f"Local semantic index for '{series_name}' loaded ({summary}).", logger)
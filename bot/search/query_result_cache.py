@@ -0,0 +1,110 @@
+import asyncio
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from bot.settings import settings
+
+QueryKey = Tuple[Any, ...]
+
+
+class QueryResultCache:
+    __ALL_SERIES = "*"
+    __ABANDONED = object()
+
+    __entries: "OrderedDict[QueryKey, Tuple[float, Any]]" = OrderedDict()
+    __inflight: Dict[QueryKey, "asyncio.Future[Any]"] = {}
+    __generations: Dict[str, int] = {}
+
+    @staticmethod
+    def normalize_quote(quote: str) -> str:
+        return " ".join(quote.casefold().split())
+
+    @staticmethod
+    def hash_filter(search_filter: Optional[Any]) -> str:
+        if not search_filter:
+            return ""
+        encoded = json.dumps(search_filter, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(kind: str, series_names: Iterable[str], *parts: Any) -> QueryKey:
+        series = tuple(sorted(series_names))
+        generations = tuple(QueryResultCache.__generations.get(name, 0) for name in series or (QueryResultCache.__ALL_SERIES,))
+        return (kind, series, generations, *parts)
+
+    @staticmethod
+    def bump_series(series_name: str) -> None:
+        for name in (series_name, QueryResultCache.__ALL_SERIES):
+            QueryResultCache.__generations[name] = QueryResultCache.__generations.get(name, 0) + 1
+        stale = [key for key in QueryResultCache.__entries if not key[1] or series_name in key[1]]
+        for key in stale:
+            del QueryResultCache.__entries[key]
+
+    @staticmethod
+    async def get_or_compute(key: QueryKey, compute: Callable[[], Awaitable[Any]]) -> Any:
+        if settings.QUERY_CACHE_TTL_SECONDS <= 0:
+            return await compute()
+
+        while True:
+            cached = QueryResultCache.__lookup(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+            pending = QueryResultCache.__inflight.get(key)
+            if pending is None:
+                break
+            result = await asyncio.shield(pending)
+            # The owner was cancelled; waiters retry and one of them takes over the computation.
+            if result is not QueryResultCache.__ABANDONED:
+                return copy.deepcopy(result)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        QueryResultCache.__inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.set_result(QueryResultCache.__ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            QueryResultCache.__inflight.pop(key, None)
+
+        QueryResultCache.__store(key, result)
+        future.set_result(result)
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def __lookup(key: QueryKey) -> Optional[Any]:
+        entry = QueryResultCache.__entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del QueryResultCache.__entries[key]
+            return None
+        QueryResultCache.__entries.move_to_end(key)
+        return result
+
+    @staticmethod
+    def __store(key: QueryKey, result: Any) -> None:
+        if result is None:
+            return
+        QueryResultCache.__entries[key] = (time.monotonic() + settings.QUERY_CACHE_TTL_SECONDS, result)
+        QueryResultCache.__entries.move_to_end(key)
+        while len(QueryResultCache.__entries) > settings.QUERY_CACHE_SIZE:
+            QueryResultCache.__entries.popitem(last=False)
@@ -0,0 +1,72 @@
+from array import array
+import asyncio
+from collections import OrderedDict
+import sys
+from typing import (
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from bot.settings import settings
+
+SceneCutKey = Tuple[str, int, int]
+
+
+class SceneCutCache:
+    __entries: "OrderedDict[SceneCutKey, array]" = OrderedDict()
+    __locks: Dict[SceneCutKey, asyncio.Lock] = {}
+    __lock_users: Dict[SceneCutKey, int] = {}
+    __total_bytes: int = 0
+
+    @staticmethod
+    def make_key(series_name: str, season: int, episode_number: int) -> SceneCutKey:
+        return series_name, int(season), int(episode_number)
+
+    @staticmethod
+    def get(key: SceneCutKey) -> Optional[array]:
+        cuts = SceneCutCache.__entries.get(key)
+        if cuts is not None:
+            SceneCutCache.__entries.move_to_end(key)
+        return cuts
+
+    @staticmethod
+    def put(key: SceneCutKey, sorted_cuts: Iterable[float]) -> array:
+        cuts = array("d", sorted_cuts)
+        SceneCutCache.__discard(key)
+        SceneCutCache.__entries[key] = cuts
+        SceneCutCache.__total_bytes += sys.getsizeof(cuts)
+        max_bytes = settings.SCENE_CUT_CACHE_MAX_MB * 1024 * 1024
+        while SceneCutCache.__total_bytes > max_bytes and len(SceneCutCache.__entries) > 1:
+            SceneCutCache.__discard(next(iter(SceneCutCache.__entries)))
+        return cuts
+
+    @staticmethod
+    def invalidate_series(series_name: str) -> None:
+        for key in [k for k in SceneCutCache.__entries if k[0] == series_name]:
+            SceneCutCache.__discard(key)
+
+    @staticmethod
+    def lock_for(key: SceneCutKey) -> asyncio.Lock:
+        lock = SceneCutCache.__locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            SceneCutCache.__locks[key] = lock
+        SceneCutCache.__lock_users[key] = SceneCutCache.__lock_users.get(key, 0) + 1
+        return lock
+
+    @staticmethod
+    def release_lock(key: SceneCutKey) -> None:
+        users = SceneCutCache.__lock_users.get(key, 0) - 1
+        if users > 0:
+            SceneCutCache.__lock_users[key] = users
+            return
+        SceneCutCache.__lock_users.pop(key, None)
+        SceneCutCache.__locks.pop(key, None)
+
+    @staticmethod
+    def __discard(key: SceneCutKey) -> None:
+        cuts = SceneCutCache.__entries.pop(key, None)
+        if cuts is not None:
+            SceneCutCache.__total_bytes -= sys.getsizeof(cuts)
@@ -3,9 +3,14 @@ from typing import (
     Any,
     Dict,
     List,
+    Sequence,
 )
 
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.search.scene_cut_cache import (
+    SceneCutCache,
+    SceneCutKey,
+)
 from bot.utils.constants import (
     ElasticsearchAggregationKeys,
     ElasticsearchIndexSuffixes,
@@ -88,7 +93,24 @@ class SceneFinder:
         season: int,
         episode_number: int,
         logger: logging.Logger,
-    ) -> List[float]:
+    ) -> Sequence[float]:
+        key = SceneCutCache.make_key(series_name, season, episode_number)
+        cached = SceneCutCache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with SceneCutCache.lock_for(key):
+                cached = SceneCutCache.get(key)
+                if cached is not None:
+                    return cached
+                return await SceneFinder.__fetch_and_cache_scene_cuts(key, logger)
+        finally:
+            SceneCutCache.release_lock(key)
+
+    @staticmethod
+    async def __fetch_and_cache_scene_cuts(key: SceneCutKey, logger: logging.Logger) -> Sequence[float]:
+        series_name, season, episode_number = key
         try:
             es = await ElasticSearchManager.connect_to_elasticsearch(logger)
             index = f"{series_name}{ElasticsearchIndexSuffixes.TEXT_SEGMENTS}"
@@ -96,7 +118,7 @@ class SceneFinder:
             response = await es.search(index=index, body=query)
             buckets = response[ElasticsearchKeys.AGGREGATIONS][SceneFinder.__UNIQUE_SCENES_AGG][ElasticsearchKeys.BUCKETS]
             raw_cuts = SceneFinder.__extract_cuts_from_buckets(buckets)
-            scene_cuts = sorted(set(raw_cuts))
+            scene_cuts = SceneCutCache.put(key, sorted(set(raw_cuts)))
             await log_system_message(
                 logging.INFO,
                 f"Fetched {len(scene_cuts)} scene cuts for S{season:02d}E{episode_number:02d} in '{series_name}'",
@@ -9,6 +9,7 @@ from typing import (
 from bot.responses.not_sending_videos.emotions_handler_responses import map_emotion_to_en
 from bot.search.filter_applicator import _build_season_episode_clauses
 from bot.search.infra.elastic_search_manager import build_fuzzy_with_boost_query
+from bot.search.query_result_cache import QueryResultCache
 from bot.settings import settings
 from bot.types import (
     SearchFilter,
@@ -139,6 +140,22 @@ class ScenesFinder:
         search_filter: SearchFilter,
         size: int,
         logger: logging.Logger,
+    ) -> List[SegmentWithScore]:
+        key = QueryResultCache.make_key(
+            "scenes_filter", series_names, QueryResultCache.hash_filter(search_filter), size,
+        )
+        return await QueryResultCache.get_or_compute(
+            key,
+            lambda: ScenesFinder.__find_by_filter(es, series_names, search_filter, size, logger),
+        )
+
+    @staticmethod
+    async def __find_by_filter(
+        es: Any,
+        series_names: List[str],
+        search_filter: SearchFilter,
+        size: int,
+        logger: logging.Logger,
     ) -> List[SegmentWithScore]:
         filter_clauses = ScenesFinder._build_filter_clauses(search_filter)
         sort = ScenesFinder._build_sort(search_filter)
@@ -178,6 +195,27 @@ class ScenesFinder:
         search_filter: Optional[SearchFilter],
         size: int,
         logger: logging.Logger,
+    ) -> List[SegmentWithScore]:
+        key = QueryResultCache.make_key(
+            "scenes_text",
+            series_names,
+            QueryResultCache.normalize_quote(quote),
+            QueryResultCache.hash_filter(search_filter),
+            size,
+        )
+        return await QueryResultCache.get_or_compute(
+            key,
+            lambda: ScenesFinder.__find_by_text_and_filter(es, series_names, quote, search_filter, size, logger),
+        )
+
+    @staticmethod
+    async def __find_by_text_and_filter(
+        es: Any,
+        series_names: List[str],
+        quote: str,
+        search_filter: Optional[SearchFilter],
+        size: int,
+        logger: logging.Logger,
     ) -> List[SegmentWithScore]:
         filter_clauses = ScenesFinder._build_filter_clauses(search_filter) if search_filter else []
 
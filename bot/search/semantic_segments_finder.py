@@ -9,10 +9,18 @@ from typing import (
     Tuple,
 )
 
-from elasticsearch import NotFoundError
+from elasticsearch import (
+    AsyncElasticsearch,
+    NotFoundError,
+)
 
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.search.infra.vector_profile import VECTOR_PROFILE
 from bot.search.infra.vllm_client import VllmClient
+from bot.search.local_semantic_index import (
+    LocalHit,
+    LocalSemanticIndex,
+)
 from bot.settings import settings
 from bot.utils.constants import (
     ActorKeys,
@@ -206,19 +214,15 @@ class SemanticSegmentsFinder:
     ) -> Optional[List[Dict[str, Any]]]:
         es = await ElasticSearchManager.connect_to_elasticsearch(logger)
         index = f"{series_name}_{index_suffix}"
-
-        knn_query = {
-            "knn": {
-                ElasticsearchQueryKeys.FIELD: embedding_field,
-                "query_vector": embedding,
-                "k": size,
-                "num_candidates": min(size * 10, 10000),
-            },
-            ElasticsearchQueryKeys.SOURCE: SemanticSegmentsFinder.__SOURCE_FIELDS_BY_SUFFIX.get(index_suffix, True),
-        }
+        source_fields = SemanticSegmentsFinder.__SOURCE_FIELDS_BY_SUFFIX.get(index_suffix, True)
 
         try:
-            response = await es.search(index=index, body=knn_query, size=size)
+            if LocalSemanticIndex.enabled():
+                results = await SemanticSegmentsFinder.__search_local(
+                    es, index, series_name, index_suffix, embedding, size, source_fields, logger,
+                )
+            else:
+                results = await SemanticSegmentsFinder.__search_knn(es, index, embedding_field, embedding, size, source_fields)
         except NotFoundError:
             await log_system_message(
                 logging.WARNING,
@@ -227,17 +231,12 @@ class SemanticSegmentsFinder:
             )
             return None
 
-        hits = response[ElasticsearchKeys.HITS][ElasticsearchKeys.HITS]
-        if not hits:
+        if results is None:
+            return None
+        if not results:
             await log_system_message(logging.INFO, "No semantic results found.", logger)
             return None
 
-        results = []
-        for hit in hits:
-            doc: Dict[str, Any] = hit[ElasticsearchKeys.SOURCE]
-            doc[ElasticsearchKeys.SCORE] = hit[ElasticsearchKeys.SCORE]
-            results.append(doc)
-
         await log_system_message(
             logging.INFO,
             f"Semantic search [{index_suffix}] returned {len(results)} results.",
@@ -245,6 +244,107 @@ class SemanticSegmentsFinder:
         )
         return results
 
+    @staticmethod
+    async def __search_knn(
+        es: AsyncElasticsearch,
+        index: str,
+        embedding_field: str,
+        embedding: List[float],
+        size: int,
+        source_fields: Any,
+    ) -> List[Dict[str, Any]]:
+        knn_query = {
+            **VECTOR_PROFILE.search_body(embedding_field, embedding, size),
+            ElasticsearchQueryKeys.SOURCE: source_fields,
+        }
+        response = await es.search(index=index, body=knn_query, size=size)
+
+        results = []
+        for hit in response[ElasticsearchKeys.HITS][ElasticsearchKeys.HITS]:
+            doc: Dict[str, Any] = hit[ElasticsearchKeys.SOURCE]
+            doc[ElasticsearchKeys.SCORE] = hit[ElasticsearchKeys.SCORE]
+            results.append(doc)
+        return results
+
+    @staticmethod
+    async def __search_local(
+        es: AsyncElasticsearch,
+        index: str,
+        series_name: str,
+        index_suffix: str,
+        embedding: List[float],
+        size: int,
+        source_fields: Any,
+        logger: logging.Logger,
+    ) -> Optional[List[Dict[str, Any]]]:
+        local = await LocalSemanticIndex.search(series_name, index_suffix, embedding, size, logger)
+        if local is None:
+            await log_system_message(
+                logging.WARNING,
+                f"Local semantic index '{index_suffix}' for '{series_name}' not found.",
+                logger,
+            )
+            return None
+        key_field, local_hits = local
+        return await SemanticSegmentsFinder.__fetch_local_hits(es, index, key_field, local_hits, source_fields)
+
+    @staticmethod
+    async def __fetch_local_hits(
+        es: AsyncElasticsearch,
+        index: str,
+        key_field: Optional[str],
+        local_hits: List[LocalHit],
+        source_fields: Any,
+    ) -> List[Dict[str, Any]]:
+        if not local_hits:
+            return []
+
+        keys_by_episode: Dict[str, List[int]] = {}
+        for episode_id, key, _ in local_hits:
+            keys_by_episode.setdefault(episode_id, []).append(key)
+
+        if key_field:
+            should_filters = [
+                {
+                    ElasticsearchQueryKeys.BOOL: {
+                        ElasticsearchQueryKeys.FILTER: [
+                            {ElasticsearchQueryKeys.TERM: {EmbeddingKeys.EPISODE_ID: episode_id}},
+                            {ElasticsearchQueryKeys.TERMS: {key_field: keys}},
+                        ],
+                    },
+                }
+                for episode_id, keys in keys_by_episode.items()
+            ]
+        else:
+            should_filters = [{ElasticsearchQueryKeys.TERMS: {EmbeddingKeys.EPISODE_ID: list(keys_by_episode)}}]
+
+        query = {
+            ElasticsearchQueryKeys.QUERY: {
+                ElasticsearchQueryKeys.BOOL: {
+                    ElasticsearchQueryKeys.SHOULD: should_filters,
+                    ElasticsearchQueryKeys.MINIMUM_SHOULD_MATCH: 1,
+                },
+            },
+            ElasticsearchQueryKeys.SIZE: len(local_hits),
+            ElasticsearchQueryKeys.SOURCE: source_fields,
+        }
+        response = await es.search(index=index, body=query)
+
+        docs: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for hit in response[ElasticsearchKeys.HITS][ElasticsearchKeys.HITS]:
+            src = hit[ElasticsearchKeys.SOURCE]
+            key = src.get(key_field, -1) if key_field else -1
+            docs[(src.get(EmbeddingKeys.EPISODE_ID, ""), key)] = src
+
+        results = []
+        for episode_id, key, score in local_hits:
+            doc = docs.pop((episode_id, key), None)
+            if doc is None:
+                continue
+            doc[ElasticsearchKeys.SCORE] = score
+            results.append(doc)
+        return results
+
     @staticmethod
     def __normalize_frames(frames: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         for frame in frames:
@@ -15,6 +15,7 @@ from bot.search.infra.elastic_search_manager import (
     build_episode_restriction_filter,
     build_fuzzy_with_boost_query,
 )
+from bot.search.query_result_cache import QueryResultCache
 from bot.settings import settings
 from bot.types import (
     BaseSegment,
@@ -185,6 +186,29 @@ class TextSegmentsFinder:
             episode_filter: Optional[int] = None,
             size: int = 1,
             search_filter: Optional[SearchFilter] = None,
+    ) -> Optional[Union[SegmentWithScore, List[SegmentWithScore]]]:
+        key = QueryResultCache.make_key(
+            "text_quote",
+            [series_name],
+            QueryResultCache.normalize_quote(quote),
+            season_filter,
+            episode_filter,
+            QueryResultCache.hash_filter(search_filter),
+            size,
+        )
+        return await QueryResultCache.get_or_compute(
+            key,
+            lambda: TextSegmentsFinder.__find_segment_by_quote(
+                quote, logger, series_name, season_filter, episode_filter, size, search_filter,
+            ),
+        )
+
+    @staticmethod
+    async def __find_segment_by_quote(
+            quote: str, logger: logging.Logger, series_name: str, season_filter: Optional[int],
+            episode_filter: Optional[int],
+            size: int,
+            search_filter: Optional[SearchFilter],
     ) -> Optional[Union[SegmentWithScore, List[SegmentWithScore]]]:
         await log_system_message(
             logging.INFO,
@@ -0,0 +1,169 @@
+import math
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import numpy as np
+
+from bot.utils.constants import EmbeddingKeys
+
+
+class VectorProfile:
+    FULL_DIMS = 4096
+    FULL_VECTOR_SUFFIX = "_full"
+    INDEX_TYPES = {
+        "float": "hnsw",
+        "int8": "int8_hnsw",
+        "int4": "int4_hnsw",
+        "bbq": "bbq_hnsw",
+    }
+    PROFILED_FIELDS = (EmbeddingKeys.TEXT_EMBEDDING, EmbeddingKeys.VIDEO_EMBEDDING)
+    LOCAL_INDEX_FIELDS = (*PROFILED_FIELDS, EmbeddingKeys.FULL_EPISODE_EMBEDDING)
+    __MAX_CANDIDATES = 10000
+
+    def __init__(
+        self,
+        quantization: str,
+        dims: int,
+        rescore_oversample: float = 0.0,
+        full_dims: int = FULL_DIMS,
+        stores_vectors: bool = True,
+    ) -> None:
+        if quantization not in self.INDEX_TYPES:
+            raise ValueError(f"Unknown vector quantization '{quantization}', expected one of {', '.join(self.INDEX_TYPES)}")
+        if not 0 < dims <= full_dims:
+            raise ValueError(f"Vector dims must be between 1 and {full_dims}, got {dims}")
+        self.quantization = quantization
+        self.dims = dims
+        self.rescore_oversample = rescore_oversample
+        self.full_dims = full_dims
+        self.stores_vectors = stores_vectors
+
+    @property
+    def label(self) -> str:
+        label = f"{self.quantization}/{self.dims}"
+        return f"{label} rescore x{self.rescore_oversample:g}" if self.rescores else label
+
+    @property
+    def truncates(self) -> bool:
+        return self.dims < self.full_dims
+
+    @property
+    def rescores(self) -> bool:
+        return self.rescore_oversample > 1.0 and (self.truncates or self.quantization != "float")
+
+    def full_field(self, field: str) -> str:
+        return f"{field}{self.FULL_VECTOR_SUFFIX}" if self.truncates else field
+
+    def mapping_properties(self, field: str) -> Dict[str, Any]:
+        if not self.stores_vectors:
+            return {}
+        if field not in self.PROFILED_FIELDS:
+            return {
+                field: {
+                    "type": "dense_vector",
+                    "dims": self.full_dims,
+                    "index": True,
+                    "similarity": "cosine",
+                },
+            }
+
+        properties = {
+            field: {
+                "type": "dense_vector",
+                "dims": self.dims,
+                "index": True,
+                "similarity": "cosine",
+                "index_options": {"type": self.INDEX_TYPES[self.quantization]},
+            },
+        }
+        if self.truncates and self.rescores:
+            properties[self.full_field(field)] = {
+                "type": "dense_vector",
+                "dims": self.full_dims,
+                "index": False,
+            }
+        return properties
+
+    def truncate(self, vector: Any) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        if len(array) <= self.dims:
+            return array
+        head = array[:self.dims]
+        norm = float(np.linalg.norm(head))
+        return head / norm if norm > 0 else head
+
+    def document_fields(self, field: str, vector: Any) -> Dict[str, np.ndarray]:
+        full = np.asarray(vector, dtype=np.float32)
+        fields = {field: self.truncate(full)}
+        if self.truncates and self.rescores and len(full) > self.dims:
+            fields[self.full_field(field)] = full
+        return fields
+
+    def prepare_document(self, doc: Dict[str, Any]) -> None:
+        """Reshapes full-size vectors of an already generated document in place."""
+        if not self.stores_vectors:
+            for field in self.LOCAL_INDEX_FIELDS:
+                doc.pop(field, None)
+                doc.pop(f"{field}{self.FULL_VECTOR_SUFFIX}", None)
+            return
+
+        for field in self.PROFILED_FIELDS:
+            vector = doc.get(field)
+            if not isinstance(vector, list) or len(vector) <= self.dims:
+                continue
+            if self.rescores:
+                doc[self.full_field(field)] = vector
+            doc[field] = self.truncate(vector).tolist()
+
+    def search_body(
+        self,
+        field: str,
+        query_vector: Any,
+        k: int,
+        filters: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        if field not in self.PROFILED_FIELDS:
+            knn = {
+                "field": field,
+                "query_vector": np.asarray(query_vector, dtype=np.float32).tolist(),
+                "k": k,
+                "num_candidates": min(k * 10, self.__MAX_CANDIDATES),
+            }
+            if filters:
+                knn["filter"] = filters
+            return {"knn": knn}
+
+        window = min(math.ceil(k * self.rescore_oversample), self.__MAX_CANDIDATES) if self.rescores else k
+        knn = {
+            "field": field,
+            "query_vector": self.truncate(query_vector).tolist(),
+            "num_candidates": min(window * 10, self.__MAX_CANDIDATES),
+        }
+        if filters:
+            knn["filter"] = filters
+        if not self.rescores:
+            return {"knn": {**knn, "k": k}}
+
+        return {
+            "query": {"knn": knn},
+            "rescore": {
+                "window_size": window,
+                "query": {
+                    "rescore_query": {
+                        "script_score": {
+                            "query": {"match_all": {}},
+                            "script": {
+                                "source": f"(cosineSimilarity(params.query_vector, '{self.full_field(field)}') + 1.0) / 2.0",
+                                "params": {"query_vector": np.asarray(query_vector, dtype=np.float32).tolist()},
+                            },
+                        },
+                    },
+                    "query_weight": 0.0,
+                    "rescore_query_weight": 1.0,
+                },
+            },
+        }
@@ -1,4 +1,5 @@
 from bot.search.video_frames.character_finder import CharacterFinder
+from bot.search.video_frames.frame_hash_finder import FrameHashFinder
 from bot.search.video_frames.frames_finder import VideoFramesFinder
 from bot.search.video_frames.object_finder import (
     ObjectFinder,
@@ -7,6 +8,7 @@ from bot.search.video_frames.object_finder import (
 
 __all__ = [
     "CharacterFinder",
+    "FrameHashFinder",
     "ObjectFinder",
     "VideoFramesFinder",
     "get_polish_name",
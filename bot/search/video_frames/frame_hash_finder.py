@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from elasticsearch import NotFoundError
+from elasticsearch.helpers import async_scan
+import numpy as np
+
+from bot.search.hamming_index import HammingIndex
+from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.settings import settings
+from bot.utils.constants import (
+    ElasticsearchIndexSuffixes,
+    ElasticsearchKeys,
+    ElasticsearchQueryKeys,
+    EpisodeMetadataKeys,
+    SceneInfoKeys,
+    SegmentKeys,
+    VideoFrameKeys,
+)
+from bot.utils.log import log_system_message
+
+HASH_DISTANCE_KEY = "hamming_distance"
+
+
+class FrameHashFinder:
+    __SCAN_BATCH_SIZE = 5000
+    __FRAME_SOURCE_FIELDS = [
+        EpisodeMetadataKeys.EPISODE_METADATA,
+        VideoFrameKeys.TIMESTAMP,
+        VideoFrameKeys.FRAME_NUMBER,
+        VideoFrameKeys.SCENE_INFO,
+        VideoFrameKeys.PERCEPTUAL_HASH,
+        SegmentKeys.VIDEO_PATH,
+        VideoFrameKeys.EPISODE_ID,
+    ]
+
+    __indexes: Dict[str, Tuple[HammingIndex, np.ndarray]] = {}
+    __locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    async def find_similar(
+        phash: int,
+        series_name: str,
+        logger: logging.Logger,
+        max_distance: int = settings.FRAME_HASH_MAX_DISTANCE,
+        size: int = settings.MAX_ES_RESULTS_QUICK,
+    ) -> Optional[List[Dict[str, Any]]]:
+        loaded = await FrameHashFinder.__get_index(series_name, logger)
+        if loaded is None:
+            return None
+        index, doc_ids = loaded
+
+        rows, distances = index.search(phash, max_distance)
+        await log_system_message(
+            logging.INFO,
+            f"Hash {phash:016x} matched {len(rows)} frames within distance {max_distance} in '{series_name}'.",
+            logger,
+        )
+        if rows.size == 0:
+            return []
+
+        rows, distances = rows[:size], distances[:size]
+        es = await ElasticSearchManager.connect_to_elasticsearch(logger)
+        response = await es.mget(
+            index=FrameHashFinder.__build_index_name(series_name),
+            ids=[str(doc_ids[row]) for row in rows],
+            _source=FrameHashFinder.__FRAME_SOURCE_FIELDS,
+        )
+
+        frames = []
+        for doc, distance in zip(response["docs"], distances):
+            if not doc.get("found"):
+                continue
+            frame: Dict[str, Any] = doc[ElasticsearchKeys.SOURCE]
+            scene = frame.get(VideoFrameKeys.SCENE_INFO) or {}
+            timestamp = frame.get(VideoFrameKeys.TIMESTAMP, 0.0)
+            frame[SegmentKeys.START_TIME] = scene.get(SceneInfoKeys.SCENE_START_TIME, timestamp)
+            frame[SegmentKeys.END_TIME] = scene.get(SceneInfoKeys.SCENE_END_TIME, timestamp)
+            frame[HASH_DISTANCE_KEY] = int(distance)
+            frames.append(frame)
+        return frames
+
+    @staticmethod
+    def invalidate(series_name: str) -> None:
+        FrameHashFinder.__indexes.pop(series_name, None)
+        FrameHashFinder.__index_path(series_name).unlink(missing_ok=True)
+
+    @staticmethod
+    async def __get_index(series_name: str, logger: logging.Logger) -> Optional[Tuple[HammingIndex, np.ndarray]]:
+        loaded = FrameHashFinder.__indexes.get(series_name)
+        if loaded is not None:
+            return loaded
+
+        lock = FrameHashFinder.__locks.setdefault(series_name, asyncio.Lock())
+        async with lock:
+            loaded = FrameHashFinder.__indexes.get(series_name)
+            if loaded is not None:
+                return loaded
+
+            path = FrameHashFinder.__index_path(series_name)
+            if path.exists():
+                loaded = await asyncio.to_thread(FrameHashFinder.__load, path)
+            else:
+                loaded = await FrameHashFinder.__build(series_name, logger)
+                if loaded is None:
+                    return None
+                await asyncio.to_thread(FrameHashFinder.__save, path, *loaded)
+
+            FrameHashFinder.__indexes[series_name] = loaded
+            await log_system_message(
+                logging.INFO,
+                f"Frame hash index for '{series_name}' ready with {len(loaded[0])} frames.",
+                logger,
+            )
+            return loaded
+
+    @staticmethod
+    async def __build(series_name: str, logger: logging.Logger) -> Optional[Tuple[HammingIndex, np.ndarray]]:
+        es = await ElasticSearchManager.connect_to_elasticsearch(logger)
+        doc_ids: List[str] = []
+        hashes: List[int] = []
+        try:
+            async for hit in async_scan(
+                es,
+                index=FrameHashFinder.__build_index_name(series_name),
+                query={
+                    ElasticsearchQueryKeys.QUERY: {
+                        ElasticsearchQueryKeys.EXISTS: {
+                            ElasticsearchQueryKeys.FIELD: VideoFrameKeys.PERCEPTUAL_HASH_INT,
+                        },
+                    },
+                },
+                _source=[VideoFrameKeys.PERCEPTUAL_HASH_INT],
+                size=FrameHashFinder.__SCAN_BATCH_SIZE,
+            ):
+                doc_ids.append(hit["_id"])
+                hashes.append(int(hit[ElasticsearchKeys.SOURCE][VideoFrameKeys.PERCEPTUAL_HASH_INT]))
+        except NotFoundError:
+            await log_system_message(
+                logging.WARNING,
+                f"Video frames index for '{series_name}' not found.",
+                logger,
+            )
+            return None
+
+        index = await asyncio.to_thread(HammingIndex, np.asarray(hashes, dtype=np.uint64))
+        return index, np.asarray(doc_ids, dtype=str)
+
+    @staticmethod
+    def __load(path: Path) -> Tuple[HammingIndex, np.ndarray]:
+        with np.load(path) as arrays:
+            loaded = {name: arrays[name] for name in arrays.files}
+        return HammingIndex.from_arrays(loaded), loaded["doc_ids"]
+
+    @staticmethod
+    def __save(path: Path, index: HammingIndex, doc_ids: np.ndarray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".npz.tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(f, doc_ids=doc_ids, **index.to_arrays())
+        temp_path.replace(path)
+
+    @staticmethod
+    def __index_path(series_name: str) -> Path:
+        return Path(settings.FRAME_HASH_INDEX_DIR) / f"{series_name}.npz"
+
+    @staticmethod
+    def __build_index_name(series_name: str) -> str:
+        return f"{series_name}{ElasticsearchIndexSuffixes.VIDEO_FRAMES}"
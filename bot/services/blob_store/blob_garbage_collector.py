@@ -0,0 +1,68 @@
+import asyncio
+from contextlib import suppress
+import logging
+import time
+from typing import Optional
+
+from bot.database.database_manager import DatabaseManager
+from bot.services.blob_store.clip_storage import ClipStorage
+from bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BlobGarbageCollector:
+    __task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    async def collect(min_age_seconds: float, dry_run: bool = False) -> int:
+        store = ClipStorage.get_store()
+        cutoff = time.time() - min_age_seconds
+        candidates = [blob_hash async for blob_hash, modified_at in store.iter_blobs() if modified_at < cutoff]
+        if not candidates:
+            return 0
+
+        referenced = await DatabaseManager.get_referenced_blob_hashes()
+        removed = 0
+        for blob_hash in candidates:
+            if blob_hash in referenced:
+                continue
+            # ClipStorage.store() touches a deduplicated blob before its row is inserted, so a blob
+            # refreshed since it was listed may be about to gain a reference the set above cannot show.
+            modified_at = await store.modified_at(blob_hash)
+            if modified_at is None or modified_at >= cutoff:
+                continue
+            if not dry_run:
+                await store.delete(blob_hash)
+            removed += 1
+        return removed
+
+    @staticmethod
+    def start() -> bool:
+        if settings.BLOB_GC_INTERVAL_SECONDS <= 0:
+            return False
+        if BlobGarbageCollector.__task is not None and not BlobGarbageCollector.__task.done():
+            return False
+        BlobGarbageCollector.__task = asyncio.create_task(BlobGarbageCollector.__run())
+        return True
+
+    @staticmethod
+    async def stop() -> None:
+        task = BlobGarbageCollector.__task
+        BlobGarbageCollector.__task = None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    @staticmethod
+    async def __run() -> None:
+        while True:
+            try:
+                removed = await BlobGarbageCollector.collect(settings.BLOB_GC_MIN_AGE_MINUTES * 60)
+                if removed:
+                    logger.info(f"Removed {removed} unreferenced blobs.")
+            except Exception as e:
+                logger.error(f"Blob garbage collection failed: {e}")
+            await asyncio.sleep(settings.BLOB_GC_INTERVAL_SECONDS)
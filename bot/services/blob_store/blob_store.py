@@ -0,0 +1,48 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import asyncio
+import hashlib
+from typing import (
+    AsyncIterator,
+    Optional,
+    Tuple,
+)
+
+from bot.database.models import BlobRef
+
+
+class BlobStore(ABC):
+    @abstractmethod
+    async def put(self, blob_hash: str, data: bytes) -> None: ...
+    @abstractmethod
+    async def get(self, blob_hash: str) -> Optional[bytes]: ...
+    @abstractmethod
+    async def exists(self, blob_hash: str) -> bool: ...
+    @abstractmethod
+    async def touch(self, blob_hash: str) -> bool: ...
+    @abstractmethod
+    async def delete(self, blob_hash: str) -> None: ...
+    @abstractmethod
+    async def modified_at(self, blob_hash: str) -> Optional[float]: ...
+
+    @abstractmethod
+    async def iter_blobs(self) -> AsyncIterator[Tuple[str, float]]:
+        yield
+
+    async def store(self, data: bytes) -> BlobRef:
+        blob_hash = await asyncio.to_thread(BlobStore.__hash, data)
+        # A dedupe hit refreshes the blob's modification time so a concurrent GC pass,
+        # which only removes blobs older than its minimum age, does not reclaim it.
+        if not await self.touch(blob_hash):
+            await self.put(blob_hash, data)
+        return BlobRef(blob_hash=blob_hash, size=len(data))
+
+    @staticmethod
+    def __hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _shard_path(blob_hash: str) -> str:
+        return f"{blob_hash[:2]}/{blob_hash[2:4]}/{blob_hash}"
@@ -0,0 +1,64 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+from bot.database.database_manager import DatabaseManager
+from bot.database.models import (
+    BlobRef,
+    LastClip,
+    VideoClip,
+)
+from bot.services.blob_store.blob_store import BlobStore
+from bot.services.blob_store.local_blob_store import LocalBlobStore
+from bot.services.blob_store.s3_blob_store import (
+    Boto3S3Client,
+    S3BlobStore,
+)
+from bot.settings import settings
+
+
+class ClipStorage:
+    __store: Optional[BlobStore] = None
+
+    @staticmethod
+    def get_store() -> BlobStore:
+        if ClipStorage.__store is None:
+            ClipStorage.__store = ClipStorage.__create_store()
+        return ClipStorage.__store
+
+    @staticmethod
+    async def store(data: bytes) -> BlobRef:
+        return await ClipStorage.get_store().store(data)
+
+    @staticmethod
+    async def store_file(path: Path) -> BlobRef:
+        return await ClipStorage.store(await asyncio.to_thread(path.read_bytes))
+
+    @staticmethod
+    async def load_video(clip: VideoClip) -> Optional[bytes]:
+        if clip.video_hash:
+            return await ClipStorage.get_store().get(clip.video_hash)
+        return await DatabaseManager.get_legacy_video_data(clip.id)
+
+    @staticmethod
+    async def load_compiled_clip(last_clip: LastClip) -> Optional[bytes]:
+        if last_clip.compiled_clip_hash:
+            return await ClipStorage.get_store().get(last_clip.compiled_clip_hash)
+        return await DatabaseManager.get_legacy_compiled_clip(last_clip.id)
+
+    @staticmethod
+    def __create_store() -> BlobStore:
+        backend = settings.BLOB_STORE_BACKEND.lower()
+        if backend == "local":
+            return LocalBlobStore(Path(settings.BLOB_STORE_DIR))
+        if backend == "s3":
+            if not settings.BLOB_STORE_S3_BUCKET:
+                raise ValueError("BLOB_STORE_S3_BUCKET must be set when BLOB_STORE_BACKEND=s3")
+            client = Boto3S3Client(
+                endpoint_url=settings.BLOB_STORE_S3_ENDPOINT_URL or None,
+                access_key=settings.BLOB_STORE_S3_ACCESS_KEY.get_secret_value() or None if settings.BLOB_STORE_S3_ACCESS_KEY else None,
+                secret_key=settings.BLOB_STORE_S3_SECRET_KEY.get_secret_value() or None if settings.BLOB_STORE_S3_SECRET_KEY else None,
+                region=settings.BLOB_STORE_S3_REGION or None,
+            )
+            return S3BlobStore(client, settings.BLOB_STORE_S3_BUCKET, settings.BLOB_STORE_S3_PREFIX)
+        raise ValueError(f"Unknown BLOB_STORE_BACKEND: {settings.BLOB_STORE_BACKEND}")
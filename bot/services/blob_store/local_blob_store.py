@@ -0,0 +1,83 @@
+import asyncio
+import os
+from pathlib import Path
+from stat import S_ISREG
+import tempfile
+from typing import (
+    AsyncIterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from bot.services.blob_store.blob_store import BlobStore
+
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: Path) -> None:
+        self.__root = root
+
+    async def put(self, blob_hash: str, data: bytes) -> None:
+        await asyncio.to_thread(self.__write, self.__path(blob_hash), data)
+
+    async def get(self, blob_hash: str) -> Optional[bytes]:
+        path = self.__path(blob_hash)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def exists(self, blob_hash: str) -> bool:
+        return await asyncio.to_thread(self.__path(blob_hash).exists)
+
+    async def touch(self, blob_hash: str) -> bool:
+        try:
+            await asyncio.to_thread(os.utime, self.__path(blob_hash))
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def delete(self, blob_hash: str) -> None:
+        await asyncio.to_thread(self.__path(blob_hash).unlink, missing_ok=True)
+
+    async def modified_at(self, blob_hash: str) -> Optional[float]:
+        try:
+            return (await asyncio.to_thread(self.__path(blob_hash).stat)).st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def iter_blobs(self) -> AsyncIterator[Tuple[str, float]]:
+        for blob in await asyncio.to_thread(self.__list_blobs):
+            yield blob
+
+    def __path(self, blob_hash: str) -> Path:
+        return self.__root / self._shard_path(blob_hash)
+
+    def __list_blobs(self) -> List[Tuple[str, float]]:
+        if not self.__root.exists():
+            return []
+        blobs: List[Tuple[str, float]] = []
+        for path in self.__root.glob("*/*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if S_ISREG(stat.st_mode):
+                blobs.append((path.name, stat.st_mtime))
+        return blobs
+
+    @staticmethod
+    def __write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import click
+
+from bot.database.database_manager import DatabaseManager
+from bot.services.blob_store.blob_garbage_collector import BlobGarbageCollector
+from bot.services.blob_store.clip_storage import ClipStorage
+
+logger = logging.getLogger(__name__)
+
+
+class BlobMigrator:
+    def __init__(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    async def migrate_video_clips(self) -> int:
+        migrated = 0
+        while True:
+            clip_ids = await DatabaseManager.get_unmigrated_video_clip_ids(self.__batch_size)
+            if not clip_ids:
+                return migrated
+            for clip_id in clip_ids:
+                video_data = await DatabaseManager.get_legacy_video_data(clip_id)
+                thumbnail_data = await DatabaseManager.get_legacy_thumbnail_data(clip_id)
+                await DatabaseManager.set_video_clip_blobs(
+                    clip_id,
+                    await ClipStorage.store(video_data) if video_data else None,
+                    await ClipStorage.store(thumbnail_data) if thumbnail_data else None,
+                )
+                migrated += 1
+            logger.info(f"Migrated {migrated} saved clips")
+
+    async def migrate_last_clips(self) -> int:
+        migrated = 0
+        while True:
+            last_clip_ids = await DatabaseManager.get_unmigrated_last_clip_ids(self.__batch_size)
+            if not last_clip_ids:
+                return migrated
+            for last_clip_id in last_clip_ids:
+                compiled_clip = await DatabaseManager.get_legacy_compiled_clip(last_clip_id)
+                if compiled_clip is None:
+                    continue
+                await DatabaseManager.set_last_clip_blob(last_clip_id, await ClipStorage.store(compiled_clip))
+                migrated += 1
+            logger.info(f"Migrated {migrated} compiled last clips")
+
+
+async def run(batch_size: int, gc: bool, gc_min_age_minutes: int, dry_run: bool) -> None:
+    await DatabaseManager.init_pool()
+    try:
+        migrator = BlobMigrator(batch_size)
+        if not dry_run:
+            logger.info(f"Saved clips moved to blob store: {await migrator.migrate_video_clips()}")
+            logger.info(f"Compiled clips moved to blob store: {await migrator.migrate_last_clips()}")
+        if gc:
+            removed = await BlobGarbageCollector.collect(gc_min_age_minutes * 60, dry_run)
+            logger.info(f"Unreferenced blobs {'found' if dry_run else 'removed'}: {removed}")
+    finally:
+        await DatabaseManager.pool.close()
+
+
+@click.command()
+@click.option('--batch-size', default=100, type=int, help='Rows fetched per migration batch')
+@click.option('--gc/--no-gc', default=True, help='Delete blobs no longer referenced by any row')
+@click.option('--gc-min-age-minutes', default=60, type=int, help='Never delete blobs younger than this')
+@click.option('--dry-run', is_flag=True, help='Skip the migration and only report unreferenced blobs')
+def main(batch_size: int, gc: bool, gc_min_age_minutes: int, dry_run: bool):
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(batch_size, gc, gc_min_age_minutes, dry_run))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,130 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+
+from bot.services.blob_store.blob_store import BlobStore
+
+
+@runtime_checkable
+class S3Client(Protocol):
+    async def put_object(self, bucket: str, key: str, body: bytes) -> None: ...
+    async def get_object(self, bucket: str, key: str) -> Optional[bytes]: ...
+    async def head_object(self, bucket: str, key: str) -> Optional[float]: ...
+    async def touch_object(self, bucket: str, key: str) -> bool: ...
+    async def delete_object(self, bucket: str, key: str) -> None: ...
+    def list_objects(self, bucket: str, prefix: str) -> AsyncIterator[Tuple[str, float]]: ...
+
+
+class S3BlobStore(BlobStore):
+    def __init__(self, client: S3Client, bucket: str, prefix: str = "") -> None:
+        self.__client = client
+        self.__bucket = bucket
+        self.__prefix = prefix.strip("/")
+
+    async def put(self, blob_hash: str, data: bytes) -> None:
+        await self.__client.put_object(self.__bucket, self.__key(blob_hash), data)
+
+    async def get(self, blob_hash: str) -> Optional[bytes]:
+        return await self.__client.get_object(self.__bucket, self.__key(blob_hash))
+
+    async def exists(self, blob_hash: str) -> bool:
+        return await self.modified_at(blob_hash) is not None
+
+    async def touch(self, blob_hash: str) -> bool:
+        return await self.__client.touch_object(self.__bucket, self.__key(blob_hash))
+
+    async def delete(self, blob_hash: str) -> None:
+        await self.__client.delete_object(self.__bucket, self.__key(blob_hash))
+
+    async def modified_at(self, blob_hash: str) -> Optional[float]:
+        return await self.__client.head_object(self.__bucket, self.__key(blob_hash))
+
+    async def iter_blobs(self) -> AsyncIterator[Tuple[str, float]]:
+        prefix = f"{self.__prefix}/" if self.__prefix else ""
+        async for key, modified_at in self.__client.list_objects(self.__bucket, prefix):
+            yield key.rsplit("/", 1)[-1], modified_at
+
+    def __key(self, blob_hash: str) -> str:
+        shard_path = self._shard_path(blob_hash)
+        return f"{self.__prefix}/{shard_path}" if self.__prefix else shard_path
+
+
+class Boto3S3Client:
+    __NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+
+    def __init__(self, endpoint_url: Optional[str], access_key: Optional[str], secret_key: Optional[str], region: Optional[str]) -> None:
+        try:
+            import boto3  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise RuntimeError("BLOB_STORE_BACKEND=s3 requires the 'boto3' package to be installed.") from e
+
+        self.__client: Any = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+        )
+
+    async def put_object(self, bucket: str, key: str, body: bytes) -> None:
+        await asyncio.to_thread(self.__client.put_object, Bucket=bucket, Key=key, Body=body)
+
+    async def get_object(self, bucket: str, key: str) -> Optional[bytes]:
+        def __read() -> Optional[bytes]:
+            try:
+                response = self.__client.get_object(Bucket=bucket, Key=key)
+            except self.__client.exceptions.NoSuchKey:
+                return None
+            return response["Body"].read()
+
+        return await asyncio.to_thread(__read)
+
+    async def head_object(self, bucket: str, key: str) -> Optional[float]:
+        def __head() -> Optional[float]:
+            try:
+                response = self.__client.head_object(Bucket=bucket, Key=key)
+            except self.__client.exceptions.ClientError as e:
+                if self.__is_not_found(e):
+                    return None
+                raise
+            return response["LastModified"].timestamp()
+
+        return await asyncio.to_thread(__head)
+
+    async def touch_object(self, bucket: str, key: str) -> bool:
+        def __touch() -> bool:
+            try:
+                self.__client.copy_object(
+                    Bucket=bucket,
+                    Key=key,
+                    CopySource={"Bucket": bucket, "Key": key},
+                    MetadataDirective="REPLACE",
+                )
+                return True
+            except self.__client.exceptions.ClientError as e:
+                if self.__is_not_found(e):
+                    return False
+                raise
+
+        return await asyncio.to_thread(__touch)
+
+    async def delete_object(self, bucket: str, key: str) -> None:
+        await asyncio.to_thread(self.__client.delete_object, Bucket=bucket, Key=key)
+
+    @staticmethod
+    def __is_not_found(error: Exception) -> bool:
+        code = str(getattr(error, "response", {}).get("Error", {}).get("Code", ""))
+        return code in Boto3S3Client.__NOT_FOUND_CODES
+
+    async def list_objects(self, bucket: str, prefix: str) -> AsyncIterator[Tuple[str, float]]:
+        paginator = self.__client.get_paginator("list_objects_v2")
+        pages = await asyncio.to_thread(lambda: list(paginator.paginate(Bucket=bucket, Prefix=prefix)))
+        for page in pages:
+            for item in page.get("Contents", []):
+                yield item["Key"], item["LastModified"].timestamp()
@@ -0,0 +1,224 @@
+import asyncio
+from collections import OrderedDict
+from contextlib import (
+    contextmanager,
+    suppress,
+)
+from contextvars import ContextVar
+from datetime import date
+import logging
+import time
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import asyncpg
+
+from bot.database.database_manager import DatabaseManager
+from bot.database.models import UserPrincipal
+from bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    __CHANGES_CHANNEL = "principal_changed"
+    __RECONNECT_INITIAL_DELAY_SECONDS = 1.0
+    __RECONNECT_MAX_DELAY_SECONDS = 60.0
+
+    __entries: "OrderedDict[int, Tuple[float, UserPrincipal]]" = OrderedDict()
+    __in_flight: Dict[int, Tuple[int, int]] = {}
+    __epoch: int = 0
+    __listener: Optional[asyncpg.Connection] = None
+    __reconnect_task: Optional[asyncio.Task] = None
+    __request_scope: ContextVar[Optional[Dict[int, UserPrincipal]]] = ContextVar("principal_request_scope", default=None)
+
+    @staticmethod
+    @contextmanager
+    def request_scope() -> Iterator[None]:
+        if PrincipalCache.__request_scope.get() is not None:
+            yield
+            return
+        token = PrincipalCache.__request_scope.set({})
+        try:
+            yield
+        finally:
+            PrincipalCache.__request_scope.reset(token)
+
+    @staticmethod
+    async def get(user_id: int) -> UserPrincipal:
+        scope = PrincipalCache.__request_scope.get()
+        if scope is not None and user_id in scope:
+            return scope[user_id]
+
+        principal = PrincipalCache.__lookup(user_id)
+        if principal is None:
+            principal = await PrincipalCache.__fetch(user_id)
+
+        if scope is not None:
+            scope[user_id] = principal
+        return principal
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        PrincipalCache.__forget(user_id)
+        scope = PrincipalCache.__request_scope.get()
+        if scope is not None:
+            scope.pop(user_id, None)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        PrincipalCache.__forget_all()
+        scope = PrincipalCache.__request_scope.get()
+        if scope is not None:
+            scope.clear()
+
+    @staticmethod
+    async def start() -> bool:
+        if PrincipalCache.__listener is not None or PrincipalCache.__reconnect_task is not None:
+            return False
+        try:
+            await PrincipalCache.__connect()
+        except Exception as e:
+            logger.warning(f"Principal change notifications unavailable, relying on the cache TTL: {e}")
+            return False
+        return True
+
+    @staticmethod
+    async def stop() -> None:
+        reconnect_task = PrincipalCache.__reconnect_task
+        PrincipalCache.__reconnect_task = None
+        if reconnect_task is not None:
+            reconnect_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await reconnect_task
+
+        listener = PrincipalCache.__listener
+        PrincipalCache.__listener = None
+        if listener is not None:
+            await DatabaseManager.unlisten(listener)
+
+    @staticmethod
+    async def is_admin(user_id: int) -> bool:
+        return (await PrincipalCache.get(user_id)).is_admin
+
+    @staticmethod
+    async def is_admin_or_moderator(user_id: int) -> bool:
+        principal = await PrincipalCache.get(user_id)
+        return principal.is_admin or principal.is_moderator
+
+    @staticmethod
+    async def is_subscribed(user_id: int) -> bool:
+        principal = await PrincipalCache.get(user_id)
+        if not principal.in_db:
+            return False
+        if principal.is_admin or principal.is_moderator:
+            return True
+        return principal.subscription_end is not None and principal.subscription_end >= date.today()
+
+    @staticmethod
+    async def is_in_db(user_id: int) -> bool:
+        return (await PrincipalCache.get(user_id)).in_db
+
+    @staticmethod
+    async def get_active_series(user_id: int) -> List[str]:
+        return list((await PrincipalCache.get(user_id)).active_series)
+
+    @staticmethod
+    async def __connect() -> None:
+        PrincipalCache.__listener = await DatabaseManager.listen(
+            PrincipalCache.__CHANGES_CHANNEL,
+            PrincipalCache.__on_principal_changed,
+            PrincipalCache.__on_listener_terminated,
+        )
+        # Changes made while no listener was attached were never announced.
+        PrincipalCache.__forget_all()
+
+    @staticmethod
+    def __on_listener_terminated(conn: asyncpg.Connection) -> None:
+        if conn is not PrincipalCache.__listener:
+            return
+        PrincipalCache.__listener = None
+        PrincipalCache.__forget_all()
+        logger.warning("Principal change notification connection lost, reconnecting.")
+        PrincipalCache.__reconnect_task = asyncio.get_running_loop().create_task(PrincipalCache.__reconnect(conn))
+
+    @staticmethod
+    async def __reconnect(lost: asyncpg.Connection) -> None:
+        with suppress(Exception):
+            await DatabaseManager.unlisten(lost)
+
+        delay = PrincipalCache.__RECONNECT_INITIAL_DELAY_SECONDS
+        while True:
+            try:
+                await PrincipalCache.__connect()
+            except Exception as e:
+                logger.warning(f"Principal change notifications still unavailable, retrying in {delay:.0f}s: {e}")
+            else:
+                PrincipalCache.__reconnect_task = None
+                logger.info("Principal change notifications restored.")
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PrincipalCache.__RECONNECT_MAX_DELAY_SECONDS)
+
+    @staticmethod
+    def __on_principal_changed(payload: str) -> None:
+        try:
+            PrincipalCache.__forget(int(payload))
+        except ValueError:
+            PrincipalCache.__forget_all()
+
+    @staticmethod
+    async def __fetch(user_id: int) -> UserPrincipal:
+        # Versions are tracked only while a row is being read, so an invalidation that lands mid-read drops the stale row.
+        epoch = PrincipalCache.__epoch
+        fetches, version = PrincipalCache.__in_flight.get(user_id, (0, 0))
+        PrincipalCache.__in_flight[user_id] = (fetches + 1, version)
+        try:
+            principal = await DatabaseManager.get_user_principal(user_id)
+        finally:
+            fetches, latest = PrincipalCache.__in_flight.pop(user_id)
+            if fetches > 1:
+                PrincipalCache.__in_flight[user_id] = (fetches - 1, latest)
+
+        if epoch == PrincipalCache.__epoch and latest == version:
+            PrincipalCache.__store(principal)
+        return principal
+
+    @staticmethod
+    def __forget(user_id: int) -> None:
+        PrincipalCache.__entries.pop(user_id, None)
+        in_flight = PrincipalCache.__in_flight.get(user_id)
+        if in_flight is not None:
+            fetches, version = in_flight
+            PrincipalCache.__in_flight[user_id] = (fetches, version + 1)
+
+    @staticmethod
+    def __forget_all() -> None:
+        PrincipalCache.__entries.clear()
+        PrincipalCache.__epoch += 1
+
+    @staticmethod
+    def __lookup(user_id: int) -> Optional[UserPrincipal]:
+        entry = PrincipalCache.__entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del PrincipalCache.__entries[user_id]
+            return None
+        PrincipalCache.__entries.move_to_end(user_id)
+        return principal
+
+    @staticmethod
+    def __store(principal: UserPrincipal) -> None:
+        if settings.PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+            return
+        PrincipalCache.__entries[principal.user_id] = (time.monotonic() + settings.PRINCIPAL_CACHE_TTL_SECONDS, principal)
+        PrincipalCache.__entries.move_to_end(principal.user_id)
+        while len(PrincipalCache.__entries) > settings.PRINCIPAL_CACHE_SIZE:
+            PrincipalCache.__entries.popitem(last=False)
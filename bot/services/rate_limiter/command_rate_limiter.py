@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from typing import Optional
+
+from limits import (
+    RateLimitItem,
+    RateLimitItemPerSecond,
+)
+from limits.aio.strategies import SlidingWindowCounterRateLimiter
+from limits.storage import storage_from_string
+
+from bot.database.database_manager import DatabaseManager
+from bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CommandRateLimiter:
+    __MEMORY_STORAGE_URI = "async+memory://"
+
+    __limiter: Optional[SlidingWindowCounterRateLimiter] = None
+    __fallback_limiter: Optional[SlidingWindowCounterRateLimiter] = None
+    __item: Optional[RateLimitItem] = None
+    __compaction_task: Optional[asyncio.Task] = None
+    __using_fallback: bool = False
+
+    @staticmethod
+    async def is_limited(user_id: int) -> bool:
+        try:
+            limited = not await CommandRateLimiter.__get_limiter().test(CommandRateLimiter.__get_item(), str(user_id))
+        except Exception as e:
+            CommandRateLimiter.__mark_backend_down(e)
+            return not await CommandRateLimiter.__get_fallback_limiter().test(CommandRateLimiter.__get_item(), str(user_id))
+        CommandRateLimiter.__mark_backend_up()
+        return limited
+
+    @staticmethod
+    async def record_usage(user_id: int) -> None:
+        try:
+            await CommandRateLimiter.__get_limiter().hit(CommandRateLimiter.__get_item(), str(user_id))
+        except Exception as e:
+            CommandRateLimiter.__mark_backend_down(e)
+            await CommandRateLimiter.__get_fallback_limiter().hit(CommandRateLimiter.__get_item(), str(user_id))
+            return
+        CommandRateLimiter.__mark_backend_up()
+
+    @staticmethod
+    def start() -> bool:
+        # Builds the storage now so a misconfigured URI or a missing driver stops startup
+        # instead of silently degrading every call to per-process state.
+        CommandRateLimiter.__get_limiter()
+        if CommandRateLimiter.__compaction_task is not None and not CommandRateLimiter.__compaction_task.done():
+            return False
+        CommandRateLimiter.__compaction_task = asyncio.create_task(CommandRateLimiter.__compact_legacy_table())
+        return True
+
+    @staticmethod
+    async def stop() -> None:
+        task = CommandRateLimiter.__compaction_task
+        CommandRateLimiter.__compaction_task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @staticmethod
+    def __mark_backend_down(error: Exception) -> None:
+        if CommandRateLimiter.__using_fallback:
+            return
+        CommandRateLimiter.__using_fallback = True
+        logger.warning(f"Shared rate limit backend unavailable, using in-process state until it recovers: {error}")
+
+    @staticmethod
+    def __mark_backend_up() -> None:
+        if not CommandRateLimiter.__using_fallback:
+            return
+        CommandRateLimiter.__using_fallback = False
+        logger.info("Shared rate limit backend recovered.")
+
+    @staticmethod
+    def __get_item() -> RateLimitItem:
+        if CommandRateLimiter.__item is None:
+            CommandRateLimiter.__item = RateLimitItemPerSecond(settings.MESSAGE_LIMIT, settings.LIMIT_DURATION)
+        return CommandRateLimiter.__item
+
+    @staticmethod
+    def __get_limiter() -> SlidingWindowCounterRateLimiter:
+        if CommandRateLimiter.__limiter is None:
+            storage_uri = settings.COMMAND_RATE_LIMIT_STORAGE_URI or CommandRateLimiter.__MEMORY_STORAGE_URI
+            CommandRateLimiter.__limiter = SlidingWindowCounterRateLimiter(storage_from_string(storage_uri))
+        return CommandRateLimiter.__limiter
+
+    @staticmethod
+    def __get_fallback_limiter() -> SlidingWindowCounterRateLimiter:
+        if CommandRateLimiter.__fallback_limiter is None:
+            CommandRateLimiter.__fallback_limiter = SlidingWindowCounterRateLimiter(
+                storage_from_string(CommandRateLimiter.__MEMORY_STORAGE_URI),
+            )
+        return CommandRateLimiter.__fallback_limiter
+
+    @staticmethod
+    async def __compact_legacy_table() -> None:
+        while True:
+            try:
+                deleted = await DatabaseManager.compact_command_usage(
+                    settings.COMMAND_USAGE_RETENTION_HOURS * 3600,
+                    settings.COMMAND_USAGE_COMPACTION_BATCH_SIZE,
+                )
+                if deleted:
+                    logger.info(f"Compacted {deleted} legacy user_command_limits rows.")
+            except Exception as e:
+                logger.error(f"user_command_limits compaction failed: {e}")
+            await asyncio.sleep(settings.COMMAND_USAGE_COMPACTION_INTERVAL_SECONDS)
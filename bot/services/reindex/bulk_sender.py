@@ -0,0 +1,173 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from elasticsearch import (
+    ApiError,
+    AsyncElasticsearch,
+    TransportError,
+)
+
+
+@dataclass
+class BulkSendResult:
+    indexed: int = 0
+    failed: int = 0
+    requests: int = 0
+    rejections: int = 0
+    latency: float = 0.0
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class BulkSender:
+    __REJECTED_ERROR_TYPE = "es_rejected_execution_exception"
+    __MAX_BACKOFF_SECONDS = 60.0
+    __MAX_FAILURE_SAMPLES = 10
+
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        logger: logging.Logger,
+        max_retries: int,
+        request_timeout: Optional[float] = None,
+        on_rejected: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.__es = es
+        self.__logger = logger
+        self.__max_retries = max_retries
+        self.__request_timeout = request_timeout
+        self.__on_rejected = on_rejected
+
+    @staticmethod
+    async def disable_refresh(es: AsyncElasticsearch, index_name: str) -> Any:
+        """Turns off refresh and replicas for a bulk load and returns the replica count to restore."""
+        current = await es.indices.get_settings(index=index_name, name="index.number_of_replicas")
+        replicas = current.get(index_name, {}).get("settings", {}).get("index", {}).get("number_of_replicas")
+        await es.indices.put_settings(
+            index=index_name,
+            settings={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+        )
+        return replicas
+
+    @staticmethod
+    async def restore_refresh(es: AsyncElasticsearch, index_name: str, replicas: Any, logger: logging.Logger) -> None:
+        try:
+            await es.indices.put_settings(
+                index=index_name,
+                settings={"index": {"refresh_interval": None, "number_of_replicas": replicas}},
+            )
+            await es.indices.refresh(index=index_name)
+        except Exception as e:
+            logger.warning(f"Failed to restore settings for {index_name}: {e}")
+
+    async def send(self, index_name: str, lines: List[bytes]) -> BulkSendResult:
+        """Sends one bulk request, where each line is an action and source pair.
+
+        HTTP-level 429s and transport errors retry the whole request. Items rejected with 429
+        or es_rejected_execution_exception inside a successful response are retried on their own.
+        Both use the same exponential backoff.
+        """
+        result = BulkSendResult()
+        pending = lines
+        backoff = 1.0
+        for attempt in range(self.__max_retries + 1):
+            last_attempt = attempt == self.__max_retries
+            started = time.monotonic()
+            try:
+                response = await self.__bulk(b"".join(pending))
+            except (ApiError, TransportError) as e:
+                status = getattr(getattr(e, "meta", None), "status", None)
+                retryable = isinstance(e, TransportError) or status == 429
+                if not retryable or last_attempt:
+                    result.failed += len(pending)
+                    result.error = str(e)
+                    return result
+                self.__record_rejection(result)
+                self.__logger.warning(f"Bulk to {index_name} rejected ({e}), retrying in {backoff:.0f}s")
+            else:
+                result.requests += 1
+                result.latency = time.monotonic() - started
+                pending, rejected = self.__split_response(pending, response, result)
+                if not pending:
+                    self.__log_failures(index_name, result)
+                    return result
+                if last_attempt:
+                    self.__add_failures(result, rejected)
+                    self.__log_failures(index_name, result)
+                    return result
+                self.__record_rejection(result)
+                self.__logger.warning(
+                    f"Bulk to {index_name}: {len(pending)} items rejected by the cluster, retrying in {backoff:.0f}s",
+                )
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.__MAX_BACKOFF_SECONDS)
+        return result
+
+    async def __bulk(self, payload: bytes) -> Dict[str, Any]:
+        client = self.__es
+        if self.__request_timeout is not None:
+            client = client.options(request_timeout=self.__request_timeout)
+        return await client.bulk(operations=payload)
+
+    def __split_response(
+        self,
+        lines: List[bytes],
+        response: Dict[str, Any],
+        result: BulkSendResult,
+    ) -> Tuple[List[bytes], List[Dict[str, Any]]]:
+        if not response.get("errors"):
+            result.indexed += len(lines)
+            return [], []
+
+        retry_lines: List[bytes] = []
+        rejected: List[Dict[str, Any]] = []
+        failures: List[Dict[str, Any]] = []
+        for line, entry in zip(lines, response.get("items", [])):
+            item = next(iter(entry.values()), {})
+            error = item.get("error")
+            if not error:
+                result.indexed += 1
+            elif self.__is_rejection(item):
+                retry_lines.append(line)
+                rejected.append(item)
+            else:
+                failures.append(item)
+        self.__add_failures(result, failures)
+        return retry_lines, rejected
+
+    def __is_rejection(self, item: Dict[str, Any]) -> bool:
+        error = item.get("error")
+        error_type = error.get("type") if isinstance(error, dict) else None
+        return item.get("status") == 429 or error_type == self.__REJECTED_ERROR_TYPE
+
+    def __add_failures(self, result: BulkSendResult, failures: List[Dict[str, Any]]) -> None:
+        result.failed += len(failures)
+        free_slots = self.__MAX_FAILURE_SAMPLES - len(result.failures)
+        if free_slots > 0:
+            result.failures.extend(failures[:free_slots])
+
+    def __record_rejection(self, result: BulkSendResult) -> None:
+        result.rejections += 1
+        if self.__on_rejected is not None:
+            self.__on_rejected()
+
+    def __log_failures(self, index_name: str, result: BulkSendResult) -> None:
+        if not result.failed:
+            return
+        self.__logger.warning(f"Bulk index errors in {index_name}: {result.failed} failed")
+        for failure in result.failures[:3]:
+            self.__logger.warning(f"Sample error: {failure.get('error')}")
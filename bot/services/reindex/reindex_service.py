@@ -19,10 +19,20 @@ from elasticsearch.helpers import (
 )
 
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.search.infra.vector_profile import VECTOR_PROFILE
+from bot.search.local_semantic_index import LocalSemanticIndex
+from bot.search.query_result_cache import QueryResultCache
+from bot.search.scene_cut_cache import SceneCutCache
+from bot.search.video_frames.frame_hash_finder import FrameHashFinder
 from bot.services.reindex.scenes_merger import ScenesMerger
 from bot.services.reindex.series_scanner import SeriesScanner
+from bot.services.reindex.streaming_bulk_indexer import (
+    StreamingBulkIndexer,
+    StreamingReindexStats,
+)
 from bot.services.reindex.video_path_transformer import VideoPathTransformer
 from bot.services.reindex.zip_extractor import ZipExtractor
+from bot.settings import settings
 
 
 @dataclass
@@ -49,10 +59,12 @@ class ReindexService:
         logger: logging.Logger,
         frame_before: float = 0.0,
         frame_after: float = 0.0,
+        streaming: Optional[bool] = None,
     ) -> None:
         self.__logger = logger
         self.__frame_before = frame_before
         self.__frame_after = frame_after
+        self.__streaming = settings.REINDEX_STREAMING if streaming is None else streaming
         self.__scanner = SeriesScanner(logger)
         self.__zip_extractor = ZipExtractor(logger)
         self.__video_transformer = VideoPathTransformer(logger)
@@ -148,51 +160,90 @@ class ReindexService:
 
         await progress_callback(f"Usuwanie starych indeksów dla {series_name}...", 5, 100)
         await self.__delete_series_indices(series_name)
+        SceneCutCache.invalidate_series(series_name)
+        QueryResultCache.bump_series(series_name)
+        FrameHashFinder.invalidate(series_name)
 
         total_episodes = len(zip_files)
         indexed_count = 0
         errors = []
-
-        for idx, zip_path in enumerate(zip_files):
-            try:
-                if idx > 0 and idx % 10 == 0:
-                    await self.__refresh_elasticsearch_connection(series_name, idx)
-
-                _, indexed_in_episode = await self.__process_single_episode(
-                    zip_path,
-                    series_name,
-                    mp4_map,
-                    idx,
-                    total_episodes,
-                    progress_callback,
-                )
-
-                indexed_count += indexed_in_episode
-
-            except Exception as e:
-                error_msg = f"Failed to process {zip_path.name}: {str(e)}"
-                self.__logger.error(error_msg, exc_info=True)
-                errors.append(error_msg)
-
-                if "Cannot connect" in str(e) or "Connection" in str(e):
-                    self.__logger.info("Connection error detected, recreating ES connection...")
-                    try:
-                        if self.__es_manager:
-                            await self.__es_manager.close()
-                    except Exception:
-                        pass
-                    self.__es_manager = None
-                    await self.__init_elasticsearch()
-
+        failed_episodes = 0
+
+        if self.__streaming:
+            stats = await self.__stream_series(series_name, zip_files, mp4_map, progress_callback)
+            indexed_count = stats.documents_indexed
+            errors = stats.errors
+            failed_episodes = stats.episodes_failed
+        else:
+            for idx, zip_path in enumerate(zip_files):
+                try:
+                    if idx > 0 and idx % 10 == 0:
+                        await self.__refresh_elasticsearch_connection(series_name, idx)
+
+                    _, indexed_in_episode = await self.__process_single_episode(
+                        zip_path,
+                        series_name,
+                        mp4_map,
+                        idx,
+                        total_episodes,
+                        progress_callback,
+                    )
+
+                    indexed_count += indexed_in_episode
+
+                except Exception as e:
+                    error_msg = f"Failed to process {zip_path.name}: {str(e)}"
+                    self.__logger.error(error_msg, exc_info=True)
+                    errors.append(error_msg)
+                    failed_episodes += 1
+
+                    if "Cannot connect" in str(e) or "Connection" in str(e):
+                        self.__logger.info("Connection error detected, recreating ES connection...")
+                        try:
+                            if self.__es_manager:
+                                await self.__es_manager.close()
+                        except Exception:
+                            pass
+                        self.__es_manager = None
+                        await self.__init_elasticsearch()
+
+        SceneCutCache.invalidate_series(series_name)
+        QueryResultCache.bump_series(series_name)
+        FrameHashFinder.invalidate(series_name)
+        if LocalSemanticIndex.enabled():
+            await LocalSemanticIndex.reload(series_name, self.__logger)
         await progress_callback(f"Reindeksowanie {series_name} zakończone!", 100, 100)
 
         return ReindexResult(
             series_name=series_name,
-            episodes_processed=total_episodes - len(errors),
+            episodes_processed=total_episodes - failed_episodes,
             documents_indexed=indexed_count,
             errors=errors,
         )
 
+    async def __stream_series(
+        self,
+        series_name: str,
+        zip_files: List[Path],
+        mp4_map: Dict[str, Path],
+        progress_callback: Callable[[str, int, int], Awaitable[None]],
+    ) -> StreamingReindexStats:
+        indexer = StreamingBulkIndexer(
+            self.__es_manager,
+            self.__logger,
+            self.__zip_extractor,
+            self.__video_transformer,
+            self.__scenes_merger,
+            self.__get_mapping_for_type,
+            frame_before=self.__frame_before,
+            frame_after=self.__frame_after,
+        )
+        episodes = []
+        for zip_path in zip_files:
+            episode_code = self.__extract_episode_code(zip_path)
+            episodes.append((episode_code, zip_path, mp4_map.get(episode_code)))
+        return await indexer.index_series(series_name, episodes, progress_callback)
+
     async def __init_elasticsearch(self) -> None:
         if self.__es_manager is None:
             self.__es_manager = await ElasticSearchManager.connect_to_elasticsearch(
@@ -222,6 +273,10 @@ class ReindexService:
                     deleted.append(index_name)
             except Exception as e:
                 self.__logger.warning(f"Failed to delete index {index_name}: {e}")
+        SceneCutCache.invalidate_series(series_name)
+        QueryResultCache.bump_series(series_name)
+        FrameHashFinder.invalidate(series_name)
+        LocalSemanticIndex.invalidate(series_name)
         return deleted
 
     async def __delete_series_indices(self, series_name: str) -> None:
@@ -320,6 +375,7 @@ class ReindexService:
             documents = self.__zip_extractor.parse_jsonl_from_memory(buffer)
             for doc in documents:
                 self.__video_transformer.transform_video_path(doc, mp4_path)
+                VECTOR_PROFILE.prepare_document(doc)
             parsed[jsonl_type] = documents
 
             index_name = self.__get_index_name(series_name, jsonl_type)
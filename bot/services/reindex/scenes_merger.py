@@ -7,6 +7,7 @@ from typing import (
     Any,
     Dict,
     List,
+    Optional,
 )
 
 
@@ -26,6 +27,7 @@ class ScenesMerger:
             key=lambda f: float(f["timestamp"]),
         )
         timestamps = [float(f["timestamp"]) for f in sorted_frames]
+        built_frames = [self.__build_frame(f) for f in sorted_frames]
 
         scenes = []
         for segment in text_segments:
@@ -34,9 +36,7 @@ class ScenesMerger:
 
             lo = bisect_left(timestamps, max(0.0, start - frame_before))
             hi = bisect_right(timestamps, end + frame_after)
-            segment_frames = [
-                self.__build_frame(sorted_frames[i]) for i in range(lo, hi)
-            ]
+            segment_frames = [frame for frame in built_frames[lo:hi] if frame is not None]
 
             scene = self.__build_scene(segment, segment_frames)
             scenes.append(scene)
@@ -50,16 +50,10 @@ class ScenesMerger:
         return scenes
 
     @staticmethod
-    def __build_frame(frame: Dict[str, Any]) -> Dict[str, Any]:
+    def compact_frame(frame: Dict[str, Any]) -> Dict[str, Any]:
         result: Dict[str, Any] = {
             "frame_number": frame.get("frame_number"),
             "timestamp": frame.get("timestamp"),
-            "frame_type": frame.get("frame_type"),
-            "scene_number": frame.get("scene_number"),
-            "scene_info": frame.get("scene_info"),
-            "perceptual_hash": frame.get("perceptual_hash"),
-            "perceptual_hash_int": frame.get("perceptual_hash_int"),
-            "video_embedding": frame.get("video_embedding"),
         }
         character_appearances = frame.get("character_appearances")
         if character_appearances:
@@ -67,7 +61,21 @@ class ScenesMerger:
         detected_objects = frame.get("detected_objects")
         if detected_objects:
             result["detected_objects"] = detected_objects
-        return {k: v for k, v in result.items() if v is not None}
+        return result
+
+    @staticmethod
+    def __build_frame(frame: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        character_appearances = frame.get("character_appearances")
+        detected_objects = frame.get("detected_objects")
+        if not character_appearances and not detected_objects:
+            return None
+
+        result: Dict[str, Any] = {"frame_number": frame.get("frame_number")}
+        if character_appearances:
+            result["character_appearances"] = character_appearances
+        if detected_objects:
+            result["detected_objects"] = detected_objects
+        return result
 
     @staticmethod
     def __build_scene(
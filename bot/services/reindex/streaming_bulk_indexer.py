@@ -0,0 +1,252 @@
+import asyncio
+import concurrent.futures
+from dataclasses import (
+    dataclass,
+    field,
+)
+import json
+import logging
+from pathlib import Path
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from elasticsearch import AsyncElasticsearch
+
+from bot.search.infra.vector_profile import VECTOR_PROFILE
+from bot.services.reindex.bulk_sender import BulkSender
+from bot.services.reindex.scenes_merger import ScenesMerger
+from bot.services.reindex.video_path_transformer import VideoPathTransformer
+from bot.services.reindex.zip_extractor import ZipExtractor
+from bot.settings import settings
+
+
+@dataclass
+class _BulkChunk:
+    index_name: str
+    index_type: str
+    lines: List[bytes]
+
+
+@dataclass
+class StreamingReindexStats:
+    documents_indexed: int = 0
+    documents_failed: int = 0
+    episodes_failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class StreamingBulkIndexer:
+    __SCENE_SOURCES = ("text_segments", "video_frames")
+    __PUT_POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        logger: logging.Logger,
+        zip_extractor: ZipExtractor,
+        video_transformer: VideoPathTransformer,
+        scenes_merger: ScenesMerger,
+        mapping_for_type: Callable[[str], Dict[str, Any]],
+        frame_before: float = 0.0,
+        frame_after: float = 0.0,
+    ) -> None:
+        self.__es = es
+        self.__logger = logger
+        self.__zip_extractor = zip_extractor
+        self.__video_transformer = video_transformer
+        self.__scenes_merger = scenes_merger
+        self.__mapping_for_type = mapping_for_type
+        self.__frame_before = frame_before
+        self.__frame_after = frame_after
+        self.__max_chunk_bytes = settings.REINDEX_BULK_CHUNK_MB * 1024 * 1024
+        self.__sender = BulkSender(es, logger, settings.REINDEX_BULK_MAX_RETRIES)
+        self.__index_locks: Dict[str, asyncio.Lock] = {}
+        self.__restore_replicas: Dict[str, Any] = {}
+
+    async def index_series(
+        self,
+        series_name: str,
+        episodes: List[Tuple[str, Path, Optional[Path]]],
+        progress_callback: Callable[[str, int, int], Awaitable[None]],
+    ) -> StreamingReindexStats:
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Optional[_BulkChunk]]" = asyncio.Queue(maxsize=settings.REINDEX_QUEUE_CHUNKS)
+        stop = threading.Event()
+        stats = StreamingReindexStats()
+        worker_count = max(1, settings.REINDEX_BULK_WORKERS)
+
+        workers = [asyncio.create_task(self.__worker(queue, stats)) for _ in range(worker_count)]
+        reader = asyncio.create_task(
+            asyncio.to_thread(
+                self.__read_episodes, loop, queue, stop, stats, series_name, episodes, worker_count, progress_callback,
+            ),
+        )
+        try:
+            await reader
+            await asyncio.gather(*workers)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.cancel()
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.gather(reader, *workers, return_exceptions=True)
+            await self.__restore_index_settings()
+
+        return stats
+
+    def __read_episodes(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue: "asyncio.Queue[Optional[_BulkChunk]]",
+        stop: threading.Event,
+        stats: StreamingReindexStats,
+        series_name: str,
+        episodes: List[Tuple[str, Path, Optional[Path]]],
+        worker_count: int,
+        progress_callback: Callable[[str, int, int], Awaitable[None]],
+    ) -> None:
+        def put(item: Optional[_BulkChunk]) -> None:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=self.__PUT_POLL_SECONDS)
+                    return
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+
+        try:
+            total = len(episodes)
+            for idx, (episode_code, zip_path, mp4_path) in enumerate(episodes):
+                if stop.is_set():
+                    return
+                asyncio.run_coroutine_threadsafe(
+                    progress_callback(f"Przetwarzanie {episode_code}... ({idx + 1}/{total})", 10 + int(idx / total * 85), 100),
+                    loop,
+                ).result()
+                try:
+                    for chunk in self.__episode_chunks(series_name, zip_path, mp4_path):
+                        put(chunk)
+                except Exception as e:
+                    error_msg = f"Failed to process {zip_path.name}: {str(e)}"
+                    self.__logger.error(error_msg, exc_info=True)
+                    stats.errors.append(error_msg)
+                    stats.episodes_failed += 1
+        finally:
+            for _ in range(worker_count):
+                put(None)
+
+    def __episode_chunks(self, series_name: str, zip_path: Path, mp4_path: Optional[Path]) -> Iterable[_BulkChunk]:
+        retained: Dict[str, List[Dict[str, Any]]] = {}
+        batches: Dict[str, Tuple[List[bytes], int]] = {}
+
+        for jsonl_type, doc in self.__zip_extractor.iter_documents(zip_path):
+            self.__video_transformer.transform_video_path(doc, mp4_path)
+            VECTOR_PROFILE.prepare_document(doc)
+            if jsonl_type == "video_frames":
+                retained.setdefault(jsonl_type, []).append(ScenesMerger.compact_frame(doc))
+            elif jsonl_type in self.__SCENE_SOURCES:
+                retained.setdefault(jsonl_type, []).append(doc)
+            chunk = self.__append(batches, series_name, jsonl_type, doc)
+            if chunk is not None:
+                yield chunk
+
+        if all(name in retained for name in self.__SCENE_SOURCES):
+            scenes = self.__scenes_merger.merge(
+                retained["text_segments"],
+                retained["video_frames"],
+                frame_before=self.__frame_before,
+                frame_after=self.__frame_after,
+            )
+            retained.clear()
+            for scene in scenes:
+                chunk = self.__append(batches, series_name, "scenes", scene)
+                if chunk is not None:
+                    yield chunk
+
+        for jsonl_type in list(batches):
+            chunk = self.__flush(batches, series_name, jsonl_type)
+            if chunk is not None:
+                yield chunk
+
+    def __append(
+        self,
+        batches: Dict[str, Tuple[List[bytes], int]],
+        series_name: str,
+        index_type: str,
+        doc: Dict[str, Any],
+    ) -> Optional[_BulkChunk]:
+        index_name = f"{series_name}_{index_type}"
+        action = json.dumps({"index": {"_index": index_name}}).encode("utf-8")
+        source = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+        lines, size = batches.get(index_type, ([], 0))
+        lines.append(action + b"\n" + source + b"\n")
+        size += len(action) + len(source) + 2
+        batches[index_type] = (lines, size)
+
+        if len(lines) >= settings.REINDEX_BULK_CHUNK_DOCS or size >= self.__max_chunk_bytes:
+            return self.__flush(batches, series_name, index_type)
+        return None
+
+    @staticmethod
+    def __flush(
+        batches: Dict[str, Tuple[List[bytes], int]],
+        series_name: str,
+        index_type: str,
+    ) -> Optional[_BulkChunk]:
+        lines, _ = batches.pop(index_type, ([], 0))
+        if not lines:
+            return None
+        return _BulkChunk(
+            index_name=f"{series_name}_{index_type}",
+            index_type=index_type,
+            lines=lines,
+        )
+
+    async def __worker(self, queue: "asyncio.Queue[Optional[_BulkChunk]]", stats: StreamingReindexStats) -> None:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return
+            try:
+                await self.__ensure_index(chunk.index_name, chunk.index_type)
+                result = await self.__sender.send(chunk.index_name, chunk.lines)
+            except Exception as e:
+                stats.documents_failed += len(chunk.lines)
+                self.__record_error(stats, chunk.index_name, str(e))
+                continue
+            stats.documents_indexed += result.indexed
+            stats.documents_failed += result.failed
+            if result.error is not None:
+                self.__record_error(stats, chunk.index_name, result.error)
+
+    def __record_error(self, stats: StreamingReindexStats, index_name: str, error: str) -> None:
+        error_msg = f"Bulk request to {index_name} failed: {error}"
+        self.__logger.error(error_msg)
+        stats.errors.append(error_msg)
+
+    async def __ensure_index(self, index_name: str, index_type: str) -> None:
+        if index_name in self.__restore_replicas:
+            return
+        lock = self.__index_locks.setdefault(index_name, asyncio.Lock())
+        async with lock:
+            if index_name in self.__restore_replicas:
+                return
+            if not await self.__es.indices.exists(index=index_name):
+                await self.__es.indices.create(index=index_name, body=self.__mapping_for_type(index_type))
+            self.__restore_replicas[index_name] = await BulkSender.disable_refresh(self.__es, index_name)
+
+    async def __restore_index_settings(self) -> None:
+        for index_name, replicas in self.__restore_replicas.items():
+            await BulkSender.restore_refresh(self.__es, index_name, replicas, self.__logger)
+        self.__restore_replicas.clear()
@@ -5,8 +5,10 @@ from pathlib import Path
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 import zipfile
 
@@ -37,21 +39,48 @@ class ZipExtractor:
 
         return extracted_files
 
+    def iter_documents(self, zip_path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                for file_info in zf.infolist():
+                    if not file_info.filename.endswith('.jsonl'):
+                        continue
+
+                    jsonl_type = self.__detect_type_from_filename(file_info.filename)
+                    if not jsonl_type:
+                        continue
+
+                    with zf.open(file_info) as member:
+                        for line in member:
+                            doc = self.__parse_line(line)
+                            if doc is not None:
+                                yield jsonl_type, doc
+
+        except zipfile.BadZipFile as e:
+            self.__logger.error(f"Corrupted zip file: {zip_path}")
+            raise ValueError(f"Invalid zip file: {zip_path}") from e
+
     def parse_jsonl_from_memory(self, buffer: io.BytesIO) -> List[Dict[str, Any]]:
         documents = []
         buffer.seek(0)
 
         for line in buffer:
-            line_str = line.decode('utf-8').strip()
-            if line_str:
-                try:
-                    doc = json.loads(line_str)
-                    documents.append(doc)
-                except json.JSONDecodeError as e:
-                    self.__logger.warning(f"Failed to parse JSONL line: {e}")
+            doc = self.__parse_line(line)
+            if doc is not None:
+                documents.append(doc)
 
         return documents
 
+    def __parse_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        line_str = line.decode('utf-8').strip()
+        if not line_str:
+            return None
+        try:
+            return json.loads(line_str)
+        except json.JSONDecodeError as e:
+            self.__logger.warning(f"Failed to parse JSONL line: {e}")
+            return None
+
     @staticmethod
     def __detect_type_from_filename(filename: str) -> Optional[str]:
         _type_mapping = {
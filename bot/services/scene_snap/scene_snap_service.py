@@ -1,7 +1,8 @@
 import bisect
 import logging
 from typing import (
-    List,
+    Callable,
+    Sequence,
     Tuple,
     Union,
 )
@@ -29,35 +30,50 @@ class SceneSnapService:
             return boundary + SceneSnapService.__KEYFRAME_INTERVAL
         return boundary - SceneSnapService.__KEYFRAME_INTERVAL
 
+    @staticmethod
+    def __last_matching(scene_cuts: Sequence[float], pivot: float, predicate: Callable[[float], bool]) -> int:
+        idx = bisect.bisect_right(scene_cuts, pivot) - 1
+        while idx + 1 < len(scene_cuts) and predicate(scene_cuts[idx + 1]):
+            idx += 1
+        while idx >= 0 and not predicate(scene_cuts[idx]):
+            idx -= 1
+        return idx
+
+    @staticmethod
+    def __first_matching(scene_cuts: Sequence[float], pivot: float, predicate: Callable[[float], bool]) -> int:
+        idx = bisect.bisect_left(scene_cuts, pivot)
+        while idx > 0 and predicate(scene_cuts[idx - 1]):
+            idx -= 1
+        while idx < len(scene_cuts) and not predicate(scene_cuts[idx]):
+            idx += 1
+        return idx
+
     @staticmethod
     def __snap_start(
         clip_start: float,
         speech_start: float,
-        scene_cuts: List[float],
+        scene_cuts: Sequence[float],
     ) -> float:
         def __snapped(c: float) -> float:
             return SceneSnapService.__apply_keyframe_offset(c, is_start=True)
 
-        valid = [
-            c for c in scene_cuts
-            if c <= speech_start and __snapped(c) <= speech_start
-        ]
-
-        expanding = [
-            c for c in valid
-            if __snapped(c) <= clip_start
-            and clip_start - __snapped(c) <= SceneSnapService.__MAX_EXPANSION
-        ]
-        if expanding:
-            return __snapped(min(expanding, key=lambda c: abs(__snapped(c) - clip_start)))
-
-        shrinking = [
-            c for c in valid
-            if __snapped(c) > clip_start
-            and __snapped(c) - clip_start <= SceneSnapService.__MAX_SHRINK
-        ]
-        if shrinking:
-            return __snapped(min(shrinking, key=lambda c: abs(__snapped(c) - clip_start)))
+        def __is_valid(c: float) -> bool:
+            return c <= speech_start and __snapped(c) <= speech_start
+
+        offset = SceneSnapService.__KEYFRAME_INTERVAL
+        expanding_idx = SceneSnapService.__last_matching(
+            scene_cuts, min(clip_start, speech_start) - offset, lambda c: __is_valid(c) and __snapped(c) <= clip_start,
+        )
+        if expanding_idx >= 0:
+            snapped = __snapped(scene_cuts[expanding_idx])
+            if clip_start - snapped <= SceneSnapService.__MAX_EXPANSION:
+                return snapped
+
+        shrinking_idx = SceneSnapService.__first_matching(scene_cuts, clip_start - offset, lambda c: __snapped(c) > clip_start)
+        if shrinking_idx < len(scene_cuts) and __is_valid(scene_cuts[shrinking_idx]):
+            snapped = __snapped(scene_cuts[shrinking_idx])
+            if snapped - clip_start <= SceneSnapService.__MAX_SHRINK:
+                return snapped
 
         return clip_start
 
@@ -65,31 +81,28 @@ class SceneSnapService:
     def __snap_end(
         clip_end: float,
         speech_end: float,
-        scene_cuts: List[float],
+        scene_cuts: Sequence[float],
     ) -> float:
         def __snapped(c: float) -> float:
             return SceneSnapService.__apply_keyframe_offset(c, is_start=False)
 
-        valid = [
-            c for c in scene_cuts
-            if c >= speech_end and __snapped(c) >= speech_end
-        ]
-
-        expanding = [
-            c for c in valid
-            if __snapped(c) >= clip_end
-            and __snapped(c) - clip_end <= SceneSnapService.__MAX_EXPANSION
-        ]
-        if expanding:
-            return __snapped(min(expanding, key=lambda c: abs(__snapped(c) - clip_end)))
-
-        shrinking = [
-            c for c in valid
-            if __snapped(c) < clip_end
-            and clip_end - __snapped(c) <= SceneSnapService.__MAX_SHRINK
-        ]
-        if shrinking:
-            return __snapped(min(shrinking, key=lambda c: abs(__snapped(c) - clip_end)))
+        def __is_valid(c: float) -> bool:
+            return c >= speech_end and __snapped(c) >= speech_end
+
+        offset = SceneSnapService.__KEYFRAME_INTERVAL
+        expanding_idx = SceneSnapService.__first_matching(
+            scene_cuts, max(clip_end, speech_end) + offset, lambda c: __is_valid(c) and __snapped(c) >= clip_end,
+        )
+        if expanding_idx < len(scene_cuts):
+            snapped = __snapped(scene_cuts[expanding_idx])
+            if snapped - clip_end <= SceneSnapService.__MAX_EXPANSION:
+                return snapped
+
+        shrinking_idx = SceneSnapService.__last_matching(scene_cuts, clip_end + offset, lambda c: __snapped(c) < clip_end)
+        if shrinking_idx >= 0 and __is_valid(scene_cuts[shrinking_idx]):
+            snapped = __snapped(scene_cuts[shrinking_idx])
+            if clip_end - snapped <= SceneSnapService.__MAX_SHRINK:
+                return snapped
 
         return clip_end
 
@@ -99,7 +112,7 @@ class SceneSnapService:
         clip_end: float,
         speech_start: float,
         speech_end: float,
-        scene_cuts: List[float],
+        scene_cuts: Sequence[float],
     ) -> Tuple[float, float]:
         if not scene_cuts:
             return clip_start, clip_end
@@ -141,7 +154,7 @@ class SceneSnapService:
 
     @staticmethod
     def find_boundary_by_cut_offset(
-        scene_cuts: List[float],
+        scene_cuts: Sequence[float],
         reference_time: float,
         offset_count: int,
         direction: str,
@@ -3,6 +3,7 @@ from typing import List
 
 from bot.database.database_manager import DatabaseManager
 from bot.search.infra.elastic_search_manager import ElasticSearchManager
+from bot.services.principal_cache.principal_cache import PrincipalCache
 from bot.services.reindex.series_scanner import SeriesScanner
 from bot.settings import settings
 
@@ -19,7 +20,7 @@ class SerialContextManager:
 
     @staticmethod
     async def get_user_active_series_list(user_id: int) -> List[str]:
-        return await DatabaseManager.get_user_active_series_names(user_id)
+        return await PrincipalCache.get_active_series(user_id)
 
     async def set_user_active_series(self, user_id: int, series_name: str) -> None:
         await self.set_user_active_series_list(user_id, [series_name])
@@ -27,6 +28,7 @@ class SerialContextManager:
     async def set_user_active_series_list(self, user_id: int, series_names: List[str]) -> None:
         if not series_names:
             await DatabaseManager.set_user_active_series_names(user_id, [])
+            PrincipalCache.invalidate(user_id)
             await DatabaseManager.delete_last_clips_by_chat_id(user_id)
             self.__logger.info(f"Set active series for user {user_id}: all")
             return
@@ -37,6 +39,7 @@ class SerialContextManager:
         await DatabaseManager.set_user_active_series_names(user_id, series_names)
         if len(series_ids) == 1:
             await DatabaseManager.set_user_active_series(user_id, series_ids[0])
+        PrincipalCache.invalidate(user_id)
         await DatabaseManager.delete_last_clips_by_chat_id(user_id)
         self.__logger.info(f"Set active series for user {user_id}: {series_names}")
 
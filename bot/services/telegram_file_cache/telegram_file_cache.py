@@ -0,0 +1,74 @@
+import asyncio
+from collections import OrderedDict
+import logging
+from pathlib import Path
+from typing import (
+    Optional,
+    Union,
+)
+
+from bot.database.database_manager import DatabaseManager
+from bot.settings import settings
+
+telegram_file_cache_logger = logging.getLogger(__name__)
+
+
+class TelegramFileCache:
+    __entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    async def segment_key(video_path: Union[str, Path], start_time: float, end_time: float) -> str:
+        path = Path(video_path)
+        version = await asyncio.to_thread(TelegramFileCache.__get_version, path)
+        return f"segment:{path.as_posix()}:{version}:{start_time:.3f}:{end_time:.3f}"
+
+    @staticmethod
+    def __get_version(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def saved_clip_key(clip_id: int) -> str:
+        return f"saved:{clip_id}"
+
+    @staticmethod
+    async def get(clip_key: str) -> Optional[str]:
+        file_id = TelegramFileCache.__entries.get(clip_key)
+        if file_id is not None:
+            TelegramFileCache.__entries.move_to_end(clip_key)
+            return file_id
+
+        try:
+            file_id = await DatabaseManager.get_telegram_file_id(clip_key)
+        except Exception as e:
+            telegram_file_cache_logger.warning(f"Failed to read Telegram file_id for '{clip_key}': {e}")
+            return None
+
+        if file_id is not None:
+            TelegramFileCache.__remember(clip_key, file_id)
+        return file_id
+
+    @staticmethod
+    async def put(clip_key: str, file_id: str) -> None:
+        TelegramFileCache.__remember(clip_key, file_id)
+        try:
+            await DatabaseManager.upsert_telegram_file_id(clip_key, file_id)
+        except Exception as e:
+            telegram_file_cache_logger.warning(f"Failed to store Telegram file_id for '{clip_key}': {e}")
+
+    @staticmethod
+    async def invalidate(clip_key: str) -> None:
+        TelegramFileCache.__entries.pop(clip_key, None)
+        try:
+            await DatabaseManager.delete_telegram_file_id(clip_key)
+        except Exception as e:
+            telegram_file_cache_logger.warning(f"Failed to delete Telegram file_id for '{clip_key}': {e}")
+
+    @staticmethod
+    def __remember(clip_key: str, file_id: str) -> None:
+        TelegramFileCache.__entries[clip_key] = file_id
+        TelegramFileCache.__entries.move_to_end(clip_key)
+        while len(TelegramFileCache.__entries) > settings.TELEGRAM_FILE_ID_CACHE_SIZE:
+            TelegramFileCache.__entries.popitem(last=False)
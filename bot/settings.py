@@ -1,5 +1,8 @@
 import logging
-from typing import Optional
+from typing import (
+    Literal,
+    Optional,
+)
 
 from pydantic import (
     Field,
@@ -41,6 +44,20 @@ class Settings(BaseSettings):
     ES_TRANSCRIPTION_INDEX: str = Field(...)
 
     VIDEO_DATA_DIR: str = Field(...)
+    CLIP_CACHE_ENABLED: bool = Field(True)
+    CLIP_CACHE_DIR: Optional[str] = None
+    CLIP_CACHE_MAX_MB: int = Field(512)
+    TELEGRAM_FILE_ID_CACHE_SIZE: int = Field(10000)
+    BLOB_STORE_BACKEND: str = Field("local")
+    BLOB_STORE_DIR: str = Field("blob_store")
+    BLOB_STORE_S3_BUCKET: Optional[str] = None
+    BLOB_STORE_S3_PREFIX: str = Field("clips")
+    BLOB_STORE_S3_ENDPOINT_URL: Optional[str] = None
+    BLOB_STORE_S3_REGION: Optional[str] = None
+    BLOB_STORE_S3_ACCESS_KEY: Optional[SecretStr] = None
+    BLOB_STORE_S3_SECRET_KEY: Optional[SecretStr] = None
+    BLOB_GC_INTERVAL_SECONDS: int = Field(3600)
+    BLOB_GC_MIN_AGE_MINUTES: int = Field(60)
 
     EXTEND_BEFORE: float = Field(5)
     EXTEND_AFTER: float = Field(5)
@@ -50,11 +67,30 @@ class Settings(BaseSettings):
 
     MESSAGE_LIMIT: int = Field(30)
     LIMIT_DURATION: int = Field(30)
+    COMMAND_RATE_LIMIT_STORAGE_URI: Optional[str] = None
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(60.0)
+    PRINCIPAL_CACHE_SIZE: int = Field(10000)
+    SCENE_CUT_CACHE_MAX_MB: int = Field(16)
+    QUERY_CACHE_TTL_SECONDS: float = Field(300.0)
+    QUERY_CACHE_SIZE: int = Field(2048)
+    REINDEX_STREAMING: bool = Field(False)
+    REINDEX_BULK_WORKERS: int = Field(4)
+    REINDEX_BULK_CHUNK_DOCS: int = Field(500)
+    REINDEX_BULK_CHUNK_MB: int = Field(8)
+    REINDEX_QUEUE_CHUNKS: int = Field(8)
+    REINDEX_BULK_MAX_RETRIES: int = Field(5)
+    CLIP_EXTRACTION_CONCURRENCY: Optional[int] = None
+    COMMAND_USAGE_RETENTION_HOURS: int = Field(24)
+    COMMAND_USAGE_COMPACTION_BATCH_SIZE: int = Field(5000)
+    COMMAND_USAGE_COMPACTION_INTERVAL_SECONDS: int = Field(3600)
     MAX_CLIPS_PER_COMPILATION: int = Field(30)
     MAX_ADJUSTMENT_DURATION: int = Field(20)
     MAX_ES_RESULTS_LONG: int = Field(333)
     MAX_ES_RESULTS_QUICK: int = Field(10)
     SEMANTIC_FRAMES_MERGE_GAP_SECONDS: float = Field(30.0)
+    FRAME_HASH_INDEX_DIR: str = Field("frame_hash_index")
+    FRAME_HASH_MAX_DISTANCE: int = Field(10)
+    FRAME_HASH_MAX_IMAGE_MB: int = Field(10)
     MAX_SEARCH_QUERY_LENGTH: int = Field(200)
     MAX_CLIP_DURATION: int = Field(60)
     MAX_CLIP_DURATION_HARD_LIMIT: int = Field(120)
@@ -63,6 +99,12 @@ class Settings(BaseSettings):
     MAX_CLIPS_PER_USER: int = Field(100)
 
     LOG_LEVEL: str = Field("INFO")
+    LOG_SINK_QUEUE_SIZE: int = Field(10000)
+    LOG_SINK_BATCH_SIZE: int = Field(500)
+    LOG_SINK_FLUSH_INTERVAL_MS: int = Field(250)
+    LOG_SINK_PUT_TIMEOUT_MS: int = Field(50)
+    LOG_SINK_SAMPLE_EVERY_WHEN_FULL: int = Field(100)
+    LOG_SINK_SHUTDOWN_TIMEOUT_SECONDS: float = Field(10.0)
     ENVIRONMENT: str = Field("production")
 
     ENABLE_TELEGRAM: bool = Field(False)
@@ -84,9 +126,20 @@ class Settings(BaseSettings):
     VLLM_HOST: str = Field("http://localhost:11435")
     VLLM_EMBEDDINGS_MODEL: str = Field("qwen3vl-embed")
     VLLM_TIMEOUT_SECONDS: int = Field(30)
+    VLLM_CONNECTION_POOL_SIZE: int = Field(16)
+    VLLM_KEEPALIVE_SECONDS: float = Field(30.0)
+    VLLM_BATCH_WINDOW_MS: float = Field(5.0)
+    VLLM_MAX_BATCH_SIZE: int = Field(32)
+    VLLM_EMBEDDING_CACHE_SIZE: int = Field(1024)
     ES_TEXT_EMBEDDINGS_INDEX_SUFFIX: str = Field("text_embeddings")
     ES_VIDEO_EMBEDDINGS_INDEX_SUFFIX: str = Field("video_frames")
     ES_FULL_EPISODE_EMBEDDINGS_INDEX_SUFFIX: str = Field("full_episode_embeddings")
+    ES_VECTOR_QUANTIZATION: Literal["float", "int8", "int4", "bbq"] = Field("float")
+    ES_VECTOR_DIMS: int = Field(4096, ge=1, le=4096)
+    ES_VECTOR_RESCORE_OVERSAMPLE: float = Field(0.0)
+    SEMANTIC_SEARCH_BACKEND: str = Field("elasticsearch")
+    SEMANTIC_INDEX_DIRNAME: str = Field("semantic_index")
+    SEMANTIC_INDEX_NPROBE: int = Field(16)
 
     @model_validator(mode='after')
     def check_conditional_settings(self) -> 'Settings':
@@ -105,6 +158,11 @@ class Settings(BaseSettings):
                 "JWT_SECRET_KEY is required when ENABLE_REST=true",
             )
 
+        if self.COMMAND_RATE_LIMIT_STORAGE_URI and not self.COMMAND_RATE_LIMIT_STORAGE_URI.startswith("async+"):
+            raise ValueError(
+                "COMMAND_RATE_LIMIT_STORAGE_URI must use an async storage scheme, e.g. async+redis://host:6379",
+            )
+
         return self
 
     model_config = SettingsConfigDict(
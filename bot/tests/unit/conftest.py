@@ -0,0 +1,29 @@
+import pytest
+
+# Unit tests exercise modules in-process, so the autouse E2E fixtures from bot/tests/conftest.py
+# (database pool, REST client, login) are replaced with no-ops here.
+
+
+@pytest.fixture(autouse=True)
+def reset_es_client():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def db_pool():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def test_client():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def auth_token():
+    return None
@@ -0,0 +1,115 @@
+import hashlib
+import os
+
+import pytest
+
+from bot.database.database_manager import DatabaseManager
+from bot.services.blob_store.blob_garbage_collector import BlobGarbageCollector
+from bot.services.blob_store.clip_storage import ClipStorage
+from bot.services.blob_store.local_blob_store import LocalBlobStore
+
+
+@pytest.mark.quick
+class TestLocalBlobStore:
+
+    @pytest.mark.asyncio
+    async def test_store_is_content_addressed(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        data = b"clip bytes"
+        ref = await store.store(data)
+
+        assert ref.blob_hash == hashlib.sha256(data).hexdigest()
+        assert ref.size == len(data)
+        assert await store.get(ref.blob_hash) == data
+        assert (tmp_path / ref.blob_hash[:2] / ref.blob_hash[2:4] / ref.blob_hash).is_file()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_store_keeps_one_copy_and_refreshes_mtime(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        ref = await store.store(b"same")
+        path = tmp_path / ref.blob_hash[:2] / ref.blob_hash[2:4] / ref.blob_hash
+        os.utime(path, (1_000_000, 1_000_000))
+
+        again = await store.store(b"same")
+        assert again == ref
+        assert path.stat().st_mtime > 1_000_000
+        assert [blob_hash async for blob_hash, _ in store.iter_blobs()] == [ref.blob_hash]
+
+    @pytest.mark.asyncio
+    async def test_missing_blob(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        assert await store.get("ab" * 32) is None
+        assert not await store.exists("ab" * 32)
+        assert not await store.touch("ab" * 32)
+        await store.delete("ab" * 32)
+
+    @pytest.mark.asyncio
+    async def test_iter_blobs_skips_partial_writes(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        ref = await store.store(b"done")
+        (tmp_path / ref.blob_hash[:2] / ref.blob_hash[2:4] / ".tmp-partial").write_bytes(b"half")
+
+        blobs = [blob async for blob in store.iter_blobs()]
+        assert [blob_hash for blob_hash, _ in blobs] == [ref.blob_hash]
+
+    @pytest.mark.asyncio
+    async def test_delete(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        ref = await store.store(b"gone")
+        await store.delete(ref.blob_hash)
+        assert not await store.exists(ref.blob_hash)
+        assert [blob async for blob in store.iter_blobs()] == []
+
+    @pytest.mark.asyncio
+    async def test_modified_at(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        ref = await store.store(b"dated")
+        path = tmp_path / ref.blob_hash[:2] / ref.blob_hash[2:4] / ref.blob_hash
+        os.utime(path, (1_000_000, 1_000_000))
+
+        assert await store.modified_at(ref.blob_hash) == 1_000_000
+        assert await store.modified_at("ab" * 32) is None
+
+
+@pytest.mark.quick
+class TestBlobGarbageCollector:
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        store = LocalBlobStore(tmp_path)
+        monkeypatch.setattr(ClipStorage, "get_store", staticmethod(lambda: store))
+        return store
+
+    @staticmethod
+    async def _store_old(store, tmp_path, data):
+        ref = await store.store(data)
+        os.utime(tmp_path / ref.blob_hash[:2] / ref.blob_hash[2:4] / ref.blob_hash, (1_000_000, 1_000_000))
+        return ref
+
+    @pytest.mark.asyncio
+    async def test_removes_only_old_unreferenced_blobs(self, store, tmp_path, monkeypatch):
+        kept = await self._store_old(store, tmp_path, b"referenced")
+        orphan = await self._store_old(store, tmp_path, b"orphan")
+        fresh = await store.store(b"fresh")
+
+        async def referenced():
+            return {kept.blob_hash}
+
+        monkeypatch.setattr(DatabaseManager, "get_referenced_blob_hashes", referenced)
+        assert await BlobGarbageCollector.collect(min_age_seconds=60) == 1
+        assert await store.exists(kept.blob_hash)
+        assert not await store.exists(orphan.blob_hash)
+        assert await store.exists(fresh.blob_hash)
+
+    @pytest.mark.asyncio
+    async def test_skips_blob_deduplicated_after_listing(self, store, tmp_path, monkeypatch):
+        ref = await self._store_old(store, tmp_path, b"reused")
+
+        async def referenced_while_clip_is_saved():
+            # A concurrent ClipStorage.store() dedupes onto the candidate before its row is inserted.
+            await store.store(b"reused")
+            return set()
+
+        monkeypatch.setattr(DatabaseManager, "get_referenced_blob_hashes", referenced_while_clip_is_saved)
+        assert await BlobGarbageCollector.collect(min_age_seconds=60) == 0
+        assert await store.exists(ref.blob_hash)
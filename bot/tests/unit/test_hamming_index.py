@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from bot.search.hamming_index import HammingIndex
+
+
+def _brute_force(hashes: np.ndarray, query: int, max_distance: int):
+    distances = np.bitwise_count(hashes ^ np.uint64(query)).astype(np.int64)
+    rows = np.flatnonzero(distances <= max_distance)
+    ranking = np.lexsort((rows, distances[rows]))
+    return rows[ranking], distances[rows][ranking]
+
+
+@pytest.mark.quick
+class TestHammingIndex:
+    hashes = np.random.default_rng(7).integers(0, 2 ** 63, size=2000, dtype=np.uint64)
+
+    @pytest.mark.parametrize("max_distance", [0, 3, 8, 12])
+    def test_search_matches_brute_force(self, max_distance):
+        index = HammingIndex(self.hashes)
+        rng = np.random.default_rng(max_distance)
+        for row in rng.choice(len(self.hashes), 20, replace=False):
+            flips = rng.choice(64, max_distance, replace=False)
+            query = int(self.hashes[row]) ^ int(sum(1 << int(bit) for bit in flips))
+            rows, distances = index.search(query, max_distance)
+            expected_rows, expected_distances = _brute_force(self.hashes, query, max_distance)
+            assert rows.tolist() == expected_rows.tolist()
+            assert distances.tolist() == expected_distances.tolist()
+
+    def test_search_returns_duplicates_once(self):
+        hashes = np.asarray([5, 5, 6, 1 << 40], dtype=np.uint64)
+        rows, distances = HammingIndex(hashes).search(5, 2)
+        assert rows.tolist() == [0, 1, 2]
+        assert distances.tolist() == [0, 0, 2]
+
+    def test_search_on_empty_index(self):
+        rows, distances = HammingIndex(np.empty(0, dtype=np.uint64)).search(42, 10)
+        assert len(rows) == 0
+        assert len(distances) == 0
+
+    def test_arrays_round_trip(self):
+        index = HammingIndex(self.hashes)
+        restored = HammingIndex.from_arrays(index.to_arrays())
+        query = int(self.hashes[17])
+        assert len(restored) == len(index)
+        assert restored.search(query, 6)[0].tolist() == index.search(query, 6)[0].tolist()
@@ -0,0 +1,83 @@
+import json
+
+import numpy as np
+import pytest
+
+from bot.search.ivf_index import (
+    CENTROIDS_FILE,
+    EPISODE_IDS_FILE,
+    KEYS_FILE,
+    META_FILE,
+    OFFSETS_FILE,
+    VECTORS_FILE,
+    IvfIndex,
+)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _build(vectors: np.ndarray, nlist: int):
+    centroids = vectors[:nlist].copy()
+    assignments = np.argmax(vectors @ centroids.T, axis=1)
+    order = np.argsort(assignments, kind="stable")
+    offsets = np.zeros(nlist + 1, dtype=np.int64)
+    np.cumsum(np.bincount(assignments, minlength=nlist), out=offsets[1:])
+    return vectors[order], centroids, offsets, order
+
+
+@pytest.mark.quick
+class TestIvfIndex:
+    vectors = _normalize(np.random.default_rng(3).normal(size=(500, 16)).astype(np.float32))
+
+    def _index(self, nlist: int = 8) -> IvfIndex:
+        sorted_vectors, centroids, offsets, order = _build(self.vectors, nlist)
+        episode_ids = np.asarray([f"E{row % 7}" for row in range(len(self.vectors))])
+        return IvfIndex(
+            sorted_vectors, centroids, offsets, episode_ids[order], order.astype(np.int64), {"key_field": "frame_number"},
+        )
+
+    def test_full_probe_matches_brute_force(self):
+        index = self._index()
+        query = self.vectors[42] + 0.1
+        rows, scores = index.search(query, k=10, nprobe=8)
+
+        expected = np.argsort(-(self.vectors @ (query / np.linalg.norm(query))))[:10]
+        assert index.keys[rows].tolist() == expected.tolist()
+        assert np.all(np.diff(scores) <= 0)
+
+    def test_exact_vector_is_top_hit_with_one_probe(self):
+        index = self._index()
+        rows, scores = index.search(self.vectors[123], k=1, nprobe=1)
+        assert index.keys[rows[0]] == 123
+        assert scores[0] == pytest.approx(1.0, abs=1e-5)
+
+    def test_probes_more_lists_until_k_is_covered(self):
+        index = self._index(nlist=50)
+        rows, _ = index.search(self.vectors[0], k=200, nprobe=1)
+        assert len(rows) == 200
+        assert len(set(rows.tolist())) == 200
+
+    def test_metadata(self):
+        index = self._index()
+        assert len(index) == len(self.vectors)
+        assert index.dims == 16
+        assert index.key_field == "frame_number"
+
+    def test_load_resolves_published_symlink(self, tmp_path):
+        sorted_vectors, centroids, offsets, order = _build(self.vectors, 4)
+        version_dir = tmp_path / "text_embeddings.v1"
+        version_dir.mkdir()
+        np.save(version_dir / VECTORS_FILE, sorted_vectors.astype(np.float16))
+        np.save(version_dir / CENTROIDS_FILE, centroids)
+        np.save(version_dir / OFFSETS_FILE, offsets)
+        np.save(version_dir / EPISODE_IDS_FILE, np.asarray(["E1"] * len(order)))
+        np.save(version_dir / KEYS_FILE, order.astype(np.int64))
+        (version_dir / META_FILE).write_text(json.dumps({"key_field": None}), encoding="utf-8")
+        (tmp_path / "text_embeddings").symlink_to(version_dir.name, target_is_directory=True)
+
+        index = IvfIndex.load(tmp_path / "text_embeddings")
+        rows, _ = index.search(self.vectors[7], k=1, nprobe=4)
+        assert index.keys[rows[0]] == 7
+        assert index.key_field is None
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from bot.database.database_manager import DatabaseManager
+from bot.utils.log_sink import LogSink
+
+
+@pytest.mark.quick
+class TestLogSink:
+
+    @pytest.mark.asyncio
+    async def test_offers_from_executor_threads_are_flushed(self, monkeypatch):
+        flushed = []
+
+        async def capture(records):
+            flushed.extend(records)
+
+        monkeypatch.setattr(DatabaseManager, "log_system_messages_batch", capture)
+        assert LogSink.start()
+        try:
+            accepted = await asyncio.gather(
+                *[asyncio.to_thread(LogSink.offer_system_message, "INFO", f"thread {i}") for i in range(20)],
+            )
+            LogSink.offer_system_message("INFO", "loop")
+            await asyncio.sleep(0)
+        finally:
+            await LogSink.stop()
+
+        assert all(accepted)
+        assert sorted(message for _, message in flushed) == sorted([f"thread {i}" for i in range(20)] + ["loop"])
+
+    @pytest.mark.asyncio
+    async def test_offer_is_rejected_when_not_running(self):
+        assert not LogSink.offer_system_message("INFO", "ignored")
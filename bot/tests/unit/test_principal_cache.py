@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from bot.database.database_manager import DatabaseManager
+from bot.database.models import UserPrincipal
+from bot.services.principal_cache.principal_cache import PrincipalCache
+from bot.settings import settings
+
+
+def _principal(user_id: int, is_admin: bool) -> UserPrincipal:
+    return UserPrincipal(
+        user_id=user_id,
+        in_db=True,
+        is_admin=is_admin,
+        is_moderator=False,
+        subscription_end=None,
+        active_series=(),
+    )
+
+
+class _FakeConnection:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_TTL_SECONDS", 60.0)
+    PrincipalCache.invalidate_all()
+
+
+@pytest.mark.quick
+class TestPrincipalCache:
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_drops_the_stale_row(self, monkeypatch):
+        rows = {7: _principal(7, is_admin=False)}
+        release = asyncio.Event()
+
+        async def fetch(user_id):
+            row = rows[user_id]
+            await release.wait()
+            return row
+
+        monkeypatch.setattr(DatabaseManager, "get_user_principal", fetch)
+        pending = asyncio.create_task(PrincipalCache.get(7))
+        await asyncio.sleep(0)
+
+        rows[7] = _principal(7, is_admin=True)
+        PrincipalCache.invalidate(7)
+        release.set()
+        assert not (await pending).is_admin
+
+        assert await PrincipalCache.is_admin(7)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_drops_every_overlapping_fetch(self, monkeypatch):
+        release = asyncio.Event()
+        fetches = []
+
+        async def fetch(user_id):
+            fetches.append(user_id)
+            await release.wait()
+            return _principal(user_id, is_admin=False)
+
+        monkeypatch.setattr(DatabaseManager, "get_user_principal", fetch)
+        first = asyncio.create_task(PrincipalCache.get(5))
+        second = asyncio.create_task(PrincipalCache.get(5))
+        await asyncio.sleep(0)
+
+        PrincipalCache.invalidate(5)
+        release.set()
+        await asyncio.gather(first, second)
+
+        await PrincipalCache.get(5)
+        await PrincipalCache.get(5)
+        assert fetches == [5, 5, 5]
+
+    @pytest.mark.asyncio
+    async def test_lost_listener_clears_cache_and_reconnects(self, monkeypatch):
+        connections = []
+
+        async def listen(_channel, _callback, on_terminated):
+            conn = _FakeConnection()
+            connections.append((conn, on_terminated))
+            return conn
+
+        async def unlisten(_conn):
+            return None
+
+        fetches = []
+
+        async def fetch(user_id):
+            fetches.append(user_id)
+            return _principal(user_id, is_admin=False)
+
+        monkeypatch.setattr(DatabaseManager, "listen", listen)
+        monkeypatch.setattr(DatabaseManager, "unlisten", unlisten)
+        monkeypatch.setattr(DatabaseManager, "get_user_principal", fetch)
+
+        assert await PrincipalCache.start()
+        try:
+            await PrincipalCache.get(3)
+            await PrincipalCache.get(3)
+            assert fetches == [3]
+
+            lost, on_terminated = connections[0]
+            on_terminated(lost)
+            await asyncio.sleep(0.01)
+
+            assert len(connections) == 2
+            await PrincipalCache.get(3)
+            assert fetches == [3, 3]
+        finally:
+            await PrincipalCache.stop()
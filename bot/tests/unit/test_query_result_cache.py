@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from bot.search.query_result_cache import QueryResultCache
+from bot.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_TTL_SECONDS", 300.0)
+    monkeypatch.setattr(settings, "QUERY_CACHE_SIZE", 128)
+
+
+class _SlowQuery:
+    def __init__(self, result):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.__result = result
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.__result
+
+
+@pytest.mark.quick
+class TestQueryResultCache:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(self):
+        key = QueryResultCache.make_key("coalesce", ["ranczo"], "wójt")
+        query = _SlowQuery({"hits": [1, 2]})
+        tasks = [asyncio.create_task(QueryResultCache.get_or_compute(key, query)) for _ in range(5)]
+        await asyncio.sleep(0)
+        query.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert query.calls == 1
+        assert all(result == {"hits": [1, 2]} for result in results)
+        results[0]["hits"].append(3)
+        assert results[1] == {"hits": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_computation(self):
+        key = QueryResultCache.make_key("hit", ["ranczo"], "kusy")
+        query = _SlowQuery(["cached"])
+        query.release.set()
+        await QueryResultCache.get_or_compute(key, query)
+        assert await QueryResultCache.get_or_compute(key, query) == ["cached"]
+        assert query.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_owner_is_cancelled(self):
+        key = QueryResultCache.make_key("takeover", ["ranczo"], "lucy")
+        query = _SlowQuery(["result"])
+        owner = asyncio.create_task(QueryResultCache.get_or_compute(key, query))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(QueryResultCache.get_or_compute(key, query))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        query.release.set()
+
+        assert await waiter == ["result"]
+        assert query.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_waiters_and_are_not_cached(self):
+        key = QueryResultCache.make_key("error", ["ranczo"], "pietrek")
+        release = asyncio.Event()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise RuntimeError("elasticsearch down")
+
+        tasks = [asyncio.create_task(QueryResultCache.get_or_compute(key, failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert calls == 1
+
+        with pytest.raises(RuntimeError):
+            await QueryResultCache.get_or_compute(key, failing)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_bump_series_invalidates_entries(self):
+        query = _SlowQuery(["old"])
+        query.release.set()
+        key = QueryResultCache.make_key("bump", ["kryminalni"], "q")
+        await QueryResultCache.get_or_compute(key, query)
+
+        QueryResultCache.bump_series("kryminalni")
+        assert QueryResultCache.make_key("bump", ["kryminalni"], "q") != key
+        await QueryResultCache.get_or_compute(QueryResultCache.make_key("bump", ["kryminalni"], "q"), query)
+        assert query.calls == 2
@@ -0,0 +1,22 @@
+import pytest
+
+from bot.search.scene_cut_cache import SceneCutCache
+
+
+@pytest.mark.quick
+class TestSceneCutCacheLocks:
+
+    def test_lock_is_kept_while_any_caller_holds_it(self):
+        key = SceneCutCache.make_key("ranczo", 1, 2)
+        first = SceneCutCache.lock_for(key)
+        waiter = SceneCutCache.lock_for(key)
+        assert waiter is first
+
+        SceneCutCache.release_lock(key)
+        assert SceneCutCache.lock_for(key) is first
+
+        SceneCutCache.release_lock(key)
+        SceneCutCache.release_lock(key)
+        fresh = SceneCutCache.lock_for(key)
+        assert fresh is not first
+        SceneCutCache.release_lock(key)
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+import pytest_asyncio
+
+from bot.exceptions.vllm_exceptions import VllmRequestError
+from bot.search.infra.vllm_client import VllmClient
+from bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@pytest_asyncio.fixture(name="proxy")
+async def fake_proxy(monkeypatch):
+    responses = []
+
+    async def embeddings(request: web.Request) -> web.Response:
+        texts = (await request.json())["input"]
+        return web.json_response({"data": responses.pop(0)(texts)})
+
+    app = web.Application()
+    app.router.add_post("/v1/embeddings", embeddings)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(settings, "VLLM_HOST", str(server.make_url("")).rstrip("/"))
+    monkeypatch.setattr(settings, "VLLM_EMBEDDING_CACHE_SIZE", 0)
+    try:
+        yield responses
+    finally:
+        await VllmClient.close_session()
+        await server.close()
+
+
+@pytest.mark.quick
+class TestVllmClient:
+
+    @pytest.mark.asyncio
+    async def test_batch_is_ordered_by_index(self, proxy):
+        proxy.append(lambda texts: [{"index": i, "embedding": [float(i)]} for i in reversed(range(len(texts)))])
+        assert await VllmClient.get_text_embeddings_batch(["a", "b", "c"], logger) == [[0.0], [1.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_short_response_fails_every_waiter(self, proxy):
+        proxy.append(lambda texts: [{"index": 0, "embedding": [0.0]}])
+        waiters = [VllmClient.get_text_embedding(text, logger) for text in ("wójt", "kusy", "czerepach")]
+
+        results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), timeout=5)
+        assert all(isinstance(result, VllmRequestError) for result in results)
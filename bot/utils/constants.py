@@ -136,7 +136,9 @@ class DatabaseKeys:
     IS_ADMIN: Final[str] = "is_admin"
     IS_MODERATOR: Final[str] = "is_moderator"
     CLIP_NAME: Final[str] = "clip_name"
-    VIDEO_DATA: Final[str] = "video_data"
+    VIDEO_HASH: Final[str] = "video_hash"
+    VIDEO_SIZE: Final[str] = "video_size"
+    THUMBNAIL_HASH: Final[str] = "thumbnail_hash"
     START_TIME: Final[str] = "start_time"
     END_TIME: Final[str] = "end_time"
     DURATION: Final[str] = "duration"
@@ -146,7 +148,7 @@ class DatabaseKeys:
     QUOTE: Final[str] = "quote"
     SEGMENTS: Final[str] = "segments"
     SEGMENT: Final[str] = "segment"
-    COMPILED_CLIP: Final[str] = "compiled_clip"
+    COMPILED_CLIP_HASH: Final[str] = "compiled_clip_hash"
     CLIP_TYPE: Final[str] = "clip_type"
     ADJUSTED_START_TIME: Final[str] = "adjusted_start_time"
     ADJUSTED_END_TIME: Final[str] = "adjusted_end_time"
@@ -206,6 +208,8 @@ class VideoFrameKeys:
     SCENE_INFO: Final[str] = "scene_info"
     EPISODE_ID: Final[str] = "episode_id"
     SCENE_NUMBER: Final[str] = "scene_number"
+    PERCEPTUAL_HASH: Final[str] = "perceptual_hash"
+    PERCEPTUAL_HASH_INT: Final[str] = "perceptual_hash_int"
 
 
 class DetectedObjectKeys:
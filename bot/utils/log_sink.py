@@ -0,0 +1,204 @@
+import asyncio
+import itertools
+import logging
+from typing import (
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from bot.database.database_manager import DatabaseManager
+from bot.settings import settings
+
+log_sink_logger = logging.getLogger(__name__)
+
+SystemLogRecord = Tuple[str, str]
+UserActivityRecord = Tuple[int, str, Optional[int]]
+LogRecord = Union[SystemLogRecord, UserActivityRecord]
+
+
+class LogSink:
+    __queue: Optional[asyncio.Queue] = None
+    __loop: Optional[asyncio.AbstractEventLoop] = None
+    __worker: Optional[asyncio.Task] = None
+    __sample_counter = itertools.count()
+    __dropped: int = 0
+    __STOP = object()
+    __PRIORITY_LEVELS = frozenset({"WARNING", "ERROR", "CRITICAL"})
+
+    @staticmethod
+    def is_running() -> bool:
+        return LogSink.__worker is not None and not LogSink.__worker.done()
+
+    @staticmethod
+    def start() -> bool:
+        if LogSink.is_running():
+            return False
+
+        LogSink.__queue = asyncio.Queue(maxsize=settings.LOG_SINK_QUEUE_SIZE)
+        LogSink.__loop = asyncio.get_running_loop()
+        LogSink.__dropped = 0
+        LogSink.__worker = asyncio.create_task(LogSink.__run())
+        log_sink_logger.info(
+            f"Log sink started (queue={settings.LOG_SINK_QUEUE_SIZE}, batch={settings.LOG_SINK_BATCH_SIZE}, "
+            f"interval={settings.LOG_SINK_FLUSH_INTERVAL_MS}ms).",
+        )
+        return True
+
+    @staticmethod
+    async def stop() -> None:
+        if not LogSink.is_running():
+            return
+
+        worker = LogSink.__worker
+        await LogSink.__queue.put(LogSink.__STOP)
+        try:
+            await asyncio.wait_for(worker, timeout=settings.LOG_SINK_SHUTDOWN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            log_sink_logger.error("Log sink did not flush before shutdown timeout; remaining records are lost.")
+        finally:
+            LogSink.__worker = None
+            LogSink.__queue = None
+            LogSink.__loop = None
+
+        if LogSink.__dropped:
+            log_sink_logger.warning(f"Log sink dropped {LogSink.__dropped} records while the queue was full.")
+        log_sink_logger.info("Log sink stopped.")
+
+    @staticmethod
+    def offer_system_message(log_level: str, log_message: str) -> bool:
+        if not LogSink.is_running():
+            return False
+
+        record = (log_level, log_message)
+        if LogSink.__is_on_loop_thread():
+            return LogSink.__offer(record)
+
+        # asyncio.Queue is not thread-safe; records from executor threads are queued on the sink's loop.
+        loop = LogSink.__loop
+        if loop is None:
+            return False
+        try:
+            loop.call_soon_threadsafe(LogSink.__offer, record)
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    async def submit_system_message(log_level: str, log_message: str) -> None:
+        if not LogSink.is_running():
+            await DatabaseManager.log_system_message(log_level, log_message)
+            return
+
+        record = (log_level, log_message)
+        if LogSink.__try_put(record):
+            return
+
+        if log_level in LogSink.__PRIORITY_LEVELS or LogSink.__is_sampled():
+            await LogSink.__put_with_backpressure(record)
+        else:
+            LogSink.__record_drop()
+
+    @staticmethod
+    async def submit_user_activity(user_id: int, command: str, series_id: Optional[int] = None) -> None:
+        if not LogSink.is_running():
+            await DatabaseManager.log_user_activity(user_id, command, series_id)
+            return
+
+        await LogSink.__put_with_backpressure((user_id, command, series_id))
+
+    @staticmethod
+    def __is_on_loop_thread() -> bool:
+        try:
+            return asyncio.get_running_loop() is LogSink.__loop
+        except RuntimeError:
+            return False
+
+    @staticmethod
+    def __offer(record: SystemLogRecord) -> bool:
+        if LogSink.__queue is None:
+            return False
+        if LogSink.__try_put(record):
+            return True
+        LogSink.__record_drop()
+        return False
+
+    @staticmethod
+    def __try_put(record: LogRecord) -> bool:
+        try:
+            LogSink.__queue.put_nowait(record)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    @staticmethod
+    def __is_sampled() -> bool:
+        return next(LogSink.__sample_counter) % settings.LOG_SINK_SAMPLE_EVERY_WHEN_FULL == 0
+
+    @staticmethod
+    def __record_drop() -> None:
+        LogSink.__dropped += 1
+        if LogSink.__dropped % settings.LOG_SINK_QUEUE_SIZE == 1:
+            log_sink_logger.warning(f"Log sink queue is full; {LogSink.__dropped} records dropped so far.")
+
+    @staticmethod
+    async def __put_with_backpressure(record: LogRecord) -> None:
+        try:
+            await asyncio.wait_for(
+                LogSink.__queue.put(record),
+                timeout=settings.LOG_SINK_PUT_TIMEOUT_MS / 1000,
+            )
+        except asyncio.TimeoutError:
+            LogSink.__record_drop()
+
+    @staticmethod
+    async def __collect_batch(queue: asyncio.Queue) -> Tuple[List[LogRecord], bool]:
+        loop = asyncio.get_running_loop()
+        first = await queue.get()
+        if first is LogSink.__STOP:
+            return [], True
+
+        batch: List[LogRecord] = [first]
+        deadline = loop.time() + settings.LOG_SINK_FLUSH_INTERVAL_MS / 1000
+        while len(batch) < settings.LOG_SINK_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                record = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if record is LogSink.__STOP:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    @staticmethod
+    async def __flush(batch: List[LogRecord]) -> None:
+        system_records = [r for r in batch if len(r) == 2]
+        user_records = [r for r in batch if len(r) == 3]
+        try:
+            if system_records:
+                await DatabaseManager.log_system_messages_batch(system_records)
+            if user_records:
+                await DatabaseManager.log_user_activities_batch(user_records)
+        except Exception as e:
+            log_sink_logger.error(f"Failed to flush {len(batch)} log records: {e}")
+
+    @staticmethod
+    async def __run() -> None:
+        queue = LogSink.__queue
+        stopping = False
+        while not stopping:
+            batch, stopping = await LogSink.__collect_batch(queue)
+            if batch:
+                await LogSink.__flush(batch)
+
+        leftover: List[LogRecord] = []
+        while not queue.empty():
+            record = queue.get_nowait()
+            if record is not LogSink.__STOP:
+                leftover.append(record)
+        if leftover:
+            await LogSink.__flush(leftover)
@@ -0,0 +1,257 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import uuid
+
+from bot.settings import settings
+
+clip_cache_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClipCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    total_bytes: int = 0
+    handout_bytes: int = 0
+
+
+class ClipCache:
+    __ENTRIES_DIR = "clips"
+    __STAGING_DIR = "staging"
+    __HANDOUT_DIR = "handout"
+    __SUFFIX = ".mp4"
+
+    __entries: "OrderedDict[str, int]" = OrderedDict()
+    __locks: Dict[str, asyncio.Lock] = {}
+    __lock_users: Dict[str, int] = {}
+    __stats = ClipCacheStats()
+    __copied_handouts: Dict[Path, int] = {}
+    __handout_bytes: int = 0
+    __root: Optional[Path] = None
+    __loaded: bool = False
+    __load_lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return settings.CLIP_CACHE_ENABLED and settings.CLIP_CACHE_MAX_MB > 0
+
+    @staticmethod
+    def make_key(video_path: Path, start_time: float, end_time: float, flags: Sequence[str]) -> str:
+        stat = video_path.stat()
+        raw = "|".join([
+            str(video_path.resolve()),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            f"{start_time:.3f}",
+            f"{end_time:.3f}",
+            " ".join(flags),
+        ])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def lock_for(key: str) -> asyncio.Lock:
+        lock = ClipCache.__locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            ClipCache.__locks[key] = lock
+        ClipCache.__lock_users[key] = ClipCache.__lock_users.get(key, 0) + 1
+        return lock
+
+    @staticmethod
+    def release_lock(key: str) -> None:
+        users = ClipCache.__lock_users.get(key, 0) - 1
+        if users > 0:
+            ClipCache.__lock_users[key] = users
+            return
+        ClipCache.__lock_users.pop(key, None)
+        ClipCache.__locks.pop(key, None)
+
+    @staticmethod
+    async def new_staging_path() -> Path:
+        await ClipCache.__ensure_loaded()
+        return await asyncio.to_thread(ClipCache.__make_staging_file)
+
+    @staticmethod
+    async def lookup(key: str) -> Optional[Path]:
+        await ClipCache.__ensure_loaded()
+        if key not in ClipCache.__entries:
+            ClipCache.__stats.misses += 1
+            return None
+
+        try:
+            handout, copied_bytes = await asyncio.to_thread(ClipCache.__hand_out, ClipCache.__entry_path(key))
+        except FileNotFoundError:
+            ClipCache.__forget(key)
+            ClipCache.__stats.misses += 1
+            return None
+
+        ClipCache.__track_handout(handout, copied_bytes)
+        if key in ClipCache.__entries:
+            ClipCache.__entries.move_to_end(key)
+        ClipCache.__stats.hits += 1
+        return handout
+
+    @staticmethod
+    async def publish(key: str, staged_path: Path) -> Path:
+        await ClipCache.__ensure_loaded()
+        cached = ClipCache.__entry_path(key)
+        size = await asyncio.to_thread(ClipCache.__install, staged_path, cached)
+
+        ClipCache.__forget(key)
+        ClipCache.__entries[key] = size
+        ClipCache.__stats.total_bytes += size
+        await ClipCache.__evict(keep=key)
+
+        handout, copied_bytes = await asyncio.to_thread(ClipCache.__hand_out, cached)
+        ClipCache.__track_handout(handout, copied_bytes)
+        return handout
+
+    @staticmethod
+    def get_stats() -> ClipCacheStats:
+        ClipCache.__stats.entries = len(ClipCache.__entries)
+        ClipCache.__stats.handout_bytes = ClipCache.__handout_bytes
+        return ClipCache.__stats
+
+    @staticmethod
+    def __get_root() -> Path:
+        if ClipCache.__root is None:
+            configured = settings.CLIP_CACHE_DIR or os.path.join(tempfile.gettempdir(), "ranchbot_clip_cache")
+            ClipCache.__root = Path(configured)
+        return ClipCache.__root
+
+    @staticmethod
+    def __entry_path(key: str) -> Path:
+        return ClipCache.__get_root() / ClipCache.__ENTRIES_DIR / f"{key}{ClipCache.__SUFFIX}"
+
+    @staticmethod
+    def __make_staging_file() -> Path:
+        fd, tmp_path = tempfile.mkstemp(suffix=ClipCache.__SUFFIX, dir=ClipCache.__get_root() / ClipCache.__STAGING_DIR)
+        os.close(fd)
+        return Path(tmp_path)
+
+    @staticmethod
+    def __install(staged_path: Path, cached: Path) -> int:
+        size = staged_path.stat().st_size
+        os.replace(staged_path, cached)
+        return size
+
+    @staticmethod
+    def __hand_out(cached: Path) -> Tuple[Path, int]:
+        # A hard link shares the entry's blocks; only a copy takes up space of its own.
+        handout = ClipCache.__get_root() / ClipCache.__HANDOUT_DIR / f"{uuid.uuid4().hex}{ClipCache.__SUFFIX}"
+        try:
+            os.link(cached, handout)
+            return handout, 0
+        except OSError:
+            shutil.copyfile(cached, handout)
+            return handout, handout.stat().st_size
+
+    @staticmethod
+    def __track_handout(handout: Path, copied_bytes: int) -> None:
+        if copied_bytes:
+            ClipCache.__copied_handouts[handout] = copied_bytes
+            ClipCache.__handout_bytes += copied_bytes
+
+    @staticmethod
+    async def __ensure_loaded() -> None:
+        if ClipCache.__loaded:
+            return
+
+        load_lock = ClipCache.__get_load_lock()
+        async with load_lock:
+            if ClipCache.__loaded:
+                return
+            existing = await asyncio.to_thread(ClipCache.__prepare_root)
+            for key, size in existing:
+                ClipCache.__entries[key] = size
+                ClipCache.__stats.total_bytes += size
+            ClipCache.__loaded = True
+            await ClipCache.__evict(keep=None)
+
+        clip_cache_logger.info(
+            f"Clip cache loaded {len(ClipCache.__entries)} entries "
+            f"({ClipCache.__stats.total_bytes / (1024 * 1024):.1f}MB) from {ClipCache.__get_root()}.",
+        )
+
+    @staticmethod
+    def __get_load_lock() -> asyncio.Lock:
+        lock = ClipCache.__load_lock
+        if lock is None:
+            lock = asyncio.Lock()
+            ClipCache.__load_lock = lock
+        return lock
+
+    @staticmethod
+    def __prepare_root() -> List[Tuple[str, int]]:
+        root = ClipCache.__get_root()
+        shutil.rmtree(root / ClipCache.__STAGING_DIR, ignore_errors=True)
+        shutil.rmtree(root / ClipCache.__HANDOUT_DIR, ignore_errors=True)
+        for name in (ClipCache.__ENTRIES_DIR, ClipCache.__STAGING_DIR, ClipCache.__HANDOUT_DIR):
+            (root / name).mkdir(parents=True, exist_ok=True)
+
+        existing = [(path, path.stat()) for path in (root / ClipCache.__ENTRIES_DIR).glob(f"*{ClipCache.__SUFFIX}")]
+        existing.sort(key=lambda item: item[1].st_atime)
+        return [(path.stem, stat.st_size) for path, stat in existing]
+
+    @staticmethod
+    def __forget(key: str) -> None:
+        size = ClipCache.__entries.pop(key, 0)
+        ClipCache.__stats.total_bytes -= size
+
+    @staticmethod
+    async def __evict(keep: Optional[str]) -> None:
+        max_bytes = settings.CLIP_CACHE_MAX_MB * 1024 * 1024
+        if ClipCache.__stats.total_bytes + ClipCache.__handout_bytes <= max_bytes:
+            return
+
+        if ClipCache.__copied_handouts:
+            gone = await asyncio.to_thread(ClipCache.__find_consumed, list(ClipCache.__copied_handouts))
+            for handout in gone:
+                ClipCache.__handout_bytes -= ClipCache.__copied_handouts.pop(handout, 0)
+
+        excess = ClipCache.__stats.total_bytes + ClipCache.__handout_bytes - max_bytes
+        if excess <= 0:
+            return
+        candidates = [(key, size) for key, size in ClipCache.__entries.items() if key != keep]
+        evicted = await asyncio.to_thread(ClipCache.__unlink_lru, candidates, excess)
+        for key in evicted:
+            ClipCache.__forget(key)
+        ClipCache.__stats.evictions += len(evicted)
+
+    @staticmethod
+    def __find_consumed(handouts: List[Path]) -> List[Path]:
+        return [handout for handout in handouts if not handout.exists()]
+
+    @staticmethod
+    def __unlink_lru(candidates: List[Tuple[str, int]], excess: int) -> List[str]:
+        # Evicting an entry that is still linked from a hand-out frees nothing, so those are skipped.
+        evicted: List[str] = []
+        for key, size in candidates:
+            if excess <= 0:
+                break
+            cached = ClipCache.__entry_path(key)
+            try:
+                if cached.stat().st_nlink > 1:
+                    continue
+            except FileNotFoundError:
+                pass
+            cached.unlink(missing_ok=True)
+            evicted.append(key)
+            excess -= size
+        return evicted
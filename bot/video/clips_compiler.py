@@ -6,11 +6,13 @@ import tempfile
 from typing import (
     List,
     Optional,
+    Tuple,
 )
 
 from bot.database.database_manager import DatabaseManager
 from bot.database.models import ClipType
 from bot.interfaces.message import AbstractMessage
+from bot.services.blob_store.clip_storage import ClipStorage
 from bot.services.scene_snap.scene_snap_service import SceneSnapService
 from bot.settings import settings
 from bot.types import ClipSegment
@@ -24,6 +26,8 @@ from bot.video.utils import FFMpegException
 
 
 class ClipsCompiler:
+    __extraction_semaphore: Optional[asyncio.Semaphore] = None
+
     @staticmethod
     async def __do_compile_clips(segment_files: List[Path], output_file: Path, logger: logging.Logger) -> None:
         with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".txt") as concat_file:
@@ -52,25 +56,66 @@ class ClipsCompiler:
         finally:
             concat_file_path.unlink(missing_ok=True)
 
+    @staticmethod
+    def __get_extraction_semaphore() -> asyncio.Semaphore:
+        semaphore = ClipsCompiler.__extraction_semaphore
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.CLIP_EXTRACTION_CONCURRENCY or os.cpu_count() or 1)
+            ClipsCompiler.__extraction_semaphore = semaphore
+        return semaphore
+
+    @staticmethod
+    async def __resolve_bounds(
+        segment: ClipSegment,
+        logger: logging.Logger,
+        series_name: Optional[str],
+    ) -> Tuple[float, float]:
+        start_time = max(0.0, segment[SegmentKeys.START_TIME] - settings.EXTEND_BEFORE_COMPILE)
+        end_time = segment[SegmentKeys.END_TIME] + settings.EXTEND_AFTER_COMPILE
+
+        if series_name and segment.get(EpisodeMetadataKeys.EPISODE_METADATA):
+            start_time, end_time = await SceneSnapService.snap_clip_times(
+                series_name, segment, start_time, end_time, logger,
+            )
+        return start_time, end_time
+
+    @staticmethod
+    async def __extract_segment(
+        video_path: Path,
+        start_time: float,
+        end_time: float,
+        logger: logging.Logger,
+        use_clip_cache: bool,
+    ) -> Path:
+        semaphore = ClipsCompiler.__get_extraction_semaphore()
+        async with semaphore:
+            return await ClipsExtractor.extract_clip(
+                video_path, start_time, end_time, logger, probe_duration=False, use_cache=use_clip_cache,
+            )
+
     @staticmethod
     async def __compile_clips(
         selected_clips: List[ClipSegment],
         logger: logging.Logger,
         series_name: Optional[str],
+        use_clip_cache: bool,
     ) -> Optional[Path]:
         temp_files = []
         try:
-            for segment in selected_clips:
-                start_time = max(0.0, segment[SegmentKeys.START_TIME] - settings.EXTEND_BEFORE_COMPILE)
-                end_time = segment[SegmentKeys.END_TIME] + settings.EXTEND_AFTER_COMPILE
-
-                if series_name and segment.get(EpisodeMetadataKeys.EPISODE_METADATA):
-                    start_time, end_time = await SceneSnapService.snap_clip_times(
-                        series_name, segment, start_time, end_time, logger,
-                    )
-
-                extracted_clip_path = await ClipsExtractor.extract_clip(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, logger)
-                temp_files.append(extracted_clip_path)
+            bounds = await asyncio.gather(
+                *[ClipsCompiler.__resolve_bounds(segment, logger, series_name) for segment in selected_clips],
+            )
+            results = await asyncio.gather(
+                *[
+                    ClipsCompiler.__extract_segment(segment[SegmentKeys.VIDEO_PATH], start_time, end_time, logger, use_clip_cache)
+                    for segment, (start_time, end_time) in zip(selected_clips, bounds)
+                ],
+                return_exceptions=True,
+            )
+            temp_files = [result for result in results if isinstance(result, Path)]
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
             fd, tmp_path = tempfile.mkstemp(suffix=".mp4")
             os.close(fd)
@@ -90,13 +135,10 @@ class ClipsCompiler:
 
     @staticmethod
     async def __insert_to_last_clips(message: AbstractMessage, compiled_output: Path) -> None:
-        with compiled_output.open("rb") as f:
-            compiled_clip_data = f.read()
-
         await DatabaseManager.insert_last_clip(
             chat_id=message.get_chat_id(),
             segment={},
-            compiled_clip=compiled_clip_data,
+            compiled_clip=await ClipStorage.store_file(compiled_output),
             clip_type=ClipType.COMPILED,
             adjusted_start_time=None,
             adjusted_end_time=None,
@@ -109,8 +151,9 @@ class ClipsCompiler:
         selected_segments: List[ClipSegment],
         logger: logging.Logger,
         series_name: Optional[str] = None,
+        use_clip_cache: bool = True,
     ) -> Path:
-        compiled_output = await ClipsCompiler.__compile_clips(selected_segments, logger, series_name)
+        compiled_output = await ClipsCompiler.__compile_clips(selected_segments, logger, series_name, use_clip_cache)
         await ClipsCompiler.__insert_to_last_clips(message, compiled_output)
         return compiled_output
 
@@ -120,13 +163,10 @@ async def process_compiled_clip(
     compiled_output: Path,
     clip_type: ClipType,
 ) -> None:
-    with compiled_output.open("rb") as f:
-        compiled_clip_data = f.read()
-
     await DatabaseManager.insert_last_clip(
         chat_id=message.get_chat_id(),
         segment={},
-        compiled_clip=compiled_clip_data,
+        compiled_clip=await ClipStorage.store_file(compiled_output),
         clip_type=clip_type,
         adjusted_start_time=None,
         adjusted_end_time=None,
@@ -1,9 +1,15 @@
+import asyncio
 import logging
 import os
 from pathlib import Path
 import tempfile
+from typing import (
+    List,
+    Tuple,
+)
 
 from bot.utils.log import log_system_message
+from bot.video.clip_cache import ClipCache
 from bot.video.utils import (
     get_video_duration,
     run_ffmpeg_command,
@@ -11,38 +17,43 @@ from bot.video.utils import (
 
 
 class ClipsExtractor:
+    __OUTPUT_FLAGS: Tuple[str, ...] = (
+        "-c", "copy",
+        "-movflags", "+faststart",
+        "-fflags", "+genpts",
+        "-avoid_negative_ts", "1",
+    )
+
     @staticmethod
-    async def extract_clip(
+    def __build_command(video_path: Path, start_time: float, duration: float, output_filename: Path) -> List[str]:
+        return [
+            "ffmpeg",
+            "-y",
+            "-ss", str(start_time),
+            "-i", str(video_path),
+            "-t", str(duration),
+            *ClipsExtractor.__OUTPUT_FLAGS,
+            "-loglevel", "error",
+            str(output_filename),
+        ]
+
+    @staticmethod
+    async def __cut(
         video_path: Path,
         start_time: float,
         end_time: float,
+        output_filename: Path,
         logger: logging.Logger,
-    ) -> Path:
+        probe_duration: bool,
+    ) -> None:
         duration = end_time - start_time
-        fd, tmp_path = tempfile.mkstemp(suffix=".mp4")
-        os.close(fd)
-        output_filename = Path(tmp_path)
         await log_system_message(
             logging.INFO,
             f"Extracting clip from {video_path}, start: {start_time}, end: {end_time}, duration: {duration}",
             logger,
         )
 
-        command = [
-            "ffmpeg",
-            "-y",
-            "-ss", str(start_time),
-            "-i", str(video_path),
-            "-t", str(duration),
-            "-c", "copy",
-            "-movflags", "+faststart",
-            "-fflags", "+genpts",
-            "-avoid_negative_ts", "1",
-            "-loglevel", "error",
-            str(output_filename),
-        ]
-
-        await run_ffmpeg_command(command)
+        await run_ffmpeg_command(ClipsExtractor.__build_command(video_path, start_time, duration, output_filename))
 
         await log_system_message(
             logging.INFO,
@@ -50,6 +61,60 @@ class ClipsExtractor:
             logger,
         )
 
-        clip_duration = await get_video_duration(output_filename)
-        await log_system_message(logging.INFO, f"Clip duration: {clip_duration}", logger)
+        if probe_duration:
+            clip_duration = await get_video_duration(output_filename)
+            await log_system_message(logging.INFO, f"Clip duration: {clip_duration}", logger)
+
+    @staticmethod
+    async def __extract_uncached(
+        video_path: Path,
+        start_time: float,
+        end_time: float,
+        logger: logging.Logger,
+        probe_duration: bool,
+    ) -> Path:
+        fd, tmp_path = tempfile.mkstemp(suffix=".mp4")
+        os.close(fd)
+        output_filename = Path(tmp_path)
+        await ClipsExtractor.__cut(video_path, start_time, end_time, output_filename, logger, probe_duration)
         return output_filename
+
+    @staticmethod
+    async def extract_clip(
+        video_path: Path,
+        start_time: float,
+        end_time: float,
+        logger: logging.Logger,
+        probe_duration: bool = True,
+        use_cache: bool = True,
+    ) -> Path:
+        video_path = Path(video_path)
+        if not use_cache or not ClipCache.is_enabled():
+            return await ClipsExtractor.__extract_uncached(video_path, start_time, end_time, logger, probe_duration)
+
+        try:
+            key = await asyncio.to_thread(ClipCache.make_key, video_path, start_time, end_time, ClipsExtractor.__OUTPUT_FLAGS)
+        except FileNotFoundError:
+            return await ClipsExtractor.__extract_uncached(video_path, start_time, end_time, logger, probe_duration)
+
+        try:
+            async with ClipCache.lock_for(key):
+                cached = await ClipCache.lookup(key)
+                if cached is not None:
+                    stats = ClipCache.get_stats()
+                    await log_system_message(
+                        logging.INFO,
+                        f"Clip cache hit for {video_path} [{start_time}-{end_time}] (hits: {stats.hits}, misses: {stats.misses})",
+                        logger,
+                    )
+                    return cached
+
+                staged = await ClipCache.new_staging_path()
+                try:
+                    await ClipsExtractor.__cut(video_path, start_time, end_time, staged, logger, probe_duration)
+                except Exception:
+                    staged.unlink(missing_ok=True)
+                    raise
+                return await ClipCache.publish(key, staged)
+        finally:
+            ClipCache.release_lock(key)
@@ -0,0 +1,41 @@
+import asyncio
+
+import numpy as np
+
+from bot.video.utils import FFMpegException
+
+
+class FrameHasher:
+    __HASH_SIZE = 8
+    __RESIZE_SIZE = __HASH_SIZE * 4
+
+    @staticmethod
+    async def compute_phash(image_bytes: bytes) -> int:
+        size = FrameHasher.__RESIZE_SIZE
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-loglevel", "error",
+            "-i", "pipe:0",
+            "-frames:v", "1",
+            "-vf", f"scale={size}:{size}:flags=lanczos,format=gray",
+            "-f", "rawvideo",
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate(image_bytes)
+        if process.returncode != 0 or len(stdout) < size * size:
+            raise FFMpegException(stderr.decode())
+
+        pixels = np.frombuffer(stdout[:size * size], dtype=np.uint8).reshape(size, size)
+        return FrameHasher.phash_from_pixels(pixels)
+
+    @staticmethod
+    def phash_from_pixels(pixels: np.ndarray) -> int:
+        hash_size = FrameHasher.__HASH_SIZE
+        coefficients = np.fft.fft(np.fft.fft(pixels.astype(np.float32), axis=0), axis=1).real
+        low_frequencies = coefficients[:hash_size, :hash_size].ravel()
+        median = np.sort(low_frequencies)[(low_frequencies.size - 1) // 2]
+        bits = low_frequencies > median
+        return int(np.sum(np.left_shift(np.uint64(1), np.arange(bits.size, dtype=np.uint64))[bits]))
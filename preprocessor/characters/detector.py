@@ -19,12 +19,14 @@ from preprocessor.core.base_processor import (
     OutputSpec,
     ProcessingItem,
 )
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.core.file_naming import FileNamingConventions
 from preprocessor.core.output_path_builder import OutputPathBuilder
 from preprocessor.utils.console import console
 from preprocessor.utils.detection_io import (
     process_frames_for_detection,
+    read_frames_fps,
     save_character_detections,
 )
 
@@ -33,6 +35,8 @@ from preprocessor.utils.detection_io import (
 
 
 class CharacterDetector(BaseProcessor):
+    RESOURCE_CLASS = ResourceClass.GPU
+
     def __init__(self, args: Dict[str, Any]):
         super().__init__(
             args=args,
@@ -103,7 +107,7 @@ class CharacterDetector(BaseProcessor):
             if f.is_file() and "frame_" in f.name
         ])
 
-        fps = 25.0
+        fps = read_frames_fps(metadata_file)
 
         results = process_frames_for_detection(
             frame_files,
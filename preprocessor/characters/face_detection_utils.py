@@ -14,6 +14,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 import cv2
@@ -79,47 +80,52 @@ def _get_face_embedding(img_path: str, face_app: FaceAnalysis) -> Optional[np.nd
     return faces[0].normed_embedding
 
 
-def detect_characters_in_frame(
-    frame_path: Path,
-    face_app: FaceAnalysis,
-    character_vectors: Dict[str, np.ndarray],
-    threshold: float,
-) -> List[Dict[str, Any]]:
-    img = cv2.imread(str(frame_path))
-    if img is None:
-        return []
-
-    faces = face_app.get(img)
-    if not faces:
-        return []
+def build_reference_matrix(character_vectors: Dict[str, np.ndarray]) -> Tuple[List[str], np.ndarray]:
+    names = list(character_vectors)
+    if not names:
+        return names, np.empty((0, 0), dtype=np.float32)
+    matrix = np.stack([np.asarray(character_vectors[name], dtype=np.float32) for name in names])
+    matrix /= np.maximum(norm(matrix, axis=1, keepdims=True), 1e-12)
+    return names, matrix
 
-    detected = []
 
-    for face in faces:
-        face_embedding = face.normed_embedding
+def detect_characters_in_batch(
+    images: List[Optional[np.ndarray]],
+    face_app: FaceAnalysis,
+    character_names: List[str],
+    reference_matrix: np.ndarray,
+    threshold: float,
+) -> List[List[Dict[str, Any]]]:
+    detected: List[List[Dict[str, Any]]] = [[] for _ in images]
+    faces = [
+        (image_idx, face)
+        for image_idx, img in enumerate(images)
+        if img is not None
+        for face in face_app.get(img)
+    ]
+    if not faces or not character_names:
+        return detected
+
+    embeddings = np.stack([face.normed_embedding for _, face in faces]).astype(np.float32)
+    similarities = embeddings @ reference_matrix.T
+    best_matches = similarities.argmax(axis=1)
+    best_similarities = similarities[np.arange(len(faces)), best_matches]
+
+    for (image_idx, face), char_idx, similarity in zip(faces, best_matches, best_similarities):
+        if similarity <= threshold:
+            continue
         bbox = face.bbox.astype(int)
-
-        best_match = None
-        best_similarity = threshold
-
-        for char_name, char_vector in character_vectors.items():
-            similarity = np.dot(face_embedding, char_vector)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = char_name
-
-        if best_match is not None:
-            detected.append({
-                "name": best_match,
-                "confidence": float(best_similarity),
-                "bbox": {
-                    "x1": int(bbox[0]),
-                    "y1": int(bbox[1]),
-                    "x2": int(bbox[2]),
-                    "y2": int(bbox[3]),
-                },
-            })
-
-    detected.sort(key=lambda x: x["confidence"], reverse=True)
+        detected[image_idx].append({
+            "name": character_names[char_idx],
+            "confidence": float(similarity),
+            "bbox": {
+                "x1": int(bbox[0]),
+                "y1": int(bbox[1]),
+                "x2": int(bbox[2]),
+                "y2": int(bbox[3]),
+            },
+        })
+
+    for frame_detections in detected:
+        frame_detections.sort(key=lambda x: x["confidence"], reverse=True)
     return detected
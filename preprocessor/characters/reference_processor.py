@@ -48,6 +48,8 @@ class CandidateFace:
 
 
 class CharacterReferenceProcessor(BaseProcessor):
+    RESOURCE_CLASS = None
+
     def __init__(self, args: Dict[str, Any]):
         super().__init__(
             args=args,
@@ -2,6 +2,9 @@ import click
 
 from preprocessor.cli.commands import (
     analyze_text,
+    benchmark_vectors,
+    build_ann_index,
+    build_hash_index,
     detect_scenes,
     export_frames,
     fix_unicode,
@@ -48,6 +51,12 @@ cli.add_command(export_frames)
 # noinspection PyTypeChecker
 cli.add_command(image_hashing)
 # noinspection PyTypeChecker
+cli.add_command(build_hash_index)
+# noinspection PyTypeChecker
+cli.add_command(benchmark_vectors)
+# noinspection PyTypeChecker
+cli.add_command(build_ann_index)
+# noinspection PyTypeChecker
 cli.add_command(generate_embeddings)
 # noinspection PyTypeChecker
 cli.add_command(generate_elastic_documents)
@@ -1,4 +1,7 @@
 from preprocessor.cli.commands.analyze_text import analyze_text
+from preprocessor.cli.commands.benchmark_vectors import benchmark_vectors
+from preprocessor.cli.commands.build_ann_index import build_ann_index
+from preprocessor.cli.commands.build_hash_index import build_hash_index
 from preprocessor.cli.commands.detect_scenes import detect_scenes
 from preprocessor.cli.commands.export_frames import export_frames
 from preprocessor.cli.commands.fix_unicode import fix_unicode
@@ -20,6 +23,9 @@ from preprocessor.cli.commands.validate import validate
 
 __all__ = [
     "analyze_text",
+    "benchmark_vectors",
+    "build_ann_index",
+    "build_hash_index",
     "detect_scenes",
     "export_frames",
     "fix_unicode",
@@ -0,0 +1,116 @@
+import asyncio
+from pathlib import Path
+import sys
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+import click
+from elasticsearch import AsyncElasticsearch
+
+from bot.search.vector_profile import VectorProfile
+from preprocessor.search.vector_benchmark import (
+    VectorBenchmark,
+    VectorBenchmarkResult,
+)
+from preprocessor.utils.console import console
+from preprocessor.utils.file_utils import atomic_write_json
+
+DEFAULT_PROFILES = (
+    "float:4096",
+    "int8:4096",
+    "int4:4096",
+    "bbq:4096",
+    "bbq:4096:3",
+    "int8:1024",
+    "int8:512",
+    "int8:512:3",
+)
+INDEX_FIELDS = {
+    "text_embeddings": "text_embedding",
+    "video_frames": "video_embedding",
+}
+
+
+def _parse_profile(spec: str, full_dims: int) -> VectorProfile:
+    parts = spec.split(":")
+    if len(parts) not in (2, 3):
+        raise click.BadParameter(f"'{spec}' is not quantization:dims[:oversample]", param_hint="--profile")
+    try:
+        oversample = float(parts[2]) if len(parts) == 3 else 0.0
+        return VectorProfile(parts[0], int(parts[1]), oversample, full_dims=full_dims)
+    except ValueError as e:
+        raise click.BadParameter(f"'{spec}': {e}", param_hint="--profile") from e
+
+
+@click.command(context_settings={"show_default": True})
+@click.option("--name", required=True, help="Series name")
+@click.option("--index-type", type=click.Choice(list(INDEX_FIELDS)), default="video_frames", help="Embeddings index to sample vectors from")
+@click.option("--host", type=str, default="http://localhost:9200", help="Elasticsearch host")
+@click.option("--sample-size", type=click.IntRange(min=100), default=20000, help="Number of vectors to index per profile")
+@click.option("--queries", "num_queries", type=click.IntRange(min=1), default=100, help="Number of held-out query vectors")
+@click.option("--k", type=click.IntRange(min=1, max=1000), default=10, help="Recall@k cutoff")
+@click.option(
+    "--profile", "profiles", multiple=True, default=DEFAULT_PROFILES,
+    help="Vector profile as quantization:dims[:rescore_oversample], quantization one of float/int8/int4/bbq",
+)
+@click.option("--keep-indices", is_flag=True, help="Keep the benchmark indices after measuring")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), help="Write results as JSON")
+def benchmark_vectors(
+    name: str,
+    index_type: str,
+    host: str,
+    sample_size: int,
+    num_queries: int,
+    k: int,
+    profiles: Tuple[str, ...],
+    keep_indices: bool,
+    output: Optional[Path],
+):
+    """Compare recall@k, latency and size of vector storage profiles on a sample of indexed embeddings."""
+    results = asyncio.run(
+        _run(name, index_type, host, sample_size, num_queries, k, profiles, keep_indices),
+    )
+    if not results:
+        sys.exit(1)
+
+    for row in VectorBenchmark.summary_rows(results):
+        console.print(row, highlight=False)
+    if output:
+        atomic_write_json(output, [result.to_dict() for result in results])
+        console.print(f"[green]Results saved to {output}[/green]")
+
+
+async def _run(
+    name: str,
+    index_type: str,
+    host: str,
+    sample_size: int,
+    num_queries: int,
+    k: int,
+    profiles: Tuple[str, ...],
+    keep_indices: bool,
+) -> List[VectorBenchmarkResult]:
+    es_client = AsyncElasticsearch(hosts=[host], verify_certs=False, request_timeout=120)
+    benchmark = VectorBenchmark(es_client, INDEX_FIELDS[index_type], k, index_prefix=f"{name}_vector_bench")
+    try:
+        source_index = f"{name}_{index_type}"
+        console.print(f"[cyan]Sampling {sample_size + num_queries:,} vectors from {source_index}...[/cyan]")
+        vectors = await benchmark.load_sample(source_index, sample_size + num_queries)
+        if len(vectors) <= num_queries:
+            console.print(f"[red]Not enough vectors in {source_index} ({len(vectors)})[/red]")
+            return []
+
+        vector_profiles = [_parse_profile(spec, vectors.shape[1]) for spec in profiles]
+        corpus, queries = VectorBenchmark.split(vectors, num_queries)
+        truth = benchmark.ground_truth(corpus, queries)
+
+        results = []
+        for profile in vector_profiles:
+            console.print(f"[cyan]Benchmarking {profile.label} on {len(corpus):,} vectors...[/cyan]")
+            results.append(await benchmark.run(profile, corpus, queries, truth, keep_index=keep_indices))
+        return results
+    finally:
+        await es_client.close()
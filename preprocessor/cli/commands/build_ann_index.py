@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from pathlib import Path
+import sys
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+import click
+import orjson
+
+from preprocessor.config.config import (
+    get_output_path,
+    settings,
+)
+from preprocessor.search.ivf_index import (
+    IvfIndexBuilder,
+    IvfIndexWriter,
+)
+from preprocessor.utils.console import console
+
+ELASTIC_SUBDIRS = settings.output_subdirs.elastic_document_subdirs
+
+
+@dataclass(frozen=True)
+class AnnSource:
+    pattern: str
+    field: str
+    key_field: Optional[str]
+
+
+ANN_SOURCES = {
+    ELASTIC_SUBDIRS.text_embeddings: AnnSource("*_text_embeddings.jsonl", "text_embedding", "embedding_id"),
+    ELASTIC_SUBDIRS.video_frames: AnnSource("*_video_frames.jsonl", "video_embedding", "frame_number"),
+    ELASTIC_SUBDIRS.full_episode_embeddings: AnnSource("*_full_episode_embedding.jsonl", "full_episode_embedding", None),
+}
+
+
+@click.command(context_settings={"show_default": True})
+@click.option("--name", required=True, help="Series name")
+@click.option(
+    "--elastic-documents-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=str(get_output_path(settings.output_subdirs.elastic_documents)),
+    help="Directory with generated elastic documents",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Output directory (default: <semantic index dir>/<name>); copy it to <series data dir>/semantic_index for the bot",
+)
+@click.option("--nlist", type=click.IntRange(min=0), default=settings.semantic_index.nlist, help="Number of IVF lists (0 = 4 * sqrt(vectors))")
+@click.option("--iterations", type=click.IntRange(min=1), default=settings.semantic_index.kmeans_iterations, help="k-means training iterations")
+def build_ann_index(name: str, elastic_documents_dir: Path, output_dir: Optional[Path], nlist: int, iterations: int):
+    """Build in-process IVF indices over text, frame and episode embeddings for local semantic search."""
+    output_dir = output_dir or settings.semantic_index.output_dir / name
+    built = 0
+
+    for index_suffix, source in ANN_SOURCES.items():
+        files = sorted(elastic_documents_dir.rglob(source.pattern))
+        vectors, episode_ids, keys = IvfIndexBuilder.collect(_iter_rows(files, source.field, source.key_field))
+        if vectors.size == 0:
+            console.print(f"[yellow]No {source.field} vectors found, skipping {index_suffix}[/yellow]")
+            continue
+
+        IvfIndexWriter.write(
+            output_dir / index_suffix,
+            vectors,
+            episode_ids,
+            keys,
+            meta={"series_name": name, "field": source.field, "key_field": source.key_field, "nprobe": settings.semantic_index.nprobe},
+            builder=IvfIndexBuilder(nlist=nlist, iterations=iterations),
+        )
+        built += 1
+
+    if not built:
+        console.print("[red]No embeddings found in elastic documents[/red]")
+        sys.exit(1)
+    console.print(f"[green]Semantic index for '{name}' written to {output_dir}[/green]")
+
+
+def _iter_rows(files, field: str, key_field: Optional[str]) -> Iterator[Tuple[str, int, Any]]:
+    for jsonl_file in files:
+        with open(jsonl_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                doc = orjson.loads(line)
+                vector = doc.get(field)
+                if not vector:
+                    continue
+                key = doc.get(key_field) if key_field else None
+                yield doc.get("episode_id", ""), -1 if key is None else int(key), vector
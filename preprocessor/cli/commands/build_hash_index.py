@@ -0,0 +1,51 @@
+import asyncio
+from pathlib import Path
+import sys
+from typing import Optional
+
+import click
+from elasticsearch import AsyncElasticsearch
+
+from preprocessor.config.config import settings
+from preprocessor.hashing.hamming_index import FrameHashIndex
+from preprocessor.utils.console import console
+
+
+@click.command(context_settings={"show_default": True})
+@click.option("--name", required=True, help="Series name")
+@click.option(
+    "--elastic-documents-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=str(settings.elastic_documents.output_dir) if hasattr(settings, 'elastic_documents') else "/app/output_data/elastic_documents",
+    help="Directory with generated elastic documents (*_video_frames.jsonl)",
+)
+@click.option("--from-es", is_flag=True, help="Read frame hashes from Elasticsearch instead of JSONL documents")
+@click.option("--host", type=str, default="http://localhost:9200", help="Elasticsearch host (with --from-es)")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output .npz path (default: <hash index dir>/<name>_frame_hashes.npz)",
+)
+def build_hash_index(name: str, elastic_documents_dir: Path, from_es: bool, host: str, output: Optional[Path]):
+    """Build a multi-index Hamming search index over frame perceptual hashes."""
+    output = output or settings.image_hash.index_dir / f"{name}_frame_hashes.npz"
+
+    if from_es:
+        frame_index = asyncio.run(_build_from_elasticsearch(host, f"{name}_video_frames"))
+    else:
+        frame_index = FrameHashIndex.from_documents(FrameHashIndex.iter_jsonl_documents(elastic_documents_dir))
+
+    if not frame_index:
+        console.print("[red]No frames with perceptual hashes found[/red]")
+        sys.exit(1)
+
+    frame_index.save(output)
+    console.print(f"[green]Indexed {len(frame_index):,} frame hashes -> {output}[/green]")
+
+
+async def _build_from_elasticsearch(host: str, index_name: str) -> FrameHashIndex:
+    es_client = AsyncElasticsearch(hosts=[host], verify_certs=False)
+    try:
+        return await FrameHashIndex.from_elasticsearch(es_client, index_name)
+    finally:
+        await es_client.close()
@@ -25,6 +25,7 @@ from preprocessor.cli.pipeline.steps import (
 )
 from preprocessor.cli.utils import create_state_manager
 from preprocessor.config.config import settings
+from preprocessor.core.enums import ResourceClass
 from preprocessor.utils.console import console
 from preprocessor.utils.resolution import Resolution
 
@@ -76,6 +77,11 @@ from preprocessor.utils.resolution import Resolution
 )
 @click.option("--dry-run", is_flag=True, help="Dry run for Elasticsearch indexing")
 @click.option("--no-state", is_flag=True, help="Disable state management (no resume on interrupt)")
+@click.option(
+    "--overlap-stages",
+    is_flag=True,
+    help="Stream episode batches through steps 1-10 so GPU, CPU and ffmpeg stages run concurrently",
+)
 @click.option(
     "--ramdisk-path",
     type=click.Path(path_type=Path),
@@ -150,6 +156,7 @@ def run_all(  # pylint: disable=too-many-arguments,too-many-locals,too-many-stat
     language: str,
     dry_run: bool,
     no_state: bool,
+    overlap_stages: bool,
     ramdisk_path: Path,
     scrape_urls: Tuple[str, ...],
     character_urls: Tuple[str, ...],
@@ -258,6 +265,7 @@ def run_all(  # pylint: disable=too-many-arguments,too-many-locals,too-many-stat
         state_manager=state_manager,
         series_name=series_name,
         metadata_output_dir=metadata_output_dir,
+        overlap_stages=overlap_stages,
     )
     skip_character_visualization = not debug_visualizations
     skip_object_visualization = not debug_visualizations
@@ -271,21 +279,51 @@ def run_all(  # pylint: disable=too-many-arguments,too-many-locals,too-many-stat
     orchestrator.add_step("Scraping character metadata", "0b/14", run_character_scrape_step, skip=False)
     orchestrator.add_step("Downloading character references", "0c/14", run_character_reference_download_step, skip=False)
     orchestrator.add_step("Processing character references", "0d/14", run_character_reference_processing_step, skip=skip_character_reference_processing)
-    orchestrator.add_step("Transcoding videos", "1/14", run_transcode_step, skip=skip_transcode)
-    orchestrator.add_step("Generating transcriptions", "2/14", run_transcribe_step, skip=skip_transcribe)
-    orchestrator.add_step("Separating sounds and dialogues", "3/14", run_sound_separation_step, skip=skip_transcribe)
-    orchestrator.add_step("Analyzing transcription texts", "4/14", run_text_analysis_step, skip=skip_text_analysis)
-    orchestrator.add_step("Detecting scenes", "5/14", run_scene_step, skip=skip_scenes)
-    orchestrator.add_step("Exporting frames", "6/14", run_frame_export_step, skip=skip_frame_export)
-    orchestrator.add_step("Generating text embeddings", "7/14", run_embedding_step, skip=skip_embeddings)
+    orchestrator.add_step(
+        "Transcoding videos", "1/14", run_transcode_step, skip=skip_transcode,
+        key="transcode", resource=ResourceClass.FFMPEG,
+    )
+    orchestrator.add_step(
+        "Generating transcriptions", "2/14", run_transcribe_step, skip=skip_transcribe,
+        key="transcribe", resource=ResourceClass.GPU,
+    )
+    orchestrator.add_step(
+        "Separating sounds and dialogues", "3/14", run_sound_separation_step, skip=skip_transcribe,
+        key="sound_separation", depends_on=("transcribe",),
+    )
+    orchestrator.add_step(
+        "Analyzing transcription texts", "4/14", run_text_analysis_step, skip=skip_text_analysis,
+        key="text_analysis", depends_on=("sound_separation",),
+    )
+    orchestrator.add_step(
+        "Detecting scenes", "5/14", run_scene_step, skip=skip_scenes,
+        key="scenes", resource=ResourceClass.GPU,
+    )
+    orchestrator.add_step(
+        "Exporting frames", "6/14", run_frame_export_step, skip=skip_frame_export,
+        key="frame_export", resource=ResourceClass.FFMPEG, depends_on=("scenes",),
+    )
+    orchestrator.add_step(
+        "Generating text embeddings", "7/14", run_embedding_step, skip=skip_embeddings,
+        key="text_embeddings", resource=ResourceClass.GPU, depends_on=("sound_separation",),
+    )
     orchestrator.add_step(
         "Processing frames (hashing + embeddings + characters + emotions + clustering + objects)",
         "8/14",
         run_frame_processing_step,
         skip=skip_frame_processing,
+        key="frame_processing",
+        resource=ResourceClass.GPU,
+        depends_on=("frame_export",),
+    )
+    orchestrator.add_step(
+        "Generating Elasticsearch documents", "9/14", run_elastic_documents_step, skip=skip_elastic_documents,
+        key="elastic_documents", depends_on=("transcode", "text_analysis", "text_embeddings", "frame_processing"),
+    )
+    orchestrator.add_step(
+        "Archiving Elasticsearch documents", "10/14", run_archive_generation_step, skip=skip_archives,
+        key="archives", resource=ResourceClass.IO, depends_on=("elastic_documents",),
     )
-    orchestrator.add_step("Generating Elasticsearch documents", "9/14", run_elastic_documents_step, skip=skip_elastic_documents)
-    orchestrator.add_step("Archiving Elasticsearch documents", "10/14", run_archive_generation_step, skip=skip_archives)
     orchestrator.add_step("Indexing in Elasticsearch", "11/14", run_index_step, skip=skip_index)
     orchestrator.add_step("Validating output data", "12/14", run_validation_step, skip=skip_validation)
 
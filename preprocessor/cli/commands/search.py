@@ -15,7 +15,9 @@ from transformers import (
 )
 
 from preprocessor.config.config import settings
+from preprocessor.hashing.hamming_index import FrameHashIndex
 from preprocessor.hashing.image_hasher import PerceptualHasher
+from preprocessor.search.vector_profile import get_vector_profile
 from preprocessor.utils.constants import (
     ElasticsearchAggregationKeys,
     ElasticsearchKeys,
@@ -159,18 +161,9 @@ async def search_text_semantic(es_client, text, season=None, episode=None, limit
     if episode is not None:
         filter_clauses.append({"term": {"episode_metadata.episode_number": episode}})
 
-    knn_query = {
-        "field": "text_embedding",
-        "query_vector": embedding,
-        "k": limit,
-        "num_candidates": limit * 10,
-    }
-    if filter_clauses:
-        knn_query["filter"] = filter_clauses
-
     return await es_client.search(
         index="ranczo_text_embeddings",
-        knn=knn_query,
+        **get_vector_profile().search_body("text_embedding", embedding, limit, filter_clauses),
         size=limit,
         _source=[
             "episode_id", "embedding_id", "text", "segment_range",
@@ -195,18 +188,9 @@ async def search_video_semantic(es_client, image_path, season=None, episode=None
             },
         })
 
-    knn_query = {
-        "field": "video_embedding",
-        "query_vector": embedding,
-        "k": limit,
-        "num_candidates": limit * 10,
-    }
-    if filter_clauses:
-        knn_query["filter"] = filter_clauses
-
     return await es_client.search(
         index="ranczo_video_frames",
-        knn=knn_query,
+        **get_vector_profile().search_body("video_embedding", embedding, limit, filter_clauses),
         size=limit,
         _source=[
             "episode_id", "frame_number", "timestamp", "frame_type", "scene_number",
@@ -231,18 +215,9 @@ async def search_text_to_video(es_client, text, season=None, episode=None, chara
             },
         })
 
-    knn_query = {
-        "field": "video_embedding",
-        "query_vector": embedding,
-        "k": limit,
-        "num_candidates": limit * 10,
-    }
-    if filter_clauses:
-        knn_query["filter"] = filter_clauses
-
     return await es_client.search(
         index="ranczo_video_frames",
-        knn=knn_query,
+        **get_vector_profile().search_body("video_embedding", embedding, limit, filter_clauses),
         size=limit,
         _source=[
             "episode_id", "frame_number", "timestamp", "frame_type", "scene_number",
@@ -426,6 +401,26 @@ async def search_perceptual_hash(es_client, phash, limit=10):
     )
 
 
+async def search_perceptual_hash_near(es_client, phash, max_distance, index_path, limit=10):
+    if index_path.exists():
+        frame_index = FrameHashIndex.load(index_path)
+    else:
+        click.echo(f"Building hash index from ranczo_video_frames -> {index_path}", err=True)
+        frame_index = await FrameHashIndex.from_elasticsearch(es_client, "ranczo_video_frames")
+        frame_index.save(index_path)
+
+    matches = frame_index.search(int(phash, 16), max_distance, limit)
+    return {
+        "hits": {
+            "total": {"value": len(matches)},
+            "hits": [
+                {"_score": 1.0 - match[FrameHashIndex.DISTANCE_KEY] / 64, "_source": match}
+                for match in matches
+            ],
+        },
+    }
+
+
 async def list_characters(es_client):
     result = await es_client.search(
         index="ranczo_video_frames",
@@ -572,6 +567,8 @@ def _print_results(result, result_type="text"):  # pylint: disable=too-many-loca
                 click.echo(f"Scene number: {source['scene_number']}")
             if "perceptual_hash" in source:
                 click.echo(f"Hash: {source['perceptual_hash']}")
+            if FrameHashIndex.DISTANCE_KEY in source:
+                click.echo(f"Hamming distance: {source[FrameHashIndex.DISTANCE_KEY]}")
             if source.get("character_appearances"):
                 chars_strs = []
                 for char in source['character_appearances']:
@@ -595,6 +592,13 @@ def _print_results(result, result_type="text"):  # pylint: disable=too-many-loca
 @click.option("--text-to-video", type=str, help="Cross-modal search: text query w video embeddings")
 @click.option("--image", type=click.Path(exists=True, path_type=Path), help="Semantic search po video embeddings")
 @click.option("--hash", "phash", type=str, help="Szukaj po perceptual hash (podaj hash string lub sciezke do obrazka)")
+@click.option("--max-distance", type=click.IntRange(0, 64), default=0, help="Maksymalna odleglosc Hamminga dla --hash (0 = dokladne dopasowanie)")
+@click.option(
+    "--hash-index",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=str(settings.image_hash.index_dir / "ranczo_frame_hashes.npz"),
+    help="Indeks hashy z build-hash-index (budowany z Elasticsearch, jesli nie istnieje)",
+)
 @click.option("--character", type=str, help="Szukaj po postaci")
 @click.option("--emotion", type=str, help="Szukaj po emocji (neutral, happiness, surprise, sadness, anger, disgust, fear, contempt)")
 @click.option("--object", "object_query", type=str, help="Szukaj po wykrytych obiektach (np. 'dog', 'person:5+', 'chair:2-4')")
@@ -609,8 +613,8 @@ def _print_results(result, result_type="text"):  # pylint: disable=too-many-loca
 @click.option("--json-output", is_flag=True, help="Output w formacie JSON")
 @click.option("--host", type=str, default="http://localhost:9200", help="Elasticsearch host")
 def search(  # pylint: disable=too-many-locals
-    text, text_semantic, text_to_video, image, phash, character, emotion, object_query, episode_name,
-    episode_name_semantic, list_chars_flag, list_objects_flag, season, episode, limit,
+    text, text_semantic, text_to_video, image, phash, max_distance, hash_index, character, emotion, object_query,
+    episode_name, episode_name_semantic, list_chars_flag, list_objects_flag, season, episode, limit,
     stats, json_output, host,
 ):
     """Search tool - comprehensive Elasticsearch search"""
@@ -727,7 +731,10 @@ def search(  # pylint: disable=too-many-locals
                     _print_results(result, "video")
 
             elif hash_value:
-                result = await search_perceptual_hash(es_client, hash_value, limit)
+                if max_distance:
+                    result = await search_perceptual_hash_near(es_client, hash_value, max_distance, hash_index, limit)
+                else:
+                    result = await search_perceptual_hash(es_client, hash_value, limit)
                 if json_output:
                     click.echo(json.dumps(result["hits"], indent=2))
                 else:
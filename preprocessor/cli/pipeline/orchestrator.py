@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 import json
 from pathlib import Path
 from typing import (
@@ -7,45 +6,63 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
+from preprocessor.cli.pipeline.pipeline_step import PipelineStep
+from preprocessor.cli.pipeline.stage_scheduler import StageScheduler
 from preprocessor.cli_utils.resource_scope import ResourceScope
 from preprocessor.config.config import (
     get_output_path,
     settings,
 )
-from preprocessor.core.processing_metadata import ProcessingMetadata
+from preprocessor.core.enums import ResourceClass
+from preprocessor.core.processing_metadata import (
+    ProcessingMetadata,
+    StepMetadata,
+)
 from preprocessor.core.state_manager import StateManager
 from preprocessor.utils.console import console
 
 ELASTIC_SUBDIRS = settings.output_subdirs.elastic_document_subdirs
 
 
-@dataclass
-class PipelineStep:
-    name: str
-    step_num: str
-    execute_func: Callable
-    skip: bool = False
-
-
 class PipelineOrchestrator:
-    def __init__(self, state_manager: Optional[StateManager] = None, series_name: Optional[str] = None, metadata_output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        state_manager: Optional[StateManager] = None,
+        series_name: Optional[str] = None,
+        metadata_output_dir: Optional[Path] = None,
+        overlap_stages: bool = False,
+    ):
         self.state_manager = state_manager
         self.steps: List[PipelineStep] = []
         self.series_name = series_name
         self.metadata_output_dir = metadata_output_dir
+        self.overlap_stages = overlap_stages
         self.metadata: Optional[ProcessingMetadata] = None
 
-    def add_step(self, name: str, step_num: str, func: Callable, skip: bool = False):
-        self.steps.append(PipelineStep(name, step_num, func, skip))
+    def add_step(
+        self,
+        name: str,
+        step_num: str,
+        func: Callable,
+        skip: bool = False,
+        key: Optional[str] = None,
+        resource: ResourceClass = ResourceClass.CPU,
+        depends_on: Tuple[str, ...] = (),
+    ):
+        self.steps.append(PipelineStep(name, step_num, func, skip, key, resource, depends_on))
 
     def execute(self, **params) -> int:
         if self.series_name:
             self.metadata = ProcessingMetadata(series_name=self.series_name, params=params)
 
         try:
-            exit_code = self.__run_all_steps(params)
+            if self.overlap_stages:
+                exit_code = self.__run_overlapped(params)
+            else:
+                exit_code = self.__run_steps(self.steps, params)
             if self.state_manager:
                 self.state_manager.cleanup()
             self.__finalize_metadata(exit_code)
@@ -55,8 +72,33 @@ class PipelineOrchestrator:
             self.__finalize_metadata(130)
             return 130
 
-    def __run_all_steps(self, params: Dict[str, Any]) -> int:
-        for step in self.steps:
+    def __run_overlapped(self, params: Dict[str, Any]) -> int:
+        staged_positions = [i for i, step in enumerate(self.steps) if step.key]
+        if not staged_positions:
+            return self.__run_steps(self.steps, params)
+
+        first, last = staged_positions[0], staged_positions[-1]
+        staged = self.steps[first:last + 1]
+        if any(not step.key for step in staged):
+            raise ValueError("Per-episode stages must be registered contiguously")
+
+        exit_code = self.__run_steps(self.steps[:first], params)
+        if exit_code != 0:
+            return exit_code
+
+        step_metadata: Dict[str, Optional[StepMetadata]] = {
+            step.key: self.metadata.add_step(name=step.name, step_num=step.step_num) if self.metadata else None
+            for step in staged
+        }
+        episodes = StageScheduler.discover_episodes(params["videos"], params.get("episodes_info_json"), params["name"])
+        exit_code = StageScheduler(staged, step_metadata).run(episodes, params)
+        if exit_code != 0:
+            return exit_code
+
+        return self.__run_steps(self.steps[last + 1:], params)
+
+    def __run_steps(self, steps: List[PipelineStep], params: Dict[str, Any]) -> int:
+        for step in steps:
             step_metadata = None
             if self.metadata:
                 step_metadata = self.metadata.add_step(name=step.name, step_num=step.step_num)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+)
+
+from preprocessor.core.enums import ResourceClass
+
+
+@dataclass
+class PipelineStep:
+    name: str
+    step_num: str
+    execute_func: Callable
+    skip: bool = False
+    key: Optional[str] = None
+    resource: ResourceClass = ResourceClass.CPU
+    depends_on: Tuple[str, ...] = ()
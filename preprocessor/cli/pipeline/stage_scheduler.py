@@ -0,0 +1,175 @@
+from pathlib import Path
+import queue
+import threading
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
+
+from preprocessor.cli.pipeline.pipeline_step import PipelineStep
+from preprocessor.cli_utils.resource_scope import ResourceScope
+from preprocessor.config.config import settings
+from preprocessor.core.constants import SUPPORTED_VIDEO_EXTENSIONS
+from preprocessor.core.enums import ResourceClass
+from preprocessor.core.episode_manager import EpisodeManager
+from preprocessor.core.processing_metadata import StepMetadata
+from preprocessor.utils.console import console
+
+EpisodeKey = Tuple[int, int]
+EpisodeBatch = FrozenSet[EpisodeKey]
+
+
+class StageScheduler:
+    __POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        steps: List[PipelineStep],
+        step_metadata: Dict[str, Optional[StepMetadata]],
+        batch_episodes: Optional[int] = None,
+        queue_batches: Optional[int] = None,
+    ) -> None:
+        keys = {step.key for step in steps}
+        for step in steps:
+            unknown = [dep for dep in step.depends_on if dep not in keys]
+            if unknown:
+                raise ValueError(f"Stage '{step.key}' depends on unknown stages: {', '.join(unknown)}")
+
+        self.__steps = steps
+        self.__step_metadata = step_metadata
+        self.__batch_episodes = max(1, batch_episodes or settings.concurrency.pipeline_batch_episodes)
+        self.__queue_batches = max(1, queue_batches or settings.concurrency.pipeline_queue_batches)
+        self.__resource_slots = {resource: threading.Lock() for resource in ResourceClass}
+        self.__queues: Dict[Tuple[str, str], "queue.Queue[int]"] = {}
+        self.__stop = threading.Event()
+        self.__exit_code = 0
+        self.__exit_lock = threading.Lock()
+
+    @staticmethod
+    def discover_episodes(videos: Path, episodes_info_json: Optional[Path], series_name: str) -> List[EpisodeKey]:
+        episode_manager = EpisodeManager(episodes_info_json, series_name)
+        episodes = set()
+        for ext in SUPPORTED_VIDEO_EXTENSIONS:
+            for video_file in Path(videos).rglob(f"*{ext}"):
+                episode_info = episode_manager.parse_filename(video_file)
+                if episode_info:
+                    episodes.add((episode_info.season, episode_info.relative_episode))
+        return sorted(episodes)
+
+    def run(self, episodes: List[EpisodeKey], params: Dict[str, Any]) -> int:
+        batches = [
+            frozenset(episodes[i:i + self.__batch_episodes])
+            for i in range(0, len(episodes), self.__batch_episodes)
+        ]
+        console.print(
+            f"[bold blue]Streaming {len(episodes)} episodes through {len(self.__steps)} stages "
+            f"in {len(batches)} batches of up to {self.__batch_episodes}[/bold blue]",
+        )
+
+        self.__queues = {
+            (dep, step.key): queue.Queue(maxsize=self.__queue_batches)
+            for step in self.__steps
+            for dep in step.depends_on
+        }
+        threads = [
+            threading.Thread(
+                target=self.__run_stage,
+                args=(step, batches, params),
+                name=f"stage-{step.key}",
+                daemon=True,
+            )
+            for step in self.__steps
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=self.__POLL_SECONDS)
+        except KeyboardInterrupt:
+            self.__stop.set()
+            raise
+
+        return self.__exit_code
+
+    def __run_stage(self, step: PipelineStep, batches: List[EpisodeBatch], params: Dict[str, Any]) -> None:
+        metadata = self.__step_metadata.get(step.key)
+        inputs = [self.__queues[(dep, step.key)] for dep in step.depends_on]
+        outputs = [q for (dep, _), q in self.__queues.items() if dep == step.key]
+        exit_code = 0
+
+        if step.skip:
+            console.print(f"[yellow]Step {step.step_num}: {step.name} - SKIPPED[/yellow]")
+            if metadata:
+                metadata.skip()
+        elif metadata:
+            metadata.start()
+
+        try:
+            for batch_idx, batch in enumerate(batches):
+                if not all(self.__get(q) == batch_idx for q in inputs):
+                    return
+
+                if not step.skip:
+                    exit_code = self.__run_batch(step, batch, batch_idx, len(batches), params)
+                    if exit_code != 0:
+                        console.print(f"[red]Step {step.step_num} failed with exit code {exit_code}[/red]")
+                        self.__fail(exit_code)
+                        return
+
+                for q in outputs:
+                    if not self.__put(q, batch_idx):
+                        return
+        except Exception as e:
+            console.print(f"[red]Step {step.step_num} crashed: {e}[/red]")
+            exit_code = 1
+            self.__fail(exit_code)
+        finally:
+            if metadata and not step.skip:
+                metadata.finish(130 if self.__stop.is_set() and exit_code == 0 else exit_code)
+
+    def __run_batch(
+        self,
+        step: PipelineStep,
+        batch: EpisodeBatch,
+        batch_idx: int,
+        total_batches: int,
+        params: Dict[str, Any],
+    ) -> int:
+        with self.__resource_slots[step.resource]:
+            if self.__stop.is_set():
+                return 0
+            console.print(
+                f"[bold blue]Step {step.step_num}: {step.name} "
+                f"(batch {batch_idx + 1}/{total_batches}, {len(batch)} episodes)[/bold blue]",
+            )
+            with ResourceScope():
+                return step.execute_func(**params, episode_batch=batch)
+
+    def __get(self, q: "queue.Queue[int]") -> Optional[int]:
+        while not self.__stop.is_set():
+            try:
+                return q.get(timeout=self.__POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return None
+
+    def __put(self, q: "queue.Queue[int]", batch_idx: int) -> bool:
+        while not self.__stop.is_set():
+            try:
+                q.put(batch_idx, timeout=self.__POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __fail(self, exit_code: int) -> None:
+        with self.__exit_lock:
+            if self.__exit_code == 0:
+                self.__exit_code = exit_code
+        self.__stop.set()
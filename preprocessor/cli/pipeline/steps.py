@@ -177,6 +177,7 @@ def run_transcode_step(videos, episodes_info_json, name, resolution, codec, stat
     transcode_dict = transcode_config.to_dict()
     transcode_dict["state_manager"] = state_manager
     transcode_dict["series_name"] = name
+    transcode_dict["episode_batch"] = kwargs.get("episode_batch")
 
     transcoder = VideoTranscoder(transcode_dict)
     return transcoder.work()
@@ -201,6 +202,7 @@ def run_transcribe_step(videos, episodes_info_json, name, model, language, devic
                 "language_code": settings.elevenlabs.language_code,
                 "diarize": settings.elevenlabs.diarize,
                 "state_manager": state_manager,
+                "episode_batch": kwargs.get("episode_batch"),
             },
         )
         return transcriber.work()
@@ -224,12 +226,13 @@ def run_transcribe_step(videos, episodes_info_json, name, model, language, devic
     transcription_dict["state_manager"] = state_manager
     transcription_dict["series_name"] = name
     transcription_dict["ramdisk_path"] = ramdisk_path
+    transcription_dict["episode_batch"] = kwargs.get("episode_batch")
 
     generator = TranscriptionGenerator(transcription_dict)
     return generator.work()
 
 
-def run_sound_separation_step(name, episodes_info_json, transcription_jsons, state_manager, **_kwargs):
+def run_sound_separation_step(name, episodes_info_json, transcription_jsons, state_manager, episode_batch=None, **_kwargs):
     from preprocessor.transcription.processors.sound_separator import SoundEventSeparator  # pylint: disable=import-outside-toplevel
 
     separator = SoundEventSeparator(
@@ -238,6 +241,7 @@ def run_sound_separation_step(name, episodes_info_json, transcription_jsons, sta
             "episodes_info_json": episodes_info_json,
             "series_name": name,
             "state_manager": state_manager,
+            "episode_batch": episode_batch,
         },
     )
     return separator.work()
@@ -260,6 +264,7 @@ def run_scene_step(device, **kwargs):
             "device": device,
             "series_name": name,
             "episodes_info_json": episodes_info_json,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
     exit_code = detector.work()
@@ -285,6 +290,7 @@ def run_frame_export_step(state_manager, **kwargs):
             "series_name": name,
             "episodes_info_json": episodes_info_json,
             "state_manager": state_manager,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
     return exporter.work()
@@ -338,6 +344,7 @@ def run_embedding_step(device, state_manager, **kwargs):
             "series_name": name,
             "episodes_info_json": episodes_info_json,
             "state_manager": state_manager,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
     exit_code = embedding_generator.work()
@@ -370,6 +377,7 @@ def run_elastic_documents_step(**kwargs):
             "output_dir": get_output_path("elastic_documents"),
             "series_name": name,
             "episodes_info_json": episodes_info_json,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
     return generator.work()
@@ -420,6 +428,7 @@ def run_frame_processing_step(  # pylint: disable=too-many-locals,too-many-argum
             "series_name": name,
             "episodes_info_json": episodes_info_json,
             "state_manager": state_manager,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
 
@@ -571,7 +580,7 @@ def run_validation_step(name, episodes_info_json, **kwargs):  # pylint: disable=
     return 0
 
 
-def run_text_analysis_step(name, episodes_info_json, language, state_manager, **_kwargs):
+def run_text_analysis_step(name, episodes_info_json, language, state_manager, episode_batch=None, **_kwargs):
     from preprocessor.text_analysis.text_analyzer import TextAnalyzer  # pylint: disable=import-outside-toplevel
 
     analyzer = TextAnalyzer(
@@ -580,6 +589,7 @@ def run_text_analysis_step(name, episodes_info_json, language, state_manager, **
             "episodes_info_json": episodes_info_json,
             "language": language,
             "state_manager": state_manager,
+            "episode_batch": episode_batch,
         },
     )
     return analyzer.work()
@@ -603,6 +613,7 @@ def run_archive_generation_step(**kwargs):
             "output_dir": output_dir,
             "series_name": name,
             "episodes_info_json": episodes_info_json,
+            "episode_batch": kwargs.get("episode_batch"),
         },
     )
     return generator.work()
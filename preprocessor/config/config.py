@@ -96,6 +96,9 @@ class TranscodeSettings:
     target_duration_seconds: float = 100.0
     audio_bitrate_kbps: int = 128
     gop_size: float = 0.5
+    software_preset: str = "medium"
+    chunk_seconds: float = 60.0
+    chunk_workers: int = 0  # 0 = split this episode's share of the CPUs between chunks
 
     def calculate_video_bitrate_mbps(self) -> float:
         total_bitrate_mbps = (self.target_file_size_mb * 8) / self.target_duration_seconds
@@ -135,6 +138,8 @@ class KeyframeExtractionSettings:
 class FrameExportSettings:
     output_dir: Path = BASE_OUTPUT_DIR / "exported_frames"
     resolution: Resolution = Resolution.R1080P
+    decode_batch_size: int = 32
+    encode_workers: int = 4
 
 
 # ============================================================================
@@ -209,6 +214,7 @@ class EmbeddingSettings:
     progress_sub_batch_size: int = 100
     prefetch_chunks: int = 2
     generate_full_episode_embedding: bool = True
+    storage_dtype: str = "float16"
 
 
 # ============================================================================
@@ -250,6 +256,8 @@ class CharacterSettings:
     face_detection_threshold: float = 0.2
     reference_matching_threshold: float = 0.50
     frame_detection_threshold: float = 0.55
+    detection_batch_size: int = 32
+    decode_workers: int = 4
 
 
 _OBJECT_DETECTIONS_DIR = BASE_OUTPUT_DIR / "object_detections"
@@ -270,6 +278,16 @@ class ObjectDetectionSettings:
 @dataclass
 class ImageHashSettings:
     output_dir: Path = BASE_OUTPUT_DIR / "image_hashes"
+    index_dir: Path = BASE_OUTPUT_DIR / "hash_index"
+    max_distance: int = 10
+
+
+@dataclass
+class SemanticIndexSettings:
+    output_dir: Path = BASE_OUTPUT_DIR / "semantic_index"
+    nlist: int = 0
+    kmeans_iterations: int = 20
+    nprobe: int = 16
 
 
 @dataclass
@@ -309,6 +327,14 @@ class ElasticsearchSettings:
     host: str = ""
     user: str = ""
     password: str = ""
+    bulk_workers: int = 4
+    bulk_chunk_mb: float = 8.0
+    bulk_max_chunk_mb: float = 32.0
+    bulk_target_latency_seconds: float = 2.0
+    bulk_max_retries: int = 8
+    vector_quantization: str = "float"
+    vector_dims: int = 4096
+    vector_rescore_oversample: float = 0.0
 
     @classmethod
     def _from_env(cls) -> "ElasticsearchSettings":
@@ -316,6 +342,14 @@ class ElasticsearchSettings:
             host=os.getenv("ES_HOST", ""),
             user=os.getenv("ES_USER", ""),
             password=os.getenv("ES_PASS", ""),
+            bulk_workers=int(os.getenv("ES_BULK_WORKERS", "4")),
+            bulk_chunk_mb=float(os.getenv("ES_BULK_CHUNK_MB", "8")),
+            bulk_max_chunk_mb=float(os.getenv("ES_BULK_MAX_CHUNK_MB", "32")),
+            bulk_target_latency_seconds=float(os.getenv("ES_BULK_TARGET_LATENCY_SECONDS", "2")),
+            bulk_max_retries=int(os.getenv("ES_BULK_MAX_RETRIES", "8")),
+            vector_quantization=os.getenv("ES_VECTOR_QUANTIZATION", "float"),
+            vector_dims=int(os.getenv("ES_VECTOR_DIMS", "4096")),
+            vector_rescore_oversample=float(os.getenv("ES_VECTOR_RESCORE_OVERSAMPLE", "0")),
         )
 
 
@@ -329,6 +363,33 @@ class GeminiSettings(BaseAPISettings):
         return cls(_api_key=api_key)
 
 
+# ============================================================================
+# CONCURRENCY
+# ============================================================================
+
+@dataclass
+class ConcurrencySettings:
+    cpu_workers: int = 1
+    io_workers: int = 8
+    gpu_workers: int = 1
+    ffmpeg_workers: int = 2
+    cpu_use_processes: bool = True
+    pipeline_batch_episodes: int = 4
+    pipeline_queue_batches: int = 2
+
+    @classmethod
+    def _from_env(cls) -> "ConcurrencySettings":
+        return cls(
+            cpu_workers=int(os.getenv("PREPROCESSOR_CPU_WORKERS", str(os.cpu_count() or 1))),
+            io_workers=int(os.getenv("PREPROCESSOR_IO_WORKERS", "8")),
+            gpu_workers=int(os.getenv("PREPROCESSOR_GPU_WORKERS", "1")),
+            ffmpeg_workers=int(os.getenv("PREPROCESSOR_FFMPEG_WORKERS", "2")),
+            cpu_use_processes=os.getenv("PREPROCESSOR_CPU_USE_PROCESSES", "true").lower() == "true",
+            pipeline_batch_episodes=int(os.getenv("PREPROCESSOR_PIPELINE_BATCH_EPISODES", "4")),
+            pipeline_queue_batches=int(os.getenv("PREPROCESSOR_PIPELINE_QUEUE_BATCHES", "2")),
+        )
+
+
 # ============================================================================
 # MAIN SETTINGS
 # ============================================================================
@@ -344,6 +405,7 @@ class Settings:  # pylint: disable=too-many-instance-attributes
     keyframe_extraction: KeyframeExtractionSettings
     frame_export: FrameExportSettings
     image_hash: ImageHashSettings
+    semantic_index: SemanticIndexSettings
     scraper: ScraperSettings
     character: CharacterSettings
     object_detection: ObjectDetectionSettings
@@ -356,6 +418,7 @@ class Settings:  # pylint: disable=too-many-instance-attributes
     gemini: GeminiSettings
     transcode: TranscodeSettings
     transcription: TranscriptionSettings
+    concurrency: ConcurrencySettings
 
     @classmethod
     def _from_env(cls) -> "Settings":
@@ -369,6 +432,7 @@ class Settings:  # pylint: disable=too-many-instance-attributes
             keyframe_extraction=KeyframeExtractionSettings(),
             frame_export=FrameExportSettings(),
             image_hash=ImageHashSettings(),
+            semantic_index=SemanticIndexSettings(),
             scraper=ScraperSettings(),
             character=CharacterSettings(),
             object_detection=ObjectDetectionSettings(),
@@ -381,6 +445,7 @@ class Settings:  # pylint: disable=too-many-instance-attributes
             gemini=GeminiSettings._from_env(),
             transcode=TranscodeSettings(),
             transcription=TranscriptionSettings(),
+            concurrency=ConcurrencySettings._from_env(),
         )
 
 
@@ -2,10 +2,23 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
+import itertools
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 import re
+import signal
+import threading
 from typing import (
     Any,
     Dict,
@@ -14,10 +27,12 @@ from typing import (
     Tuple,
 )
 
+from preprocessor.config.config import settings
 from preprocessor.core.constants import (
     FILE_SUFFIXES,
     SUPPORTED_VIDEO_EXTENSIONS,
 )
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.state_manager import StateManager
 from preprocessor.utils.console import (
     console,
@@ -39,8 +54,29 @@ class OutputSpec:
     required: bool = True
 
 
+_pool_processor: Optional["BaseProcessor"] = None
+
+
+def _init_pool_worker() -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _pool_processor.state_manager = None
+
+
+def _process_item_in_worker(item: ProcessingItem) -> Tuple[Optional[str], List[str]]:
+    processor = _pool_processor
+    errors_before = len(processor.logger.get_errors())
+    failure = None
+    try:
+        processor._process_item(item, item.metadata.get('missing_outputs', []))
+    except Exception as e:
+        failure = str(e)
+    return failure, processor.logger.get_errors()[errors_before:]
+
+
 class BaseProcessor(ABC):
     SUPPORTED_VIDEO_EXTENSIONS = SUPPORTED_VIDEO_EXTENSIONS
+    RESOURCE_CLASS: Optional[ResourceClass] = ResourceClass.CPU
 
     def __init__(
         self,
@@ -60,6 +96,7 @@ class BaseProcessor(ABC):
 
         self.state_manager: Optional[StateManager] = args.get("state_manager")
         self.series_name: str = args.get("series_name", "unknown")
+        self.episode_manager: Optional["EpisodeManager"] = None
 
         from preprocessor.utils.progress_tracker import ProgressTracker  # pylint: disable=import-outside-toplevel
         self.progress = args.get("progress_tracker", ProgressTracker())
@@ -186,8 +223,22 @@ class BaseProcessor(ABC):
 
         return False, missing_outputs, ""
 
+    def _in_episode_batch(self, episode_info: Optional["EpisodeInfo"]) -> bool:
+        episode_batch = self._args.get("episode_batch")
+        if episode_batch is None or episode_info is None:
+            return True
+        return (episode_info.season, episode_info.relative_episode) in episode_batch
+
+    def __matches_episode_batch(self, item: ProcessingItem) -> bool:
+        if self._args.get("episode_batch") is None:
+            return True
+        episode_info = item.metadata.get("episode_info")
+        if episode_info is None and self.episode_manager is not None:
+            episode_info = self.episode_manager.parse_filename(item.input_path)
+        return self._in_episode_batch(episode_info)
+
     def _execute(self) -> None:
-        all_items = self._get_processing_items()
+        all_items = [item for item in self._get_processing_items() if self.__matches_episode_batch(item)]
 
         if not all_items:
             console.print("[yellow]No items to process[/yellow]")
@@ -236,8 +287,13 @@ class BaseProcessor(ABC):
             return
 
         step_name = self.__get_step_name()
+        max_workers = min(self._get_max_workers(), len(items))
 
         try:
+            if max_workers > 1:
+                self.__execute_concurrently(items, step_name, max_workers)
+                return
+
             with create_progress() as progress:
                 task = progress.add_task(
                     self._get_progress_description(),
@@ -246,19 +302,12 @@ class BaseProcessor(ABC):
 
                 for item in items:
                     try:
-                        if self.state_manager:
-                            temp_files = self._get_temp_files(item)
-                            self.state_manager.mark_step_started(
-                                step_name,
-                                item.episode_id,
-                                temp_files,
-                            )
+                        self.__mark_started(step_name, item)
 
                         missing_outputs = item.metadata.get('missing_outputs', [])
                         self._process_item(item, missing_outputs)
 
-                        if self.state_manager:
-                            self.state_manager.mark_step_completed(step_name, item.episode_id)
+                        self.__mark_completed(step_name, item)
 
                     except Exception as e:
                         self.logger.error(f"Failed to process {item.episode_id}: {e}")
@@ -268,6 +317,100 @@ class BaseProcessor(ABC):
             console.print("\n[yellow]Processing interrupted[/yellow]")
             raise
 
+    def __execute_concurrently(self, items: List[ProcessingItem], step_name: str, max_workers: int) -> None:
+        use_processes = self.__use_process_pool()
+        console.print(
+            f"[blue]Running {self.RESOURCE_CLASS.value} step on {max_workers} "
+            f"{'processes' if use_processes else 'threads'}[/blue]",
+        )
+
+        executor = self.__create_executor(max_workers, use_processes)
+        pending = iter(items)
+        running: Dict[Future, ProcessingItem] = {}
+        try:
+            with create_progress() as progress:
+                task = progress.add_task(
+                    self._get_progress_description(),
+                    total=len(items),
+                )
+
+                for item in itertools.islice(pending, max_workers):
+                    running[self.__submit(executor, step_name, item, use_processes)] = item
+
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = running.pop(future)
+                        self.__collect_result(future, step_name, item, use_processes)
+                        progress.advance(task)
+
+                        next_item = next(pending, None)
+                        if next_item is not None:
+                            running[self.__submit(executor, step_name, next_item, use_processes)] = next_item
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __use_process_pool(self) -> bool:
+        return (
+            self.RESOURCE_CLASS == ResourceClass.CPU and
+            settings.concurrency.cpu_use_processes and
+            "fork" in multiprocessing.get_all_start_methods() and
+            threading.active_count() == 1
+        )
+
+    def __create_executor(self, max_workers: int, use_processes: bool) -> Executor:
+        if not use_processes:
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        global _pool_processor  # pylint: disable=global-statement
+        _pool_processor = self
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_pool_worker,
+        )
+        # Fork every worker now, before the progress bar starts its refresh thread.
+        executor.submit(os.getpid).result()
+        return executor
+
+    def __submit(self, executor: Executor, step_name: str, item: ProcessingItem, use_processes: bool) -> Future:
+        self.__mark_started(step_name, item)
+        if use_processes:
+            return executor.submit(_process_item_in_worker, item)
+        return executor.submit(self._process_item, item, item.metadata.get('missing_outputs', []))
+
+    def __collect_result(self, future: Future, step_name: str, item: ProcessingItem, use_processes: bool) -> None:
+        try:
+            if use_processes:
+                failure, worker_errors = future.result()
+                self.logger.add_errors(worker_errors)
+                if failure is not None:
+                    raise RuntimeError(failure)
+            else:
+                future.result()
+            self.__mark_completed(step_name, item)
+        except Exception as e:
+            self.logger.error(f"Failed to process {item.episode_id}: {e}")
+
+    def __mark_started(self, step_name: str, item: ProcessingItem) -> None:
+        if self.state_manager:
+            self.state_manager.mark_step_started(
+                step_name,
+                item.episode_id,
+                self._get_temp_files(item),
+            )
+
+    def __mark_completed(self, step_name: str, item: ProcessingItem) -> None:
+        if self.state_manager:
+            self.state_manager.mark_step_completed(step_name, item.episode_id)
+
+    def _get_max_workers(self) -> int:
+        if self.RESOURCE_CLASS is None:
+            return 1
+        if self._args.get("max_workers"):
+            return max(1, int(self._args["max_workers"]))
+        return max(1, getattr(settings.concurrency, f"{self.RESOURCE_CLASS.value}_workers"))
+
     def _get_temp_files(self, item: ProcessingItem) -> List[str]:  # pylint: disable=unused-argument
         return []
 
@@ -325,7 +468,7 @@ class BaseProcessor(ABC):
 
         base_name = transcription_file.stem.replace(FILE_SUFFIXES["segmented"], "").replace(FILE_SUFFIXES["simple"], "")
 
-        episode_info = self.episode_manager.parse_filename(transcription_file) if hasattr(self, 'episode_manager') else None
+        episode_info = self.episode_manager.parse_filename(transcription_file) if self.episode_manager is not None else None
         if episode_info:
             episode_id = EpisodeManager.get_episode_id_for_state(episode_info)
         else:
@@ -33,3 +33,10 @@ class TranscriptionFormat(str, Enum):
 class Device(str, Enum):
     CUDA = "cuda"
     CPU = "cpu"
+
+
+class ResourceClass(str, Enum):
+    CPU = "cpu"
+    IO = "io"
+    GPU = "gpu"
+    FFMPEG = "ffmpeg"
@@ -5,17 +5,21 @@ from dataclasses import (
 )
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 import signal
 import sys
+import threading
 from typing import (
     Any,
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 from preprocessor.utils.console import console
+from preprocessor.utils.file_utils import atomic_write_json
 
 
 @dataclass
@@ -39,7 +43,7 @@ class ProcessingState:
     started_at: str
     last_checkpoint: str
     completed_steps: List[StepCheckpoint] = field(default_factory=list)
-    in_progress: Optional[InProgressStep] = None
+    in_progress: List[InProgressStep] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -47,7 +51,7 @@ class ProcessingState:
             "started_at": self.started_at,
             "last_checkpoint": self.last_checkpoint,
             "completed_steps": [asdict(step) for step in self.completed_steps],
-            "in_progress": asdict(self.in_progress) if self.in_progress else None,
+            "in_progress": [asdict(step) for step in self.in_progress],
         }
 
     @classmethod
@@ -55,8 +59,10 @@ class ProcessingState:
         completed_steps = [
             StepCheckpoint(**step) for step in data.get("completed_steps", [])
         ]
-        in_progress_data = data.get("in_progress")
-        in_progress = InProgressStep(**in_progress_data) if in_progress_data else None
+        in_progress_data = data.get("in_progress") or []
+        if isinstance(in_progress_data, dict):
+            in_progress_data = [in_progress_data]
+        in_progress = [InProgressStep(**step) for step in in_progress_data]
 
         return cls(
             series_name=data["series_name"],
@@ -69,24 +75,30 @@ class ProcessingState:
 
 class StateManager:
     STATE_FILE: str = ".preprocessing_state.json"
+    JOURNAL_FILE: str = ".preprocessing_state.journal.jsonl"
 
     def __init__(self, series_name: str, working_dir: Path = Path(".")) -> None:
         self.__series_name: str = series_name
         self.__state_file: Path = working_dir / self.STATE_FILE
+        self.__journal_file: Path = working_dir / self.JOURNAL_FILE
         self.__state: Optional[ProcessingState] = None
+        self.__completed: Dict[Tuple[str, str], StepCheckpoint] = {}
+        self.__in_progress: Dict[Tuple[str, str], InProgressStep] = {}
         self.__cleanup_registered: bool = False
         self.__interrupted: bool = False
+        self.__lock = threading.RLock()
 
     def load_or_create_state(self) -> ProcessingState:
-        if self.__state_file.exists():
-            console.print(f"[yellow]Found existing state file: {self.__state_file}[/yellow]")
-            with open(self.__state_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.__state = ProcessingState._from_dict(data)
+        with self.__lock:
+            if self.__state_file.exists() or self.__journal_file.exists():
+                console.print(f"[yellow]Found existing state file: {self.__state_file}[/yellow]")
+                self.__load_snapshot()
+                replayed = self.__replay_journal()
+                self.__compact()
                 console.print(f"[green]Loaded state for series: {self.__state.series_name}[/green]")
-                console.print(f"[green]Completed steps: {len(self.__state.completed_steps)}[/green]")
+                console.print(f"[green]Completed steps: {len(self.__completed)} (replayed {replayed} journal entries)[/green]")
                 return self.__state
-        else:
+
             console.print("[blue]Creating new processing state...[/blue]")
             now = datetime.now().isoformat()
             self.__state = ProcessingState(
@@ -94,75 +106,125 @@ class StateManager:
                 started_at=now,
                 last_checkpoint=now,
             )
-            self.__save_state()
+            self.__compact()
             return self.__state
 
-    def __save_state(self) -> None:
-        if self.__state is None:
+    def __load_snapshot(self) -> None:
+        now = datetime.now().isoformat()
+        self.__state = ProcessingState(series_name=self.__series_name, started_at=now, last_checkpoint=now)
+        if self.__state_file.exists():
+            with open(self.__state_file, "r", encoding="utf-8") as f:
+                self.__state = ProcessingState._from_dict(json.load(f))
+
+        self.__completed = {(s.step, s.episode): s for s in self.__state.completed_steps}
+        self.__in_progress = {(s.step, s.episode): s for s in self.__state.in_progress}
+
+    def __replay_journal(self) -> int:
+        if not self.__journal_file.exists():
+            return 0
+
+        replayed = 0
+        with open(self.__journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    console.print("[yellow]Ignoring torn entry at the end of the state journal[/yellow]")
+                    break
+                self.__apply(entry)
+                self.__state.last_checkpoint = entry.get("at", self.__state.last_checkpoint)
+                replayed += 1
+        return replayed
+
+    def __apply(self, entry: Dict[str, Any]) -> None:
+        event = entry["event"]
+        if event == "rolled_back":
+            self.__in_progress.clear()
             return
 
-        self.__state.last_checkpoint = datetime.now().isoformat()
-        with open(self.__state_file, "w", encoding="utf-8") as f:
-            json.dump(self.__state.to_dict(), f, indent=2, ensure_ascii=False)
+        key = (entry["step"], entry["episode"])
+        if event == "started":
+            self.__in_progress[key] = InProgressStep(
+                step=entry["step"],
+                episode=entry["episode"],
+                started_at=entry["at"],
+                temp_files=entry.get("temp_files", []),
+            )
+        elif event == "completed":
+            self.__in_progress.pop(key, None)
+            self.__completed.pop(key, None)
+            self.__completed[key] = StepCheckpoint(step=entry["step"], episode=entry["episode"], completed_at=entry["at"])
+
+    def __compact(self) -> None:
+        self.__state.completed_steps = list(self.__completed.values())
+        self.__state.in_progress = list(self.__in_progress.values())
+        atomic_write_json(self.__state_file, self.__state.to_dict(), indent=2)
+        with open(self.__journal_file, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.__lock:
+            self.__apply(entry)
+            self.__state.last_checkpoint = entry["at"]
+            with open(self.__journal_file, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
 
     def mark_step_started(self, step: str, episode: str, temp_files: Optional[List[str]] = None) -> None:
         if self.__state is None:
             raise RuntimeError("State not initialized")
 
-        self.__state.in_progress = InProgressStep(
-            step=step,
-            episode=episode,
-            started_at=datetime.now().isoformat(),
-            temp_files=temp_files or [],
-        )
-        self.__save_state()
+        self.__append({
+            "event": "started",
+            "step": step,
+            "episode": episode,
+            "at": datetime.now().isoformat(),
+            "temp_files": temp_files or [],
+        })
         console.print(f"[cyan]Started: {step} for {episode}[/cyan]")
 
     def mark_step_completed(self, step: str, episode: str) -> None:
         if self.__state is None:
             raise RuntimeError("State not initialized")
 
-        checkpoint = StepCheckpoint(
-            step=step,
-            episode=episode,
-            completed_at=datetime.now().isoformat(),
-        )
-        self.__state.completed_steps.append(checkpoint)
-        self.__state.in_progress = None
-        self.__save_state()
+        self.__append({
+            "event": "completed",
+            "step": step,
+            "episode": episode,
+            "at": datetime.now().isoformat(),
+        })
         console.print(f"[green]✓ Completed: {step} for {episode}[/green]")
 
     def is_step_completed(self, step: str, episode: str) -> bool:
-        if self.__state is None:
-            return False
-
-        return any(
-            s.step == step and s.episode == episode
-            for s in self.__state.completed_steps
-        )
+        return (step, episode) in self.__completed
 
     def __rollback_in_progress(self) -> None:
-        if self.__state is None or self.__state.in_progress is None:
+        if self.__state is None or not self.__in_progress:
             return
 
-        console.print(f"[yellow]Rolling back in-progress step: {self.__state.in_progress.step}[/yellow]")
+        with self.__lock:
+            for in_progress in list(self.__in_progress.values()):
+                console.print(f"[yellow]Rolling back in-progress step: {in_progress.step} ({in_progress.episode})[/yellow]")
 
-        for temp_file in self.__state.in_progress.temp_files:
-            temp_path = Path(temp_file)
-            if temp_path.exists():
-                try:
-                    temp_path.unlink()
-                    console.print(f"[yellow]Removed temp file: {temp_file}[/yellow]")
-                except OSError as e:
-                    console.print(f"[red]Failed to remove {temp_file}: {e}[/red]")
+                for temp_file in in_progress.temp_files:
+                    temp_path = Path(temp_file)
+                    if temp_path.exists():
+                        try:
+                            temp_path.unlink()
+                            console.print(f"[yellow]Removed temp file: {temp_file}[/yellow]")
+                        except OSError as e:
+                            console.print(f"[red]Failed to remove {temp_file}: {e}[/red]")
 
-        self.__state.in_progress = None
-        self.__save_state()
+            self.__append({"event": "rolled_back", "at": datetime.now().isoformat()})
 
     def cleanup(self) -> None:
-        if self.__state_file.exists():
-            console.print(f"[blue]Cleaning up state file: {self.__state_file}[/blue]")
-            self.__state_file.unlink()
+        for path in (self.__state_file, self.__journal_file):
+            if path.exists():
+                console.print(f"[blue]Cleaning up state file: {path}[/blue]")
+                path.unlink()
 
     def register_interrupt_handler(self) -> None:
         if self.__cleanup_registered:
@@ -187,8 +249,8 @@ class StateManager:
         console.print("[blue]Interrupt handler registered (Ctrl+C to safely stop)[/blue]")
 
     def get_resume_info(self) -> Optional[str]:
-        if self.__state is None or not self.__state.completed_steps:
+        if self.__state is None or not self.__completed:
             return None
 
-        last_step = self.__state.completed_steps[-1]
+        last_step = next(reversed(self.__completed.values()))
         return f"Resuming from: {last_step.step} ({last_step.episode}) at {last_step.completed_at}"
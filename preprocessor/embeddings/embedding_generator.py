@@ -8,6 +8,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 import numpy as np
@@ -20,8 +21,10 @@ from preprocessor.core.base_processor import (
     ProcessingItem,
 )
 from preprocessor.core.constants import FILE_SUFFIXES
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.core.output_path_builder import OutputPathBuilder
+from preprocessor.embeddings.embedding_store import EmbeddingStore
 from preprocessor.embeddings.episode_name_embedder import EpisodeNameEmbedder
 from preprocessor.embeddings.gpu_batch_processor import GPUBatchProcessor
 from preprocessor.embeddings.qwen3_vl_embedding import Qwen3VLEmbedder
@@ -37,6 +40,8 @@ from preprocessor.utils.metadata_utils import create_processing_metadata
 
 
 class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-attributes
+    RESOURCE_CLASS = ResourceClass.GPU
+
     def __init__(self, args: Dict[str, Any]):
         super().__init__(
             args=args,
@@ -277,7 +282,7 @@ class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-att
         if need_sound_events:
             sound_event_embeddings = self.__generate_sound_event_embeddings(trans_file)
 
-        video_embeddings = []
+        video_embeddings: Tuple[List[Dict[str, Any]], np.ndarray] = ([], np.empty((0, 0)))
         if need_video:
             episode_info = data.get("episode_info", {})
             frame_metadata = self.__load_frame_metadata(episode_info)
@@ -386,7 +391,7 @@ class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-att
                     for meta, embedding in zip(batch_meta, batch_embeddings):
                         embeddings.append({
                             **meta,
-                            "embedding": embedding.tolist(),
+                            "embedding": embedding,
                         })
                 except (RuntimeError, ValueError, OSError) as e:
                     self.logger.error(f"Failed text embedding batch {batch_idx}: {e}")
@@ -466,7 +471,7 @@ class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-att
                     for meta, embedding in zip(batch_meta, batch_embeddings):
                         embeddings.append({
                             **meta,
-                            "embedding": embedding.tolist(),
+                            "embedding": embedding,
                         })
                 except (RuntimeError, ValueError, OSError) as e:
                     self.logger.error(f"Failed sound event embedding batch {batch_idx}: {e}")
@@ -655,17 +660,19 @@ class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-att
     def __load_image_hashes(self, episode_info_dict: Dict[str, Any]) -> Dict[int, str]:
         return load_image_hashes_for_episode(episode_info_dict, self.logger)
 
-    def __generate_video_embeddings(self, episode_info_dict: Dict[str, Any], frame_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def __generate_video_embeddings(
+        self, episode_info_dict: Dict[str, Any], frame_metadata: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], np.ndarray]:
         frame_requests = frame_metadata.get("frames", [])
         if not frame_requests:
-            return []
+            return [], np.empty((0, 0))
 
         season = episode_info_dict.get("season")
         episode = episode_info_dict.get("episode_number")
 
         episode_info_obj = self.episode_manager.get_episode_by_season_and_relative(season, episode)
         if not episode_info_obj:
-            return []
+            return [], np.empty((0, 0))
 
         frames_episode_dir = self.episode_manager.get_episode_subdir(episode_info_obj, settings.output_subdirs.frames)
         episode_output_dir = self.episode_manager.get_episode_subdir(episode_info_obj, settings.output_subdirs.embeddings)
@@ -707,104 +714,117 @@ class EmbeddingGenerator(BaseProcessor): # pylint: disable=too-many-instance-att
         text_output.parent.mkdir(parents=True, exist_ok=True)
 
         if text_embeddings:
-            text_data = create_processing_metadata(
-                episode_info=type(
-                    'obj', (object,), {
-                        'season': episode_info.get(EpisodeMetadataKeys.SEASON),
-                        'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
-                    },
-                )(),
-                processing_params={
-                    "model_name": self.model_name,
-                    "model_revision": self.model_revision,
-                    "segments_per_embedding": self.segments_per_embedding,
-                    "use_sentence_based_chunking": True,
-                    "text_sentences_per_chunk": self.text_sentences_per_chunk,
-                    "text_chunk_overlap": self.text_chunk_overlap,
-                    "device": self.device,
-                },
-                statistics={
-                    "total_embeddings": len(text_embeddings),
-                    "embedding_dimension": len(text_embeddings[0]["embedding"]) if text_embeddings else 0,
-                },
-                results_key="text_embeddings",
-                results_data=text_embeddings,
-            )
-            atomic_write_json(text_output, text_data, indent=2, ensure_ascii=False)
-
-        if video_embeddings:
-            video_data = create_processing_metadata(
-                episode_info=type(
-                    'obj', (object,), {
-                        'season': episode_info.get(EpisodeMetadataKeys.SEASON),
-                        'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
-                    },
-                )(),
-                processing_params={
-                    "model_name": self.model_name,
-                    "model_revision": self.model_revision,
-                    "batch_size": self.batch_size,
-                    "device": self.device,
-                },
-                statistics={
-                    "total_embeddings": len(video_embeddings),
-                    "embedding_dimension": len(video_embeddings[0]["embedding"]) if video_embeddings else 0,
-                    "frames_with_hash": sum(1 for e in video_embeddings if "perceptual_hash" in e),
-                },
-                results_key="video_embeddings",
-                results_data=video_embeddings,
-            )
-            atomic_write_json(video_output, video_data, indent=2, ensure_ascii=False)
-
+            self.__save_text_embeddings(episode_info, text_embeddings, text_output)
+        self.__save_video_embeddings(episode_info, video_embeddings, video_output)
         if full_episode_embedding:
-            full_episode_data = create_processing_metadata(
-                episode_info=type(
-                    'obj', (object,), {
-                        'season': episode_info.get(EpisodeMetadataKeys.SEASON),
-                        'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
-                    },
-                )(),
-                processing_params={
-                    "model_name": self.model_name,
-                    "model_revision": self.model_revision,
-                    "device": self.device,
+            self.__save_full_episode_embedding(episode_info, full_episode_embedding, full_episode_output)
+        if sound_event_embeddings:
+            self.__save_sound_event_embeddings(episode_info, sound_event_embeddings, sound_events_output)
+
+    def __save_text_embeddings(self, episode_info, text_embeddings, text_output) -> None:
+        text_rows, text_matrix = EmbeddingStore.split_rows(text_embeddings)
+        text_data = create_processing_metadata(
+            episode_info=type(
+                'obj', (object,), {
+                    'season': episode_info.get(EpisodeMetadataKeys.SEASON),
+                    'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
                 },
-                statistics={
-                    "transcript_length": full_episode_embedding.get("transcript_length", 0),
-                    "embedding_dimension": len(full_episode_embedding["embedding"]) if "embedding" in full_episode_embedding else 0,
+            )(),
+            processing_params={
+                "model_name": self.model_name,
+                "model_revision": self.model_revision,
+                "segments_per_embedding": self.segments_per_embedding,
+                "use_sentence_based_chunking": True,
+                "text_sentences_per_chunk": self.text_sentences_per_chunk,
+                "text_chunk_overlap": self.text_chunk_overlap,
+                "device": self.device,
+            },
+            statistics={
+                "total_embeddings": len(text_rows),
+                "embedding_dimension": text_matrix.shape[1],
+            },
+            results_key="text_embeddings",
+            results_data=text_rows,
+        )
+        EmbeddingStore.save(text_output, text_data, "text_embeddings", text_rows, text_matrix)
+
+    def __save_video_embeddings(self, episode_info, video_embeddings, video_output) -> None:
+        video_rows, video_matrix = video_embeddings
+        if not video_rows:
+            return
+        video_data = create_processing_metadata(
+            episode_info=type(
+                'obj', (object,), {
+                    'season': episode_info.get(EpisodeMetadataKeys.SEASON),
+                    'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
                 },
-                results_key="full_episode_embedding",
-                results_data=full_episode_embedding,
-            )
-            atomic_write_json(full_episode_output, full_episode_data, indent=2, ensure_ascii=False)
-            console.print(f"[green]✓ Saved full episode embedding to: {full_episode_output}[/green]")
-
-        if sound_event_embeddings:
-            sound_events_data = create_processing_metadata(
-                episode_info=type(
-                    'obj', (object,), {
-                        'season': episode_info.get(EpisodeMetadataKeys.SEASON),
-                        'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
-                    },
-                )(),
-                processing_params={
-                    "model_name": self.model_name,
-                    "model_revision": self.model_revision,
-                    "segments_per_embedding": self.segments_per_embedding,
-                    "use_sentence_based_chunking": True,
-                    "text_sentences_per_chunk": self.text_sentences_per_chunk,
-                    "text_chunk_overlap": self.text_chunk_overlap,
-                    "device": self.device,
+            )(),
+            processing_params={
+                "model_name": self.model_name,
+                "model_revision": self.model_revision,
+                "batch_size": self.batch_size,
+                "device": self.device,
+            },
+            statistics={
+                "total_embeddings": len(video_rows),
+                "embedding_dimension": video_matrix.shape[1],
+                "frames_with_hash": sum(1 for e in video_rows if "perceptual_hash" in e),
+            },
+            results_key="video_embeddings",
+            results_data=video_rows,
+        )
+        EmbeddingStore.save(video_output, video_data, "video_embeddings", video_rows, video_matrix)
+
+    def __save_full_episode_embedding(self, episode_info, full_episode_embedding, full_episode_output) -> None:
+        full_episode_data = create_processing_metadata(
+            episode_info=type(
+                'obj', (object,), {
+                    'season': episode_info.get(EpisodeMetadataKeys.SEASON),
+                    'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
                 },
-                statistics={
-                    "total_embeddings": len(sound_event_embeddings),
-                    "embedding_dimension": len(sound_event_embeddings[0]["embedding"]) if sound_event_embeddings else 0,
+            )(),
+            processing_params={
+                "model_name": self.model_name,
+                "model_revision": self.model_revision,
+                "device": self.device,
+            },
+            statistics={
+                "transcript_length": full_episode_embedding.get("transcript_length", 0),
+                "embedding_dimension": len(full_episode_embedding["embedding"]) if "embedding" in full_episode_embedding else 0,
+            },
+            results_key="full_episode_embedding",
+            results_data=full_episode_embedding,
+        )
+        atomic_write_json(full_episode_output, full_episode_data, indent=2, ensure_ascii=False)
+        console.print(f"[green]✓ Saved full episode embedding to: {full_episode_output}[/green]")
+
+    def __save_sound_event_embeddings(self, episode_info, sound_event_embeddings, sound_events_output) -> None:
+        sound_event_rows, sound_event_matrix = EmbeddingStore.split_rows(sound_event_embeddings)
+        sound_events_data = create_processing_metadata(
+            episode_info=type(
+                'obj', (object,), {
+                    'season': episode_info.get(EpisodeMetadataKeys.SEASON),
+                    'relative_episode': episode_info.get(EpisodeMetadataKeys.EPISODE_NUMBER),
                 },
-                results_key="sound_event_embeddings",
-                results_data=sound_event_embeddings,
-            )
-            atomic_write_json(sound_events_output, sound_events_data, indent=2, ensure_ascii=False)
-            console.print(f"[green]✓ Saved sound event embeddings to: {sound_events_output}[/green]")
+            )(),
+            processing_params={
+                "model_name": self.model_name,
+                "model_revision": self.model_revision,
+                "segments_per_embedding": self.segments_per_embedding,
+                "use_sentence_based_chunking": True,
+                "text_sentences_per_chunk": self.text_sentences_per_chunk,
+                "text_chunk_overlap": self.text_chunk_overlap,
+                "device": self.device,
+            },
+            statistics={
+                "total_embeddings": len(sound_event_rows),
+                "embedding_dimension": sound_event_matrix.shape[1],
+            },
+            results_key="sound_event_embeddings",
+            results_data=sound_event_rows,
+        )
+        EmbeddingStore.save(sound_events_output, sound_events_data, "sound_event_embeddings", sound_event_rows, sound_event_matrix)
+        console.print(f"[green]✓ Saved sound event embeddings to: {sound_events_output}[/green]")
 
     @staticmethod
     def _cleanup_memory() -> None:
@@ -0,0 +1,155 @@
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import orjson
+
+from preprocessor.config.config import settings
+from preprocessor.utils.file_utils import atomic_write_json
+
+EMBEDDING_FIELD = "embedding"
+
+
+class EmbeddingStore:
+    MATRIX_KEY = "embedding_matrix"
+
+    @staticmethod
+    def matrix_path(json_path: Path) -> Path:
+        return json_path.with_suffix(".npy")
+
+    @staticmethod
+    def storage_dtype() -> np.dtype:
+        return np.dtype(settings.embedding.storage_dtype)
+
+    @staticmethod
+    def split_rows(results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        rows = []
+        vectors = []
+        for result in results:
+            row = {k: v for k, v in result.items() if k != EMBEDDING_FIELD}
+            rows.append(row)
+            vectors.append(result[EMBEDDING_FIELD])
+        dtype = EmbeddingStore.storage_dtype()
+        if not vectors:
+            return rows, np.empty((0, 0), dtype=dtype)
+        return rows, np.asarray(vectors, dtype=dtype)
+
+    @staticmethod
+    def save(json_path: Path, data: Dict[str, Any], results_key: str, rows: List[Dict[str, Any]], matrix: np.ndarray) -> None:
+        if len(rows) != matrix.shape[0]:
+            raise ValueError(f"{json_path.name}: {len(rows)} rows but {matrix.shape[0]} vectors")
+
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        matrix_file = EmbeddingStore.matrix_path(json_path)
+        temp_matrix = matrix_file.with_suffix(".npy.tmp")
+        with open(temp_matrix, "wb") as f:
+            np.save(f, np.ascontiguousarray(matrix, dtype=EmbeddingStore.storage_dtype()))
+        temp_matrix.replace(matrix_file)
+
+        data[results_key] = rows
+        data[EmbeddingStore.MATRIX_KEY] = {
+            "file": matrix_file.name,
+            "dtype": str(EmbeddingStore.storage_dtype()),
+            "shape": list(matrix.shape),
+        }
+        atomic_write_json(json_path, data, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def load_matrix(json_path: Path, data: Dict[str, Any]) -> Optional[np.ndarray]:
+        if EmbeddingStore.MATRIX_KEY not in data:
+            return None
+        matrix_file = json_path.parent / data[EmbeddingStore.MATRIX_KEY]["file"]
+        return np.load(matrix_file, mmap_mode="r")
+
+    @staticmethod
+    def iter_embeddings(json_path: Path, results_key: str) -> Iterator[Tuple[Dict[str, Any], Optional[np.ndarray]]]:
+        with open(json_path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        rows = data.get(results_key, [])
+        matrix = EmbeddingStore.load_matrix(json_path, data)
+        for i, row in enumerate(rows):
+            if matrix is not None:
+                yield row, matrix[i]
+                continue
+            embedding = row.get(EMBEDDING_FIELD)
+            yield row, np.asarray(embedding, dtype=np.float32) if embedding else None
+
+    @staticmethod
+    def validate(json_path: Path, results_key: str, expected_dim: int) -> Optional[str]:
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            matrix = EmbeddingStore.load_matrix(json_path, data)
+        except (OSError, ValueError) as e:
+            return f"{json_path.name}: {e}"
+        if matrix is None:
+            return None
+        rows = len(data.get(results_key, []))
+        if matrix.ndim != 2 or matrix.shape[0] != rows:
+            return f"{json_path.name}: matrix shape {matrix.shape} does not match {rows} rows"
+        if rows and matrix.shape[1] != expected_dim:
+            return f"{json_path.name}: embeddings have {matrix.shape[1]} dimensions, expected {expected_dim}"
+        return None
+
+
+class EmbeddingCheckpoint:
+    def __init__(self, checkpoint_file: Path) -> None:
+        self.__rows_file = checkpoint_file.with_suffix(".rows.jsonl")
+        self.__vectors_file = checkpoint_file.with_suffix(".vectors.bin")
+        self.__legacy_file = checkpoint_file
+        self.__dtype = EmbeddingStore.storage_dtype()
+
+    def exists(self) -> bool:
+        return self.__rows_file.exists()
+
+    def load(self) -> Tuple[int, List[Dict[str, Any]], List[np.ndarray]]:
+        last_batch_idx = -1
+        dim = 0
+        rows: List[Dict[str, Any]] = []
+        valid_bytes = 0
+        with open(self.__rows_file, "r+b") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line.decode("utf-8"))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                last_batch_idx = entry["batch_idx"]
+                dim = entry["dim"]
+                rows.extend(entry["rows"])
+                valid_bytes += len(line)
+            f.truncate(valid_bytes)
+
+        if not rows:
+            # Vectors written just before a crash have no rows line; appending after them would misalign the next batches.
+            self.__vectors_file.unlink(missing_ok=True)
+            return last_batch_idx, rows, []
+        with open(self.__vectors_file, "r+b") as f:
+            f.truncate(len(rows) * dim * self.__dtype.itemsize)
+        vectors = np.fromfile(self.__vectors_file, dtype=self.__dtype).reshape(len(rows), dim)
+        return last_batch_idx, rows, [vectors]
+
+    def append(self, batch_idx: int, rows: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        self.__rows_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.__vectors_file, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=self.__dtype).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.__rows_file, "a", encoding="utf-8") as f:
+            entry = {"batch_idx": batch_idx, "dim": int(vectors.shape[1]), "rows": rows}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        for path in (self.__rows_file, self.__vectors_file, self.__legacy_file):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+)
+
+from elasticsearch.helpers import async_scan
+import numpy as np
+
+from bot.search.hamming_index import HammingIndex
+from preprocessor.utils.constants import (
+    ElasticDocKeys,
+    EmbeddingKeys,
+    SegmentKeys,
+)
+from preprocessor.utils.file_utils import atomic_write_json
+
+
+class FrameHashIndex:
+    ROW_FIELDS = (
+        EmbeddingKeys.EPISODE_ID,
+        EmbeddingKeys.FRAME_NUMBER,
+        EmbeddingKeys.TIMESTAMP,
+        SegmentKeys.VIDEO_PATH,
+        EmbeddingKeys.EPISODE_METADATA,
+        ElasticDocKeys.PERCEPTUAL_HASH,
+        ElasticDocKeys.SCENE_INFO,
+    )
+    DISTANCE_KEY = "hamming_distance"
+
+    def __init__(self, index: HammingIndex, rows: List[Dict[str, Any]]) -> None:
+        self.__index = index
+        self.__rows = rows
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    @staticmethod
+    def from_documents(documents: Iterable[Dict[str, Any]]) -> "FrameHashIndex":
+        hashes = []
+        rows = []
+        for doc in documents:
+            hash_int = doc.get(ElasticDocKeys.PERCEPTUAL_HASH_INT)
+            if hash_int is None and doc.get(ElasticDocKeys.PERCEPTUAL_HASH):
+                hash_int = int(doc[ElasticDocKeys.PERCEPTUAL_HASH], 16)
+            if hash_int is None:
+                continue
+            hashes.append(int(hash_int))
+            rows.append({key: doc[key] for key in FrameHashIndex.ROW_FIELDS if key in doc})
+        return FrameHashIndex(HammingIndex(np.asarray(hashes, dtype=np.uint64)), rows)
+
+    @staticmethod
+    async def from_elasticsearch(es_client, index_name: str, batch_size: int = 5000) -> "FrameHashIndex":
+        documents = []
+        async for hit in async_scan(
+            es_client,
+            index=index_name,
+            query={"query": {"exists": {"field": ElasticDocKeys.PERCEPTUAL_HASH_INT}}},
+            _source=[*FrameHashIndex.ROW_FIELDS, ElasticDocKeys.PERCEPTUAL_HASH_INT],
+            size=batch_size,
+        ):
+            documents.append(hit["_source"])
+        return FrameHashIndex.from_documents(documents)
+
+    @staticmethod
+    def iter_jsonl_documents(documents_dir: Path) -> Iterator[Dict[str, Any]]:
+        for jsonl_file in sorted(documents_dir.rglob("*_video_frames.jsonl")):
+            with open(jsonl_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def search(self, hash_int: int, max_distance: int, limit: int) -> List[Dict[str, Any]]:
+        rows, distances = self.__index.search(hash_int, max_distance)
+        results = []
+        for row, distance in zip(rows[:limit], distances[:limit]):
+            result = dict(self.__rows[row])
+            result[self.DISTANCE_KEY] = int(distance)
+            results.append(result)
+        return results
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".npz.tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(f, **self.__index.to_arrays())
+        temp_path.replace(path)
+        atomic_write_json(self.__rows_path(path), self.__rows, ensure_ascii=False)
+
+    @staticmethod
+    def load(path: Path) -> "FrameHashIndex":
+        with np.load(path) as arrays:
+            index = HammingIndex.from_arrays({name: arrays[name] for name in arrays.files})
+        with open(FrameHashIndex.__rows_path(path), "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        return FrameHashIndex(index, rows)
+
+    @staticmethod
+    def __rows_path(path: Path) -> Path:
+        return path.with_suffix(".rows.json")
@@ -17,6 +17,7 @@ from preprocessor.core.base_processor import (
     OutputSpec,
     ProcessingItem,
 )
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.core.output_path_builder import OutputPathBuilder
 from preprocessor.hashing.image_hasher import PerceptualHasher
@@ -29,6 +30,8 @@ from preprocessor.utils.metadata_utils import create_processing_metadata
 
 
 class ImageHashProcessor(BaseProcessor):
+    RESOURCE_CLASS = ResourceClass.GPU
+
     def __init__(self, args: Dict[str, Any]) -> None:
         super().__init__(
             args=args,
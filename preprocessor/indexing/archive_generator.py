@@ -17,6 +17,7 @@ from preprocessor.core.constants import (
     FILE_EXTENSIONS,
     FILE_SUFFIXES,
 )
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.utils.console import console
 
@@ -24,6 +25,8 @@ ELASTIC_SUBDIRS = settings.output_subdirs.elastic_document_subdirs
 
 
 class ArchiveGenerator(BaseProcessor):
+    RESOURCE_CLASS = ResourceClass.IO
+
     FOLDER_TO_FILE_SUFFIX = {
         ELASTIC_SUBDIRS.text_segments: "text_segments",
         ELASTIC_SUBDIRS.text_embeddings: "text_embeddings",
@@ -0,0 +1,142 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+import json
+import logging
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from elasticsearch import AsyncElasticsearch
+
+from bot.services.reindex.bulk_sender import (
+    BulkSender,
+    BulkSendResult,
+)
+from preprocessor.config.config import settings
+
+MB = 1024 * 1024
+
+
+@dataclass
+class BulkLoadStats:
+    documents_indexed: int = 0
+    documents_failed: int = 0
+    requests: int = 0
+    rejections: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _BulkChunk:
+    lines: List[bytes]
+
+
+class BulkLoader:
+    __MIN_CHUNK_BYTES = 1 * MB
+    __MAX_ERROR_SAMPLES = 10
+
+    def __init__(self, client: AsyncElasticsearch, logger: logging.Logger) -> None:
+        self.__client = client
+        self.__logger = logger
+        es_settings = settings.elasticsearch
+        self.__workers = max(1, es_settings.bulk_workers)
+        self.__max_chunk_bytes = int(es_settings.bulk_max_chunk_mb * MB)
+        self.__chunk_bytes = min(int(es_settings.bulk_chunk_mb * MB), self.__max_chunk_bytes)
+        self.__min_chunk_bytes = min(self.__MIN_CHUNK_BYTES, self.__chunk_bytes)
+        self.__target_latency = es_settings.bulk_target_latency_seconds
+        self.__sender = BulkSender(
+            client,
+            logger,
+            es_settings.bulk_max_retries,
+            request_timeout=max(60.0, self.__target_latency * 10),
+            on_rejected=lambda: self.__shrink(0.5),
+        )
+
+    async def load(self, index_name: str, jsonl_files: List[Path]) -> BulkLoadStats:
+        stats = BulkLoadStats()
+        queue: "asyncio.Queue[Optional[_BulkChunk]]" = asyncio.Queue(maxsize=self.__workers * 2)
+        chunks = self.__iter_chunks(index_name, jsonl_files)
+
+        replicas = await BulkSender.disable_refresh(self.__client, index_name)
+        workers = [asyncio.create_task(self.__worker(index_name, queue, stats)) for _ in range(self.__workers)]
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                await queue.put(chunk)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await BulkSender.restore_refresh(self.__client, index_name, replicas, self.__logger)
+
+        return stats
+
+    @staticmethod
+    def iter_sources(jsonl_files: List[Path]) -> Iterator[bytes]:
+        for jsonl_file in jsonl_files:
+            with open(jsonl_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield line
+
+    def __iter_chunks(self, index_name: str, jsonl_files: List[Path]) -> Iterator[_BulkChunk]:
+        action = json.dumps({"index": {"_index": index_name}}).encode("utf-8") + b"\n"
+        lines: List[bytes] = []
+        size = 0
+        for source in self.iter_sources(jsonl_files):
+            lines.append(action + source + b"\n")
+            size += len(action) + len(source) + 1
+            if size >= self.__chunk_bytes:
+                yield _BulkChunk(lines=lines)
+                lines, size = [], 0
+        if lines:
+            yield _BulkChunk(lines=lines)
+
+    async def __worker(self, index_name: str, queue: "asyncio.Queue[Optional[_BulkChunk]]", stats: BulkLoadStats) -> None:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return
+            try:
+                result = await self.__sender.send(index_name, chunk.lines)
+            except Exception as e:
+                self.__logger.error(f"Bulk request to {index_name} failed: {e}")
+                stats.documents_failed += len(chunk.lines)
+                continue
+            if result.requests:
+                self.__adapt(result.latency)
+            self.__record(result, stats)
+            if result.error is not None:
+                self.__logger.error(f"Bulk request to {index_name} failed: {result.error}")
+
+    def __record(self, result: BulkSendResult, stats: BulkLoadStats) -> None:
+        stats.documents_indexed += result.indexed
+        stats.documents_failed += result.failed
+        stats.requests += result.requests
+        stats.rejections += result.rejections
+        free_slots = self.__MAX_ERROR_SAMPLES - len(stats.errors)
+        if free_slots > 0:
+            stats.errors.extend(result.failures[:free_slots])
+
+    def __adapt(self, latency: float) -> None:
+        if latency > self.__target_latency:
+            self.__shrink(0.75)
+        else:
+            self.__chunk_bytes = min(self.__chunk_bytes + MB, self.__max_chunk_bytes)
+
+    def __shrink(self, factor: float) -> None:
+        self.__chunk_bytes = max(int(self.__chunk_bytes * factor), self.__min_chunk_bytes)
@@ -1,18 +1,23 @@
-import json
+from collections import Counter
+from itertools import chain
 import logging
 from pathlib import Path
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
+import numpy as np
+import orjson
+
 from bot.types import (
     CharacterDetectionInFrame,
     EpisodeMetadata,
     ObjectDetectionInFrame,
-    SceneTimestampsData,
 )
 from preprocessor.config.config import settings
 from preprocessor.core.base_processor import (
@@ -26,7 +31,10 @@ from preprocessor.core.constants import (
 )
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.core.output_path_builder import OutputPathBuilder
+from preprocessor.embeddings.embedding_store import EmbeddingStore
 from preprocessor.embeddings.episode_name_embedder import EpisodeNameEmbedder
+from preprocessor.indexing.scene_lookup import SceneLookup
+from preprocessor.search.vector_profile import get_vector_profile
 from preprocessor.utils.console import console
 from preprocessor.utils.constants import (
     CharacterDetectionKeys,
@@ -36,11 +44,11 @@ from preprocessor.utils.constants import (
     EmotionKeys,
     EpisodeMetadataKeys,
     ObjectDetectionKeys,
-    SceneKeys,
-    SceneTimeKeys,
 )
 
 ELASTIC_SUBDIRS = settings.output_subdirs.elastic_document_subdirs
+JSONL_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 class ElasticDocumentGenerator(BaseProcessor):
@@ -220,8 +228,7 @@ class ElasticDocumentGenerator(BaseProcessor):
             return
         trans_file_for_segments = clean_transcription_file
 
-        with open(trans_file_for_segments, "r", encoding="utf-8") as f:
-            transcription_data = json.load(f)
+        transcription_data = self.__read_json(trans_file_for_segments)
 
         episode_info_dict = transcription_data.get(EpisodeMetadataKeys.EPISODE_INFO, {})
         season = episode_info_dict.get(EpisodeMetadataKeys.SEASON)
@@ -240,7 +247,7 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_id = episode_info.episode_code()
         video_path = self.episode_manager.build_video_path_for_elastic(episode_info)
 
-        scene_timestamps = self.__load_scene_timestamps(episode_info)
+        scene_lookup = SceneLookup(EpisodeManager.load_scene_timestamps(episode_info, self.scene_timestamps_dir, self.logger))
         character_detections = self.__load_character_detections(episode_info)
         object_detections = self.__load_object_detections(episode_info)
 
@@ -250,7 +257,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                 episode_id,
                 episode_metadata,
                 video_path,
-                scene_timestamps,
+                scene_lookup,
                 season_dir,
                 base_name,
             )
@@ -259,15 +266,14 @@ class ElasticDocumentGenerator(BaseProcessor):
         sound_events_dir = trans_dir / settings.output_subdirs.transcription_subdirs.sound_events
         sound_events_json = sound_events_dir / f"{base_name}_sound_events.json"
         if sound_events_json.exists() and any("_sound_events.jsonl" in str(o.path) for o in missing_outputs):
-            with open(sound_events_json, "r", encoding="utf-8") as f:
-                sound_events_data = json.load(f)
+            sound_events_data = self.__read_json(sound_events_json)
 
             self.__generate_sound_events(
                 sound_events_data,
                 episode_id,
                 episode_metadata,
                 video_path,
-                scene_timestamps,
+                scene_lookup,
                 episode_info,
                 base_name,
             )
@@ -296,7 +302,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                     episode_id,
                     episode_metadata,
                     video_path,
-                    scene_timestamps,
+                    scene_lookup,
                     character_detections,
                     object_detections,
                     episode_info,
@@ -370,9 +376,6 @@ class ElasticDocumentGenerator(BaseProcessor):
             "viewership": metadata.get("viewership"),
         }
 
-    def __load_scene_timestamps(self, episode_info) -> Optional[SceneTimestampsData]:
-        return EpisodeManager.load_scene_timestamps(episode_info, self.scene_timestamps_dir, self.logger)
-
     def __load_character_detections(self, episode_info) -> Dict[int, List[CharacterDetectionInFrame]]:
         if not self.character_detections_dir:
             return {}
@@ -385,24 +388,23 @@ class ElasticDocumentGenerator(BaseProcessor):
             return {}
 
         try:
-            with open(detection_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self.__read_json(detection_file)
 
             detections_dict = {}
             for detection in data.get(DetectionKeys.DETECTIONS, []):
                 frame_number = detection.get(DetectionKeys.FRAME_NUMBER)
                 if frame_number is not None:
-                    detections_dict[frame_number] = detection.get(DetectionKeys.CHARACTERS, [])
+                    detections_dict[frame_number] = self.__format_characters(detection.get(DetectionKeys.CHARACTERS, []))
                 elif DetectionKeys.FRAME in detection:
                     frame_file = detection[DetectionKeys.FRAME]
-                    detections_dict[frame_file] = detection.get(DetectionKeys.CHARACTERS, [])
+                    detections_dict[frame_file] = self.__format_characters(detection.get(DetectionKeys.CHARACTERS, []))
 
             return detections_dict
         except Exception as e:
             self.logger.error(f"Error loading character detections: {e}")
             return {}
 
-    def __load_object_detections(self, episode_info) -> Dict[str, List[ObjectDetectionInFrame]]:
+    def __load_object_detections(self, episode_info) -> Dict[str, List[Dict[str, Any]]]:
         if not self.object_detections_dir:
             return {}
 
@@ -414,13 +416,12 @@ class ElasticDocumentGenerator(BaseProcessor):
             return {}
 
         try:
-            with open(detection_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self.__read_json(detection_file)
 
             detections_dict = {}
             for frame_data in data.get(DetectionKeys.DETECTIONS, []):
                 frame_name = frame_data[DetectionKeys.FRAME_NAME]
-                detections_dict[frame_name] = frame_data.get(DetectionKeys.DETECTIONS, [])
+                detections_dict[frame_name] = self.__summarize_objects(frame_data.get(DetectionKeys.DETECTIONS, []))
 
             return detections_dict
         except Exception as e:
@@ -428,12 +429,7 @@ class ElasticDocumentGenerator(BaseProcessor):
             return {}
 
     @staticmethod
-    def __get_characters_for_frame(
-        frame_identifier,
-        character_detections: Dict[int, List[CharacterDetectionInFrame]],
-    ) -> List[CharacterDetectionInFrame]:
-        characters = character_detections.get(frame_identifier, [])
-
+    def __format_characters(characters: List[CharacterDetectionInFrame]) -> List[CharacterDetectionInFrame]:
         character_list = []
         for char in characters:
             char_data = {
@@ -452,41 +448,27 @@ class ElasticDocumentGenerator(BaseProcessor):
         return character_list
 
     @staticmethod
-    def __get_objects_for_frame(frame_name: str, object_detections: Dict[str, List[ObjectDetectionInFrame]]) -> List[Dict[str, Any]]:
-        detections = object_detections.get(frame_name, [])
-        objects_summary = {}
-        for det in detections:
-            class_name = det[ObjectDetectionKeys.CLASS_NAME]
-            if class_name in objects_summary:
-                objects_summary[class_name] += 1
-            else:
-                objects_summary[class_name] = 1
-
+    def __summarize_objects(detections: List[ObjectDetectionInFrame]) -> List[Dict[str, Any]]:
+        objects_summary = Counter(det[ObjectDetectionKeys.CLASS_NAME] for det in detections)
         return [{"class": cls, "count": cnt} for cls, cnt in objects_summary.items()]
 
     @staticmethod
-    def __find_scene_for_timestamp(timestamp: float, scene_timestamps: Optional[SceneTimestampsData]) -> Optional[Dict[str, Any]]:
-        if not scene_timestamps or SceneKeys.SCENES not in scene_timestamps:
-            return None
+    def __read_json(path: Path) -> Any:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
 
-        scenes = scene_timestamps[SceneKeys.SCENES]
-        for scene in scenes:
-            start_time = scene[SceneKeys.START][SceneTimeKeys.SECONDS]
-            end_time = scene[SceneKeys.END][SceneTimeKeys.SECONDS]
-
-            if start_time is None or end_time is None:
-                continue
-
-            if start_time <= timestamp < end_time:
-                return {
-                    SceneKeys.SCENE_NUMBER: scene[SceneKeys.SCENE_NUMBER],
-                    SceneKeys.SCENE_START_TIME: start_time,
-                    SceneKeys.SCENE_END_TIME: end_time,
-                    SceneKeys.SCENE_START_FRAME: scene[SceneKeys.START][SceneTimeKeys.FRAME],
-                    SceneKeys.SCENE_END_FRAME: scene[SceneKeys.END][SceneTimeKeys.FRAME],
-                }
+    @staticmethod
+    def __open_jsonl(output_file: Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        return open(output_file, "wb", buffering=WRITE_BUFFER_SIZE)
 
-        return None
+    @staticmethod
+    def __peek_embeddings(json_path: Path, results_key: str) -> Optional[Iterator[Tuple[Dict[str, Any], Optional[np.ndarray]]]]:
+        embeddings = EmbeddingStore.iter_embeddings(json_path, results_key)
+        first = next(embeddings, None)
+        if first is None:
+            return None
+        return chain([first], embeddings)
 
     def __generate_segments(  # pylint: disable=too-many-locals
         self,
@@ -494,7 +476,7 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_id: str,
         episode_metadata: EpisodeMetadata,
         video_path: str,
-        scene_timestamps: Optional[SceneTimestampsData],
+        scene_lookup: SceneLookup,
         season_dir: str,
         base_name: str,
     ) -> None:
@@ -516,9 +498,7 @@ class ElasticDocumentGenerator(BaseProcessor):
             filename = f"{base_name}{FILE_SUFFIXES['text_segments']}{FILE_EXTENSIONS['jsonl']}"
             output_file = self.output_dir / ELASTIC_SUBDIRS.text_segments / season_dir / filename
 
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
+        with self.__open_jsonl(output_file) as f:
             for i, segment in enumerate(segments):
                 text = segment.get("text", "").strip()
                 if not text:
@@ -534,7 +514,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                     end_time = segment.get("end", 0.0)
                     speaker = segment.get("speaker", "unknown")
 
-                scene_info = self.__find_scene_for_timestamp(start_time, scene_timestamps)
+                scene_info = scene_lookup.find(start_time)
 
                 doc = {
                     "episode_id": episode_id,
@@ -550,7 +530,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                 if scene_info:
                     doc[ElasticDocKeys.SCENE_INFO] = scene_info
 
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
 
         console.print(f"[green]Generated {len(segments)} segment documents → {output_file.name}[/green]")
 
@@ -560,7 +540,7 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_id: str,
         episode_metadata: EpisodeMetadata,
         video_path: str,
-        scene_timestamps: Optional[SceneTimestampsData],
+        scene_lookup: SceneLookup,
         episode_info,
         base_name: str,
     ) -> None:
@@ -573,9 +553,7 @@ class ElasticDocumentGenerator(BaseProcessor):
             f"{settings.output_subdirs.elastic_documents}/{ELASTIC_SUBDIRS.sound_events}",
             f"{base_name}_sound_events.jsonl",
         )
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
+        with self.__open_jsonl(output_file) as f:
             for i, segment in enumerate(segments):
                 if "text" not in segment:
                     continue
@@ -588,7 +566,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                     start_time = words[0].get("start") or 0.0
                     end_time = words[-1].get("end") or 0.0
 
-                scene_info = self.__find_scene_for_timestamp(start_time, scene_timestamps)
+                scene_info = scene_lookup.find(start_time)
 
                 doc = {
                     "episode_id": episode_id,
@@ -604,7 +582,7 @@ class ElasticDocumentGenerator(BaseProcessor):
                 if scene_info:
                     doc[ElasticDocKeys.SCENE_INFO] = scene_info
 
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
 
         console.print(f"[green]Generated {len(segments)} sound event documents → {output_file.name}[/green]")
 
@@ -617,11 +595,8 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_info,
         base_name: str,
     ) -> None:
-        with open(text_emb_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        text_embeddings = data.get("text_embeddings", [])
-        if not text_embeddings:
+        text_embeddings = self.__peek_embeddings(text_emb_file, "text_embeddings")
+        if text_embeddings is None:
             return
 
         output_file = self.episode_manager.build_episode_output_path(
@@ -629,15 +604,13 @@ class ElasticDocumentGenerator(BaseProcessor):
             f"{settings.output_subdirs.elastic_documents}/{ELASTIC_SUBDIRS.text_embeddings}",
             f"{base_name}_text_embeddings.jsonl",
         )
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            for i, emb in enumerate(text_embeddings):
+        generated = 0
+        with self.__open_jsonl(output_file) as f:
+            for i, (emb, embedding) in enumerate(text_embeddings):
                 segment_range = emb.get("segment_range", [])
                 text = emb.get("text", "")
-                embedding = emb.get("embedding", [])
 
-                if not embedding:
+                if embedding is None:
                     continue
 
                 doc = {
@@ -646,13 +619,14 @@ class ElasticDocumentGenerator(BaseProcessor):
                     "embedding_id": i,
                     "segment_range": segment_range[0] if segment_range else 0,
                     "text": text,
-                    "text_embedding": embedding,
+                    **get_vector_profile().document_fields("text_embedding", embedding),
                     "video_path": video_path,
                 }
 
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
+                generated += 1
 
-        console.print(f"[green]Generated {len(text_embeddings)} text embedding documents → {output_file.name}[/green]")
+        console.print(f"[green]Generated {generated} text embedding documents → {output_file.name}[/green]")
 
     def __generate_video_frames( # pylint: disable=too-many-locals
         self,
@@ -660,17 +634,14 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_id: str,
         episode_metadata: EpisodeMetadata,
         video_path: str,
-        scene_timestamps: Optional[SceneTimestampsData],
+        scene_lookup: SceneLookup,
         character_detections: Dict[str, List[Dict[str, Any]]],
         object_detections: Dict[str, List[Dict[str, Any]]],
         episode_info,
         base_name: str,
     ) -> None:
-        with open(video_emb_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        video_embeddings = data.get("video_embeddings", [])
-        if not video_embeddings:
+        video_embeddings = self.__peek_embeddings(video_emb_file, "video_embeddings")
+        if video_embeddings is None:
             return
 
         output_file = self.episode_manager.build_episode_output_path(
@@ -678,18 +649,16 @@ class ElasticDocumentGenerator(BaseProcessor):
             f"{settings.output_subdirs.elastic_documents}/{ELASTIC_SUBDIRS.video_frames}",
             f"{base_name}_video_frames.jsonl",
         )
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            for emb in video_embeddings:
+        generated = 0
+        with self.__open_jsonl(output_file) as f:
+            for emb, embedding in video_embeddings:
                 frame_number = emb.get(EmbeddingKeys.FRAME_NUMBER)
                 timestamp = emb.get(EmbeddingKeys.TIMESTAMP)
-                embedding = emb.get(EmbeddingKeys.EMBEDDING)
 
                 if embedding is None or timestamp is None:
                     continue
 
-                scene_info = self.__find_scene_for_timestamp(timestamp, scene_timestamps)
+                scene_info = scene_lookup.find(timestamp)
 
                 perceptual_hash = emb.get(EmbeddingKeys.PERCEPTUAL_HASH)
                 frame_path = emb.get(EmbeddingKeys.FRAME_PATH, f"frame_{frame_number:06d}.jpg" if frame_number is not None else "")
@@ -701,17 +670,17 @@ class ElasticDocumentGenerator(BaseProcessor):
                     "timestamp": timestamp,
                     "frame_type": emb.get("type", "unknown"),
                     "video_path": video_path,
-                    "video_embedding": embedding,
+                    **get_vector_profile().document_fields("video_embedding", embedding),
                 }
 
                 if frame_number is not None:
-                    characters = self.__get_characters_for_frame(frame_number, character_detections)
+                    characters = character_detections.get(frame_number)
                     if characters:
                         doc[ElasticDocKeys.CHARACTER_APPEARANCES] = characters
 
                 if frame_path:
                     frame_name = Path(frame_path).name if isinstance(frame_path, str) else frame_path
-                    objects = self.__get_objects_for_frame(frame_name, object_detections)
+                    objects = object_detections.get(frame_name)
                     if objects:
                         doc[ElasticDocKeys.DETECTED_OBJECTS] = objects
 
@@ -728,9 +697,10 @@ class ElasticDocumentGenerator(BaseProcessor):
                 if scene_info:
                     doc[ElasticDocKeys.SCENE_INFO] = scene_info
 
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
+                generated += 1
 
-        console.print(f"[green]Generated {len(video_embeddings)} video frame documents → {output_file.name}[/green]")
+        console.print(f"[green]Generated {generated} video frame documents → {output_file.name}[/green]")
 
     def __generate_episode_name_document(
         self,
@@ -760,8 +730,8 @@ class ElasticDocumentGenerator(BaseProcessor):
             "video_path": video_path,
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
 
         console.print(f"[green]Generated episode name document → {output_file.name}[/green]")
 
@@ -774,8 +744,7 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_info,
         base_name: str,
     ) -> None:
-        with open(text_stats_file, "r", encoding="utf-8") as f:
-            stats_data = json.load(f)
+        stats_data = self.__read_json(text_stats_file)
 
         basic_stats = stats_data.get("basic_statistics", {})
         advanced_stats = stats_data.get("advanced_statistics", {})
@@ -803,8 +772,8 @@ class ElasticDocumentGenerator(BaseProcessor):
             "trigrams": stats_data.get("trigrams", [])[:10],
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
 
         console.print(f"[green]Generated text statistics document → {output_file.name}[/green]")
 
@@ -817,8 +786,7 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_info,
         base_name: str,
     ) -> None:
-        with open(full_episode_emb_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self.__read_json(full_episode_emb_file)
 
         full_episode_embedding_data = data.get("full_episode_embedding", {})
         if not full_episode_embedding_data or "embedding" not in full_episode_embedding_data:
@@ -840,8 +808,8 @@ class ElasticDocumentGenerator(BaseProcessor):
             "video_path": video_path,
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
 
         console.print(f"[green]Generated full episode embedding document → {output_file.name}[/green]")
 
@@ -854,11 +822,8 @@ class ElasticDocumentGenerator(BaseProcessor):
         episode_info,
         base_name: str,
     ) -> None:
-        with open(sound_event_emb_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        sound_event_embeddings = data.get("sound_event_embeddings", [])
-        if not sound_event_embeddings:
+        sound_event_embeddings = self.__peek_embeddings(sound_event_emb_file, "sound_event_embeddings")
+        if sound_event_embeddings is None:
             return
 
         output_file = self.episode_manager.build_episode_output_path(
@@ -866,18 +831,16 @@ class ElasticDocumentGenerator(BaseProcessor):
             f"{settings.output_subdirs.elastic_documents}/{ELASTIC_SUBDIRS.sound_event_embeddings}",
             f"{base_name}_sound_event_embeddings.jsonl",
         )
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            for i, emb in enumerate(sound_event_embeddings):
+        generated = 0
+        with self.__open_jsonl(output_file) as f:
+            for i, (emb, embedding) in enumerate(sound_event_embeddings):
                 segment_range = emb.get("segment_range", [])
                 text = emb.get("text", "")
-                embedding = emb.get("embedding", [])
                 sound_types = emb.get("sound_types", [])
                 start_time = emb.get("start_time", 0.0)
                 end_time = emb.get("end_time", 0.0)
 
-                if not embedding:
+                if embedding is None:
                     continue
 
                 if isinstance(segment_range, list) and len(segment_range) == 2:
@@ -892,10 +855,11 @@ class ElasticDocumentGenerator(BaseProcessor):
                     "sound_types": sound_types,
                     "start_time": start_time,
                     "end_time": end_time,
-                    "sound_event_embedding": embedding,
+                    "sound_event_embedding": np.asarray(embedding, dtype=np.float32),
                     "video_path": video_path,
                 }
 
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(doc, option=JSONL_OPTIONS))
+                generated += 1
 
-        console.print(f"[green]Generated {len(sound_event_embeddings)} sound event embedding documents → {output_file.name}[/green]")
+        console.print(f"[green]Generated {generated} sound event embedding documents → {output_file.name}[/green]")
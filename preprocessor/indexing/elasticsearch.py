@@ -7,18 +7,15 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
-    List,
 )
 
 from elasticsearch import exceptions as es_exceptions
-from elasticsearch.helpers import (
-    BulkIndexError,
-    async_bulk,
-)
 
+from bot.search.vector_profile import VectorProfile
 from preprocessor.config.config import settings
 from preprocessor.core.base_processor import BaseProcessor
 from preprocessor.core.episode_manager import EpisodeManager
+from preprocessor.indexing.bulk_loader import BulkLoader
 from preprocessor.search.elastic_manager import ElasticSearchManager
 from preprocessor.utils.console import console
 
@@ -50,7 +47,10 @@ class ElasticSearchIndexer(BaseProcessor):
 
     @staticmethod
     def __sanitize_error_for_logging(error: Dict[str, Any]) -> Dict[str, Any]:
-        vector_keys = {"text_embedding", "video_embedding", "title_embedding", "embedding"}
+        vector_keys = {
+            "text_embedding", "video_embedding", "title_embedding", "embedding",
+            f"text_embedding{VectorProfile.FULL_VECTOR_SUFFIX}", f"video_embedding{VectorProfile.FULL_VECTOR_SUFFIX}",
+        }
 
         def _truncate_vectors(obj):
             if isinstance(obj, dict):
@@ -137,8 +137,8 @@ class ElasticSearchIndexer(BaseProcessor):
     async def __create_index(self, index_name: str, doc_type: str) -> None:
         mappings = {
             ELASTIC_SUBDIRS.text_segments: ElasticSearchManager.SEGMENTS_INDEX_MAPPING,
-            ELASTIC_SUBDIRS.text_embeddings: ElasticSearchManager.TEXT_EMBEDDINGS_INDEX_MAPPING,
-            ELASTIC_SUBDIRS.video_frames: ElasticSearchManager.VIDEO_EMBEDDINGS_INDEX_MAPPING,
+            ELASTIC_SUBDIRS.text_embeddings: ElasticSearchManager.text_embeddings_index_mapping(),
+            ELASTIC_SUBDIRS.video_frames: ElasticSearchManager.video_embeddings_index_mapping(),
             ELASTIC_SUBDIRS.episode_names: ElasticSearchManager.EPISODE_NAMES_INDEX_MAPPING,
             ELASTIC_SUBDIRS.full_episode_embeddings: ElasticSearchManager.FULL_EPISODE_EMBEDDINGS_INDEX_MAPPING,
             ELASTIC_SUBDIRS.sound_events: ElasticSearchManager.SOUND_EVENTS_INDEX_MAPPING,
@@ -178,73 +178,40 @@ class ElasticSearchIndexer(BaseProcessor):
             raise
 
     async def __index_documents(self, doc_type: str, index_name: str) -> None:
-        jsonl_files = list(self.elastic_documents_dir.glob(f"{doc_type}/**/*.jsonl"))
+        jsonl_files = sorted(self.elastic_documents_dir.glob(f"{doc_type}/**/*.jsonl"))
 
         if not jsonl_files:
             self.logger.info(f"No {doc_type} documents found. Skipping.")
             return
 
-        actions = self.__load_jsonl_files(jsonl_files, index_name)
+        console.print(f"[cyan]Streaming {len(jsonl_files)} {doc_type} files for indexing[/cyan]")
 
-        if not actions:
-            self.logger.info(f"No {doc_type} documents to index.")
+        if self.dry_run:
+            count = 0
+            for source in BulkLoader.iter_sources(jsonl_files):
+                if count == 0:
+                    sample = json.dumps(json.loads(source), indent=2, ensure_ascii=False)[:500]
+                    self.logger.info(f"Sample document:\n{sample}...")
+                count += 1
+            self.logger.info(f"Dry-run: would index {count} documents to '{index_name}'")
             return
 
-        console.print(f"[cyan]Prepared {len(actions)} {doc_type} documents for indexing[/cyan]")
+        stats = await BulkLoader(self.client, self.logger).load(index_name, jsonl_files)
+        if stats.documents_indexed == 0 and stats.documents_failed == 0:
+            self.logger.info(f"No {doc_type} documents to index.")
+            return
 
-        if self.dry_run:
-            self.logger.info(f"Dry-run: would index {len(actions)} documents to '{index_name}'")
-            if actions:
-                sample = json.dumps(actions[0], indent=2, ensure_ascii=False)[:500]
-                self.logger.info(f"Sample document:\n{sample}...")
-        else:
-            try:
-                await async_bulk(
-                    self.client,
-                    actions,
-                    chunk_size=50,
-                    max_chunk_bytes=5 * 1024 * 1024,
-                )
-                console.print(f"[green]✓ Indexed {len(actions)} {doc_type} documents → {index_name}[/green]")
-            except BulkIndexError as e:
-                self.logger.error(f"Bulk indexing failed: {len(e.errors)} errors.")
-                for error in e.errors[:3]:
-                    sanitized = self.__sanitize_error_for_logging(error)
-                    self.logger.error(f"Failed document: {json.dumps(sanitized, indent=2)}")
-                if len(e.errors) > 10:
-                    self.logger.error(f"... and {len(e.errors) - 10} more errors")
-
-    def __load_jsonl_files(self, jsonl_files: List[Path], index_name: str) -> List[Dict[str, Any]]:
-        actions = []
-
-        for jsonl_file in jsonl_files:
-            self.logger.info(f"Loading {jsonl_file.name}")
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        doc = json.loads(line)
-                        actions.append({
-                            "_index": index_name,
-                            "_source": doc,
-                        })
-
-        return actions
-
-    def _load_jsonl_documents(self, doc_dir: Path, index_name: str) -> List[Dict[str, Any]]:
-        actions = []
-
-        for jsonl_file in doc_dir.rglob("*.jsonl"):
-            self.logger.info(f"Loading {jsonl_file.name}")
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        doc = json.loads(line)
-                        actions.append({
-                            "_index": index_name,
-                            "_source": doc,
-                        })
-
-        return actions
+        console.print(
+            f"[green]✓ Indexed {stats.documents_indexed} {doc_type} documents → {index_name} "
+            f"({stats.requests} bulk requests, {stats.rejections} rejections)[/green]",
+        )
+        if stats.documents_failed:
+            self.logger.error(f"Bulk indexing failed: {stats.documents_failed} errors.")
+            for error in stats.errors[:3]:
+                sanitized = self.__sanitize_error_for_logging(error)
+                self.logger.error(f"Failed document: {json.dumps(sanitized, indent=2)}")
+            if stats.documents_failed > 3:
+                self.logger.error(f"... and {stats.documents_failed - 3} more errors")
 
     async def __print_sample_document(self, index_name: str) -> None:
         try:  # pylint: disable=too-many-try-statements
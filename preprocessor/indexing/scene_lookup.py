@@ -0,0 +1,42 @@
+from bisect import bisect_right
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from bot.types import SceneTimestampsData
+from preprocessor.utils.constants import (
+    SceneKeys,
+    SceneTimeKeys,
+)
+
+
+class SceneLookup:
+    def __init__(self, scene_timestamps: Optional[SceneTimestampsData]) -> None:
+        scenes = []
+        if scene_timestamps and SceneKeys.SCENES in scene_timestamps:
+            for scene in scene_timestamps[SceneKeys.SCENES]:
+                start_time = scene[SceneKeys.START][SceneTimeKeys.SECONDS]
+                end_time = scene[SceneKeys.END][SceneTimeKeys.SECONDS]
+                if start_time is None or end_time is None:
+                    continue
+                scenes.append((start_time, end_time, {
+                    SceneKeys.SCENE_NUMBER: scene[SceneKeys.SCENE_NUMBER],
+                    SceneKeys.SCENE_START_TIME: start_time,
+                    SceneKeys.SCENE_END_TIME: end_time,
+                    SceneKeys.SCENE_START_FRAME: scene[SceneKeys.START][SceneTimeKeys.FRAME],
+                    SceneKeys.SCENE_END_FRAME: scene[SceneKeys.END][SceneTimeKeys.FRAME],
+                }))
+
+        scenes.sort(key=lambda scene: scene[0])
+        self.__starts: List[float] = [scene[0] for scene in scenes]
+        self.__ends: List[float] = [scene[1] for scene in scenes]
+        self.__infos: List[Dict[str, Any]] = [scene[2] for scene in scenes]
+
+    def find(self, timestamp: float) -> Optional[Dict[str, Any]]:
+        idx = bisect_right(self.__starts, timestamp) - 1
+        if idx < 0 or timestamp >= self.__ends[idx]:
+            return None
+        return self.__infos[idx]
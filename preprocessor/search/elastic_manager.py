@@ -1,4 +1,8 @@
 import json
+from typing import (
+    Any,
+    Dict,
+)
 
 from elasticsearch import (
     AsyncElasticsearch,
@@ -7,6 +11,7 @@ from elasticsearch import (
 import urllib3
 
 from preprocessor.config.config import settings
+from preprocessor.search.vector_profile import get_vector_profile
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -145,90 +150,84 @@ class ElasticSearchManager:
         },
     }
 
-    TEXT_EMBEDDINGS_INDEX_MAPPING: json = {
-        "mappings": {
-            "properties": {
-                "episode_id": {"type": "keyword"},
-                "episode_metadata": {
-                    "properties": {
-                        "season": {"type": "integer"},
-                        "episode_number": {"type": "integer"},
-                        "title": {"type": "text"},
-                        "premiere_date": {"type": "date", "format": "dd.MM.yyyy||d.MM.yyyy||d.M.yyyy||yyyy-MM-dd||strict_date_optional_time||epoch_millis"},
-                        "series_name": {"type": "keyword"},
+    @staticmethod
+    def text_embeddings_index_mapping() -> Dict[str, Any]:
+        return {
+            "mappings": {
+                "properties": {
+                    "episode_id": {"type": "keyword"},
+                    "episode_metadata": {
+                        "properties": {
+                            "season": {"type": "integer"},
+                            "episode_number": {"type": "integer"},
+                            "title": {"type": "text"},
+                            "premiere_date": {"type": "date", "format": "dd.MM.yyyy||d.MM.yyyy||d.M.yyyy||yyyy-MM-dd||strict_date_optional_time||epoch_millis"},
+                            "series_name": {"type": "keyword"},
+                        },
                     },
+                    "embedding_id": {"type": "integer"},
+                    "segment_range": {"type": "integer"},
+                    "text": {"type": "text"},
+                    **get_vector_profile().mapping_properties("text_embedding"),
+                    "video_path": {"type": "keyword"},
                 },
-                "embedding_id": {"type": "integer"},
-                "segment_range": {"type": "integer"},
-                "text": {"type": "text"},
-                "text_embedding": {
-                    "type": "dense_vector",
-                    "dims": settings.embedding_model.embedding_dim,
-                    "index": True,
-                    "similarity": "cosine",
-                },
-                "video_path": {"type": "keyword"},
             },
-        },
-    }
+        }
 
-    VIDEO_EMBEDDINGS_INDEX_MAPPING: json = {
-        "mappings": {
-            "properties": {
-                "episode_id": {"type": "keyword"},
-                "episode_metadata": {
-                    "properties": {
-                        "season": {"type": "integer"},
-                        "episode_number": {"type": "integer"},
-                        "title": {"type": "text"},
-                        "premiere_date": {"type": "date", "format": "dd.MM.yyyy||d.MM.yyyy||d.M.yyyy||yyyy-MM-dd||strict_date_optional_time||epoch_millis"},
-                        "series_name": {"type": "keyword"},
+    @staticmethod
+    def video_embeddings_index_mapping() -> Dict[str, Any]:
+        return {
+            "mappings": {
+                "properties": {
+                    "episode_id": {"type": "keyword"},
+                    "episode_metadata": {
+                        "properties": {
+                            "season": {"type": "integer"},
+                            "episode_number": {"type": "integer"},
+                            "title": {"type": "text"},
+                            "premiere_date": {"type": "date", "format": "dd.MM.yyyy||d.MM.yyyy||d.M.yyyy||yyyy-MM-dd||strict_date_optional_time||epoch_millis"},
+                            "series_name": {"type": "keyword"},
+                        },
                     },
-                },
-                "frame_number": {"type": "integer"},
-                "timestamp": {"type": "float"},
-                "frame_type": {"type": "keyword"},
-                "scene_number": {"type": "integer"},
-                "video_embedding": {
-                    "type": "dense_vector",
-                    "dims": settings.embedding_model.embedding_dim,
-                    "index": True,
-                    "similarity": "cosine",
-                },
-                "perceptual_hash": {"type": "keyword"},
-                "perceptual_hash_int": {"type": "unsigned_long"},
-                "video_path": {"type": "keyword"},
-                "character_appearances": {
-                    "type": "nested",
-                    "properties": {
-                        "name": {"type": "keyword"},
-                        "confidence": {"type": "float"},
-                        "emotion": {
-                            "properties": {
-                                "label": {"type": "keyword"},
-                                "confidence": {"type": "float"},
+                    "frame_number": {"type": "integer"},
+                    "timestamp": {"type": "float"},
+                    "frame_type": {"type": "keyword"},
+                    "scene_number": {"type": "integer"},
+                    **get_vector_profile().mapping_properties("video_embedding"),
+                    "perceptual_hash": {"type": "keyword"},
+                    "perceptual_hash_int": {"type": "unsigned_long"},
+                    "video_path": {"type": "keyword"},
+                    "character_appearances": {
+                        "type": "nested",
+                        "properties": {
+                            "name": {"type": "keyword"},
+                            "confidence": {"type": "float"},
+                            "emotion": {
+                                "properties": {
+                                    "label": {"type": "keyword"},
+                                    "confidence": {"type": "float"},
+                                },
                             },
                         },
                     },
-                },
-                "detected_objects": {
-                    "type": "nested",
-                    "properties": {
-                        "class": {"type": "keyword"},
-                        "count": {"type": "integer"},
+                    "detected_objects": {
+                        "type": "nested",
+                        "properties": {
+                            "class": {"type": "keyword"},
+                            "count": {"type": "integer"},
+                        },
                     },
-                },
-                "scene_info": {
-                    "properties": {
-                        "scene_start_time": {"type": "float"},
-                        "scene_end_time": {"type": "float"},
-                        "scene_start_frame": {"type": "integer"},
-                        "scene_end_frame": {"type": "integer"},
+                    "scene_info": {
+                        "properties": {
+                            "scene_start_time": {"type": "float"},
+                            "scene_end_time": {"type": "float"},
+                            "scene_start_frame": {"type": "integer"},
+                            "scene_end_frame": {"type": "integer"},
+                        },
                     },
                 },
             },
-        },
-    }
+        }
 
     EPISODE_NAMES_INDEX_MAPPING: json = {
         "mappings": {
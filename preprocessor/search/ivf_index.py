@@ -0,0 +1,141 @@
+import json
+import os
+from pathlib import Path
+import shutil
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from bot.search.ivf_index import (
+    CENTROIDS_FILE,
+    EPISODE_IDS_FILE,
+    KEYS_FILE,
+    META_FILE,
+    OFFSETS_FILE,
+    VECTORS_FILE,
+)
+from preprocessor.utils.console import console
+
+
+class IvfIndexBuilder:
+    __ASSIGN_BATCH = 8192
+
+    def __init__(self, nlist: int = 0, iterations: int = 20, train_per_list: int = 64, seed: int = 0) -> None:
+        self.__nlist = nlist
+        self.__iterations = iterations
+        self.__train_per_list = train_per_list
+        self.__rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def collect(rows: Iterable[Tuple[str, int, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        episode_ids: List[str] = []
+        keys: List[int] = []
+        vectors: List[np.ndarray] = []
+        for episode_id, key, vector in rows:
+            episode_ids.append(episode_id)
+            keys.append(key)
+            vectors.append(np.asarray(vector, dtype=np.float16))
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float16), np.asarray(episode_ids, dtype=str), np.asarray(keys, dtype=np.int64)
+        return np.vstack(vectors), np.asarray(episode_ids, dtype=str), np.asarray(keys, dtype=np.int64)
+
+    def build(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        vectors = self.__normalize(vectors.astype(np.float32)).astype(np.float16)
+        nlist = self.__resolve_nlist(len(vectors))
+        centroids = self.__train(vectors, nlist)
+        assignments = self.__assign(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=nlist), out=offsets[1:])
+        return vectors[order], centroids, offsets, order
+
+    def __resolve_nlist(self, count: int) -> int:
+        nlist = self.__nlist or int(4 * np.sqrt(count))
+        return int(np.clip(nlist, 1, max(1, count)))
+
+    def __train(self, vectors: np.ndarray, nlist: int) -> np.ndarray:
+        sample_size = min(len(vectors), nlist * self.__train_per_list)
+        sample = vectors[self.__rng.choice(len(vectors), sample_size, replace=False)].astype(np.float32)
+        centroids = sample[self.__rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(self.__iterations):
+            assignments = self.__assign(sample, centroids)
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=nlist)
+            starts = np.cumsum(counts) - counts
+            filled = counts > 0
+            sums = np.empty_like(centroids)
+            sums[filled] = np.add.reduceat(sample[order], starts[filled], axis=0)
+            sums[~filled] = sample[self.__rng.choice(sample_size, int((~filled).sum()))]
+            centroids = self.__normalize(sums)
+        return centroids
+
+    def __assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), self.__ASSIGN_BATCH):
+            batch = vectors[start:start + self.__ASSIGN_BATCH].astype(np.float32)
+            assignments[start:start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+        return assignments
+
+    @staticmethod
+    def __normalize(vectors: np.ndarray) -> np.ndarray:
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+
+class IvfIndexWriter:
+    @staticmethod
+    def write(
+        output_dir: Path,
+        vectors: np.ndarray,
+        episode_ids: np.ndarray,
+        keys: np.ndarray,
+        meta: Dict[str, Any],
+        builder: Optional[IvfIndexBuilder] = None,
+    ) -> None:
+        builder = builder or IvfIndexBuilder()
+        sorted_vectors, centroids, offsets, order = builder.build(vectors)
+
+        version_dir = output_dir.with_name(f"{output_dir.name}.v{time.time_ns()}")
+        version_dir.mkdir(parents=True)
+        np.save(version_dir / VECTORS_FILE, sorted_vectors)
+        np.save(version_dir / CENTROIDS_FILE, centroids.astype(np.float32))
+        np.save(version_dir / OFFSETS_FILE, offsets)
+        np.save(version_dir / EPISODE_IDS_FILE, episode_ids[order])
+        np.save(version_dir / KEYS_FILE, keys[order])
+        with open(version_dir / META_FILE, "w", encoding="utf-8") as f:
+            json.dump({**meta, "count": len(sorted_vectors), "dims": int(sorted_vectors.shape[1]), "nlist": len(centroids)}, f, indent=2)
+
+        previous_dir = IvfIndexWriter.__publish(output_dir, version_dir)
+        IvfIndexWriter.__remove_stale_versions(output_dir, keep=(version_dir, previous_dir))
+        console.print(f"[green]{output_dir.name}: {len(sorted_vectors):,} vectors in {len(centroids)} lists[/green]")
+
+    @staticmethod
+    def __publish(output_dir: Path, version_dir: Path) -> Optional[Path]:
+        """Points output_dir at version_dir with a single rename of a symlink, so readers see either version whole."""
+        previous_dir = output_dir.resolve() if output_dir.is_symlink() else None
+        if output_dir.exists() and not output_dir.is_symlink():
+            # Indexes written before versioning are a plain directory, which a symlink cannot replace in place.
+            previous_dir = output_dir.with_name(f"{output_dir.name}.v0")
+            output_dir.replace(previous_dir)
+
+        link = output_dir.with_name(f"{output_dir.name}.link")
+        link.unlink(missing_ok=True)
+        link.symlink_to(version_dir.name, target_is_directory=True)
+        os.replace(link, output_dir)
+        return previous_dir
+
+    @staticmethod
+    def __remove_stale_versions(output_dir: Path, keep: Tuple[Optional[Path], ...]) -> None:
+        # The previous version stays until the next write, so a reader that resolved the old link can still load it.
+        kept = {path.resolve() for path in keep if path is not None}
+        for version_dir in output_dir.parent.glob(f"{output_dir.name}.v*"):
+            if version_dir.resolve() not in kept:
+                shutil.rmtree(version_dir, ignore_errors=True)
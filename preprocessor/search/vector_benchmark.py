@@ -0,0 +1,171 @@
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import (
+    async_bulk,
+    async_scan,
+)
+import numpy as np
+
+from bot.search.vector_profile import VectorProfile
+
+_BYTES_PER_DIM = {
+    "float": 4.0,
+    "int8": 1.0,
+    "int4": 0.5,
+    "bbq": 0.125,
+}
+
+
+@dataclass
+class VectorBenchmarkResult:
+    profile: str
+    recall: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    took_p50_ms: float
+    index_size_mb: float
+    vector_memory_mb: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class VectorBenchmark:
+    __DOC_ID = "doc_id"
+    __WARMUP_QUERIES = 10
+
+    def __init__(self, client: AsyncElasticsearch, field: str, k: int, index_prefix: str) -> None:
+        self.__client = client
+        self.__field = field
+        self.__k = k
+        self.__index_prefix = index_prefix
+
+    async def load_sample(self, index_name: str, size: int) -> np.ndarray:
+        full_field = f"{self.__field}{VectorProfile.FULL_VECTOR_SUFFIX}"
+        vectors = []
+        async for hit in async_scan(
+            self.__client,
+            index=index_name,
+            query={"query": {"match_all": {}}},
+            _source=[self.__field, full_field],
+            size=min(size, 2000),
+        ):
+            source = hit["_source"]
+            vector = source.get(full_field) or source.get(self.__field)
+            if vector:
+                vectors.append(vector)
+            if len(vectors) >= size:
+                break
+        return np.asarray(vectors, dtype=np.float32)
+
+    @staticmethod
+    def split(vectors: np.ndarray, num_queries: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        if len(vectors) <= num_queries:
+            raise ValueError(f"Need more than {num_queries} vectors to hold out queries, got {len(vectors)}")
+        order = np.random.default_rng(seed).permutation(len(vectors))
+        return vectors[order[num_queries:]], vectors[order[:num_queries]]
+
+    def ground_truth(self, corpus: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        similarities = self.__normalize(queries) @ self.__normalize(corpus).T
+        top = np.argpartition(-similarities, self.__k - 1, axis=1)[:, :self.__k]
+        return np.take_along_axis(top, np.argsort(-np.take_along_axis(similarities, top, axis=1), axis=1), axis=1)
+
+    async def run(self, profile: VectorProfile, corpus: np.ndarray, queries: np.ndarray, truth: np.ndarray, keep_index: bool = False) -> VectorBenchmarkResult:
+        index_name = self.__index_name(profile)
+        await self.__build_index(index_name, profile, corpus)
+        try:
+            for query in queries[:self.__WARMUP_QUERIES]:
+                await self.__search(index_name, profile, query)
+
+            latencies, took, recalls = [], [], []
+            for query, expected in zip(queries, truth):
+                started = time.perf_counter()
+                response = await self.__search(index_name, profile, query)
+                latencies.append((time.perf_counter() - started) * 1000)
+                took.append(response["took"])
+                found = {int(hit["_id"]) for hit in response["hits"]["hits"]}
+                recalls.append(len(found.intersection(expected.tolist())) / self.__k)
+
+            stats = await self.__client.indices.stats(index=index_name, metric="store")
+            index_bytes = stats["_all"]["primaries"]["store"]["size_in_bytes"]
+        finally:
+            if not keep_index:
+                await self.__client.indices.delete(index=index_name, ignore_unavailable=True)
+
+        return VectorBenchmarkResult(
+            profile=profile.label,
+            recall=float(np.mean(recalls)),
+            latency_p50_ms=float(np.percentile(latencies, 50)),
+            latency_p95_ms=float(np.percentile(latencies, 95)),
+            took_p50_ms=float(np.percentile(took, 50)),
+            index_size_mb=index_bytes / (1024 * 1024),
+            vector_memory_mb=len(corpus) * profile.dims * _BYTES_PER_DIM[profile.quantization] / (1024 * 1024),
+        )
+
+    async def __build_index(self, index_name: str, profile: VectorProfile, corpus: np.ndarray) -> None:
+        await self.__client.indices.delete(index=index_name, ignore_unavailable=True)
+        await self.__client.indices.create(
+            index=index_name,
+            settings={"number_of_shards": 1, "number_of_replicas": 0, "refresh_interval": "-1"},
+            mappings={
+                "properties": {
+                    self.__DOC_ID: {"type": "integer"},
+                    **profile.mapping_properties(self.__field),
+                },
+            },
+        )
+        await async_bulk(self.__client, self.__actions(index_name, profile, corpus), chunk_size=500)
+        await self.__client.indices.refresh(index=index_name)
+        await self.__client.indices.forcemerge(index=index_name, max_num_segments=1, request_timeout=3600)
+
+    def __actions(self, index_name: str, profile: VectorProfile, corpus: np.ndarray) -> Iterator[Dict[str, Any]]:
+        for doc_id, vector in enumerate(corpus):
+            fields = profile.document_fields(self.__field, vector)
+            yield {
+                "_index": index_name,
+                "_id": str(doc_id),
+                "_source": {
+                    self.__DOC_ID: doc_id,
+                    **{name: values.tolist() for name, values in fields.items()},
+                },
+            }
+
+    async def __search(self, index_name: str, profile: VectorProfile, query: np.ndarray) -> Dict[str, Any]:
+        return await self.__client.search(
+            index=index_name,
+            **profile.search_body(self.__field, query, self.__k),
+            size=self.__k,
+            _source=False,
+        )
+
+    def __index_name(self, profile: VectorProfile) -> str:
+        suffix = f"{profile.quantization}_{profile.dims}"
+        if profile.rescores:
+            suffix += f"_rescore{profile.rescore_oversample:g}".replace(".", "_")
+        return f"{self.__index_prefix}_{suffix}"
+
+    @staticmethod
+    def __normalize(vectors: np.ndarray) -> np.ndarray:
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    @staticmethod
+    def summary_rows(results: List[VectorBenchmarkResult]) -> List[str]:
+        rows = [f"{'profile':<24} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8} {'took':>6} {'disk MB':>9} {'vec MB':>8}"]
+        for result in results:
+            rows.append(
+                f"{result.profile:<24} {result.recall:>7.3f} {result.latency_p50_ms:>8.1f} {result.latency_p95_ms:>8.1f}"
+                f" {result.took_p50_ms:>6.0f} {result.index_size_mb:>9.1f} {result.vector_memory_mb:>8.1f}",
+            )
+        return rows
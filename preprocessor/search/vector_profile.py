@@ -0,0 +1,15 @@
+from functools import lru_cache
+
+from bot.search.vector_profile import VectorProfile
+from preprocessor.config.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_vector_profile() -> VectorProfile:
+    es_settings = settings.elasticsearch
+    return VectorProfile(
+        quantization=es_settings.vector_quantization,
+        dims=es_settings.vector_dims,
+        rescore_oversample=es_settings.vector_rescore_oversample,
+        full_dims=settings.embedding_model.embedding_dim,
+    )
@@ -0,0 +1,4 @@
+import importlib.util
+
+# The E2E job installs only the bot's requirements; these tests need the preprocessor's own.
+collect_ignore_glob = [] if all(importlib.util.find_spec(name) for name in ("orjson", "rich")) else ["test_*.py"]
@@ -0,0 +1,53 @@
+import pytest
+
+from preprocessor.core.constants import (
+    FILE_EXTENSIONS,
+    FILE_SUFFIXES,
+)
+from preprocessor.indexing.archive_generator import (
+    ELASTIC_SUBDIRS,
+    ArchiveGenerator,
+)
+
+
+def _write_segments(docs_dir, season: int, episode: int) -> None:
+    episode_dir = docs_dir / ELASTIC_SUBDIRS.text_segments / f"S{season:02d}" / f"E{episode:02d}"
+    episode_dir.mkdir(parents=True)
+    segments_file = episode_dir / f"ranczo_S{season:02d}E{episode:02d}{FILE_SUFFIXES['text_segments']}{FILE_EXTENSIONS['jsonl']}"
+    segments_file.write_text("{}\n", encoding="utf-8")
+
+
+def _archives(output_dir):
+    return sorted(path.name for path in output_dir.rglob("*.zip"))
+
+
+@pytest.mark.quick
+class TestArchiveGeneratorEpisodeSelection:
+
+    def test_episode_filter_option_does_not_break_processing(self, tmp_path):
+        _write_segments(tmp_path / "docs", 1, 3)
+        generator = ArchiveGenerator({
+            "elastic_documents_dir": tmp_path / "docs",
+            "output_dir": tmp_path / "out",
+            "series_name": "ranczo",
+            "allow_partial": True,
+            "season_filter": 1,
+            "episode_filter": 3,
+        })
+
+        assert generator.work() == 0
+        assert _archives(tmp_path / "out") == ["ranczo_S01E03.zip"]
+
+    def test_episode_batch_limits_processed_episodes(self, tmp_path):
+        _write_segments(tmp_path / "docs", 1, 3)
+        _write_segments(tmp_path / "docs", 1, 4)
+        generator = ArchiveGenerator({
+            "elastic_documents_dir": tmp_path / "docs",
+            "output_dir": tmp_path / "out",
+            "series_name": "ranczo",
+            "allow_partial": True,
+            "episode_batch": {(1, 4)},
+        })
+
+        assert generator.work() == 0
+        assert _archives(tmp_path / "out") == ["ranczo_S01E04.zip"]
@@ -0,0 +1,126 @@
+import json
+
+import numpy as np
+import pytest
+
+from preprocessor.embeddings.embedding_store import (
+    EMBEDDING_FIELD,
+    EmbeddingCheckpoint,
+    EmbeddingStore,
+)
+
+
+def _results(count: int, dim: int):
+    rng = np.random.default_rng(count)
+    return [{"frame_number": i, EMBEDDING_FIELD: rng.normal(size=dim).tolist()} for i in range(count)]
+
+
+@pytest.mark.quick
+class TestEmbeddingStore:
+
+    def test_save_and_iterate_round_trip(self, tmp_path):
+        json_path = tmp_path / "S01E01_embeddings_video.json"
+        results = _results(5, 8)
+        rows, matrix = EmbeddingStore.split_rows(results)
+        EmbeddingStore.save(json_path, {"episode": "S01E01"}, "video_embeddings", rows, matrix)
+
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        assert data[EmbeddingStore.MATRIX_KEY]["shape"] == [5, 8]
+        assert all(EMBEDDING_FIELD not in row for row in data["video_embeddings"])
+
+        loaded = list(EmbeddingStore.iter_embeddings(json_path, "video_embeddings"))
+        assert [row["frame_number"] for row, _ in loaded] == list(range(5))
+        for (_, vector), result in zip(loaded, results):
+            np.testing.assert_allclose(vector, result[EMBEDDING_FIELD], rtol=1e-2, atol=1e-3)
+
+    def test_iterates_legacy_inline_embeddings(self, tmp_path):
+        json_path = tmp_path / "legacy.json"
+        json_path.write_text(json.dumps({"text_embeddings": [{"id": 0, EMBEDDING_FIELD: [0.5, 0.25]}, {"id": 1}]}), encoding="utf-8")
+
+        loaded = list(EmbeddingStore.iter_embeddings(json_path, "text_embeddings"))
+        assert loaded[0][1].tolist() == [0.5, 0.25]
+        assert loaded[1][1] is None
+
+    def test_save_rejects_row_count_mismatch(self, tmp_path):
+        rows, matrix = EmbeddingStore.split_rows(_results(3, 4))
+        with pytest.raises(ValueError):
+            EmbeddingStore.save(tmp_path / "bad.json", {}, "video_embeddings", rows[:2], matrix)
+
+    def test_validate(self, tmp_path):
+        json_path = tmp_path / "S01E02_embeddings_text.json"
+        rows, matrix = EmbeddingStore.split_rows(_results(4, 6))
+        EmbeddingStore.save(json_path, {}, "text_embeddings", rows, matrix)
+
+        assert EmbeddingStore.validate(json_path, "text_embeddings", 6) is None
+        assert "expected 8" in EmbeddingStore.validate(json_path, "text_embeddings", 8)
+
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        data["text_embeddings"].pop()
+        json_path.write_text(json.dumps(data), encoding="utf-8")
+        assert "does not match 3 rows" in EmbeddingStore.validate(json_path, "text_embeddings", 6)
+
+
+@pytest.mark.quick
+class TestEmbeddingCheckpoint:
+
+    def test_append_and_resume(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(tmp_path / "checkpoint.json")
+        assert not checkpoint.exists()
+
+        checkpoint.append(0, [{"frame_number": 0}, {"frame_number": 1}], np.ones((2, 3)))
+        checkpoint.append(1, [{"frame_number": 2}], np.full((1, 3), 2.0))
+
+        last_batch_idx, rows, vectors = checkpoint.load()
+        assert last_batch_idx == 1
+        assert [row["frame_number"] for row in rows] == [0, 1, 2]
+        assert np.vstack(vectors).tolist() == [[1.0] * 3, [1.0] * 3, [2.0] * 3]
+
+    def test_load_drops_torn_tail(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(tmp_path / "checkpoint.json")
+        checkpoint.append(0, [{"frame_number": 0}], np.ones((1, 4)))
+        with open(tmp_path / "checkpoint.vectors.bin", "ab") as f:
+            f.write(np.ones(4, dtype=EmbeddingStore.storage_dtype()).tobytes())
+        with open(tmp_path / "checkpoint.rows.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"batch_idx": 1, "dim": 4, "ro')
+
+        last_batch_idx, rows, vectors = checkpoint.load()
+        assert last_batch_idx == 0
+        assert len(rows) == 1
+        assert vectors[0].shape == (1, 4)
+
+        checkpoint.append(1, [{"frame_number": 1}], np.zeros((1, 4)))
+        _, rows, vectors = checkpoint.load()
+        assert len(rows) == 2
+        assert vectors[0][1].tolist() == [0.0] * 4
+
+    def test_load_discards_vectors_without_rows(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(tmp_path / "checkpoint.json")
+        with open(tmp_path / "checkpoint.vectors.bin", "wb") as f:
+            f.write(np.full(3, 9.0, dtype=EmbeddingStore.storage_dtype()).tobytes())
+        with open(tmp_path / "checkpoint.rows.jsonl", "w", encoding="utf-8") as f:
+            f.write('{"batch_idx": 0, "dim": 3, "ro')
+
+        assert checkpoint.load() == (-1, [], [])
+
+        checkpoint.append(0, [{"frame_number": 0}], np.ones((1, 3)))
+        _, rows, vectors = checkpoint.load()
+        assert len(rows) == 1
+        assert vectors[0].tolist() == [[1.0] * 3]
+
+    def test_remove_clears_orphan_vectors(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(tmp_path / "checkpoint.json")
+        with open(tmp_path / "checkpoint.vectors.bin", "wb") as f:
+            f.write(np.full(3, 9.0, dtype=EmbeddingStore.storage_dtype()).tobytes())
+        assert not checkpoint.exists()
+
+        checkpoint.remove()
+        checkpoint.append(0, [{"frame_number": 0}], np.ones((1, 3)))
+        _, _, vectors = checkpoint.load()
+        assert vectors[0].tolist() == [[1.0] * 3]
+
+    def test_remove(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(tmp_path / "checkpoint.json")
+        checkpoint.append(0, [{"frame_number": 0}], np.ones((1, 2)))
+        checkpoint.remove()
+        assert not checkpoint.exists()
+        assert not (tmp_path / "checkpoint.vectors.bin").exists()
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from preprocessor.core.state_manager import StateManager
+
+
+@pytest.mark.quick
+class TestStateManagerJournal:
+
+    def test_steps_survive_restart(self, tmp_path):
+        manager = StateManager("ranczo", tmp_path)
+        manager.load_or_create_state()
+        manager.mark_step_started("transcode", "S01E01")
+        manager.mark_step_completed("transcode", "S01E01")
+        manager.mark_step_started("transcode", "S01E02", temp_files=["S01E02.mp4.tmp"])
+
+        restored = StateManager("ranczo", tmp_path)
+        state = restored.load_or_create_state()
+        assert restored.is_step_completed("transcode", "S01E01")
+        assert not restored.is_step_completed("transcode", "S01E02")
+        assert [(step.step, step.episode) for step in state.in_progress] == [("transcode", "S01E02")]
+
+    def test_load_compacts_journal_into_snapshot(self, tmp_path):
+        manager = StateManager("ranczo", tmp_path)
+        manager.load_or_create_state()
+        manager.mark_step_started("scenes", "S01E01")
+        manager.mark_step_completed("scenes", "S01E01")
+        assert (tmp_path / StateManager.JOURNAL_FILE).read_text(encoding="utf-8").count("\n") == 2
+
+        StateManager("ranczo", tmp_path).load_or_create_state()
+        assert (tmp_path / StateManager.JOURNAL_FILE).read_text(encoding="utf-8") == ""
+        snapshot = json.loads((tmp_path / StateManager.STATE_FILE).read_text(encoding="utf-8"))
+        assert [(step["step"], step["episode"]) for step in snapshot["completed_steps"]] == [("scenes", "S01E01")]
+
+    def test_torn_journal_tail_is_ignored(self, tmp_path):
+        manager = StateManager("ranczo", tmp_path)
+        manager.load_or_create_state()
+        manager.mark_step_completed("transcribe", "S01E01")
+        with open(tmp_path / StateManager.JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write('{"event": "completed", "step": "transcribe", "epi')
+
+        restored = StateManager("ranczo", tmp_path)
+        restored.load_or_create_state()
+        assert restored.is_step_completed("transcribe", "S01E01")
+        assert not restored.is_step_completed("transcribe", "S01E02")
+
+    def test_recompleting_a_step_moves_it_last(self, tmp_path):
+        manager = StateManager("ranczo", tmp_path)
+        manager.load_or_create_state()
+        manager.mark_step_completed("scenes", "S01E01")
+        manager.mark_step_completed("scenes", "S01E02")
+        manager.mark_step_completed("scenes", "S01E01")
+
+        restored = StateManager("ranczo", tmp_path)
+        restored.load_or_create_state()
+        assert "scenes (S01E01)" in restored.get_resume_info()
+
+    def test_cleanup_removes_state_files(self, tmp_path):
+        manager = StateManager("ranczo", tmp_path)
+        manager.load_or_create_state()
+        manager.mark_step_completed("scenes", "S01E01")
+        manager.cleanup()
+        assert not (tmp_path / StateManager.STATE_FILE).exists()
+        assert not (tmp_path / StateManager.JOURNAL_FILE).exists()
@@ -21,6 +21,8 @@ from preprocessor.transcription.processors.unicode_fixer import TranscriptionUni
 
 
 class TranscriptionGenerator(BaseProcessor):
+    RESOURCE_CLASS = None
+
     def __init__(self, args: Dict[str, Any]) -> None:
         super().__init__(
             args=args,
@@ -71,7 +73,7 @@ class TranscriptionGenerator(BaseProcessor):
 
         for video_file in video_files:
             episode_info = self.episode_manager.parse_filename(video_file)
-            if not episode_info:
+            if not episode_info or not self._in_episode_batch(episode_info):
                 continue
 
             filename = self.episode_manager.file_naming.build_filename(episode_info, extension="json")
@@ -144,7 +146,7 @@ class TranscriptionGenerator(BaseProcessor):
         missing_files = []
         for video_file in video_files:
             episode_info = self.episode_manager.parse_filename(video_file)
-            if not episode_info:
+            if not episode_info or not self._in_episode_batch(episode_info):
                 continue
 
             filename = self.episode_manager.file_naming.build_filename(episode_info, extension="json")
@@ -184,7 +186,7 @@ class TranscriptionGenerator(BaseProcessor):
 
         for video_file in video_files:
             episode_info = self.episode_manager.parse_filename(video_file)
-            if not episode_info:
+            if not episode_info or not self._in_episode_batch(episode_info):
                 continue
 
             filename = self.episode_manager.file_naming.build_filename(episode_info, extension="json")
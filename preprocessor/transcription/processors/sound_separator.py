@@ -26,7 +26,6 @@ from preprocessor.utils.constants import (
 
 
 class SoundEventSeparator(BaseProcessor):
-
     def __init__(self, args: Dict[str, Any]) -> None:
         super().__init__(
             args=args,
@@ -1,5 +1,4 @@
 from concurrent.futures import ThreadPoolExecutor
-import json
 from pathlib import Path
 import time
 from typing import (
@@ -12,7 +11,12 @@ from typing import (
 )
 
 from PIL import Image
+import numpy as np
 
+from preprocessor.embeddings.embedding_store import (
+    EmbeddingCheckpoint,
+    EmbeddingStore,
+)
 from preprocessor.embeddings.gpu_batch_processor import GPUBatchProcessor
 from preprocessor.hashing.image_hasher import PerceptualHasher
 from preprocessor.utils.console import console
@@ -96,23 +100,10 @@ def compute_embeddings_in_batches(  # pylint: disable=too-many-locals
     checkpoint_file: Optional[Path] = None,
     checkpoint_interval: int = 20,
     prefetch_count: int = 2,
-) -> List[Dict[str, Any]]:
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
     total_chunks = (len(frame_requests) + batch_size - 1) // batch_size
-    embeddings = []
-    start_chunk_idx = 0
-
-    if checkpoint_file and checkpoint_file.exists():
-        console.print("[yellow]Found checkpoint file, resuming from last saved batch[/yellow]")
-        try:
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
-            embeddings = checkpoint_data.get("embeddings", [])
-            start_chunk_idx = checkpoint_data.get("last_batch_idx", 0) + 1
-            console.print(f"[cyan]Resuming from batch {start_chunk_idx}/{total_chunks}[/cyan]")
-        except (json.JSONDecodeError, KeyError) as e:
-            console.print(f"[yellow]Failed to load checkpoint: {e}. Starting from beginning.[/yellow]")
-            start_chunk_idx = 0
-            embeddings = []
+    checkpoint = EmbeddingCheckpoint(checkpoint_file) if checkpoint_file else None
+    start_chunk_idx, rows, vector_blocks = _resume_from_checkpoint(checkpoint, total_chunks)
 
     console.print(f"[cyan]Computing embeddings for {len(frame_requests)} frames in {total_chunks} batches (with prefetch={prefetch_count})[/cyan]")
 
@@ -123,6 +114,8 @@ def compute_embeddings_in_batches(  # pylint: disable=too-many-locals
     start_time = time.time()
     processed_batches = 0
     batches_to_process = total_chunks - start_chunk_idx
+    saved_rows = len(rows)
+    saved_blocks = len(vector_blocks)
 
     for chunk_idx, chunk_requests, pil_images in _prefetch_batches(
         frames_dir, frame_requests, batch_size, convert_rgb=True, prefetch_count=prefetch_count,
@@ -131,18 +124,11 @@ def compute_embeddings_in_batches(  # pylint: disable=too-many-locals
             continue
 
         chunk_embeddings = gpu_processor.process_images_batch(pil_images, chunk_idx)
+        chunk_vectors = np.asarray(chunk_embeddings, dtype=EmbeddingStore.storage_dtype())
 
-        for request, embedding in zip(chunk_requests, chunk_embeddings):
-            result = {
-                **request,
-                "embedding": embedding,
-            }
-
-            frame_num = request.get("frame_number")
-            if frame_num is not None and frame_num in image_hashes:
-                result["perceptual_hash"] = image_hashes[frame_num]
-
-            embeddings.append(result)
+        rows.extend(_build_embedding_rows(chunk_requests[:len(chunk_vectors)], image_hashes))
+        if len(chunk_vectors):
+            vector_blocks.append(chunk_vectors[:len(chunk_requests)])
 
         del pil_images
         del chunk_embeddings
@@ -156,28 +142,73 @@ def compute_embeddings_in_batches(  # pylint: disable=too-many-locals
             start_time,
         )
 
-        if checkpoint_file and (chunk_idx + 1) % actual_checkpoint_interval == 0:
-            _save_checkpoint(checkpoint_file, chunk_idx, embeddings)
+        if checkpoint and (chunk_idx + 1) % actual_checkpoint_interval == 0 and len(rows) > saved_rows:
+            checkpoint.append(chunk_idx, rows[saved_rows:], np.concatenate(vector_blocks[saved_blocks:]))
+            saved_rows = len(rows)
+            saved_blocks = len(vector_blocks)
+            console.print(f"[dim cyan]Checkpoint saved at batch {chunk_idx + 1}[/dim cyan]")
 
-    if checkpoint_file and checkpoint_file.exists():
-        checkpoint_file.unlink()
+    if checkpoint and checkpoint.exists():
+        checkpoint.remove()
         console.print("[cyan]Checkpoint file removed[/cyan]")
 
+    _report_vram_usage(gpu_processor, batch_size)
+
+    matrix = np.concatenate(vector_blocks) if vector_blocks else np.empty((0, 0), dtype=EmbeddingStore.storage_dtype())
+    console.print(f"[green]✓ Computed {len(rows)} embeddings[/green]")
+    return rows, matrix
+
+
+def _resume_from_checkpoint(
+    checkpoint: Optional[EmbeddingCheckpoint],
+    total_chunks: int,
+) -> Tuple[int, List[Dict[str, Any]], List[np.ndarray]]:
+    if not checkpoint:
+        return 0, [], []
+    if not checkpoint.exists():
+        checkpoint.remove()
+        return 0, [], []
+
+    console.print("[yellow]Found checkpoint file, resuming from last saved batch[/yellow]")
+    try:
+        last_batch_idx, rows, vector_blocks = checkpoint.load()
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"[yellow]Failed to load checkpoint: {e}. Starting from beginning.[/yellow]")
+        checkpoint.remove()
+        return 0, [], []
+
+    console.print(f"[cyan]Resuming from batch {last_batch_idx + 1}/{total_chunks}[/cyan]")
+    return last_batch_idx + 1, rows, vector_blocks
+
+
+def _build_embedding_rows(chunk_requests: List[Dict[str, Any]], image_hashes: Dict[int, str]) -> List[Dict[str, Any]]:
+    rows = []
+    for request in chunk_requests:
+        result = dict(request)
+
+        frame_num = request.get("frame_number")
+        if frame_num is not None and frame_num in image_hashes:
+            result["perceptual_hash"] = image_hashes[frame_num]
+
+        rows.append(result)
+    return rows
+
+
+def _report_vram_usage(gpu_processor: GPUBatchProcessor, batch_size: int) -> None:
     vram_stats = gpu_processor.get_vram_stats()
-    if vram_stats:
+    if not vram_stats:
+        return
+
+    console.print(
+        f"[cyan]VRAM usage: max={vram_stats['max_vram_gb']}GB, "
+        f"avg={vram_stats['avg_vram_gb']}GB[/cyan]",
+    )
+    suggested_batch = gpu_processor.suggest_optimal_batch_size(target_vram_gb=21.0)
+    if suggested_batch != batch_size:
         console.print(
-            f"[cyan]VRAM usage: max={vram_stats['max_vram_gb']}GB, "
-            f"avg={vram_stats['avg_vram_gb']}GB[/cyan]",
+            f"[yellow]Suggested batch_size for 21GB VRAM target: {suggested_batch} "
+            f"(current: {batch_size})[/yellow]",
         )
-        suggested_batch = gpu_processor.suggest_optimal_batch_size(target_vram_gb=21.0)
-        if suggested_batch != batch_size:
-            console.print(
-                f"[yellow]Suggested batch_size for 21GB VRAM target: {suggested_batch} "
-                f"(current: {batch_size})[/yellow]",
-            )
-
-    console.print(f"[green]✓ Computed {len(embeddings)} embeddings[/green]")
-    return embeddings
 
 
 def _report_batch_progress(
@@ -207,14 +238,3 @@ def _report_batch_progress(
         f"  [dim cyan]Batch {current_batch}/{total_batches} "
         f"({percent:.1f}%) | {rate_str} | ETA: {eta}[/dim cyan]",
     )
-
-
-def _save_checkpoint(checkpoint_file: Path, last_batch_idx: int, embeddings: List[Dict[str, Any]]) -> None:
-    checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
-    checkpoint_data = {
-        "last_batch_idx": last_batch_idx,
-        "embeddings": embeddings,
-    }
-    with open(checkpoint_file, "w", encoding="utf-8") as f:
-        json.dump(checkpoint_data, f)
-    console.print(f"[dim cyan]Checkpoint saved at batch {last_batch_idx + 1}[/dim cyan]")
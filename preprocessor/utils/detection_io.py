@@ -1,13 +1,26 @@
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import json
 from pathlib import Path
 import re
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
-from preprocessor.characters.face_detection_utils import detect_characters_in_frame
+import cv2
+import numpy as np
+
+from preprocessor.characters.face_detection_utils import (
+    build_reference_matrix,
+    detect_characters_in_batch,
+)
 from preprocessor.config.config import settings
 from preprocessor.core.file_naming import FileNamingConventions
 from preprocessor.core.output_path_builder import OutputPathBuilder
@@ -23,6 +36,41 @@ def _parse_frame_number(frame_filename: str) -> Optional[int]:
     return None
 
 
+def read_frames_fps(metadata_file: Path, default: float = 25.0) -> float:
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    fps = metadata.get("source_fps")
+    if fps:
+        return float(fps)
+
+    timed_frames = [
+        frame for frame in metadata.get("frames", [])
+        if frame.get("frame_number") and frame.get("timestamp")
+    ]
+    if timed_frames:
+        last = max(timed_frames, key=lambda frame: frame["frame_number"])
+        return last["frame_number"] / last["timestamp"]
+    return default
+
+
+def _iter_image_batches(frame_files: List[Path], batch_size: int, workers: int) -> Iterator[Tuple[List[Path], List[Optional[np.ndarray]]]]:
+    batches = [frame_files[i:i + batch_size] for i in range(0, len(frame_files), batch_size)]
+    if not batches:
+        return
+
+    def submit(batch: List[Path]) -> List[Future]:
+        return [executor.submit(cv2.imread, str(frame_path)) for frame_path in batch]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        upcoming = submit(batches[0])
+        for idx, batch in enumerate(batches):
+            current = upcoming
+            if idx + 1 < len(batches):
+                upcoming = submit(batches[idx + 1])
+            yield batch, [future.result() for future in current]
+
+
 def save_character_detections(
     episode_info,
     results: List[Dict[str, Any]],
@@ -63,28 +111,31 @@ def process_frames_for_detection(
     threshold: float,
     fps: float = 25.0,
 ) -> List[Dict[str, Any]]:
+    character_names, reference_matrix = build_reference_matrix(character_vectors)
+    batch_size = max(1, settings.character.detection_batch_size)
+
     results = []
-    for idx, frame_path in enumerate(frame_files):
-        detected_chars = detect_characters_in_frame(
-            frame_path,
+    for batch, images in _iter_image_batches(frame_files, batch_size, settings.character.decode_workers):
+        detections = detect_characters_in_batch(
+            images,
             face_app,
-            character_vectors,
+            character_names,
+            reference_matrix,
             threshold,
         )
 
-        frame_number = _parse_frame_number(frame_path.name)
-        timestamp = frame_number / fps if frame_number is not None else None
-
-        frame_result = {
-            "frame_number": frame_number,
-            "timestamp": timestamp,
-            "frame_file": frame_path.name,
-            "characters": detected_chars,
-        }
+        for frame_path, detected_chars in zip(batch, detections):
+            frame_number = _parse_frame_number(frame_path.name)
+            timestamp = frame_number / fps if frame_number is not None else None
 
-        results.append(frame_result)
+            results.append({
+                "frame_number": frame_number,
+                "timestamp": timestamp,
+                "frame_file": frame_path.name,
+                "characters": detected_chars,
+            })
 
-        if (idx + 1) % 100 == 0:
-            console.print(f"  Processed {idx + 1}/{len(frame_files)} frames")
+        if len(results) // 100 > (len(results) - len(batch)) // 100:
+            console.print(f"  Processed {len(results)}/{len(frame_files)} frames")
 
     return results
@@ -73,6 +73,12 @@ class ErrorHandlingLogger:
     def debug(self, message: str) -> None:
         self.__logger.debug(message)
 
+    def get_errors(self) -> List[str]:
+        return list(self.__errors)
+
+    def add_errors(self, messages: List[str]) -> None:
+        self.__errors.extend(messages)
+
     def finalize(self) -> int:
         self.__is_finalized = True
         if self.__errors:
@@ -21,6 +21,8 @@ from preprocessor.core.episode_manager import (
     EpisodeManager,
 )
 from preprocessor.core.output_path_builder import OutputPathBuilder
+from preprocessor.embeddings.embedding_store import EmbeddingStore
+from preprocessor.search.vector_profile import get_vector_profile
 from preprocessor.validation.base_result import ValidationStatusMixin
 from preprocessor.validation.file_validators import (
     validate_image_file,
@@ -389,6 +391,8 @@ class EpisodeStats(ValidationStatusMixin):  # pylint: disable=too-many-instance-
 
         embedding_field = embedding_fields[subdir]
         expected_dim = settings.embedding_model.embedding_dim
+        if subdir in (ELASTIC_SUBDIRS.text_embeddings, ELASTIC_SUBDIRS.video_frames):
+            expected_dim = get_vector_profile().dims
 
         try:
             with open(jsonl_file, "r", encoding="utf-8") as f:
@@ -440,6 +444,16 @@ class EpisodeStats(ValidationStatusMixin):  # pylint: disable=too-many-instance-
                 if not result.is_valid:
                     self.errors.append(f"Invalid {OUTPUT_FILE_NAMES['embeddings_text']}: {result.error_message}")
 
+            for suffix, results_key in (
+                ("text", "text_embeddings"),
+                ("video", "video_embeddings"),
+                ("sound_events", "sound_event_embeddings"),
+            ):
+                for sidecar in embeddings_dir.glob(f"*_embeddings_{suffix}.json"):
+                    error = EmbeddingStore.validate(sidecar, results_key, settings.embedding_model.embedding_dim)
+                    if error:
+                        self.errors.append(f"Invalid embedding matrix: {error}")
+
         elastic_subdirs = [
             ELASTIC_SUBDIRS.text_segments,
             ELASTIC_SUBDIRS.text_embeddings,
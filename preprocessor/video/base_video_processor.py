@@ -15,6 +15,8 @@ from preprocessor.core.episode_manager import EpisodeManager
 
 
 class BaseVideoProcessor(BaseProcessor, ABC):
+    RESOURCE_CLASS = None
+
     def __init__(
         self,
         args: Dict[str, Any],
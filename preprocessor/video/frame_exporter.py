@@ -1,3 +1,8 @@
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from datetime import datetime
 import json
 from pathlib import Path
@@ -5,13 +10,18 @@ import shutil
 import subprocess
 from typing import (
     Any,
+    Deque,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
 from PIL import Image
+import cv2
 import decord
+import numpy as np
 
 from bot.types import FrameRequest
 from preprocessor.config.config import settings
@@ -111,8 +121,8 @@ class FrameExporter(BaseVideoProcessor):
         console.print(f"[cyan]Extracting {len(frame_requests)} keyframes from {item.input_path.name}[/cyan]")
 
         try:
-            self.__extract_frames(item.input_path, frame_requests, episode_dir, episode_info)
-            self.__write_metadata(episode_dir, frame_requests, episode_info, item.input_path)
+            fps = self.__extract_frames(item.input_path, frame_requests, episode_dir, episode_info)
+            self.__write_metadata(episode_dir, frame_requests, episode_info, item.input_path, fps)
             console.print(f"[green]✓ Exported {len(frame_requests)} frames to {episode_dir}[/green]")
         except Exception as e:
             self.logger.error(f"Failed to extract frames from {item.input_path}: {e}")
@@ -130,28 +140,54 @@ class FrameExporter(BaseVideoProcessor):
             data["scene_timestamps"] = scene_timestamps
         return data
 
-    def __extract_frames(self, video_file: Path, frame_requests: List[FrameRequest], episode_dir: Path, episode_info) -> None:
+    def __extract_frames(self, video_file: Path, frame_requests: List[FrameRequest], episode_dir: Path, episode_info) -> float:
         metadata = self.__get_video_metadata(video_file)
-        self.current_video_dar = self.__calculate_display_aspect_ratio(metadata)
+        resize_plan = self.__build_resize_plan(self.__calculate_display_aspect_ratio(metadata))
 
-        vr = decord.VideoReader(str(video_file), ctx=decord.cpu(0))
-        frame_numbers = [req["frame_number"] for req in frame_requests]
+        frame_numbers = sorted({req["frame_number"] for req in frame_requests})
+        base_filename = self.episode_manager.file_naming.build_base_filename(episode_info)
+        output_paths = {num: episode_dir / f"{base_filename}_frame_{num:06d}.jpg" for num in frame_numbers}
 
+        vr = decord.VideoReader(str(video_file), ctx=decord.cpu(0))
+        fps = float(vr.get_avg_fps())
         with self.progress.track_operation(f"Keyframes ({len(frame_numbers)} frames)", len(frame_numbers)) as tracker:
-            for idx, frame_num in enumerate(frame_numbers, 1):
-                self.__extract_and_save_frame(vr, frame_num, episode_dir, episode_info)
-                tracker.update(idx, interval=50)
+            self.__encode_frames(self.__decode_frames(vr, frame_numbers), output_paths, resize_plan, tracker)
 
         del vr
+        return fps
 
-    def __extract_and_save_frame(self, vr, frame_num: int, episode_dir: Path, episode_info) -> None:
-        frame_np = vr[frame_num].asnumpy()
-        frame_pil = Image.fromarray(frame_np)
-
-        resized = self.__resize_frame(frame_pil, self.current_video_dar)
-        base_filename = self.episode_manager.file_naming.build_base_filename(episode_info)
-        filename = f"{base_filename}_frame_{frame_num:06d}.jpg"
-        resized.save(episode_dir / filename, quality=90)
+    @staticmethod
+    def __decode_frames(vr: decord.VideoReader, frame_numbers: List[int]) -> Iterator[Tuple[int, np.ndarray]]:
+        batch_size = settings.frame_export.decode_batch_size
+        for start in range(0, len(frame_numbers), batch_size):
+            chunk = frame_numbers[start:start + batch_size]
+            yield from zip(chunk, vr.get_batch(chunk).asnumpy())
+
+    def __encode_frames(
+        self,
+        frames: Iterator[Tuple[int, np.ndarray]],
+        output_paths: Dict[int, Path],
+        resize_plan: Tuple[int, int, int, int],
+        tracker,
+    ) -> None:
+        max_pending = settings.frame_export.decode_batch_size
+        with ThreadPoolExecutor(max_workers=settings.frame_export.encode_workers) as executor:
+            pending: Deque[Future] = deque()
+            saved = 0
+            for frame_num, frame in frames:
+                pending.append(executor.submit(self.__encode_frame, frame, output_paths[frame_num], resize_plan))
+                while len(pending) > max_pending:
+                    pending.popleft().result()
+                    saved += 1
+                    tracker.update(saved, interval=50)
+
+            while pending:
+                pending.popleft().result()
+                saved += 1
+                tracker.update(saved, interval=50)
+
+    def __encode_frame(self, frame: np.ndarray, output_path: Path, resize_plan: Tuple[int, int, int, int]) -> None:
+        Image.fromarray(self.__resize_frame(frame, resize_plan)).save(output_path, quality=90)
 
     @staticmethod
     def __get_video_metadata(video_path: Path) -> Dict[str, Any]:
@@ -188,29 +224,35 @@ class FrameExporter(BaseVideoProcessor):
 
         return (width / height) * sar
 
-    def __resize_frame(self, frame: Image.Image, display_aspect_ratio: float) -> Image.Image:
+    def __build_resize_plan(self, display_aspect_ratio: float) -> Tuple[int, int, int, int]:
         target_aspect = self.resize_width / self.resize_height
 
         if abs(display_aspect_ratio - target_aspect) < 0.01:
-            return frame.resize((self.resize_width, self.resize_height), Image.Resampling.LANCZOS)
+            return self.resize_width, self.resize_height, 0, 0
 
         if display_aspect_ratio > target_aspect:
-            new_height = self.resize_height
             new_width = int(self.resize_height * display_aspect_ratio)
-            resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            x_crop = (new_width - self.resize_width) // 2
-            cropped = resized.crop((x_crop, 0, x_crop + self.resize_width, self.resize_height))
-            return cropped
+            return new_width, self.resize_height, (new_width - self.resize_width) // 2, 0
 
-        new_width = self.resize_width
         new_height = int(self.resize_width / display_aspect_ratio)
-        resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return self.resize_width, new_height, 0, (self.resize_height - new_height) // 2
+
+    def __resize_frame(self, frame: np.ndarray, resize_plan: Tuple[int, int, int, int]) -> np.ndarray:
+        new_width, new_height, x_crop, y_offset = resize_plan
+        resized = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+
+        if new_width > self.resize_width:
+            return resized[:, x_crop:x_crop + self.resize_width]
+
+        if y_offset < 0:
+            return resized[-y_offset:-y_offset + self.resize_height]
+
+        if new_height < self.resize_height:
+            result = np.zeros((self.resize_height, self.resize_width, 3), dtype=np.uint8)
+            result[y_offset:y_offset + new_height] = resized
+            return result
 
-        result = Image.new('RGB', (self.resize_width, self.resize_height), (0, 0, 0))
-        y_offset = (self.resize_height - new_height) // 2
-        result.paste(resized, (0, y_offset))
-        return result
+        return resized
 
     @staticmethod
     def __calculate_total_scenes(frame_requests: List[FrameRequest]) -> int:
@@ -218,7 +260,14 @@ class FrameExporter(BaseVideoProcessor):
         has_invalid = -1 in scene_numbers
         return len(scene_numbers) - (1 if has_invalid else 0)
 
-    def __write_metadata(self, episode_dir: Path, frame_requests: List[FrameRequest], episode_info, source_video: Path) -> None:
+    def __write_metadata(
+        self,
+        episode_dir: Path,
+        frame_requests: List[FrameRequest],
+        episode_info,
+        source_video: Path,
+        source_fps: float,
+    ) -> None:
         frame_types_count = {}
         frames_with_paths = []
 
@@ -240,6 +289,7 @@ class FrameExporter(BaseVideoProcessor):
                 "absolute_episode": episode_info.absolute_episode,
             },
             "source_video": str(source_video),
+            "source_fps": source_fps,
             "processing_parameters": {
                 "frame_width": self.resize_width,
                 "frame_height": self.resize_height,
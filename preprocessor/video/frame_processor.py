@@ -18,6 +18,8 @@ from preprocessor.utils.console import console
 
 
 class FrameProcessor(BaseProcessor):
+    RESOURCE_CLASS = None
+
     def __init__(self, args: Dict[str, Any]):
         super().__init__(
             args=args,
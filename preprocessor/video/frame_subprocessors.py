@@ -24,6 +24,7 @@ from preprocessor.core.base_processor import (
 )
 from preprocessor.core.episode_manager import EpisodeManager
 from preprocessor.core.file_naming import FileNamingConventions
+from preprocessor.embeddings.embedding_store import EmbeddingStore
 from preprocessor.embeddings.gpu_batch_processor import GPUBatchProcessor
 from preprocessor.hashing.image_hasher import PerceptualHasher
 from preprocessor.utils.batch_processing_utils import (
@@ -33,6 +34,7 @@ from preprocessor.utils.batch_processing_utils import (
 from preprocessor.utils.console import console
 from preprocessor.utils.detection_io import (
     process_frames_for_detection,
+    read_frames_fps,
     save_character_detections,
 )
 from preprocessor.utils.error_handling_logger import ErrorHandlingLogger
@@ -212,7 +214,7 @@ class VideoEmbeddingSubProcessor(FrameSubProcessor):
             {"season": episode_info.season, "episode_number": episode_info.relative_episode},
             self.logger,
         )
-        video_embeddings = compute_embeddings_in_batches(
+        video_rows, video_matrix = compute_embeddings_in_batches(
             ramdisk_frames_dir,
             frame_requests,
             self.gpu_processor,
@@ -223,9 +225,9 @@ class VideoEmbeddingSubProcessor(FrameSubProcessor):
             prefetch_count=settings.embedding.prefetch_chunks,
         )
         series_name = item.metadata["series_name"]
-        self.__save_embeddings(episode_info, video_embeddings, series_name)
+        self.__save_embeddings(episode_info, video_rows, video_matrix, series_name)
 
-    def __save_embeddings(self, episode_info, video_embeddings: List[Dict[str, Any]], series_name: str) -> None:
+    def __save_embeddings(self, episode_info, video_rows: List[Dict[str, Any]], video_matrix: np.ndarray, series_name: str) -> None:
         episode_dir = EpisodeManager.get_episode_subdir(episode_info, settings.output_subdirs.embeddings)
         episode_dir.mkdir(parents=True, exist_ok=True)
 
@@ -238,12 +240,12 @@ class VideoEmbeddingSubProcessor(FrameSubProcessor):
                 "device": self.device,
             },
             statistics={
-                "total_embeddings": len(video_embeddings),
-                "embedding_dimension": len(video_embeddings[0]["embedding"]) if video_embeddings else 0,
-                "frames_with_hash": sum(1 for e in video_embeddings if "perceptual_hash" in e),
+                "total_embeddings": len(video_rows),
+                "embedding_dimension": video_matrix.shape[1] if video_rows else 0,
+                "frames_with_hash": sum(1 for e in video_rows if "perceptual_hash" in e),
             },
             results_key="video_embeddings",
-            results_data=video_embeddings,
+            results_data=video_rows,
         )
         file_naming = FileNamingConventions(series_name)
         video_filename = file_naming.build_filename(
@@ -252,7 +254,7 @@ class VideoEmbeddingSubProcessor(FrameSubProcessor):
             suffix="embeddings_video",
         )
         video_output = episode_dir / video_filename
-        atomic_write_json(video_output, video_data, indent=2, ensure_ascii=False)
+        EmbeddingStore.save(video_output, video_data, "video_embeddings", video_rows, video_matrix)
 
         console.print(f"[green]✓ Saved embeddings to: {video_output}[/green]")
 
@@ -325,7 +327,7 @@ class CharacterDetectionSubProcessor(FrameSubProcessor):
 
         console.print(f"[cyan]Detecting characters in {len(frame_files)} frames[/cyan]")
 
-        fps = 25.0
+        fps = read_frames_fps(item.input_path)
 
         results = process_frames_for_detection(
             frame_files,
@@ -27,6 +27,8 @@ from preprocessor.utils.file_utils import atomic_write_json
 
 
 class SceneDetector(BaseProcessor):
+    RESOURCE_CLASS = None
+
     def __init__(self, args: Dict[str, Any]):
         super().__init__(
             args=args,
@@ -1,19 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 from pathlib import Path
+import shutil
 import subprocess
 from typing import (
     Any,
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
+from preprocessor.config.config import settings
 from preprocessor.core.base_processor import (
     OutputSpec,
     ProcessingItem,
 )
 from preprocessor.core.constants import DEFAULT_VIDEO_EXTENSION
+from preprocessor.core.enums import ResourceClass
 from preprocessor.core.output_path_builder import OutputPathBuilder
 from preprocessor.utils.constants import (
     FfprobeKeys,
@@ -24,6 +29,8 @@ from preprocessor.video.base_video_processor import BaseVideoProcessor
 
 
 class VideoTranscoder(BaseVideoProcessor):
+    RESOURCE_CLASS = ResourceClass.FFMPEG
+
     def __init__(self, args: Dict[str, Any]) -> None:
         super().__init__(
             args=args,
@@ -41,6 +48,9 @@ class VideoTranscoder(BaseVideoProcessor):
         self.bufsize_mbps: Optional[float] = self._args.get("bufsize_mbps")
         self.audio_bitrate_kbps: int = int(self._args.get("audio_bitrate_kbps", 128))
         self.gop_size: float = float(self._args["gop_size"])
+        self.software_preset: str = settings.transcode.software_preset
+        self.chunk_seconds: float = float(self._args.get("chunk_seconds", settings.transcode.chunk_seconds))
+        self.chunk_workers: int = int(self._args.get("chunk_workers", settings.transcode.chunk_workers))
 
     def _validate_args(self, args: Dict[str, Any]) -> None:
         if "videos" not in args:
@@ -143,6 +153,38 @@ class VideoTranscoder(BaseVideoProcessor):
             "setsar=1"
         )
 
+        if self.codec.endswith("_nvenc"):
+            command = self.__build_nvenc_command(
+                input_video, output_video, input_fps, target_fps,
+                (video_bitrate, minrate, maxrate, bufsize), audio_bitrate, vf_filter,
+            )
+
+            self.logger.debug(f"Transcoding: {input_video.name} -> {output_video.name}")
+            self.logger.debug(f"FFmpeg command: {' '.join(command)}")
+            self.logger.debug(f"LD_LIBRARY_PATH: {os.environ.get('LD_LIBRARY_PATH', 'not set')[:200]}")
+
+            try:
+                subprocess.run(command, check=True, capture_output=False, text=True)
+            except subprocess.CalledProcessError as e:
+                self.logger.error(f"FFmpeg failed with exit code: {e.returncode}")
+                raise
+        else:
+            self.__transcode_in_chunks(
+                input_video, output_video, input_fps, target_fps,
+                (video_bitrate, minrate, maxrate, bufsize), audio_bitrate, vf_filter,
+            )
+
+    def __build_nvenc_command(
+        self,
+        input_video: Path,
+        output_video: Path,
+        input_fps: float,
+        target_fps: float,
+        rates: Tuple[float, float, float, float],
+        audio_bitrate: int,
+        vf_filter: str,
+    ) -> List[str]:
+        video_bitrate, minrate, maxrate, bufsize = rates
         command = [
             "ffmpeg",
             "-v", "error",
@@ -186,17 +228,148 @@ class VideoTranscoder(BaseVideoProcessor):
             "-f", "mp4",
             str(output_video),
         ])
+        return command
 
-        self.logger.debug(f"Transcoding: {input_video.name} -> {output_video.name}")
-        self.logger.debug(f"FFmpeg command: {' '.join(command)}")
-        self.logger.debug(f"LD_LIBRARY_PATH: {os.environ.get('LD_LIBRARY_PATH', 'not set')[:200]}")
+    def __transcode_in_chunks( # pylint: disable=too-many-locals
+        self,
+        input_video: Path,
+        output_video: Path,
+        input_fps: float,
+        target_fps: float,
+        rates: Tuple[float, float, float, float],
+        audio_bitrate: int,
+        vf_filter: str,
+    ) -> None:
+        video_bitrate, minrate, maxrate, bufsize = rates
+        chunks = self.__plan_chunks(self.__get_keyframe_times(input_video), self.chunk_seconds, target_fps)
+        # Other episodes are transcoded alongside this one, so only this episode's share of the CPUs is spent here.
+        cpu_budget = max(1, (os.cpu_count() or 1) // self._get_max_workers())
+        workers = max(1, min(self.chunk_workers or cpu_budget, len(chunks) + 1))
+        threads = max(1, cpu_budget // workers)
+
+        chunk_dir = output_video.with_suffix(".chunks")
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        chunk_dir.mkdir(parents=True)
+
+        encode_args = [
+            "-c:v", self.codec,
+            "-preset", self.software_preset,
+            "-pix_fmt", "yuv420p",
+        ]
+        if self.codec == "libx264":
+            encode_args.extend(["-profile:v", "main", "-level", "4.1", "-rc-lookahead", "32"])
+        if target_fps < input_fps:
+            encode_args.extend(["-r", str(target_fps)])
+        encode_args.extend([
+            "-b:v", f"{video_bitrate}M",
+            "-minrate", f"{minrate}M",
+            "-maxrate", f"{maxrate}M",
+            "-bufsize", f"{bufsize}M",
+            "-bf", "2",
+            "-g", str(int(target_fps * self.gop_size)),
+            "-threads", str(threads),
+            "-vf", vf_filter,
+        ])
+
+        commands = []
+        chunk_files = []
+        for idx, (start_frame, end_frame) in enumerate(chunks):
+            chunk_file = chunk_dir / f"chunk_{idx:04d}.mp4"
+            command = ["ffmpeg", "-v", "error", "-hide_banner", "-y"]
+            if start_frame > 0:
+                command.extend(["-ss", f"{start_frame / target_fps:.6f}"])
+            command.extend(["-i", str(input_video)])
+            if end_frame is not None:
+                command.extend(["-frames:v", str(end_frame - start_frame)])
+            command.extend(["-map", "0:v:0", "-an", *encode_args, "-f", "mp4", str(chunk_file)])
+            commands.append(command)
+            chunk_files.append(chunk_file)
+
+        audio_file = None
+        if self.__has_audio_stream(input_video):
+            audio_file = chunk_dir / "audio.m4a"
+            commands.append([
+                "ffmpeg", "-v", "error", "-hide_banner", "-y",
+                "-i", str(input_video),
+                "-map", "0:a:0", "-vn",
+                "-c:a", "aac",
+                "-b:a", f"{audio_bitrate}k",
+                "-ac", "2",
+                str(audio_file),
+            ])
+
+        self.logger.debug(
+            f"Transcoding: {input_video.name} -> {output_video.name} in {len(chunks)} chunks "
+            f"({workers} workers x {threads} threads)",
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(self.__run_ffmpeg, command) for command in commands]:
+                    future.result()
+
+            concat_list = chunk_dir / "concat.txt"
+            concat_list.write_text("".join(f"file '{chunk.name}'\n" for chunk in chunk_files), encoding="utf-8")
 
+            command = ["ffmpeg", "-v", "error", "-hide_banner", "-y", "-f", "concat", "-safe", "0", "-i", str(concat_list)]
+            if audio_file is not None:
+                command.extend(["-i", str(audio_file), "-map", "0:v:0", "-map", "1:a:0"])
+            command.extend(["-c", "copy", "-movflags", "+faststart", "-f", "mp4", str(output_video)])
+            self.__run_ffmpeg(command)
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    def __run_ffmpeg(self, command: List[str]) -> None:
+        self.logger.debug(f"FFmpeg command: {' '.join(command)}")
         try:
-            subprocess.run(command, check=True, capture_output=False, text=True)
+            subprocess.run(command, check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"FFmpeg failed with exit code: {e.returncode}")
+            self.logger.error(f"FFmpeg failed with exit code {e.returncode}: {e.stderr.strip()[-500:]}")
             raise
 
+    @staticmethod
+    def __plan_chunks(keyframe_times: List[float], chunk_seconds: float, target_fps: float) -> List[Tuple[int, Optional[int]]]:
+        # Boundaries are output frame indices, so every chunk holds a whole number of target-rate frames
+        # and the concatenated video stays in step with the audio, which is encoded in one piece.
+        boundaries = [0]
+        for keyframe_time in keyframe_times:
+            frame = round(keyframe_time * target_fps)
+            if frame - boundaries[-1] >= chunk_seconds * target_fps:
+                boundaries.append(frame)
+        return list(zip(boundaries, [*boundaries[1:], None]))
+
+    @staticmethod
+    def __get_keyframe_times(video: Path) -> List[float]:
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "format=start_time:packet=pts_time,flags",
+            "-of", "json",
+            str(video),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        probe_data: Dict[str, Any] = json.loads(result.stdout)
+        start_time = float(probe_data.get(FfprobeKeys.FORMAT, {}).get("start_time", 0.0) or 0.0)
+        keyframes = [
+            float(packet["pts_time"]) - start_time
+            for packet in probe_data.get("packets", [])
+            if "K" in packet.get("flags", "") and packet.get("pts_time") not in (None, "N/A")
+        ]
+        return sorted(keyframes)
+
+    @staticmethod
+    def __has_audio_stream(video: Path) -> bool:
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a",
+            "-show_entries", "stream=index",
+            "-of", "json",
+            str(video),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        probe_data: Dict[str, Any] = json.loads(result.stdout)
+        return bool(probe_data.get(FfprobeKeys.STREAMS))
+
     @staticmethod
     def __get_framerate(video: Path) -> float:
         cmd = [